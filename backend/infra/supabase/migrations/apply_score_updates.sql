@@ -0,0 +1,42 @@
+-- backend/infra/supabase/migrations/apply_score_updates.sql
+-- Batched score writes for the bulk re-score job (scripts/rescore_assessments.py)
+-- Updates a whole page of assessments in one statement instead of one request per row.
+-- Each element of updates carries id plus the columns written by SupabaseClient.save_scores().
+CREATE OR REPLACE FUNCTION public.apply_score_updates(updates JSONB) RETURNS INTEGER LANGUAGE sql SECURITY INVOKER AS $$ WITH batch AS (
+        SELECT *
+        FROM jsonb_to_recordset(updates) AS u(
+                id UUID,
+                raw_scores JSONB,
+                trait_scores JSONB,
+                facet_scores JSONB,
+                mbti_code TEXT,
+                persona_id TEXT,
+                confidence FLOAT,
+                scoring_version TEXT,
+                metadata JSONB
+            )
+    ),
+    updated AS (
+        UPDATE public.personality_assessments AS a
+        SET raw_scores = batch.raw_scores,
+            trait_scores = batch.trait_scores,
+            facet_scores = batch.facet_scores,
+            mbti_code = batch.mbti_code,
+            persona_id = batch.persona_id,
+            confidence = batch.confidence,
+            scoring_version = batch.scoring_version,
+            metadata = batch.metadata
+        FROM batch
+        WHERE a.id = batch.id
+        RETURNING a.id
+    )
+SELECT count(*)::INTEGER
+FROM updated;
+$$;
+-- Bulk re-scoring is a maintenance task: service_role only
+REVOKE ALL ON FUNCTION public.apply_score_updates(JSONB)
+FROM PUBLIC,
+    anon,
+    authenticated;
+GRANT EXECUTE ON FUNCTION public.apply_score_updates(JSONB) TO service_role;
+COMMENT ON FUNCTION public.apply_score_updates(JSONB) IS 'Batched score updates used by the bulk re-score job.';
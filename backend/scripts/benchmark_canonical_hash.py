@@ -0,0 +1,55 @@
+"""
+Benchmark the parity telemetry hashes: fast canonical encoders vs the generic
+json.dumps(sort_keys=True) path in PersonalityScorer.compute_hash.
+
+Usage:
+    python scripts/benchmark_canonical_hash.py [--iterations N]
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.constants import SCORING_VERSION
+from src.scorer.canonical_hash import hash_output
+from src.scorer.personality_scorer import PersonalityScorer
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+
+def _time_us(func, iterations: int) -> float:
+    return min(timeit.repeat(func, number=iterations, repeat=5)) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark canonical parity hashing")
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per timing run")
+    args = parser.parse_args()
+
+    scorer = PersonalityScorer(str(QUESTIONS_PATH))
+    rng = random.Random(0)
+    ids = list(scorer.questions)
+
+    print(f"{'payload':<22}{'json.dumps (us)':>18}{'canonical (us)':>18}{'speedup':>10}")
+    for label, size in (("input, 30 answers", 30), ("input, 180 answers", 180)):
+        responses = {q_id: rng.randint(1, 5) for q_id in rng.sample(ids, size)}
+        assert scorer.hasher.hash_responses(responses) == PersonalityScorer.compute_hash(responses)
+        generic = _time_us(lambda: PersonalityScorer.compute_hash(responses), args.iterations)
+        fast = _time_us(lambda: scorer.hasher.hash_responses(responses), args.iterations)
+        print(f"{label:<22}{generic:>18.2f}{fast:>18.2f}{generic / fast:>9.1f}x")
+
+    ocean = {'O': 0.742, 'C': 0.5, 'E': 0.333, 'A': 0.61, 'N': 0.25}
+    payload = {**ocean, 'mbti': 'ENFJ', 'version': SCORING_VERSION}
+    assert hash_output(ocean, 'ENFJ', SCORING_VERSION) == PersonalityScorer.compute_hash(payload)
+    generic = _time_us(lambda: PersonalityScorer.compute_hash({**ocean, 'mbti': 'ENFJ', 'version': SCORING_VERSION}), args.iterations)
+    fast = _time_us(lambda: hash_output(ocean, 'ENFJ', SCORING_VERSION), args.iterations)
+    print(f"{'output':<22}{generic:>18.2f}{fast:>18.2f}{generic / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
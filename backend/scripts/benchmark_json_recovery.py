@@ -0,0 +1,115 @@
+"""
+Benchmark LLM JSON recovery: the single-pass scanner behind safe_json_parse vs
+the previous multi-pass pipeline (json.loads, nested-brace regex passes, then
+fence stripping and first/last brace slicing), kept here for comparison.
+
+Runs the corpus in tests/fixtures/llm_json_corpus.json plus large generated
+responses (long prose around the object, malformed and truncated objects).
+
+Usage:
+    python scripts/benchmark_json_recovery.py [--iterations N]
+"""
+
+import argparse
+import json
+import re
+import sys
+import timeit
+from pathlib import Path
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.llm.provider_base import safe_json_parse
+
+CORPUS_PATH = Path(__file__).parent.parent / "tests" / "fixtures" / "llm_json_corpus.json"
+
+EXPLANATION = {
+    "persona_title": "The Architect",
+    "vibe_summary": "Calm, precise and {quietly} curious. " * 20,
+    "strengths": [f"Strength {i}: plans [ahead], finishes what they start" for i in range(20)],
+    "growth_edges": [f"Growth edge {i}" for i in range(10)],
+    "how_you_show_up": "Steady under pressure. " * 40,
+    "tagline": "Plans first",
+}
+
+
+def legacy_parse(content):
+    """The pre-scanner safe_json_parse, for comparison"""
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        pass
+
+    for match in re.findall(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', content, re.DOTALL):
+        try:
+            parsed = json.loads(match)
+            if isinstance(parsed, dict) and any(
+                key in parsed for key in ("persona_title", "vibe_summary", "summary", "strengths", "challenges", "growth_edges")
+            ):
+                return parsed
+        except json.JSONDecodeError:
+            continue
+
+    for match in re.findall(r'\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]', content, re.DOTALL):
+        try:
+            parsed = json.loads(match)
+            return parsed if isinstance(parsed, dict) else {"data": parsed}
+        except json.JSONDecodeError:
+            continue
+
+    content_clean = re.sub(r'```json\s*', '', content)
+    content_clean = re.sub(r'```\s*', '', content_clean).strip()
+    first_brace, last_brace = content_clean.find('{'), content_clean.rfind('}')
+    if first_brace != -1 and last_brace > first_brace:
+        try:
+            return json.loads(content_clean[first_brace:last_brace + 1])
+        except json.JSONDecodeError:
+            pass
+
+    raise ValueError("Could not extract valid JSON from LLM response")
+
+
+def _time_us(func, iterations: int) -> float:
+    return min(timeit.repeat(func, number=iterations, repeat=5)) / iterations * 1e6
+
+
+def _attempt(parse, text):
+    try:
+        parse(text)
+        return True
+    except ValueError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LLM JSON recovery")
+    parser.add_argument("--iterations", type=int, default=200, help="Calls per timing run")
+    args = parser.parse_args()
+
+    corpus = json.loads(CORPUS_PATH.read_text(encoding="utf-8"))["cases"]
+    body = json.dumps(EXPLANATION, indent=2)
+    prose = "Here is a careful read of the profile, with {notes} and [asides]. " * 200
+    payloads = [
+        ("corpus (all cases)", None),
+        ("fenced, 5 KB", f"```json\n{body}\n```"),
+        ("prose around, 30 KB", f"{prose}\n{body}\n{prose}"),
+        ("trailing commas, 5 KB", body.replace('"\n  ]', '",\n  ]')),
+        ("truncated, 4 KB", body[: len(body) * 4 // 5]),
+    ]
+
+    print(f"{'payload':<26}{'legacy (us)':>14}{'scanner (us)':>14}{'speedup':>10}{'legacy ok':>11}{'scanner ok':>12}")
+    for label, text in payloads:
+        texts = [case["text"] for case in corpus] if text is None else [text]
+        legacy = _time_us(lambda: [_attempt(legacy_parse, t) for t in texts], args.iterations)
+        scanner = _time_us(lambda: [_attempt(safe_json_parse, t) for t in texts], args.iterations)
+        legacy_ok = sum(_attempt(legacy_parse, t) for t in texts)
+        scanner_ok = sum(_attempt(safe_json_parse, t) for t in texts)
+        print(
+            f"{label:<26}{legacy:>14.1f}{scanner:>14.1f}{legacy / scanner:>9.1f}x"
+            f"{legacy_ok:>8}/{len(texts):<3}{scanner_ok:>8}/{len(texts):<3}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Build or refresh the population norms artifact (trait/facet percentile tables).
+
+Reads stored assessments for the current scoring version with keyset
+pagination and writes data/norms/lifesync_norms.npz. Runs are incremental:
+an existing artifact is extended with the assessments created since its
+watermark. Use --full after a bulk re-score to rebuild from scratch.
+
+The scorer attaches the artifact at startup; score() results and
+GET /v1/assessments/{id} then carry percentiles without querying the population.
+
+Usage:
+    python -m scripts.build_norms            # Incremental refresh
+    python -m scripts.build_norms --full     # Rebuild from every stored assessment
+"""
+
+import argparse
+import logging
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.constants import RESCORE_PAGE_SIZE, SCORING_VERSION
+from src.scorer.norms import NormsBuilder, NormsError, NormTables, iter_stored_scores
+from src.supabase_client import create_supabase_client
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT = Path(__file__).parent.parent / "data" / "norms" / "lifesync_norms.npz"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build population percentile norms from stored assessments')
+    parser.add_argument('--output', type=str, default=str(DEFAULT_OUTPUT), help='Norms artifact path')
+    parser.add_argument('--full', action='store_true', help='Ignore the existing artifact and rebuild')
+    parser.add_argument('--page-size', type=int, default=RESCORE_PAGE_SIZE, help='Rows per page')
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    base = None
+    if output.exists() and not args.full:
+        try:
+            base = NormTables.load(output)
+        except NormsError as e:
+            logger.warning(f"{e}; rebuilding from scratch")
+        else:
+            if base.scoring_version != SCORING_VERSION:
+                logger.info(f"Existing norms are for {base.scoring_version}; rebuilding for {SCORING_VERSION}")
+                base = None
+
+    try:
+        db = create_supabase_client()
+    except Exception as e:
+        logger.error(f"Failed to connect to Supabase: {e}")
+        sys.exit(1)
+
+    # Rows created after this run starts are left for the next refresh
+    watermark = datetime.now(timezone.utc).isoformat()
+    created_after = base.meta.get("watermark") if base else None
+    logger.info(f"Reading assessments created after {created_after or 'the beginning'} up to {watermark}")
+
+    builder = NormsBuilder(base)
+    added = 0
+    after_id = None
+    while True:
+        rows = db.get_assessments_after(
+            after_id,
+            args.page_size,
+            columns="id,trait_scores,facet_scores",
+            created_after=created_after,
+            created_before=watermark,
+            scoring_version=SCORING_VERSION,
+        )
+        for traits, facets in iter_stored_scores(rows):
+            builder.add(traits, facets)
+            added += 1
+        if len(rows) < args.page_size:
+            break
+        after_id = rows[-1]["id"]
+
+    norms = builder.build(scoring_version=SCORING_VERSION, watermark=watermark)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    norms.save(output)
+
+    # Round-trip check so a broken artifact never ships
+    NormTables.load(output)
+
+    print(f"[OK] Wrote {output}")
+    print(f"     added:           {added}")
+    print(f"     population:      {norms.population}")
+    print(f"     scoring_version: {SCORING_VERSION}")
+    print(f"     bytes:           {output.stat().st_size}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Build the precompiled question bank artifact.
+
+Compiles data/question_bank/lifesync_180_questions.json into a versioned,
+memory-mappable binary file next to it (lifesync_180_questions.lsqb).
+The scorer and GET /v1/questions load the artifact when it is present and
+matches both the source JSON and SCORING_VERSION, and fall back to JSON otherwise.
+
+Usage:
+    python scripts/build_question_artifact.py [--source PATH] [--output PATH]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scorer.bank_artifact import build_artifact, default_artifact_path, load_artifact
+
+DEFAULT_SOURCE = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the question bank into a binary artifact")
+    parser.add_argument("--source", default=str(DEFAULT_SOURCE), help="Question bank JSON")
+    parser.add_argument("--output", default=None, help="Artifact path (default: next to source, .lsqb)")
+    args = parser.parse_args()
+
+    output = Path(args.output) if args.output else default_artifact_path(args.source)
+    summary = build_artifact(args.source, output)
+
+    # Round-trip check so a broken artifact never ships
+    load_artifact(output, args.source)
+
+    print(f"[OK] Wrote {output}")
+    print(f"     questions:       {summary['questions']}")
+    print(f"     bytes:           {summary['bytes']}")
+    print(f"     scoring_version: {summary['scoring_version']}")
+    print(f"     payload_sha256:  {summary['payload_sha256']}")
+
+
+if __name__ == "__main__":
+    main()
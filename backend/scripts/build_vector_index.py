@@ -0,0 +1,84 @@
+"""
+Build the profile vector index snapshot used by GET /v1/assessments/{id}/similar.
+
+Reads every stored assessment's trait and facet scores with keyset
+pagination and writes the API's snapshot (VECTOR_INDEX_PATH, default
+<LIFESYNC_DATA_DIR>/index/profile_vectors.npz). The API loads the snapshot on
+first use, keeps it current as scores are saved and writes it back, so this
+only needs re-running after bulk changes (e.g. a re-score) or on a new host.
+
+Usage:
+    python -m scripts.build_vector_index [--output PATH] [--page-size N]
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.constants import RESCORE_PAGE_SIZE
+from src.db.vector_index import ProfileVectorIndex, profile_dimensions, snapshot_path
+from src.scorer.norms import stored_facet_scores, stored_trait_scores
+from src.supabase_client import create_supabase_client
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the profile vector index snapshot from stored assessments')
+    parser.add_argument('--output', type=str, default=str(snapshot_path()), help='Snapshot path')
+    parser.add_argument('--page-size', type=int, default=RESCORE_PAGE_SIZE, help='Rows per page')
+    args = parser.parse_args()
+
+    try:
+        db = create_supabase_client()
+    except Exception as e:
+        logger.error(f"Failed to connect to Supabase: {e}")
+        sys.exit(1)
+
+    index = ProfileVectorIndex(profile_dimensions())
+    sample_ids = []
+    after_id = None
+    while True:
+        rows = db.get_assessments_after(after_id, args.page_size, columns="id,trait_scores,facet_scores")
+        ids, vectors = [], []
+        for row in rows:
+            trait_scores = row.get("trait_scores")
+            if not isinstance(trait_scores, dict) or not trait_scores:
+                continue
+            ids.append(row["id"])
+            vectors.append(index.vector(stored_trait_scores(trait_scores), stored_facet_scores(row.get("facet_scores"))))
+        if ids:
+            index.add_many(ids, vectors)
+            sample_ids.extend(ids[:max(0, 200 - len(sample_ids))])
+        if len(rows) < args.page_size:
+            break
+        after_id = rows[-1]["id"]
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    index.save(output)
+
+    # Round-trip check so a broken snapshot never ships, then time a few queries
+    loaded = ProfileVectorIndex.load(output)
+    timings = []
+    for assessment_id in sample_ids:
+        vector = loaded.get_vector(assessment_id)
+        started = time.perf_counter()
+        loaded.query(vector, k=10, exclude=assessment_id)
+        timings.append(time.perf_counter() - started)
+
+    print(f"[OK] Wrote {output}")
+    print(f"     vectors:     {len(loaded)} x {loaded.dim}")
+    print(f"     bytes:       {output.stat().st_size}")
+    if timings:
+        print(f"     query (k=10): median {statistics.median(timings) * 1e3:.3f} ms, max {max(timings) * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
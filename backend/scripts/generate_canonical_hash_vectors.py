@@ -0,0 +1,117 @@
+"""
+Generate the cross-language golden vectors for the parity telemetry hashes.
+
+Vectors are produced with the reference encoder (PersonalityScorer.compute_hash,
+i.e. json.dumps with sort_keys and compact separators) and written to
+packages/personality-engine/test/fixtures/canonical_hash_vectors.json, where
+both the Python tests and the TypeScript engine's tests check against them.
+
+Only values both languages can represent are included: response values are
+ints or non-integral floats (JS cannot tell 3 from 3.0), OCEAN scores are
+always floats.
+
+Usage:
+    python scripts/generate_canonical_hash_vectors.py [--output PATH]
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.constants import SCORING_VERSION
+from src.scorer.personality_scorer import PersonalityScorer
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+DEFAULT_OUTPUT = (
+    Path(__file__).parent.parent.parent
+    / "packages" / "personality-engine" / "test" / "fixtures" / "canonical_hash_vectors.json"
+)
+
+
+def _canonical(data):
+    return json.dumps(data, sort_keys=True, separators=(',', ':'))
+
+
+def _response_cases(ids):
+    rng = random.Random(2024)
+    shuffled = list(ids)
+    rng.shuffle(shuffled)
+    return [
+        ("empty", {}),
+        ("single", {"Q001": 4}),
+        ("reverse_order", {"Q003": 1, "Q002": 2, "Q001": 3}),
+        ("full_shuffled", {q_id: rng.randint(1, 5) for q_id in shuffled}),
+        ("quick_30", {q_id: rng.randint(1, 5) for q_id in shuffled[:30]}),
+        ("unknown_and_off_scale", {"Q999": 3, "Q010": 0, "Q011": 6, "Q012": -1}),
+        ("fractional_values", {"Q020": 2.5, "Q021": 0.125, "Q022": 1e-07, "Q023": 12345.678}),
+        ("non_question_keys", {"zeta": 1, "Alpha": 2, "alpha": 3, "a_b": 4, "a-b": 5}),
+        ("escaped_keys", {"quote\"key": 1, "back\\slash": 2, "tab\tkey": 3, "café": 4}),
+    ]
+
+
+def _output_cases():
+    return [
+        ("typical", {"O": 0.742, "C": 0.5, "E": 0.333, "A": 0.61, "N": 0.25}, "ENFJ"),
+        ("all_zero_no_mbti", {"O": 0.0, "C": 0.0, "E": 0.0, "A": 0.0, "N": 0.0}, None),
+        ("extremes", {"O": 1.0, "C": 0.0, "E": 1.0, "A": 0.0, "N": 1.0}, "ENTP"),
+        ("unknown_mbti", {"O": 0.5, "C": 0.5, "E": 0.5, "A": 0.5, "N": 0.5}, "UNKN"),
+        ("tiny", {"O": 0.001, "C": 0.01, "E": 0.1, "A": 0.999, "N": 0.005}, "XXXX"),
+    ]
+
+
+def build_vectors():
+    scorer = PersonalityScorer(str(QUESTIONS_PATH))
+
+    responses = []
+    for name, data in _response_cases(list(scorer.questions)):
+        canonical = _canonical(data)
+        responses.append({
+            "name": name,
+            "input": data,
+            "canonical": canonical,
+            "sha256": PersonalityScorer.compute_hash(data),
+        })
+
+    outputs = []
+    for name, ocean, mbti in _output_cases():
+        payload = {**ocean, "mbti": mbti, "version": SCORING_VERSION}
+        outputs.append({
+            "name": name,
+            "ocean": ocean,
+            "mbti": mbti,
+            "version": SCORING_VERSION,
+            "canonical": _canonical(payload),
+            "sha256": PersonalityScorer.compute_hash(payload),
+        })
+
+    return {
+        "description": "Golden vectors for parity input/output hashes "
+                       "(SHA-256 of json.dumps(sort_keys=True, separators=(',', ':')))",
+        "generated_by": "backend/scripts/generate_canonical_hash_vectors.py",
+        "responses": responses,
+        "outputs": outputs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate canonical hash golden vectors")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="Vector file path")
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    vectors = build_vectors()
+    output.write_text(json.dumps(vectors, indent=2) + "\n")
+
+    print(f"[OK] Wrote {output}")
+    print(f"     response vectors: {len(vectors['responses'])}")
+    print(f"     output vectors:   {len(vectors['outputs'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Re-score every stored assessment from its raw_scores after a scoring change.
+
+Streams personality_assessments in id order (keyset pagination), scores each
+page in a process pool and writes changed rows back in one batch per page
+(requires infra/supabase/migrations/apply_score_updates.sql). Memory stays
+constant regardless of table size. With --checkpoint an interrupted run
+resumes after the last completed page.
+
+Usage:
+    python -m scripts.rescore_assessments --dry-run --report diff.jsonl     # Preview changes
+    python -m scripts.rescore_assessments --apply --checkpoint rescore.json # Write changes (resumable)
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.constants import RESCORE_PAGE_SIZE
+from src.db.rescore import RescoreJob
+from src.supabase_client import create_supabase_client
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-score stored personality assessments')
+    parser.add_argument('--dry-run', action='store_true', help='Report changes without writing them')
+    parser.add_argument('--apply', action='store_true', help='Write re-scored rows to the database')
+    parser.add_argument('--scoring-version', type=str, default=None,
+                        help='Registered scoring version to score with (default: current)')
+    parser.add_argument('--page-size', type=int, default=RESCORE_PAGE_SIZE,
+                        help='Rows per page / write batch')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Scoring processes (default: CPU count, 0 = in-process)')
+    parser.add_argument('--checkpoint', type=str, default=None,
+                        help='Checkpoint file to resume from and update after every page')
+    parser.add_argument('--report', type=str, default=None,
+                        help='Write a JSON-lines diff (id, old/new per changed column) to this file')
+
+    args = parser.parse_args()
+
+    if args.dry_run == args.apply:
+        parser.error('Must specify exactly one of --dry-run or --apply')
+
+    try:
+        db = create_supabase_client()
+    except Exception as e:
+        logger.error(f"Failed to connect to Supabase: {e}")
+        sys.exit(1)
+
+    report = open(args.report, 'a', encoding='utf-8') if args.report else None
+    try:
+        job = RescoreJob(
+            db,
+            scoring_version=args.scoring_version,
+            page_size=args.page_size,
+            workers=args.workers,
+            dry_run=args.dry_run,
+            checkpoint_path=args.checkpoint,
+            report=report,
+        )
+        logger.info(f"{'[DRY RUN] ' if args.dry_run else ''}Re-scoring with scoring_version={job.scoring_version}")
+        stats = job.run()
+    finally:
+        if report is not None:
+            report.close()
+
+    for field, count in sorted(stats.field_changes.items()):
+        logger.info(f"  {field}: {count} rows differ")
+    logger.info(f"Throughput: {stats.rows_per_second:.0f} rows/s over {stats.elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Offline simulator for the adaptive quiz: questions-to-convergence and accuracy.
+
+Simulated respondents get a latent level per trait and answer every bank
+question as round(1 + 4 * (level + noise)) (mirrored for reverse-keyed
+items). Each respondent takes the adaptive quiz; its trait scores are
+compared with the same respondent's full 180-question score and with the
+fixed smart_30 quiz.
+
+Usage:
+    python scripts/simulate_adaptive_quiz.py [--respondents N] [--noise SD] [--threshold C]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.constants import CAT_CONFIDENCE_THRESHOLD, CAT_MAX_QUESTIONS
+from src.scorer.adaptive import AdaptiveQuiz
+from src.scorer.compiled_bank import TRAIT_ORDER
+from src.scorer.personality_scorer import PersonalityScorer
+
+QUESTION_BANK_DIR = Path(__file__).parent.parent / "data" / "question_bank"
+
+
+def simulate_answers(scorer: PersonalityScorer, levels, noise: float, rng: random.Random):
+    """Answers to every bank question for one simulated respondent"""
+    answers = {}
+    for q_id, q in scorer.questions.items():
+        level = levels[q['trait']]
+        if q['reverse']:
+            level = 1.0 - level
+        answers[q_id] = min(5, max(1, round(1 + 4 * (level + rng.gauss(0.0, noise)))))
+    return answers
+
+
+def trait_error(result, reference) -> float:
+    """Mean absolute trait error against the full-bank score (0-1 scale)"""
+    return statistics.mean(abs(result['ocean'][t] - reference['ocean'][t]) for t in TRAIT_ORDER)
+
+
+def _percentile(values, pct: float):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate the adaptive quiz")
+    parser.add_argument("--respondents", type=int, default=500, help="Simulated respondents")
+    parser.add_argument("--noise", type=float, default=0.15, help="Answer noise SD (0-1 scale)")
+    parser.add_argument("--threshold", type=float, default=CAT_CONFIDENCE_THRESHOLD, help="Stopping confidence")
+    parser.add_argument("--max-questions", type=int, default=CAT_MAX_QUESTIONS, help="Question cap")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    scorer = PersonalityScorer(str(QUESTION_BANK_DIR / "lifesync_180_questions.json"))
+    with open(QUESTION_BANK_DIR / "smart_30.json") as f:
+        smart_ids = json.load(f)["question_ids"]
+    rng = random.Random(args.seed)
+
+    lengths, adaptive_errors, smart_errors, converged = [], [], [], 0
+    started = time.perf_counter()
+    for _ in range(args.respondents):
+        levels = {t: rng.uniform(0.1, 0.9) for t in TRAIT_ORDER}
+        answers = simulate_answers(scorer, levels, args.noise, rng)
+        reference = scorer.score(answers)
+
+        quiz = AdaptiveQuiz(scorer, confidence_threshold=args.threshold, max_questions=args.max_questions)
+        while (q_id := quiz.next_question()) is not None:
+            quiz.answer(q_id, answers[q_id])
+
+        lengths.append(len(quiz))
+        converged += min(quiz.trait_confidence().values()) >= args.threshold
+        adaptive_errors.append(trait_error(quiz.result(), reference))
+        smart_errors.append(trait_error(scorer.score({q: answers[q] for q in smart_ids}), reference))
+    elapsed = time.perf_counter() - started
+
+    print(f"respondents:          {args.respondents} (noise SD {args.noise}, threshold {args.threshold})")
+    print(f"questions asked:      mean {statistics.mean(lengths):.1f}, median {statistics.median(lengths):.0f}, "
+          f"p90 {_percentile(lengths, 90)}, max {max(lengths)} (full bank: {len(scorer.questions)})")
+    print(f"converged:            {converged / args.respondents:.1%} (rest hit the {args.max_questions}-question cap)")
+    print(f"trait MAE vs full:    adaptive {statistics.mean(adaptive_errors):.4f}, "
+          f"smart_30 {statistics.mean(smart_errors):.4f}")
+    print(f"selector time:        {elapsed / sum(lengths) * 1e6:.0f} us per question")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,20 @@
 LifeSync Personality Engine - AI Module
 """
 
-from .explanation_generator import generate_explanation_with_tone
-from .tone_generator import generate_tone, generate_tone_safe
+from .explanation_generator import (
+    agenerate_explanation_with_tone,
+    astream_explanation_with_tone,
+    generate_explanation_with_tone,
+)
+from .tone_generator import TONE_TABLE, generate_tone, generate_tone_safe, tone_band_code
 
 __all__ = [
     'generate_tone',
     'generate_tone_safe',
-    'generate_explanation_with_tone'
+    'tone_band_code',
+    'TONE_TABLE',
+    'generate_explanation_with_tone',
+    'agenerate_explanation_with_tone',
+    'astream_explanation_with_tone'
 ]
 
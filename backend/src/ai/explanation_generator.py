@@ -3,17 +3,132 @@ LifeSync Personality Engine - Explanation Generator
 Integrates tone generation with LLM explanation workflow
 """
 
+import hashlib
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
+from ..config.constants import EXPLANATION_SIGNATURE_STEP
+from ..llm.provider_base import ExplanationEvent
+from ..llm.router import agenerate_explanation as router_agenerate_explanation
+from ..llm.router import astream_explanation as router_astream_explanation
 from ..llm.router import generate_explanation as router_generate_explanation
-from ..llm.templates import _convert_traits_to_codes
+from ..llm.templates import PROMPT_TEMPLATE_VERSION, TRAIT_NAMES, _convert_traits_to_codes
 from ..personas.persona_registry import map_profile_to_persona
-from .tone_generator import generate_tone_safe
+from .tone_generator import generate_tone_safe, tone_band_code
 
 logger = logging.getLogger(__name__)
 
 
+def _ocean_profile(traits: Dict[str, float]) -> Dict[str, float]:
+    """Convert 0-1 traits to the 0-100 profile used for persona mapping"""
+    return {
+        "openness": traits.get("Openness", 0) * 100,
+        "conscientiousness": traits.get("Conscientiousness", 0) * 100,
+        "extraversion": traits.get("Extraversion", 0) * 100,
+        "agreeableness": traits.get("Agreeableness", 0) * 100,
+        "neuroticism": traits.get("Neuroticism", 0) * 100
+    }
+
+
+def _quantize(value: Any) -> str:
+    if not isinstance(value, (int, float)):
+        return "-"
+    return str(round(value / EXPLANATION_SIGNATURE_STEP))
+
+
+def explanation_signature(
+    traits: Dict[str, float],
+    facets: Dict[str, float],
+    confidence: Dict[str, Any],
+    provider: Optional[str] = None,
+    system_prompt: Optional[str] = None
+) -> str:
+    """
+    Cache key for the explanation generate_explanation_with_tone() would produce.
+    
+    Combines the prompt template version, provider, persona, tone band code,
+    trait scores and top-5 facets (both rounded to EXPLANATION_SIGNATURE_STEP)
+    and any per-trait confidences that reach the prompt. Profiles with the
+    same signature get interchangeable explanations.
+    
+    Returns:
+        "v<version>:<sha256 hex>" of the signature fields
+    """
+    persona = map_profile_to_persona(_ocean_profile(traits))["persona"]
+    try:
+        bands = tone_band_code(_convert_traits_to_codes(traits))
+    except (TypeError, ValueError):
+        bands = "-----"
+
+    facet_items = [(name, v) for name, v in (facets or {}).items() if isinstance(v, (int, float))]
+    top_facets = sorted(facet_items, key=lambda x: x[1], reverse=True)[:5]
+    trait_confidence = (confidence or {}).get("traits", {})
+
+    fields = [
+        provider or "default",
+        persona["id"],
+        bands,
+        ",".join(_quantize(traits.get(t)) for t in TRAIT_NAMES),
+        ",".join(f"{name}={_quantize(v)}" for name, v in top_facets),
+        ",".join(_quantize(trait_confidence.get(t)) for t in TRAIT_NAMES),
+        hashlib.sha256(system_prompt.encode("utf-8")).hexdigest() if system_prompt else "",
+    ]
+    digest = hashlib.sha256("|".join(fields).encode("utf-8")).hexdigest()
+    return f"v{PROMPT_TEMPLATE_VERSION}:{digest}"
+
+
+def _prepare_generation(traits: Dict[str, float]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Steps 1-2: tone profile and persona for the prompt"""
+    # Step 1: Generate tone profile from traits
+    # Convert full trait names to OCEAN codes for tone generator
+    trait_codes = _convert_traits_to_codes(traits)
+    
+    # Generate tone profile with safe fallbacks
+    tone_profile = generate_tone_safe(trait_codes)
+    logger.debug(f"[LLM] Generated tone profile: {len(tone_profile.get('style', []))} style descriptors")
+    
+    # Step 2: Map to Persona
+    persona_result = map_profile_to_persona(_ocean_profile(traits))
+    persona = persona_result.get("persona")
+    logger.info(f"[LLM] Mapped to persona: {persona.get('title')} (confidence: {persona_result.get('confidence')}%)")
+    return tone_profile, persona
+
+
+def _finalize_explanation(
+    explanation: Dict[str, Any],
+    tone_profile: Dict[str, Any],
+    persona: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Static persona fallback on router errors, plus tone/persona metadata"""
+    # Check if router returned an error or failed
+    if "error" in explanation:
+        logger.warning(f"[LLM] AI generation failed, using static fallback for persona: {persona.get('title')}")
+        
+        # Build a static fallback from persona data
+        fallback = {
+            "persona_title": persona.get("title", "Personality Profile"),
+            "vibe_summary": persona.get("description", "A unique blend of personality traits."),
+            "strengths": persona.get("strengths", []),
+            "growth_edges": persona.get("growth", []),
+            "how_you_show_up": f"As {persona.get('title')}, your behavior is guided by {persona.get('tagline', 'your unique perspective')}.",
+            "tagline": persona.get("tagline", ""),
+            "is_fallback": True,
+            "error_note": explanation.get("error")
+        }
+        
+        # Preserve original error for debugging but return the fallback content
+        fallback["original_error"] = explanation.get("error")
+        explanation = fallback
+    else:
+        logger.info(f"[LLM] Explanation generated successfully using {explanation.get('model_name', 'unknown')}")
+    
+    # Add tone profile and persona to explanation metadata
+    explanation["tone_profile"] = tone_profile
+    explanation["persona"] = persona
+    
+    return explanation
+
+
 def generate_explanation_with_tone(
     traits: Dict[str, float],
     facets: Dict[str, float],
@@ -51,31 +166,48 @@ def generate_explanation_with_tone(
     # Step 0: Logging
     logger.info("[LLM] Generating explanation using Gemini")
     
-    # Step 1: Generate tone profile from traits
-    # Convert full trait names to OCEAN codes for tone generator
-    trait_codes = _convert_traits_to_codes(traits)
+    tone_profile, persona = _prepare_generation(traits)
+
+    # Step 3: Generate explanation with tone profile and persona injected
+    try:
+        explanation = router_generate_explanation(
+            traits=traits,
+            facets=facets,
+            confidence=confidence,
+            dominant=dominant,
+            provider=None,  # Standardize on Gemini
+            system_prompt=system_prompt,
+            tone_profile=tone_profile,
+            persona=persona
+        )
+    except Exception as e:
+        logger.error(f"[LLM] Unexpected error in router: {e}")
+        explanation = {"error": str(e)}
     
-    # Generate tone profile with safe fallbacks
-    tone_profile = generate_tone_safe(trait_codes)
-    logger.debug(f"[LLM] Generated tone profile: {len(tone_profile.get('style', []))} style descriptors")
+    return _finalize_explanation(explanation, tone_profile, persona)
+
+
+async def agenerate_explanation_with_tone(
+    traits: Dict[str, float],
+    facets: Dict[str, float],
+    confidence: Dict[str, Any],
+    dominant: Dict[str, str],
+    provider: Optional[str] = None,
+    system_prompt: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Async generate_explanation_with_tone.
     
-    # Step 2: Map to Persona
-    # Convert 0-1 traits to 0-100 for mapping
-    ocean_profile = {
-        "openness": traits.get("Openness", 0) * 100,
-        "conscientiousness": traits.get("Conscientiousness", 0) * 100,
-        "extraversion": traits.get("Extraversion", 0) * 100,
-        "agreeableness": traits.get("Agreeableness", 0) * 100,
-        "neuroticism": traits.get("Neuroticism", 0) * 100
-    }
+    Uses the async router, so the LLM call doesn't hold a worker thread and
+    is cancelled along with the awaiting request (e.g. on timeout).
+    """
+    logger.info("[LLM] Generating explanation using Gemini (async)")
     
-    persona_result = map_profile_to_persona(ocean_profile)
-    persona = persona_result.get("persona")
-    logger.info(f"[LLM] Mapped to persona: {persona.get('title')} (confidence: {persona_result.get('confidence')}%)")
+    tone_profile, persona = _prepare_generation(traits)
 
     # Step 3: Generate explanation with tone profile and persona injected
     try:
-        explanation = router_generate_explanation(
+        explanation = await router_agenerate_explanation(
             traits=traits,
             facets=facets,
             confidence=confidence,
@@ -89,31 +221,47 @@ def generate_explanation_with_tone(
         logger.error(f"[LLM] Unexpected error in router: {e}")
         explanation = {"error": str(e)}
     
-    # Check if router returned an error or failed
-    if "error" in explanation:
-        logger.warning(f"[LLM] AI generation failed, using static fallback for persona: {persona.get('title')}")
-        
-        # Build a static fallback from persona data
-        fallback = {
-            "persona_title": persona.get("title", "Personality Profile"),
-            "vibe_summary": persona.get("description", "A unique blend of personality traits."),
-            "strengths": persona.get("strengths", []),
-            "growth_edges": persona.get("growth", []),
-            "how_you_show_up": f"As {persona.get('title')}, your behavior is guided by {persona.get('tagline', 'your unique perspective')}.",
-            "tagline": persona.get("tagline", ""),
-            "is_fallback": True,
-            "error_note": explanation.get("error")
-        }
-        
-        # Preserve original error for debugging but return the fallback content
-        fallback["original_error"] = explanation.get("error")
-        explanation = fallback
-    else:
-        logger.info(f"[LLM] Explanation generated successfully using {explanation.get('model_name', 'unknown')}")
+    return _finalize_explanation(explanation, tone_profile, persona)
+
+
+async def astream_explanation_with_tone(
+    traits: Dict[str, float],
+    facets: Dict[str, float],
+    confidence: Dict[str, Any],
+    dominant: Dict[str, str],
+    provider: Optional[str] = None,
+    system_prompt: Optional[str] = None
+) -> AsyncIterator[ExplanationEvent]:
+    """
+    Streaming generate_explanation_with_tone.
     
-    # Add tone profile and persona to explanation metadata
-    explanation["tone_profile"] = tone_profile
-    explanation["persona"] = persona
+    Yields ("field", (name, value)) as each top-level field of the LLM's
+    JSON arrives, then ("explanation", dict) with the same result
+    agenerate_explanation_with_tone would return (static persona fallback
+    on errors, tone/persona metadata).
+    """
+    logger.info("[LLM] Generating explanation using Gemini (streaming)")
     
-    return explanation
+    tone_profile, persona = _prepare_generation(traits)
 
+    explanation = None
+    try:
+        async for kind, data in router_astream_explanation(
+            traits=traits,
+            facets=facets,
+            confidence=confidence,
+            dominant=dominant,
+            provider=None,  # Standardize on Gemini
+            system_prompt=system_prompt,
+            tone_profile=tone_profile,
+            persona=persona
+        ):
+            if kind == "explanation":
+                explanation = data
+            else:
+                yield kind, data
+    except Exception as e:
+        logger.error(f"[LLM] Unexpected error in router: {e}")
+        explanation = {"error": str(e)}
+    
+    yield "explanation", _finalize_explanation(explanation or {"error": "Empty LLM stream"}, tone_profile, persona)
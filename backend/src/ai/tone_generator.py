@@ -1,127 +1,175 @@
 """
 LifeSync Personality Engine - Tone Generator
 Generates communication tone guidelines based on OCEAN personality traits
+
+A tone profile depends only on which band (low, mid, high) each of the five
+traits falls into, so all 3^5 = 243 profiles are built once at import into
+an immutable table keyed by a 5-digit band code (e.g. "21012": O high,
+C mid, E low, A mid, N high). The band code doubles as a coarse profile
+signature for downstream caching.
 """
 
-from typing import Dict, List
+from itertools import product
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
+# Thresholds
+LOW_THRESHOLD = 0.35
+HIGH_THRESHOLD = 0.65
+
+TRAIT_CODES = ("O", "C", "E", "A", "N")
+
+# Band digits used in band codes
+BAND_LOW, BAND_MID, BAND_HIGH = "0", "1", "2"
+
+_DEFAULT_STYLE = ("friendly", "clear")
+
+
+def _band(score: float) -> str:
+    score = float(score)
+    if score > HIGH_THRESHOLD:
+        return BAND_HIGH
+    if score < LOW_THRESHOLD:
+        return BAND_LOW
+    return BAND_MID
+
+
+def _build_tone(bands: Tuple[str, ...]) -> Mapping[str, Tuple[str, ...]]:
+    """Tone profile for one combination of trait bands (O, C, E, A, N order)"""
+    o_band, c_band, e_band, a_band, n_band = bands
 
-def generate_tone(traits: Dict[str, float]) -> Dict[str, List[str]]:
-    """
-    Generate communication tone profile based on OCEAN personality traits.
-    
-    Args:
-        traits: Dictionary with OCEAN trait scores (0-1 scale)
-                Expected keys: "O", "C", "E", "A", "N"
-                Example: {"O": 0.72, "C": 0.65, "E": 0.42, "A": 0.71, "N": 0.48}
-    
-    Returns:
-        Dictionary containing:
-        - style: List of writing style adjectives
-        - strengths: List of positive reinforcement messages
-        - cautions: List of emotional sensitivity warnings
-    
-    Raises:
-        ValueError: If required trait keys are missing
-    
-    Example:
-        >>> traits = {"O": 0.72, "C": 0.65, "E": 0.42, "A": 0.71, "N": 0.48}
-        >>> tone = generate_tone(traits)
-        >>> print(tone["style"])
-        ['creative', 'metaphorical', 'structured', 'calm', 'warm']
-    """
-    # Validate required trait keys
-    required_traits = ["O", "C", "E", "A", "N"]
-    missing_traits = [t for t in required_traits if t not in traits]
-    if missing_traits:
-        raise ValueError(
-            f"Missing required trait keys: {', '.join(missing_traits)}. "
-            f"Expected keys: {', '.join(required_traits)}"
-        )
-    
-    # Thresholds
-    LOW_THRESHOLD = 0.35
-    HIGH_THRESHOLD = 0.65
-    
     # Initialize tone profile
     style = []
     strengths = []
     cautions = []
     
     # Openness (O)
-    o_score = float(traits.get("O", 0.5))
-    if o_score > HIGH_THRESHOLD:
+    if o_band == BAND_HIGH:
         style.extend(["creative", "metaphorical", "imaginative"])
         strengths.append("highly creative and open to new ideas")
-    elif o_score < LOW_THRESHOLD:
+    elif o_band == BAND_LOW:
         style.extend(["practical", "grounded", "literal"])
         strengths.append("practical and focused on real-world applications")
     else:
         style.append("balanced")
     
     # Conscientiousness (C)
-    c_score = float(traits.get("C", 0.5))
-    if c_score > HIGH_THRESHOLD:
+    if c_band == BAND_HIGH:
         style.extend(["structured", "organized", "action-oriented"])
         strengths.append("highly organized and goal-driven")
-    elif c_score < LOW_THRESHOLD:
+    elif c_band == BAND_LOW:
         style.extend(["easygoing", "flexible", "non-judgmental"])
         strengths.append("adaptable and open to spontaneity")
     else:
         style.append("moderately organized")
     
     # Extraversion (E)
-    e_score = float(traits.get("E", 0.5))
-    if e_score > HIGH_THRESHOLD:
+    if e_band == BAND_HIGH:
         style.extend(["energetic", "enthusiastic", "encouraging"])
         strengths.append("naturally energetic and socially engaging")
-    elif e_score < LOW_THRESHOLD:
+    elif e_band == BAND_LOW:
         style.extend(["calm", "introspective", "soft-spoken"])
         strengths.append("thoughtful and comfortable with reflection")
     else:
         style.append("socially balanced")
     
     # Agreeableness (A)
-    a_score = float(traits.get("A", 0.5))
-    if a_score > HIGH_THRESHOLD:
+    if a_band == BAND_HIGH:
         style.extend(["warm", "gentle", "supportive"])
         strengths.append("empathetic and considerate of others")
-    elif a_score < LOW_THRESHOLD:
+    elif a_band == BAND_LOW:
         style.extend(["direct", "honest", "straightforward"])
         strengths.append("clear and direct in communication")
     else:
         style.append("balanced in social interactions")
     
     # Neuroticism (N)
-    n_score = float(traits.get("N", 0.5))
-    if n_score > HIGH_THRESHOLD:
+    if n_band == BAND_HIGH:
         cautions.extend([
             "may need reassurance",
             "emotionally sensitive",
             "may experience stress more intensely"
         ])
-    elif n_score < LOW_THRESHOLD:
+    elif n_band == BAND_LOW:
         strengths.append("emotionally stable and resilient")
         strengths.append("handles stress and setbacks well")
     else:
         strengths.append("generally emotionally balanced")
     
     # Remove duplicates while preserving order
-    style = list(dict.fromkeys(style))
-    strengths = list(dict.fromkeys(strengths))
-    cautions = list(dict.fromkeys(cautions))
+    style = tuple(dict.fromkeys(style)) or _DEFAULT_STYLE
+    return MappingProxyType({
+        "style": style,
+        "strengths": tuple(dict.fromkeys(strengths)),
+        "cautions": tuple(dict.fromkeys(cautions)),
+    })
+
+
+# All 243 tone profiles, keyed by band code
+TONE_TABLE: Mapping[str, Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+    "".join(bands): _build_tone(bands)
+    for bands in product((BAND_LOW, BAND_MID, BAND_HIGH), repeat=len(TRAIT_CODES))
+})
+
+_DEFAULT_TONE = MappingProxyType({"style": _DEFAULT_STYLE, "strengths": (), "cautions": ()})
+
+
+def tone_band_code(traits: Dict[str, float]) -> str:
+    """
+    5-digit band code of a trait profile (O, C, E, A, N; 0 = low, 1 = mid, 2 = high).
     
-    # Fallback: Ensure at least basic style descriptors
-    if not style:
-        style = ["friendly", "clear"]
+    Profiles with the same code get the same tone, so the code is a cheap
+    profile signature for caching anything derived from the tone.
     
+    Raises:
+        ValueError: If required trait keys are missing
+    """
+    try:
+        return _band(traits["O"]) + _band(traits["C"]) + _band(traits["E"]) + _band(traits["A"]) + _band(traits["N"])
+    except KeyError:
+        missing_traits = [t for t in TRAIT_CODES if t not in traits]
+        raise ValueError(
+            f"Missing required trait keys: {', '.join(missing_traits)}. "
+            f"Expected keys: {', '.join(TRAIT_CODES)}"
+        )
+
+
+def _as_lists(tone: Mapping[str, Tuple[str, ...]]) -> Dict[str, List[str]]:
+    """Fresh list copies of a table entry, so callers can't modify the table"""
     return {
-        "style": style,
-        "strengths": strengths,
-        "cautions": cautions
+        "style": list(tone["style"]),
+        "strengths": list(tone["strengths"]),
+        "cautions": list(tone["cautions"])
     }
 
 
+def generate_tone(traits: Dict[str, float]) -> Dict[str, List[str]]:
+    """
+    Generate communication tone profile based on OCEAN personality traits.
+    
+    Args:
+        traits: Dictionary with OCEAN trait scores (0-1 scale)
+                Expected keys: "O", "C", "E", "A", "N"
+                Example: {"O": 0.72, "C": 0.65, "E": 0.42, "A": 0.71, "N": 0.48}
+    
+    Returns:
+        Dictionary containing:
+        - style: List of writing style adjectives
+        - strengths: List of positive reinforcement messages
+        - cautions: List of emotional sensitivity warnings
+    
+    Raises:
+        ValueError: If required trait keys are missing
+    
+    Example:
+        >>> traits = {"O": 0.72, "C": 0.65, "E": 0.42, "A": 0.71, "N": 0.48}
+        >>> tone = generate_tone(traits)
+        >>> print(tone["style"])
+        ['creative', 'metaphorical', 'structured', 'calm', 'warm']
+    """
+    return _as_lists(TONE_TABLE[tone_band_code(traits)])
+
+
 def generate_tone_safe(traits: Dict[str, float]) -> Dict[str, List[str]]:
     """
     Safe wrapper for generate_tone with fallback defaults.
@@ -133,32 +181,8 @@ def generate_tone_safe(traits: Dict[str, float]) -> Dict[str, List[str]]:
         Tone profile dictionary with guaranteed non-empty lists
     """
     try:
-        tone_profile = generate_tone(traits)
-        
-        # Ensure all lists are non-empty with fallbacks
-        if not tone_profile.get("style"):
-            tone_profile["style"] = ["friendly", "clear"]
-        
-        if not tone_profile.get("strengths"):
-            tone_profile["strengths"] = []
-        
-        if not tone_profile.get("cautions"):
-            tone_profile["cautions"] = []
-        
-        return tone_profile
-        
-    except ValueError:
-        # If traits are invalid, return safe defaults
-        return {
-            "style": ["friendly", "clear"],
-            "strengths": [],
-            "cautions": []
-        }
+        tone = TONE_TABLE[tone_band_code(traits)]
     except Exception:
-        # Any other error, return safe defaults
-        return {
-            "style": ["friendly", "clear"],
-            "strengths": [],
-            "cautions": []
-        }
-
+        # Invalid or missing traits: safe defaults
+        tone = _DEFAULT_TONE
+    return _as_lists(tone)
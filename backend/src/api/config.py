@@ -7,6 +7,7 @@ Loads environment variables and provides configuration settings
 # Handle BOM (Byte Order Mark) that Windows editors sometimes add
 import codecs
 import os
+from pathlib import Path
 
 from dotenv import load_dotenv
 
@@ -69,6 +70,27 @@ class Config:
     # Connection timeout (5 seconds)
     DATABASE_CONNECTION_TIMEOUT: float = float(os.getenv("DATABASE_CONNECTION_TIMEOUT", "5.0"))
 
+    # Runtime state written by the API (explanation cache, job store), kept out of the source tree
+    # Empty = $XDG_STATE_HOME/lifesync (~/.local/state/lifesync)
+    DATA_DIR: str = os.getenv("LIFESYNC_DATA_DIR", "")
+
+    # Explanation cache (SQLite file shared by the workers on a host)
+    EXPLANATION_CACHE_ENABLED: bool = os.getenv("EXPLANATION_CACHE_ENABLED", "true").lower() == "true"
+    # Empty = <DATA_DIR>/cache/explanations.sqlite3
+    EXPLANATION_CACHE_PATH: str = os.getenv("EXPLANATION_CACHE_PATH", "")
+
+    # Lock/result directory for coalescing explanation requests across workers
+    # (empty = coalesce within each worker process only)
+    SINGLE_FLIGHT_LOCK_DIR: str = os.getenv("SINGLE_FLIGHT_LOCK_DIR", "")
+
+    # Background job store (SQLite file shared by the workers on a host)
+    # Empty = <DATA_DIR>/jobs/jobs.sqlite3
+    JOB_STORE_PATH: str = os.getenv("JOB_STORE_PATH", "")
+
+    # Profile vector index snapshot (loaded on first use, written periodically and at shutdown)
+    # Empty = <DATA_DIR>/index/profile_vectors.npz
+    VECTOR_INDEX_PATH: str = os.getenv("VECTOR_INDEX_PATH", "")
+
     # Global Request Timeout (60 seconds)
     REQUEST_TIMEOUT: float = float(os.getenv("REQUEST_TIMEOUT", "60.0"))
 
@@ -152,6 +174,14 @@ class Config:
         return cls.SUPABASE_KEY
     
     
+    @classmethod
+    def get_data_dir(cls) -> Path:
+        """Directory for runtime state files (LIFESYNC_DATA_DIR, default $XDG_STATE_HOME/lifesync)"""
+        if cls.DATA_DIR:
+            return Path(cls.DATA_DIR)
+        state_home = os.getenv("XDG_STATE_HOME") or str(Path.home() / ".local" / "state")
+        return Path(state_home) / "lifesync"
+    
     @classmethod
     def get_gemini_key(cls) -> str:
         """Get Gemini API key"""
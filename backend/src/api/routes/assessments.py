@@ -5,22 +5,51 @@ Handles assessment submission, scoring, and persistence
 Updated to use optimized query methods (Fixes issue #11)
 """
 
+import asyncio
+import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel, Field, field_validator
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from starlette.concurrency import run_in_threadpool
 
-from src.ai.explanation_generator import generate_explanation_with_tone
+from src.ai.explanation_generator import (
+    agenerate_explanation_with_tone,
+    astream_explanation_with_tone,
+    explanation_signature,
+)
+from src.api.config import config
 from src.api.dependencies import get_supabase_client
+from src.api.routes.jobs import SSE_HEADERS, JobResponse, job_response, sse_event
+from src.config.constants import BATCH_SCORING_MAX_ITEMS, SCORING_VERSION, VECTOR_INDEX_DEFAULT_K, VECTOR_INDEX_MAX_K
+from src.db.explanation_cache import get_explanation_cache
 from src.db.quota import quota_tracker
+from src.db.vector_index import SPACES, TRAIT_DIMENSIONS, get_profile_index
+from src.scorer import PackedAnswersError, UnknownScoringVersionError, get_percentiles, score_many, score_packed
+from src.scorer.norms import stored_facet_scores, stored_trait_scores
 from src.supabase_client import SupabaseClient
+from src.utils.job_queue import JobError, QueueFullError, job_queue
+from src.utils.single_flight import SingleFlight, create_flight_store
 from src.utils.validators import validate_assessment_id, sanitize_answers, validate_answers, sanitize_text
 from src.llm.circuit_breaker import CircuitBreaker, with_circuit_breaker, CircuitBreakerOpenException
 
+# Optional: msgpack bodies for POST /v1/assessments/score:packed
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+MSGPACK_CONTENT_TYPES = ("application/msgpack", "application/x-msgpack")
+
 # Initialize Circuit Breaker for LLM calls
 llm_circuit_breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60.0, name="llm_explanation")
 
+# Concurrent generate_explanation calls for one assessment share a single generation
+explanation_flights = SingleFlight("explanations", store=create_flight_store(config.SINGLE_FLIGHT_LOCK_DIR))
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -71,6 +100,108 @@ class AssessmentResponse(BaseModel):
     needs_retake: bool = False
     needs_retake_reason: Optional[str] = None
     traits_with_data: list = []
+    # Population percentiles (0-100) from the precomputed norms, when available
+    percentiles: Optional[Dict[str, Dict[str, Optional[float]]]] = None
+
+class BatchScoreRequest(BaseModel):
+    """Request model for batch scoring"""
+    responses: List[Dict[str, Any]] = Field(..., min_length=1, max_length=BATCH_SCORING_MAX_ITEMS)
+    scoring_version: Optional[str] = Field(None, max_length=32)
+
+class BatchScoreResponse(BaseModel):
+    """Response model for batch scoring"""
+    count: int
+    scoring_version: str
+    results: List[Dict[str, Any]]
+
+@router.post("/v1/assessments/score:batch", response_model=BatchScoreResponse)
+async def score_batch(payload: BatchScoreRequest):
+    """
+    Score many response sets in one request (nothing is persisted).
+
+    Intended for partner integrations and bulk re-imports. Each item uses the
+    same answer format as a single submission; results are returned in order.
+    An optional scoring_version re-scores under an older registered version.
+    """
+    answers_list = []
+    for i, answers in enumerate(payload.responses):
+        sanitized = sanitize_answers(answers)
+        is_valid, error = validate_answers(sanitized)
+        if not is_valid:
+            raise HTTPException(status_code=422, detail=f"responses[{i}]: {error}")
+        answers_list.append(sanitized)
+
+    try:
+        # CPU-bound; keep it off the event loop (large batches fan out to a process pool)
+        results = await run_in_threadpool(score_many, answers_list, scoring_version=payload.scoring_version)
+    except UnknownScoringVersionError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        logger.error(f"Batch scoring failed for {len(answers_list)} response sets: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to score batch")
+
+    return {
+        "count": len(results),
+        "scoring_version": payload.scoring_version or SCORING_VERSION,
+        "results": results
+    }
+
+class PackedScoreRequest(BaseModel):
+    """Request model for packed-answer scoring"""
+    bank_version: str = Field(..., max_length=32)
+    # Base64 text in JSON bodies, raw bytes in msgpack bodies
+    answers: Union[str, bytes] = Field(..., max_length=1024)
+    scoring_version: Optional[str] = Field(None, max_length=32)
+
+@router.post("/v1/assessments/score:packed")
+async def score_packed_answers(request: Request):
+    """
+    Score one response set sent as a packed answer vector (nothing is persisted).
+
+    Body is JSON {"bank_version": "1.0.0", "answers": "<base64>"} or, with
+    Content-Type application/msgpack, the same map with raw bytes. The
+    answers hold one nibble per question in bank order (0 = unanswered), so
+    the full quiz is 90 bytes and needs no per-key parsing or validation.
+    """
+    body = await request.body()
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+
+    if content_type in MSGPACK_CONTENT_TYPES:
+        if not MSGPACK_AVAILABLE:
+            raise HTTPException(status_code=415, detail="msgpack bodies are not supported on this server")
+        try:
+            payload = msgpack.unpackb(body, raw=False)
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid msgpack body")
+    else:
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid JSON body")
+
+    try:
+        packed_request = PackedScoreRequest.model_validate(payload)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+
+    try:
+        result = score_packed(
+            packed_request.answers,
+            packed_request.bank_version,
+            scoring_version=packed_request.scoring_version,
+        )
+    except (PackedAnswersError, UnknownScoringVersionError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        logger.error(f"Packed scoring failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to score answers")
+
+    return {
+        "scoring_version": packed_request.scoring_version or SCORING_VERSION,
+        "bank_version": packed_request.bank_version,
+        **result
+    }
+
 @router.get("/v1/assessments/{assessment_id}", response_model=AssessmentResponse)
 async def get_assessment(assessment_id: str, db: SupabaseClient = Depends(get_supabase_client)):
     """
@@ -139,7 +270,12 @@ async def get_assessment(assessment_id: str, db: SupabaseClient = Depends(get_su
                 "personality_code": f"{assessment.get('mbti_code')}-X" if assessment.get('mbti_code') else "UNKN-X"
             },
             "is_complete": is_complete,
-            "traits_with_data": list(traits.keys()) if traits else []
+            "traits_with_data": list(traits.keys()) if traits else [],
+            "percentiles": get_percentiles(
+                stored_trait_scores(traits),
+                stored_facet_scores(facets),
+                scoring_version=metadata["scoring_version"]
+            )
         }
         
         return response_model
@@ -150,93 +286,214 @@ async def get_assessment(assessment_id: str, db: SupabaseClient = Depends(get_su
         logger.error(f"Error fetching assessment {assessment_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve assessment data")
 
-@router.post("/v1/assessments/{assessment_id}/generate_explanation")
-async def generate_explanation(
-    req: Request, 
-    assessment_id: str, 
-    payload: Optional[ExplanationRequest] = None,
+class SimilarAssessment(BaseModel):
+    assessment_id: str
+    distance: float
+    similarity: float
+
+
+class SimilarAssessmentsResponse(BaseModel):
+    assessment_id: str
+    space: str
+    neighbors: List[SimilarAssessment]
+    index_size: int
+
+
+@router.get("/v1/assessments/{assessment_id}/similar", response_model=SimilarAssessmentsResponse)
+async def get_similar_assessments(
+    assessment_id: str,
+    k: int = VECTOR_INDEX_DEFAULT_K,
+    space: str = "full",
     db: SupabaseClient = Depends(get_supabase_client)
 ):
     """
-    Generate LLM explanation for an assessment.
-    Rate limit: 10 generations per day and 2 per hour per IP address.
+    Nearest stored profiles to an assessment (in-process vector index).
+
+    Args:
+        assessment_id: Assessment to compare against
+        k: Number of neighbours (1-VECTOR_INDEX_MAX_K)
+        space: "full" (traits + facets) or "traits" (OCEAN only)
+
+    Returns:
+        Neighbours nearest first; distance is Euclidean on the 0-1 scale and
+        similarity = 1 - distance / max possible distance
     """
-    # Validate assessment_id
     is_valid, error = validate_assessment_id(assessment_id)
     if not is_valid:
         raise HTTPException(status_code=422, detail=error)
-
-    # Apply rate limits (both day and hour limits)
-    limiter = get_limiter(req)
-    await limiter.check_for_limits(req, "10/day")
-    await limiter.check_for_limits(req, "2/hour")
-
-    # Check quota tracker (using IP address as identifier)
-    user_identifier = req.client.host if req.client else "unknown"
-    has_quota, error_msg = quota_tracker.check_quota(user_identifier)
-    if not has_quota:
-        raise HTTPException(status_code=429, detail=error_msg)
+    if space not in SPACES:
+        raise HTTPException(status_code=422, detail=f"space must be one of {list(SPACES)}")
+    if not 1 <= k <= VECTOR_INDEX_MAX_K:
+        raise HTTPException(status_code=422, detail=f"k must be between 1 and {VECTOR_INDEX_MAX_K}")
 
     try:
-        # Use get_assessment_full to fetch all fields needed for explanation generation
-        assessment = db.get_assessment_full(assessment_id)
+        index = get_profile_index()
+        vector = index.get_vector(assessment_id)
+        if vector is None:
+            # Not indexed (e.g. scored before the last snapshot): use the stored scores
+            assessment = db.get_assessment(assessment_id)
+            traits = (assessment or {}).get("trait_scores") or {}
+            if not traits:
+                raise HTTPException(status_code=404, detail=f"Assessment {assessment_id} not found")
+            vector = index.vector(stored_trait_scores(traits), stored_facet_scores(assessment.get("facet_scores")))
 
-        if not assessment:
-            raise HTTPException(status_code=404, detail=f"Assessment {assessment_id} not found")
-        trait_scores = assessment.get("trait_scores", {}) or {}
-        facets = assessment.get("facet_scores", {}) or {}
-        confidence_val = assessment.get("confidence") or 0.0
-        mbti_code = assessment.get("mbti_code") or "UNKN"
-
-        # 🟢 Map short trait keys (0-100) to full names (0-1) for AI generator
-        def map_trait(val):
-            if val is None: return 0.0
-            return float(val) / 100.0 if val > 1.0 else float(val)
-
-        traits = {
-            "Openness": map_trait(trait_scores.get("O") or trait_scores.get("Openness")),
-            "Conscientiousness": map_trait(trait_scores.get("C") or trait_scores.get("Conscientiousness")),
-            "Extraversion": map_trait(trait_scores.get("E") or trait_scores.get("Extraversion")),
-            "Agreeableness": map_trait(trait_scores.get("A") or trait_scores.get("Agreeableness")),
-            "Neuroticism": map_trait(trait_scores.get("N") or trait_scores.get("Neuroticism"))
+        neighbors = index.query(vector, k=k, space=space, exclude=assessment_id)
+        max_distance = (len(vector) if space == "full" else len(TRAIT_DIMENSIONS)) ** 0.5
+        return {
+            "assessment_id": assessment_id,
+            "space": space,
+            "neighbors": [
+                {"assessment_id": other_id, "distance": distance, "similarity": round(1.0 - distance / max_distance, 4)}
+                for other_id, distance in neighbors
+            ],
+            "index_size": len(index),
         }
-        
-        # Prepare context for generator
-        confidence_dict = {"global": confidence_val}
-        dominant_dict = {
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error finding assessments similar to {assessment_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to find similar assessments")
+
+def _explanation_context(db: SupabaseClient, assessment_id: str) -> Dict[str, Any]:
+    """Generator inputs for a stored assessment (404 if it doesn't exist)"""
+    # Use get_assessment_full to fetch all fields needed for explanation generation
+    assessment = db.get_assessment_full(assessment_id)
+
+    if not assessment:
+        raise HTTPException(status_code=404, detail=f"Assessment {assessment_id} not found")
+    trait_scores = assessment.get("trait_scores", {}) or {}
+    facets = assessment.get("facet_scores", {}) or {}
+    confidence_val = assessment.get("confidence") or 0.0
+    mbti_code = assessment.get("mbti_code") or "UNKN"
+
+    # 🟢 Map short trait keys (0-100) to full names (0-1) for AI generator
+    def map_trait(val):
+        if val is None: return 0.0
+        return float(val) / 100.0 if val > 1.0 else float(val)
+
+    traits = {
+        "Openness": map_trait(trait_scores.get("O") or trait_scores.get("Openness")),
+        "Conscientiousness": map_trait(trait_scores.get("C") or trait_scores.get("Conscientiousness")),
+        "Extraversion": map_trait(trait_scores.get("E") or trait_scores.get("Extraversion")),
+        "Agreeableness": map_trait(trait_scores.get("A") or trait_scores.get("Agreeableness")),
+        "Neuroticism": map_trait(trait_scores.get("N") or trait_scores.get("Neuroticism"))
+    }
+
+    # Prepare context for generator
+    return {
+        "traits": traits,
+        "facets": facets,
+        "confidence": {"global": confidence_val},
+        "dominant": {
             "mbti_proxy": mbti_code,
             "personality_code": assessment.get("personality_code") or f"{mbti_code}-X"
-        }
-        
-        provider = payload.provider if payload else None
-        
-        logger.info(f"Generating AI explanation for assessment {assessment_id} (Provider: {provider or 'default'})")
-        
-        
-        # Call generator with circuit breaker protection
+        },
+    }
+
+async def _resolve_explanation(
+    db: SupabaseClient,
+    assessment_id: str,
+    context: Dict[str, Any],
+    provider: Optional[str],
+    user_identifier: str
+) -> Dict[str, Any]:
+    """Cached or freshly generated explanation, saved to the assessment"""
+    traits, facets, confidence_dict = context["traits"], context["facets"], context["confidence"]
+
+    # Profiles sharing a signature reuse a cached explanation (also while the LLM is unavailable)
+    explanation_cache = get_explanation_cache()
+    cache_key = explanation_signature(traits, facets, confidence_dict, provider=provider)
+    explanation = explanation_cache.get(cache_key) if explanation_cache is not None else None
+    cache_hit = explanation is not None
+
+    if cache_hit:
+        logger.info(f"Explanation cache hit for assessment {assessment_id}")
+        explanation["cached"] = True
+    else:
+        # Call generator with circuit breaker protection; awaited, so the
+        # request timeout middleware cancels the in-flight LLM call
         @with_circuit_breaker(llm_circuit_breaker)
         async def protected_generate():
-            return generate_explanation_with_tone(
+            return await agenerate_explanation_with_tone(
                 traits=traits,
                 facets=facets,
                 confidence=confidence_dict,
-                dominant=dominant_dict,
+                dominant=context["dominant"],
                 provider=provider
             )
-        
+
         try:
             explanation = await protected_generate()
         except CircuitBreakerOpenException as e:
             logger.warning(f"Circuit breaker open for explanation: {e}")
             raise HTTPException(status_code=503, detail="AI service temporarily unavailable. Please try again later.")
-        
-        # Save generated explanation to DB
-        db.save_explanation(assessment_id, explanation)
 
-        # Record successful usage
+        # Static fallbacks are not worth keeping; the next request should retry the LLM
+        if explanation_cache is not None and not explanation.get("is_fallback") and "error" not in explanation:
+            explanation_cache.put(cache_key, explanation)
+
+    # Save generated explanation to DB
+    db.save_explanation(assessment_id, explanation)
+
+    # Record usage (cache hits don't spend LLM quota)
+    if not cache_hit:
         quota_tracker.record_usage(user_identifier)
+    return explanation
 
-        return explanation
+async def _coalesced_explanation(
+    db: SupabaseClient,
+    assessment_id: str,
+    context: Dict[str, Any],
+    provider: Optional[str],
+    user_identifier: str
+) -> Dict[str, Any]:
+    # Duplicate requests (double-clicks, retries, several tabs, queued jobs) join
+    # the one in flight: one LLM call, one saved row, one unit of quota
+    return await explanation_flights.run(
+        f"{assessment_id}:{provider or 'default'}",
+        lambda: _resolve_explanation(db, assessment_id, context, provider, user_identifier)
+    )
+
+async def _check_explanation_limits(req: Request) -> str:
+    """Apply the explanation rate limits and quota; returns the quota identifier"""
+    # Apply rate limits (both day and hour limits)
+    limiter = get_limiter(req)
+    await limiter.check_for_limits(req, "10/day")
+    await limiter.check_for_limits(req, "2/hour")
+
+    # Check quota tracker (using IP address as identifier)
+    user_identifier = req.client.host if req.client else "unknown"
+    has_quota, error_msg = quota_tracker.check_quota(user_identifier)
+    if not has_quota:
+        raise HTTPException(status_code=429, detail=error_msg)
+    return user_identifier
+
+@router.post("/v1/assessments/{assessment_id}/generate_explanation")
+async def generate_explanation(
+    req: Request, 
+    assessment_id: str, 
+    payload: Optional[ExplanationRequest] = None,
+    db: SupabaseClient = Depends(get_supabase_client)
+):
+    """
+    Generate LLM explanation for an assessment.
+    Rate limit: 10 generations per day and 2 per hour per IP address.
+    """
+    # Validate assessment_id
+    is_valid, error = validate_assessment_id(assessment_id)
+    if not is_valid:
+        raise HTTPException(status_code=422, detail=error)
+
+    user_identifier = await _check_explanation_limits(req)
+
+    try:
+        context = _explanation_context(db, assessment_id)
+        provider = payload.provider if payload else None
+        
+        logger.info(f"Generating AI explanation for assessment {assessment_id} (Provider: {provider or 'default'})")
+        
+        return await _coalesced_explanation(db, assessment_id, context, provider, user_identifier)
 
     except HTTPException:
         raise
@@ -244,6 +501,203 @@ async def generate_explanation(
         logger.error(f"Error generating explanation for {assessment_id}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to generate AI insights: {str(e)}")
 
+# Top-level fields of the LLM's explanation JSON, in prompt order (replayed from the cache when streaming)
+STREAMED_FIELDS = ("persona_title", "vibe_summary", "strengths", "growth_edges", "how_you_show_up", "tagline")
+
+@router.post("/v1/assessments/{assessment_id}/generate_explanation:stream")
+async def stream_explanation(
+    req: Request,
+    assessment_id: str,
+    payload: Optional[ExplanationRequest] = None,
+    db: SupabaseClient = Depends(get_supabase_client)
+):
+    """
+    Generate an LLM explanation and stream it as Server-Sent Events.
+
+    Sends a "field" event ({"field": name, "value": value}) as each field of
+    the explanation (persona_title, vibe_summary, strengths, ...) is complete,
+    then "done" with the full explanation once it is saved, or "error".
+    Same rate limits, quota and explanation cache as generate_explanation,
+    and the same single-flight: a duplicate request waits for the running
+    generation and replays the fields of its result.
+    """
+    is_valid, error = validate_assessment_id(assessment_id)
+    if not is_valid:
+        raise HTTPException(status_code=422, detail=error)
+
+    user_identifier = await _check_explanation_limits(req)
+
+    try:
+        context = _explanation_context(db, assessment_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error loading assessment {assessment_id} for streaming: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to generate AI insights: {str(e)}")
+
+    provider = payload.provider if payload else None
+    traits, facets, confidence_dict = context["traits"], context["facets"], context["confidence"]
+
+    explanation_cache = get_explanation_cache()
+    cache_key = explanation_signature(traits, facets, confidence_dict, provider=provider)
+    cached = explanation_cache.get(cache_key) if explanation_cache is not None else None
+
+    if cached is None and not llm_circuit_breaker.allow_request():
+        raise HTTPException(status_code=503, detail="AI service temporarily unavailable. Please try again later.")
+
+    logger.info(f"Streaming AI explanation for assessment {assessment_id} (Provider: {provider or 'default'})")
+
+    async def events():
+        if cached is not None:
+            logger.info(f"Explanation cache hit for assessment {assessment_id}")
+            explanation = cached
+            explanation["cached"] = True
+            for name in STREAMED_FIELDS:
+                if name in explanation:
+                    yield sse_event("field", {"field": name, "value": explanation[name]})
+            try:
+                db.save_explanation(assessment_id, explanation)
+            except Exception as e:
+                logger.error(f"Error saving streamed explanation for {assessment_id}: {e}", exc_info=True)
+                yield sse_event("error", {"detail": "Failed to save AI insights"})
+                return
+            yield sse_event("done", explanation)
+            return
+
+        # Fields completed by the generation this request runs; a request that
+        # joins another one's generation replays the fields of its result
+        fields: asyncio.Queue = asyncio.Queue()
+        streaming = False
+
+        async def generate():
+            nonlocal streaming
+            streaming = True
+            explanation = None
+            try:
+                async for kind, data in astream_explanation_with_tone(
+                    traits=traits,
+                    facets=facets,
+                    confidence=confidence_dict,
+                    dominant=context["dominant"],
+                    provider=provider
+                ):
+                    if kind == "field":
+                        fields.put_nowait(data)
+                    else:
+                        explanation = data
+                llm_circuit_breaker.record_success()
+            except Exception:
+                llm_circuit_breaker.record_failure()
+                raise
+
+            # Static fallbacks are not worth keeping; the next request should retry the LLM
+            if explanation_cache is not None and not explanation.get("is_fallback") and "error" not in explanation:
+                explanation_cache.put(cache_key, explanation)
+
+            try:
+                db.save_explanation(assessment_id, explanation)
+            except Exception as e:
+                logger.error(f"Error saving streamed explanation for {assessment_id}: {e}", exc_info=True)
+                raise HTTPException(status_code=500, detail="Failed to save AI insights")
+
+            quota_tracker.record_usage(user_identifier)
+            return explanation
+
+        # Same key as generate_explanation: duplicate requests share one LLM call and one saved row
+        flight = asyncio.ensure_future(
+            explanation_flights.run(f"{assessment_id}:{provider or 'default'}", generate)
+        )
+        try:
+            while True:
+                next_field = asyncio.ensure_future(fields.get())
+                await asyncio.wait({next_field, flight}, return_when=asyncio.FIRST_COMPLETED)
+                if not next_field.done():
+                    next_field.cancel()
+                    break
+                name, value = next_field.result()
+                yield sse_event("field", {"field": name, "value": value})
+            while not fields.empty():
+                name, value = fields.get_nowait()
+                yield sse_event("field", {"field": name, "value": value})
+            explanation = flight.result()
+        except Exception as e:
+            logger.error(f"Error streaming explanation for {assessment_id}: {e}", exc_info=True)
+            detail = e.detail if isinstance(e, HTTPException) else "Failed to generate AI insights"
+            yield sse_event("error", {"detail": detail})
+            return
+        finally:
+            # Client gone: leave the flight (it is cancelled once no caller is left)
+            flight.cancel()
+
+        if not streaming:
+            for name in STREAMED_FIELDS:
+                if name in explanation:
+                    yield sse_event("field", {"field": name, "value": explanation[name]})
+        yield sse_event("done", explanation)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@router.post("/v1/assessments/{assessment_id}/generate_explanation:async", status_code=202, response_model=JobResponse)
+async def enqueue_explanation(
+    req: Request,
+    assessment_id: str,
+    payload: Optional[ExplanationRequest] = None,
+    db: SupabaseClient = Depends(get_supabase_client)
+):
+    """
+    Queue LLM explanation generation and return 202 with a job at once.
+
+    Poll GET /v1/jobs/{job_id} or follow GET /v1/jobs/{job_id}/events; the
+    finished job's result is the explanation, which is also saved to the
+    assessment. Same rate limits and quota as generate_explanation.
+    """
+    is_valid, error = validate_assessment_id(assessment_id)
+    if not is_valid:
+        raise HTTPException(status_code=422, detail=error)
+
+    user_identifier = await _check_explanation_limits(req)
+
+    try:
+        if not db.get_assessment(assessment_id):
+            raise HTTPException(status_code=404, detail=f"Assessment {assessment_id} not found")
+
+        job = job_queue.submit("explanation", {
+            "assessment_id": assessment_id,
+            "provider": payload.provider if payload else None,
+            "user_identifier": user_identifier,
+        })
+    except HTTPException:
+        raise
+    except QueueFullError as e:
+        logger.warning(f"Explanation queue full, rejecting {assessment_id}: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Too many explanations in progress. Please try again later.",
+            headers={"Retry-After": "30"}
+        )
+    except Exception as e:
+        logger.error(f"Error queueing explanation for {assessment_id}: {e}", exc_info=True)
+        raise HTTPException(status_code=503, detail="Background explanation generation is unavailable")
+
+    logger.info(f"Queued explanation job {job['id']} for assessment {assessment_id}")
+    response = job_response(job)
+    return JSONResponse(status_code=202, content=response, headers={"Location": response["status_url"]})
+
+async def run_explanation_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Job handler for queued explanations (see enqueue_explanation)"""
+    assessment_id = payload["assessment_id"]
+    try:
+        db = get_supabase_client()
+        context = _explanation_context(db, assessment_id)
+        return await _coalesced_explanation(
+            db, assessment_id, context, payload.get("provider"), payload["user_identifier"]
+        )
+    except HTTPException as e:
+        raise JobError(e.detail)
+
+# Jobs for one provider share its concurrency limit
+job_queue.register("explanation", run_explanation_job, concurrency_key=lambda payload: payload.get("provider") or "default")
+
 @router.get("/v1/assessments/{user_id}/history")
 async def get_assessment_history(
     user_id: str,
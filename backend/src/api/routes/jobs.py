@@ -0,0 +1,110 @@
+"""
+LifeSync Personality Engine - Jobs API Route
+Status and completion events for background jobs (explanation generation)
+"""
+
+import json
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from src.config.constants import JOB_EVENTS_KEEPALIVE, JOB_EVENTS_POLL_INTERVAL
+from src.db.job_store import FINISHED_STATUSES, get_job_store
+from src.utils.job_queue import job_queue
+from src.utils.validators import validate_user_id
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+# Server-Sent Events responses must reach the client unbuffered
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def sse_event(event: str, data: Any) -> str:
+    """One Server-Sent Events message with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class JobResponse(BaseModel):
+    """Response model for a background job"""
+    job_id: str
+    kind: str
+    status: str
+    created_at: float
+    updated_at: float
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    status_url: str
+    events_url: str
+
+
+def job_response(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Public view of a stored job (payload is internal)"""
+    return {
+        "job_id": job["id"],
+        "kind": job["kind"],
+        "status": job["status"],
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"],
+        "result": job["result"],
+        "error": job["error"],
+        "status_url": f"/v1/jobs/{job['id']}",
+        "events_url": f"/v1/jobs/{job['id']}/events",
+    }
+
+
+def _get_job(job_id: str) -> Dict[str, Any]:
+    # Job ids are UUIDs, like user and assessment ids
+    is_valid, _ = validate_user_id(job_id)
+    job = get_job_store().get(job_id) if is_valid else None
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.get("/v1/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """
+    Status of a background job.
+
+    status is queued, running, succeeded (result holds the output) or
+    failed (error holds the reason).
+    """
+    return job_response(_get_job(job_id))
+
+
+@router.get("/v1/jobs/{job_id}/events")
+async def get_job_events(job_id: str, request: Request):
+    """
+    Server-Sent Events stream of a job's status changes.
+
+    Sends the current status at once, then one event per change (event name
+    = status, data = the job as returned by GET /v1/jobs/{id}), and closes
+    after succeeded or failed. Keep-alive comments are sent while waiting.
+    """
+    job = _get_job(job_id)
+
+    async def events():
+        current, status, last_write = job, None, 0.0
+        while current is not None:
+            if current["status"] != status:
+                status = current["status"]
+                yield sse_event(status, job_response(current))
+                last_write = time.monotonic()
+                if status in FINISHED_STATUSES:
+                    return
+            elif time.monotonic() - last_write >= JOB_EVENTS_KEEPALIVE:
+                yield ": keep-alive\n\n"
+                last_write = time.monotonic()
+
+            if await request.is_disconnected():
+                return
+            # Woken by this process's workers; the poll covers jobs run by other workers
+            await job_queue.wait(job_id, JOB_EVENTS_POLL_INTERVAL)
+            current = get_job_store().get(job_id)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
@@ -11,6 +11,10 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from src.scorer import get_balanced_question_ids, start_adaptive_quiz
+from src.scorer.bank_artifact import ArtifactError, default_artifact_path, load_artifact
+from src.utils.validators import sanitize_answers
+
 logger = logging.getLogger(__name__)
 
 # Initialize router
@@ -36,6 +40,21 @@ class QuestionsListResponse(BaseModel):
     questions: List[QuestionResponse] = Field(..., description="List of questions")
 
 
+class NextQuestionRequest(BaseModel):
+    """Request model for the adaptive quiz (answers so far; the server keeps no state)"""
+    answers: Dict[str, int] = Field(default_factory=dict, max_length=180)
+    confidence_threshold: Optional[float] = Field(None, gt=0, lt=1)
+    max_questions: Optional[int] = Field(None, ge=1, le=180)
+
+
+class NextQuestionResponse(BaseModel):
+    """Response model for the adaptive quiz"""
+    done: bool = Field(..., description="True when the quiz can stop (submit the answers)")
+    question: Optional[QuestionResponse] = Field(None, description="Next question to ask")
+    answered: int
+    precision: Dict[str, float] = Field(..., description="Per-trait confidence (0-1) driving the stopping rule")
+
+
 def _load_questions() -> List[Dict[str, Any]]:
     """
     Load questions from JSON file and cache them.
@@ -56,6 +75,18 @@ def _load_questions() -> List[Dict[str, Any]]:
     backend_dir = Path(__file__).parent.parent.parent.parent
     questions_file = backend_dir / "data" / "question_bank" / "lifesync_180_questions.json"
     
+    # Prefer the precompiled artifact (no JSON parse) when it is present and valid
+    artifact_file = default_artifact_path(questions_file)
+    if artifact_file.exists():
+        try:
+            questions = load_artifact(artifact_file, questions_file).questions()
+            _questions_cache = questions
+            _questions_loaded = True
+            logger.info(f"Loaded {len(questions)} questions from {artifact_file}")
+            return questions
+        except ArtifactError as e:
+            logger.warning(f"Ignoring question bank artifact, falling back to JSON: {e}")
+    
     if not questions_file.exists():
         error_msg = f"Questions file not found: {questions_file}"
         logger.error(error_msg)
@@ -91,7 +122,8 @@ def _load_questions() -> List[Dict[str, Any]]:
 
 def _get_balanced_question_ids(limit: int = 30) -> List[str]:
     """
-    Get balanced question IDs from smart_quiz_30.json.
+    Get balanced question IDs: smart_quiz_30.json for 30, otherwise a
+    trait- and facet-balanced order from the adaptive selector.
     This ensures all 5 traits are covered evenly.
     """
     backend_dir = Path(__file__).parent.parent.parent.parent
@@ -103,16 +135,21 @@ def _get_balanced_question_ids(limit: int = 30) -> List[str]:
                 smart_quiz = json.load(f)
             question_ids = smart_quiz.get("question_ids", [])
             
-            # Strict check: if we want 30, and we have 30, return them ALL.
-            # If we have more, slice. If we have fewer, log warning.
-            if len(question_ids) > 0:
+            # The curated list is facet-ordered, so only use it whole (a prefix is unbalanced)
+            if len(question_ids) == limit:
                 logger.info(f"Loaded {len(question_ids)} IDs from smart_quiz_30.json")
-                return question_ids[:limit]
+                return question_ids
         except Exception as e:
             logger.warning(f"Failed to load smart_quiz_30.json: {e}")
     
+    # Other sizes: the adaptive selector's cold-start order (traits take turns, facets rotate)
+    try:
+        return get_balanced_question_ids(limit)
+    except Exception as e:
+        logger.warning(f"Failed to build balanced question order: {e}")
+    
     # Fallback: return first N question IDs (not balanced, but works)
-    logger.warning("Smart quiz file not found or failed to load. Falling back to default order.")
+    logger.warning("Balanced question order unavailable. Falling back to default order.")
     all_questions = _load_questions()
     return [q.get('id', '') for q in all_questions[:limit] if q.get('id')]
 
@@ -205,6 +242,43 @@ async def get_questions(limit: Optional[int] = Query(None, description="Limit nu
         )
 
 
+@router.post("/v1/questions/next", response_model=NextQuestionResponse)
+async def next_adaptive_question(payload: NextQuestionRequest):
+    """
+    Adaptive quiz: next question for the answers given so far.
+
+    Targets the least-certain trait and stops once every trait is precise
+    enough, so most respondents finish well short of the full bank.
+    """
+    try:
+        quiz = start_adaptive_quiz(
+            sanitize_answers(payload.answers),
+            confidence_threshold=payload.confidence_threshold,
+            max_questions=payload.max_questions,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    q_id = quiz.next_question()
+    question = None
+    if q_id is not None:
+        q = quiz.scorer.questions[q_id]
+        question = QuestionResponse(
+            id=q_id,
+            text=q.get('text', ''),
+            trait=q.get('trait', ''),
+            facet=q.get('facet', ''),
+            reverse=q.get('reverse', False)
+        )
+
+    return NextQuestionResponse(
+        done=q_id is None,
+        question=question,
+        answered=len(quiz),
+        precision=quiz.trait_confidence()
+    )
+
+
 # Pre-load questions at module import time (startup) for instant responses
 def _preload_questions():
     """Pre-load questions at startup to avoid first-request delay"""
@@ -63,11 +63,19 @@ logging.basicConfig(
 )
 
 from ..db.connection_manager import ConnectionManager
+from ..db.explanation_cache import get_explanation_cache_stats
+from ..db.job_store import get_job_store
+from ..db.vector_index import get_profile_index, snapshot_profile_index, snapshot_profile_index_periodically
+from ..llm.provider_registry import get_hedging_stats, get_provider_registry_stats
+from ..llm.templates import get_prompt_cache_stats
+from ..scorer.create_scorer_wrapper import get_memo_stats, get_registry_stats, shutdown_scoring_pool
 from ..supabase_client import create_supabase_client
+from ..utils.job_queue import job_queue
 from ..utils.metrics import metrics_collector
 from .middleware.logging_middleware import LoggingMiddleware
 from .routes import assessments as assessments_router
 from .routes import auth as auth_router
+from .routes import jobs as jobs_router
 from .routes import profiles as profiles_router
 from .routes import questions as questions_router
 
@@ -99,18 +107,36 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize connection pool: {e}")
 
+    try:
+        # Background explanation jobs (resumes jobs queued before a restart)
+        await job_queue.start(get_job_store())
+    except Exception as e:
+        logger.error(f"Failed to start job queue: {e}")
+
+    # Profile vector index updates since the last snapshot survive a crash up to this interval
+    index_snapshots = asyncio.ensure_future(snapshot_profile_index_periodically())
+
     logger.info(f"Server started on {config.API_HOST}:{config.API_PORT}")
     
     yield
     
     # --- Shutdown ---
     logger.info("LifeSync Personality Engine shutting down...")
+    await job_queue.stop()
+    index_snapshots.cancel()
+    try:
+        path = snapshot_profile_index()
+        if path is not None:
+            logger.info(f"Profile vector index saved to {path}")
+    except Exception as e:
+        logger.error(f"Failed to save profile vector index: {e}")
     try:
         manager = ConnectionManager()
         manager.close()
         logger.info("Database connection pool closed successfully")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
+    shutdown_scoring_pool()
     logger.info("Shutdown complete")
 
 # Initialize FastAPI app with lifespan
@@ -207,18 +233,36 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize connection pool: {e}")
 
+    try:
+        # Background explanation jobs (resumes jobs queued before a restart)
+        await job_queue.start(get_job_store())
+    except Exception as e:
+        logger.error(f"Failed to start job queue: {e}")
+
+    # Profile vector index updates since the last snapshot survive a crash up to this interval
+    index_snapshots = asyncio.ensure_future(snapshot_profile_index_periodically())
+
     logger.info(f"Server started on {config.API_HOST}:{config.API_PORT}")
     
     yield
     
     # --- Shutdown ---
     logger.info("LifeSync Personality Engine shutting down...")
+    await job_queue.stop()
+    index_snapshots.cancel()
+    try:
+        path = snapshot_profile_index()
+        if path is not None:
+            logger.info(f"Profile vector index saved to {path}")
+    except Exception as e:
+        logger.error(f"Failed to save profile vector index: {e}")
     try:
         manager = ConnectionManager()
         manager.close()
         logger.info("Database connection pool closed successfully")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
+    shutdown_scoring_pool()
     logger.info("Shutdown complete")
 
 
@@ -226,6 +270,7 @@ async def lifespan(app: FastAPI):
 app.include_router(questions_router.router, tags=["questions"])
 app.include_router(assessments_router.router, tags=["assessments"])
 app.include_router(profiles_router.router, tags=["profiles"])
+app.include_router(jobs_router.router, tags=["jobs"])
 app.include_router(auth_router.router, prefix="/v1/auth", tags=["auth"])
  # Included assessments router
 
@@ -258,6 +303,15 @@ def get_metrics():
     """
     metrics = metrics_collector.get_metrics()
     metrics["cache"] = get_cache_stats()
+    metrics["cache"]["scoring_memo"] = get_memo_stats()
+    metrics["cache"]["scoring_registry"] = get_registry_stats()
+    metrics["cache"]["vector_index"] = get_profile_index().stats()
+    metrics["cache"]["prompt_templates"] = get_prompt_cache_stats()
+    metrics["cache"]["explanations"] = get_explanation_cache_stats()
+    metrics["cache"]["llm_providers"] = get_provider_registry_stats()
+    metrics["single_flight"] = assessments_router.explanation_flights.stats()
+    metrics["llm_hedging"] = get_hedging_stats()
+    metrics["jobs"] = job_queue.stats()
     metrics["database_initialized"] = ConnectionManager().is_initialized()
     return metrics
 
@@ -298,7 +352,15 @@ def root():
         "version": "1.0.0",
         "endpoints": {
             "POST /v1/assessments": "Create and score a personality assessment",
+            "POST /v1/assessments/score:batch": "Score many response sets in one request",
+            "POST /v1/assessments/score:packed": "Score a packed (nibble-encoded) response set",
             "POST /v1/assessments/{id}/generate_explanation": "Generate LLM explanation for an assessment",
+            "POST /v1/assessments/{id}/generate_explanation:stream": "Stream an LLM explanation as Server-Sent Events",
+            "POST /v1/assessments/{id}/generate_explanation:async": "Queue explanation generation (202 + job)",
+            "GET /v1/jobs/{id}": "Background job status and result",
+            "GET /v1/jobs/{id}/events": "Server-Sent Events stream of a job's status",
+            "GET /v1/assessments/{id}/similar": "Nearest stored profiles to an assessment",
+            "POST /v1/questions/next": "Next question for an adaptive quiz",
             "GET /health": "Health check"
         }
     }
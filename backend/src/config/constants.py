@@ -5,3 +5,101 @@ Configuration constants for LifeSync Backend
 # SCORING VERSION STRICT COMPATIBILITY
 # Bump only on breaking changes to scoring logic or schema
 SCORING_VERSION = "v1"
+
+# Scoring versions served side by side: version -> question bank file in data/question_bank/
+# Older versions stay registered so stored assessments can be re-scored as they were
+SCORING_VERSIONS = {
+    "v1": "lifesync_180_questions.json",
+}
+
+# Batch scoring limits
+# Maximum response sets accepted by POST /v1/assessments/score:batch
+BATCH_SCORING_MAX_ITEMS = 1000
+# Batches at least this large are fanned out to a process pool
+BATCH_SCORING_POOL_THRESHOLD = 500
+# Response sets per process pool task
+BATCH_SCORING_CHUNK_SIZE = 250
+
+# Bulk re-scoring (scripts/rescore_assessments.py)
+# Rows fetched per keyset page; each page is scored by one worker and written in one batch
+RESCORE_PAGE_SIZE = 500
+# Pages in flight per worker; bounds memory regardless of table size
+RESCORE_PAGES_PER_WORKER = 2
+# Seconds between throughput log lines
+RESCORE_PROGRESS_INTERVAL = 10.0
+
+# Adaptive quiz (POST /v1/questions/next)
+# Stop once every trait's precision-based confidence reaches this (1 - SE / prior SD)
+CAT_CONFIDENCE_THRESHOLD = 0.75
+# Never ask more than this many questions adaptively
+CAT_MAX_QUESTIONS = 60
+
+# Population norms (data/norms/lifesync_norms.npz, built by scripts/build_norms.py)
+# Percentiles are only reported for dimensions with at least this many observations
+NORMS_MIN_POPULATION = 100
+
+# Scoring result memo
+# Distinct response sets kept by the shared scorer's LRU (0 disables memoization)
+SCORING_MEMO_SIZE = 1024
+
+# Profile vector index (GET /v1/assessments/{id}/similar)
+# Rows scored per block in a query; bounds temporary memory at ~block * 4 bytes
+VECTOR_INDEX_BLOCK_ROWS = 65536
+# Default and maximum neighbours returned per query
+VECTOR_INDEX_DEFAULT_K = 10
+VECTOR_INDEX_MAX_K = 100
+# Seconds between snapshots of the process-wide index while the API runs (written only if
+# it changed; also written at shutdown)
+VECTOR_INDEX_SNAPSHOT_INTERVAL = 300.0
+
+# Compiled LLM prompt templates
+# Rendered persona and tone fragments kept per LRU
+PROMPT_FRAGMENT_CACHE_SIZE = 512
+
+# Explanation cache (EXPLANATION_CACHE_PATH, default <LIFESYNC_DATA_DIR>/cache/explanations.sqlite3)
+# Seconds a cached explanation stays valid
+EXPLANATION_CACHE_TTL = 30 * 24 * 3600
+# Entries kept before least-recently-used ones are evicted
+EXPLANATION_CACHE_MAX_ENTRIES = 50000
+# Trait and facet scores are rounded to this step (0-1 scale) in cache signatures
+EXPLANATION_SIGNATURE_STEP = 0.05
+
+# Single-flight explanation generation (concurrent requests per assessment share one LLM call)
+# Seconds a finished result is served to other workers (cross-worker mode only)
+SINGLE_FLIGHT_RESULT_TTL = 30.0
+# Seconds between lock attempts while another worker is generating
+SINGLE_FLIGHT_POLL_INTERVAL = 0.2
+
+# Background explanation jobs (POST /v1/assessments/{id}/generate_explanation:async)
+# Worker tasks per API process
+JOB_QUEUE_WORKERS = 8
+# Jobs waiting per process before new submissions get 503
+JOB_QUEUE_MAX_PENDING = 500
+# Jobs for the same LLM provider running at once per process
+JOB_PROVIDER_CONCURRENCY = 4
+# Seconds finished jobs stay readable via GET /v1/jobs/{id}
+JOB_RETENTION = 24 * 3600
+# Seconds without an update after which a running job is resumed on restart
+JOB_STALE_AFTER = 600.0
+# Seconds between updates of a running job's updated_at (well under JOB_STALE_AFTER)
+JOB_HEARTBEAT_INTERVAL = 60.0
+# Minimum seconds between prunes of expired finished jobs while the API runs
+JOB_PRUNE_INTERVAL = 300.0
+# Seconds between status checks on GET /v1/jobs/{id}/events (jobs run by other workers)
+JOB_EVENTS_POLL_INTERVAL = 1.0
+# Seconds between keep-alive comments on GET /v1/jobs/{id}/events
+JOB_EVENTS_KEEPALIVE = 15.0
+
+# Hedged Gemini requests (GEMINI_HEDGING_ENABLED): the alternate model is fired when the
+# primary is slower than GEMINI_HEDGE_PERCENTILE of its recent latencies
+# Primary latencies kept per provider
+HEDGE_LATENCY_WINDOW = 200
+# Latencies needed before the percentile is used
+HEDGE_MIN_SAMPLES = 20
+# Seconds before hedging until enough latencies are known
+HEDGE_DEFAULT_DELAY = 5.0
+# Hedge delays are never shorter than this (seconds)
+HEDGE_MIN_DELAY = 0.25
+# When the percentile falls on a primary cancelled by a hedge (its latency is only known to
+# exceed the elapsed time), wait this many times that elapsed time instead
+HEDGE_CENSORED_BACKOFF = 2.0
@@ -3,6 +3,7 @@ LifeSync Personality Engine - LLM Provider Configuration
 """
 
 import os
+from pathlib import Path
 from typing import Literal
 
 from dotenv import load_dotenv
@@ -18,10 +19,17 @@ DEFAULT_PROVIDER: LLMProvider = "gemini"
 
 # API Keys
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
+# Optional file holding the key (e.g. a mounted secret); re-read on every call
+GEMINI_API_KEY_FILE = os.getenv("GEMINI_API_KEY_FILE", "")
 
 # Model names
 DEFAULT_GEMINI_MODEL = os.getenv("DEFAULT_GEMINI_MODEL", "gemini-2.0-flash")
 
+# Hedged requests: fire the alternate model in parallel when the primary is
+# slower than this percentile of its recent latencies
+GEMINI_HEDGING_ENABLED = os.getenv("GEMINI_HEDGING_ENABLED", "false").lower() == "true"
+GEMINI_HEDGE_PERCENTILE = float(os.getenv("GEMINI_HEDGE_PERCENTILE", "95"))
+
 
 def get_provider() -> LLMProvider:
     """Get the configured LLM provider"""
@@ -29,8 +37,20 @@ def get_provider() -> LLMProvider:
 
 
 def get_gemini_key() -> str:
-    """Get Gemini API key"""
-    return GEMINI_API_KEY
+    """
+    Get Gemini API key.
+    
+    Read at call time (GEMINI_API_KEY_FILE first, then the environment) so a
+    rotated key is picked up without a restart.
+    """
+    if GEMINI_API_KEY_FILE:
+        try:
+            key = Path(GEMINI_API_KEY_FILE).read_text().strip()
+            if key:
+                return key
+        except OSError:
+            pass
+    return os.getenv("GEMINI_API_KEY", GEMINI_API_KEY)
 
 
 def is_provider_available(provider: LLMProvider) -> bool:
@@ -44,6 +64,7 @@ def is_provider_available(provider: LLMProvider) -> bool:
         True if provider has API key configured
     """
     if provider == "gemini":
-        return bool(GEMINI_API_KEY and not GEMINI_API_KEY.startswith("YOUR"))
+        key = get_gemini_key()
+        return bool(key and not key.startswith("YOUR"))
     return False
 
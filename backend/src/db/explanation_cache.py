@@ -0,0 +1,173 @@
+"""
+Explanation Cache
+Persistent LLM explanation cache keyed by quantized profile signatures
+
+Explanations depend only on the persona, tone and (rounded) scores that
+thousands of users share, so generated explanations are stored in a local
+SQLite file that survives restarts and is shared by every worker on the
+host. Entries expire after a TTL; when the cache is full the least recently
+used entries are evicted. Any SQLite error is logged and treated as a miss:
+the cache must never fail an explanation request.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ..api.config import config
+from ..config.constants import EXPLANATION_CACHE_MAX_ENTRIES, EXPLANATION_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS explanations (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS explanations_last_used ON explanations (last_used);
+"""
+
+
+class ExplanationCache:
+    """
+    SQLite-backed TTL + LRU cache of explanation dicts.
+
+    Args:
+        path: Database file (":memory:" for a private in-process cache)
+        ttl: Seconds an entry stays valid
+        max_entries: Entries kept before least-recently-used ones are evicted
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: float = EXPLANATION_CACHE_TTL,
+        max_entries: int = EXPLANATION_CACHE_MAX_ENTRIES,
+    ):
+        self.path = str(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+        self._errors = 0
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5.0, isolation_level=None)
+        if self.path != ":memory:":
+            # Several API workers share the file
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached explanation for key, or None (also on expiry or error)"""
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, created_at FROM explanations WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self._misses += 1
+                    return None
+                value, created_at = row
+                if now - created_at > self.ttl:
+                    self._conn.execute("DELETE FROM explanations WHERE key = ?", (key,))
+                    self._expired += 1
+                    self._misses += 1
+                    return None
+                self._conn.execute("UPDATE explanations SET last_used = ? WHERE key = ?", (now, key))
+                self._hits += 1
+            return json.loads(value)
+        except (sqlite3.Error, ValueError) as e:
+            self._errors += 1
+            logger.warning(f"Explanation cache read failed: {e}")
+            return None
+
+    def put(self, key: str, explanation: Dict[str, Any]):
+        """Store an explanation, evicting expired and least-recently-used entries as needed"""
+        now = time.time()
+        try:
+            value = json.dumps(explanation)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO explanations (key, value, created_at, last_used) VALUES (?, ?, ?, ?)",
+                    (key, value, now, now),
+                )
+                self._expired += self._conn.execute(
+                    "DELETE FROM explanations WHERE created_at < ?", (now - self.ttl,)
+                ).rowcount
+                excess = self._conn.execute("SELECT COUNT(*) FROM explanations").fetchone()[0] - self.max_entries
+                if excess > 0:
+                    self._evictions += self._conn.execute(
+                        "DELETE FROM explanations WHERE key IN "
+                        "(SELECT key FROM explanations ORDER BY last_used LIMIT ?)",
+                        (excess,),
+                    ).rowcount
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self._errors += 1
+            logger.warning(f"Explanation cache write failed: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM explanations")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM explanations").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        try:
+            size = len(self)
+        except sqlite3.Error:
+            size = None
+        return {
+            "size": size,
+            "maxsize": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "expired": self._expired,
+            "evictions": self._evictions,
+            "errors": self._errors,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Process-wide cache (lazy-opened)
+_cache: Optional[ExplanationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_explanation_cache() -> Optional[ExplanationCache]:
+    """The shared cache, or None when disabled (EXPLANATION_CACHE_ENABLED=false) or unopenable"""
+    global _cache
+    if _cache is None and config.EXPLANATION_CACHE_ENABLED:
+        with _cache_lock:
+            if _cache is None:
+                path = config.EXPLANATION_CACHE_PATH or config.get_data_dir() / "cache" / "explanations.sqlite3"
+                try:
+                    _cache = ExplanationCache(path)
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning(f"Explanation cache disabled: cannot open {path}: {e}")
+                    config.EXPLANATION_CACHE_ENABLED = False
+    return _cache
+
+
+def get_explanation_cache_stats() -> Dict[str, Any]:
+    cache = get_explanation_cache()
+    return cache.stats() if cache is not None else {"enabled": False}
@@ -0,0 +1,226 @@
+"""
+Job Store
+Persistent state for background jobs (explanation generation)
+
+Jobs are kept in a local SQLite file shared by every worker on the host, so
+a queued job survives a restart and any worker can answer GET /v1/jobs/{id}.
+A worker claims a queued job with a conditional UPDATE before running it, so
+two workers that both picked the job up never run it twice. A running job's
+updated_at is refreshed by its worker (touch), so only jobs whose worker died
+look stale. Finished jobs are kept for a retention period and then pruned.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ..api.config import config
+from ..config.constants import JOB_PRUNE_INTERVAL, JOB_RETENTION, JOB_STALE_AFTER
+
+logger = logging.getLogger(__name__)
+
+# Job lifecycle: queued -> running -> succeeded | failed
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED_STATUSES = (SUCCEEDED, FAILED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+CREATE INDEX IF NOT EXISTS jobs_updated ON jobs (status, updated_at);
+"""
+
+_COLUMNS = "id, kind, payload, status, result, error, attempts, created_at, updated_at"
+
+
+def _row_to_job(row) -> Dict[str, Any]:
+    job_id, kind, payload, status, result, error, attempts, created_at, updated_at = row
+    return {
+        "id": job_id,
+        "kind": kind,
+        "payload": json.loads(payload),
+        "status": status,
+        "result": json.loads(result) if result is not None else None,
+        "error": error,
+        "attempts": attempts,
+        "created_at": created_at,
+        "updated_at": updated_at,
+    }
+
+
+class JobStore:
+    """
+    SQLite-backed job records.
+
+    Args:
+        path: Database file (":memory:" for a private in-process store)
+        retention: Seconds finished jobs are kept
+        stale_after: Seconds after which a running job with no update is
+            considered abandoned (its worker died) and is queued again
+        prune_interval: Minimum seconds between prunes on create/finish
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        retention: float = JOB_RETENTION,
+        stale_after: float = JOB_STALE_AFTER,
+        prune_interval: float = JOB_PRUNE_INTERVAL,
+    ):
+        self.path = str(path)
+        self.retention = retention
+        self.stale_after = stale_after
+        self.prune_interval = prune_interval
+        self._lock = threading.Lock()
+        self._pruned_at = 0.0
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5.0, isolation_level=None)
+        if self.path != ":memory:":
+            # Several API workers share the file
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def create(self, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert a queued job and return it"""
+        now = time.time()
+        job_id = str(uuid.uuid4())
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, payload, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(payload), QUEUED, now, now),
+            )
+            self._maybe_prune(now)
+        return {
+            "id": job_id,
+            "kind": kind,
+            "payload": payload,
+            "status": QUEUED,
+            "result": None,
+            "error": None,
+            "attempts": 0,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_job(row) if row is not None else None
+
+    def claim(self, job_id: str) -> bool:
+        """Move a queued job to running; False if it is gone or another worker claimed it"""
+        with self._lock:
+            return self._conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ? WHERE id = ? AND status = ?",
+                (RUNNING, time.time(), job_id, QUEUED),
+            ).rowcount == 1
+
+    def touch(self, job_id: str) -> bool:
+        """Heartbeat for a running job, so recover() doesn't take it for abandoned"""
+        with self._lock:
+            return self._conn.execute(
+                "UPDATE jobs SET updated_at = ? WHERE id = ? AND status = ?",
+                (time.time(), job_id, RUNNING),
+            ).rowcount == 1
+
+    def complete(self, job_id: str, result: Any):
+        self._finish(job_id, SUCCEEDED, json.dumps(result), None)
+
+    def fail(self, job_id: str, error: str):
+        self._finish(job_id, FAILED, None, error)
+
+    def _finish(self, job_id: str, status: str, result: Optional[str], error: Optional[str]):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE id = ?",
+                (status, result, error, now, job_id),
+            )
+            self._maybe_prune(now)
+
+    def _maybe_prune(self, now: float):
+        """Prune at most every prune_interval (caller holds the lock)"""
+        if now - self._pruned_at >= self.prune_interval:
+            self._prune(now)
+
+    def _prune(self, now: float) -> int:
+        """Delete finished jobs past retention (caller holds the lock)"""
+        self._pruned_at = now
+        return self._conn.execute(
+            "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+            (*FINISHED_STATUSES, now - self.retention),
+        ).rowcount
+
+    def prune(self) -> int:
+        """Delete finished jobs past retention; returns how many"""
+        with self._lock:
+            return self._prune(time.time())
+
+    def requeue(self, job_id: str):
+        """Return a running job to the queue (e.g. the worker is shutting down)"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ? AND status = ?",
+                (QUEUED, time.time(), job_id, RUNNING),
+            )
+
+    def recover(self) -> List[Dict[str, Any]]:
+        """
+        Jobs to resume after a restart, oldest first.
+
+        Stale running jobs are queued again; expired finished jobs are pruned.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ? AND updated_at < ?",
+                (QUEUED, now, RUNNING, now - self.stale_after),
+            )
+            self._prune(now)
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE status = ? ORDER BY created_at", (QUEUED,)
+            ).fetchall()
+        return [_row_to_job(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Process-wide store (lazy-opened)
+_store: Optional[JobStore] = None
+_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    """The shared job store (JOB_STORE_PATH, default <LIFESYNC_DATA_DIR>/jobs/jobs.sqlite3)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = JobStore(config.JOB_STORE_PATH or config.get_data_dir() / "jobs" / "jobs.sqlite3")
+    return _store
@@ -0,0 +1,264 @@
+"""
+Bulk Re-scoring of Stored Assessments
+Re-scores personality_assessments rows from their raw_scores after a scoring change
+
+Rows are read in id order with keyset pagination (id > last_id), scored page
+by page in a process pool and written back one batch per page. Only a
+bounded number of pages is ever in flight, so memory stays constant no
+matter how many rows the table holds. Progress is checkpointed after every
+page so an interrupted run resumes where it stopped.
+"""
+
+import json
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Union
+
+from ..config.constants import (
+    RESCORE_PAGE_SIZE,
+    RESCORE_PAGES_PER_WORKER,
+    RESCORE_PROGRESS_INTERVAL,
+)
+from ..scorer.create_scorer_wrapper import get_scorer
+from ..supabase_client import build_score_update
+from ..utils.validators import sanitize_answers, validate_answers
+
+logger = logging.getLogger(__name__)
+
+# Stored columns compared against the fresh score for the diff report
+DIFF_FIELDS = ("trait_scores", "facet_scores", "mbti_code", "persona_id", "confidence", "scoring_version")
+
+# Result fields needed to build a save_scores() update
+_SCORE_FIELDS = ("traits", "facets", "mbti_proxy", "persona_id", "confidence", "metadata")
+
+
+class RescoreStats:
+    """Counters and throughput for a re-score run"""
+
+    def __init__(self, counts: Optional[Dict[str, int]] = None):
+        counts = counts or {}
+        self.scanned = counts.get("scanned", 0)
+        self.changed = counts.get("changed", 0)
+        self.written = counts.get("written", 0)
+        self.skipped = counts.get("skipped", 0)
+        self.field_changes: Dict[str, int] = dict(counts.get("field_changes") or {})
+        self.started = time.monotonic()
+        # Rows scanned by earlier runs don't count towards this run's rate
+        self._resumed_from = self.scanned
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed
+        return (self.scanned - self._resumed_from) / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scanned": self.scanned,
+            "changed": self.changed,
+            "written": self.written,
+            "skipped": self.skipped,
+            "field_changes": dict(self.field_changes),
+        }
+
+    def summary(self) -> str:
+        return (
+            f"scanned={self.scanned} changed={self.changed} written={self.written} "
+            f"skipped={self.skipped} rate={self.rows_per_second:.0f} rows/s elapsed={self.elapsed:.1f}s"
+        )
+
+
+class RescoreCheckpoint:
+    """
+    Resume point for a re-score run, stored as a small JSON file.
+
+    Holds the last fully processed id plus the counters so far. Written
+    atomically (temp file + rename) so a crash never leaves it half written.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]]):
+        self.path = Path(path) if path else None
+
+    def load(self, scoring_version: str, dry_run: bool) -> Dict[str, Any]:
+        """
+        Saved state for this run, or {} when there is nothing to resume.
+
+        Raises:
+            ValueError: If the checkpoint belongs to another version or mode
+        """
+        if self.path is None or not self.path.exists():
+            return {}
+        state = json.loads(self.path.read_text())
+        if state.get("scoring_version") != scoring_version or state.get("dry_run") != dry_run:
+            raise ValueError(
+                f"Checkpoint {self.path} is for scoring_version={state.get('scoring_version')} "
+                f"dry_run={state.get('dry_run')}; remove it or pass another --checkpoint"
+            )
+        return state
+
+    def save(self, last_id: str, scoring_version: str, dry_run: bool, stats: RescoreStats):
+        if self.path is None:
+            return
+        state = {
+            "last_id": last_id,
+            "scoring_version": scoring_version,
+            "dry_run": dry_run,
+            "counts": stats.to_dict(),
+        }
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(state))
+        os.replace(tmp_path, self.path)
+
+
+def rescore_page(rows: List[Dict[str, Any]], scoring_version: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Re-score one page of stored rows (runs in the worker processes).
+
+    Returns one entry per row: {"id", "changes"} plus, when anything
+    changed, the "scores" and "raw_responses" to write; rows whose
+    raw_scores cannot be scored get an "error" instead.
+    """
+    scorer = get_scorer(scoring_version)
+    results = []
+    for row in rows:
+        raw_responses = row.get("raw_scores")
+        answers = sanitize_answers(raw_responses) if isinstance(raw_responses, dict) else None
+        is_valid, error = validate_answers(answers)
+        if not is_valid:
+            results.append({"id": row["id"], "error": error})
+            continue
+
+        scores = scorer.score(answers).to_dict(_SCORE_FIELDS)
+        # Keep the original submission context (timestamp, platform); refresh the rest
+        scores["metadata"] = {**(row.get("metadata") or {}), **{
+            key: value for key, value in scores["metadata"].items() if key != "timestamp"
+        }}
+
+        update = build_score_update(scores, raw_responses)
+        changes = {
+            field: {"old": row.get(field), "new": update[field]}
+            for field in DIFF_FIELDS
+            if row.get(field) != update[field]
+        }
+        entry = {"id": row["id"], "changes": changes}
+        if changes:
+            entry["scores"] = scores
+            entry["raw_responses"] = raw_responses
+        results.append(entry)
+    return results
+
+
+class _InlineExecutor:
+    """Runs submitted pages in the calling process (workers=0)"""
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+    def shutdown(self, wait: bool = True):
+        pass
+
+
+class RescoreJob:
+    """
+    Streaming re-score of personality_assessments.
+
+    Args:
+        db: SupabaseClient (anything with get_assessments_after() and save_scores_batch())
+        scoring_version: Version to score with (default: SCORING_VERSION)
+        page_size: Rows per keyset page, scoring task and write batch
+        workers: Scoring processes (None = CPU count, 0 = score in-process)
+        dry_run: Compute and report changes without writing
+        checkpoint_path: Optional checkpoint file to resume from and update
+        report: Optional text stream for the JSON-lines diff report
+        progress_interval: Seconds between throughput log lines
+    """
+
+    def __init__(
+        self,
+        db,
+        scoring_version: Optional[str] = None,
+        page_size: int = RESCORE_PAGE_SIZE,
+        workers: Optional[int] = None,
+        dry_run: bool = False,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        report: Optional[TextIO] = None,
+        progress_interval: float = RESCORE_PROGRESS_INTERVAL,
+    ):
+        self.db = db
+        self.scoring_version = get_scorer(scoring_version).scoring_version
+        self.page_size = page_size
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.dry_run = dry_run
+        self.checkpoint = RescoreCheckpoint(checkpoint_path)
+        self.report = report
+        self.progress_interval = progress_interval
+
+    def run(self) -> RescoreStats:
+        """Process every remaining row and return the final counters"""
+        state = self.checkpoint.load(self.scoring_version, self.dry_run)
+        stats = RescoreStats(state.get("counts"))
+        after_id = state.get("last_id")
+        if after_id is not None:
+            logger.info(f"Resuming re-score after id {after_id} ({stats.scanned} rows already scanned)")
+
+        max_in_flight = max(1, self.workers) * RESCORE_PAGES_PER_WORKER
+        executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 0 else _InlineExecutor()
+        in_flight = deque()
+        exhausted = False
+        last_progress = time.monotonic()
+        try:
+            while True:
+                # Keep the pool fed, but never hold more than max_in_flight pages
+                while not exhausted and len(in_flight) < max_in_flight:
+                    rows = self.db.get_assessments_after(after_id, self.page_size)
+                    if rows:
+                        after_id = rows[-1]["id"]
+                        in_flight.append((after_id, executor.submit(rescore_page, rows, self.scoring_version)))
+                    exhausted = len(rows) < self.page_size
+                if not in_flight:
+                    break
+
+                # Pages are applied in id order so the checkpoint never skips rows
+                last_id, future = in_flight.popleft()
+                self._apply(future.result(), stats)
+                self.checkpoint.save(last_id, self.scoring_version, self.dry_run, stats)
+
+                if time.monotonic() - last_progress >= self.progress_interval:
+                    logger.info(f"Re-score progress: {stats.summary()} last_id={last_id}")
+                    last_progress = time.monotonic()
+        finally:
+            executor.shutdown(wait=True)
+
+        logger.info(f"{'[DRY RUN] ' if self.dry_run else ''}Re-score finished: {stats.summary()}")
+        return stats
+
+    def _apply(self, results: List[Dict[str, Any]], stats: RescoreStats):
+        """Count, report and (unless dry-run) write one scored page"""
+        updates = []
+        for entry in results:
+            stats.scanned += 1
+            if "error" in entry:
+                stats.skipped += 1
+                logger.warning(f"Skipping assessment {entry['id']}: {entry['error']}")
+                continue
+            if not entry["changes"]:
+                continue
+
+            stats.changed += 1
+            for field in entry["changes"]:
+                stats.field_changes[field] = stats.field_changes.get(field, 0) + 1
+            if self.report is not None:
+                self.report.write(json.dumps({"id": entry["id"], "changes": entry["changes"]}) + "\n")
+            updates.append((entry["id"], entry["scores"], entry["raw_responses"]))
+
+        if updates and not self.dry_run:
+            stats.written += self.db.save_scores_batch(updates)
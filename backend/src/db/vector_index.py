@@ -0,0 +1,369 @@
+"""
+Profile Vector Index
+In-process k-nearest-neighbour index over stored trait + facet score vectors
+
+Scores (0-1) are quantized to int8 levels (-127..127, ~0.004 resolution) and
+kept in one contiguous matrix together with each row's squared norm, so a
+query is a single matrix-vector product (||x||^2 - 2 x.q) per block of rows
+plus an argpartition for the top k. The levels are small integers, so the
+float32 arithmetic is exact and results match a brute-force scan.
+
+The process-wide index is loaded from a snapshot (scripts/build_vector_index.py),
+kept current by SupabaseClient.save_scores() and snapshotted back to disk by the
+API periodically and at shutdown.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..api.config import config
+from ..config.constants import VECTOR_INDEX_BLOCK_ROWS, VECTOR_INDEX_SNAPSHOT_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+
+# Leading dimensions of every vector ("traits" queries compare only these)
+TRAIT_DIMENSIONS = ['Openness', 'Conscientiousness', 'Extraversion', 'Agreeableness', 'Neuroticism']
+
+SPACES = ("traits", "full")
+
+_QMAX = 127
+_SCALE = 2 * _QMAX
+
+
+class VectorIndexError(ValueError):
+    """Raised when a snapshot is unreadable or a vector has the wrong shape"""
+    pass
+
+
+def quantize(vectors: np.ndarray) -> np.ndarray:
+    """0-1 floats (NaN = no score, treated as the 0.5 midpoint) to int8 levels"""
+    vectors = np.nan_to_num(np.asarray(vectors, dtype=np.float64), nan=0.5)
+    return np.rint(np.clip(vectors, 0.0, 1.0) * _SCALE - _QMAX).astype(np.int8)
+
+
+class ProfileVectorIndex:
+    """
+    Exact k-NN over quantized profile vectors.
+
+    Args:
+        dimensions: Names of the vector components; the first five must be
+                    TRAIT_DIMENSIONS (facets follow)
+        capacity: Initial rows allocated (the matrix doubles as it fills)
+    """
+
+    def __init__(self, dimensions: Sequence[str], capacity: int = 1024):
+        if list(dimensions[:len(TRAIT_DIMENSIONS)]) != TRAIT_DIMENSIONS:
+            raise VectorIndexError(f"Index dimensions must start with {TRAIT_DIMENSIONS}")
+        self.dimensions = list(dimensions)
+        self.dim = len(self.dimensions)
+        capacity = max(capacity, 1)
+        # Levels are stored as float32 (exact for int8 values) so queries need no conversion
+        self._vectors = np.empty((capacity, self.dim), dtype=np.float32)
+        self._norms = {space: np.empty(capacity, dtype=np.float32) for space in SPACES}
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        # Bumped by every add/remove, so callers can tell whether a snapshot is stale
+        self.version = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, assessment_id: str) -> bool:
+        return assessment_id in self._rows
+
+    def _width(self, space: str) -> int:
+        if space not in SPACES:
+            raise VectorIndexError(f"Unknown space '{space}' (expected one of {SPACES})")
+        return len(TRAIT_DIMENSIONS) if space == "traits" else self.dim
+
+    # Building and updates
+
+    def vector(self, traits: Dict[str, Optional[float]], facets: Optional[Dict[str, Optional[float]]] = None) -> np.ndarray:
+        """Float vector (NaN for missing scores) from long-name trait/facet dicts"""
+        scores = {**(facets or {}), **traits}
+        return np.array(
+            [np.nan if scores.get(name) is None else scores[name] for name in self.dimensions],
+            dtype=np.float64,
+        )
+
+    def _grow(self, needed: int):
+        capacity = len(self._vectors)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        size = len(self._ids)
+        vectors = np.empty((capacity, self.dim), dtype=np.float32)
+        vectors[:size] = self._vectors[:size]
+        self._vectors = vectors
+        for space in SPACES:
+            norms = np.empty(capacity, dtype=np.float32)
+            norms[:size] = self._norms[space][:size]
+            self._norms[space] = norms
+
+    def _write(self, rows: np.ndarray, levels: np.ndarray):
+        levels = levels.astype(np.float32)
+        self._vectors[rows] = levels
+        for space in SPACES:
+            width = self._width(space)
+            self._norms[space][rows] = np.einsum('ij,ij->i', levels[:, :width], levels[:, :width])
+
+    def add(self, assessment_id: str, vector: np.ndarray):
+        """Insert or replace one assessment's vector (0-1 floats)"""
+        self.add_many([assessment_id], np.asarray(vector, dtype=np.float64).reshape(1, -1))
+
+    def add_many(self, ids: Sequence[str], vectors: np.ndarray):
+        """Insert or replace many vectors (rows of a 0-1 float matrix)"""
+        vectors = np.asarray(vectors, dtype=np.float64)
+        if vectors.ndim != 2 or vectors.shape[1] != self.dim:
+            raise VectorIndexError(f"Expected {self.dim}-dim vectors, got shape {vectors.shape}")
+        if len(ids) != len(vectors):
+            raise VectorIndexError("ids and vectors differ in length")
+        levels = quantize(vectors)
+
+        with self._lock:
+            self._grow(len(self._ids) + len(ids))
+            rows = np.empty(len(ids), dtype=np.int64)
+            for i, assessment_id in enumerate(ids):
+                row = self._rows.get(assessment_id)
+                if row is None:
+                    row = self._rows[assessment_id] = len(self._ids)
+                    self._ids.append(assessment_id)
+                rows[i] = row
+            self._write(rows, levels)
+            self.version += 1
+
+    def remove(self, assessment_id: str) -> bool:
+        """Drop an assessment (the last row is moved into its slot)"""
+        with self._lock:
+            row = self._rows.pop(assessment_id, None)
+            if row is None:
+                return False
+            last = len(self._ids) - 1
+            if row != last:
+                moved = self._ids[last]
+                self._ids[row] = moved
+                self._rows[moved] = row
+                self._vectors[row] = self._vectors[last]
+                for space in SPACES:
+                    self._norms[space][row] = self._norms[space][last]
+            self._ids.pop()
+            self.version += 1
+            return True
+
+    # Queries
+
+    def query(
+        self,
+        vector: np.ndarray,
+        k: int = 10,
+        space: str = "full",
+        exclude: Optional[str] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        k nearest stored profiles.
+
+        Args:
+            vector: Query vector (0-1 floats; NaN = no score)
+            k: Number of neighbours
+            space: "full" (traits + facets) or "traits" (the five traits only)
+            exclude: Assessment id to leave out (usually the query's own)
+
+        Returns:
+            [(assessment_id, distance)] nearest first; distance is Euclidean on the 0-1 scale
+        """
+        width = self._width(space)
+        vector = np.asarray(vector, dtype=np.float64)
+        if vector.shape != (self.dim,):
+            raise VectorIndexError(f"Expected a {self.dim}-dim vector, got shape {vector.shape}")
+        q = quantize(vector)[:width].astype(np.float32)
+        q_norm = float(q @ q)
+
+        with self._lock:
+            n = len(self._ids)
+            skip = self._rows.get(exclude) if exclude is not None else None
+            best_rows = np.empty(0, dtype=np.int64)
+            best_d = np.empty(0, dtype=np.float32)
+
+            for start in range(0, n, VECTOR_INDEX_BLOCK_ROWS):
+                stop = min(start + VECTOR_INDEX_BLOCK_ROWS, n)
+                # ||x - q||^2 without the constant ||q||^2
+                d = self._norms[space][start:stop] - 2.0 * (self._vectors[start:stop, :width] @ q)
+                if skip is not None and start <= skip < stop:
+                    d[skip - start] = np.inf
+                top = np.argpartition(d, k)[:k] if k < len(d) else np.arange(len(d))
+                best_rows = np.concatenate([best_rows, top + start])
+                best_d = np.concatenate([best_d, d[top]])
+                if len(best_d) > k:
+                    keep = np.argpartition(best_d, k)[:k]
+                    best_rows, best_d = best_rows[keep], best_d[keep]
+
+            # Nearest first; equal distances in row order
+            order = np.lexsort((best_rows, best_d))
+            return [
+                (self._ids[best_rows[i]], round(float(np.sqrt(max(best_d[i] + q_norm, 0.0))) / _SCALE, 4))
+                for i in order if np.isfinite(best_d[i])
+            ]
+
+    def get_vector(self, assessment_id: str) -> Optional[np.ndarray]:
+        """Stored (dequantized, 0-1) vector of an assessment"""
+        with self._lock:
+            row = self._rows.get(assessment_id)
+            if row is None:
+                return None
+            levels = self._vectors[row].astype(np.float64)
+        return (levels + _QMAX) / _SCALE
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self),
+            "dimensions": self.dim,
+            "memory_bytes": int(self._vectors.nbytes + sum(norms.nbytes for norms in self._norms.values())),
+        }
+
+    # Snapshots
+
+    def save(self, path: Union[str, Path]):
+        """Write the index as an .npz snapshot of int8 levels (temp file, then rename)"""
+        path = Path(path)
+        with self._lock:
+            ids = np.array(self._ids, dtype=str)
+            levels = self._vectors[:len(self._ids)].astype(np.int8)
+        meta = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "dimensions": self.dimensions,
+            "saved_at": time.time(),
+        }
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                ids=ids,
+                levels=levels,
+                meta=np.frombuffer(json.dumps(meta).encode('utf-8'), dtype=np.uint8),
+            )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'ProfileVectorIndex':
+        """
+        Load an .npz snapshot.
+
+        Raises:
+            VectorIndexError: If the file is missing, unreadable or another format version
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(data["meta"].tobytes().decode('utf-8'))
+                ids = data["ids"].tolist()
+                levels = data["levels"]
+        except (OSError, KeyError, ValueError) as e:
+            raise VectorIndexError(f"Cannot load vector index {path}: {e}")
+        if meta.get("format_version") != INDEX_FORMAT_VERSION:
+            raise VectorIndexError(f"Vector index {path} has format {meta.get('format_version')}")
+
+        index = cls(meta["dimensions"], capacity=len(ids))
+        index._ids = ids
+        index._rows = {assessment_id: row for row, assessment_id in enumerate(ids)}
+        if ids:
+            index._write(np.arange(len(ids)), levels)
+        return index
+
+
+# Process-wide index (lazy-loaded) and its version when last loaded or written
+_index: Optional[ProfileVectorIndex] = None
+_index_lock = threading.Lock()
+_saved_version = 0
+
+
+def snapshot_path() -> Path:
+    """Where the process-wide index is loaded from and snapshotted to"""
+    return Path(config.VECTOR_INDEX_PATH or config.get_data_dir() / "index" / "profile_vectors.npz")
+
+
+def profile_dimensions() -> List[str]:
+    """Trait names followed by the question bank's facet names"""
+    from ..scorer.create_scorer_wrapper import get_scorer
+    return TRAIT_DIMENSIONS + list(get_scorer().facets.values())
+
+
+def get_profile_index() -> ProfileVectorIndex:
+    """The process-wide index: the snapshot if one exists, otherwise empty"""
+    global _index, _saved_version
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = None
+                path = snapshot_path()
+                if path.exists():
+                    try:
+                        index = ProfileVectorIndex.load(path)
+                        logger.info(f"Loaded {len(index)} profile vectors from {path}")
+                    except VectorIndexError as e:
+                        logger.warning(f"Ignoring profile vector snapshot: {e}")
+                index = index or ProfileVectorIndex(profile_dimensions())
+                _saved_version = index.version
+                _index = index
+    return _index
+
+
+def snapshot_profile_index(path: Optional[Union[str, Path]] = None) -> Optional[Path]:
+    """
+    Write the process-wide index to disk.
+
+    Without a path, writes snapshot_path() and only if the index was loaded
+    and has changed since it was loaded or last written.
+
+    Returns:
+        The path written, or None if there was nothing to write
+    """
+    global _saved_version
+    index = _index
+    if index is None:
+        return None
+    version = index.version
+    if path is None and version == _saved_version:
+        return None
+    target = Path(path) if path else snapshot_path()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    index.save(target)
+    if path is None:
+        _saved_version = version
+    return target
+
+
+async def snapshot_profile_index_periodically(interval: float = VECTOR_INDEX_SNAPSHOT_INTERVAL):
+    """Snapshot the process-wide index every interval seconds until cancelled"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            path = await asyncio.to_thread(snapshot_profile_index)
+            if path is not None:
+                logger.info(f"Snapshotted {len(_index)} profile vectors to {path}")
+        except Exception as e:
+            logger.warning(f"Profile vector snapshot failed: {e}")
+
+
+def index_saved_scores(assessment_id: str, scores: Dict[str, Any]):
+    """
+    Update the process-wide index after an assessment's scores are saved.
+
+    Never raises: a failed index update must not fail the write.
+    """
+    from ..scorer.norms import stored_facet_scores, stored_trait_scores
+    try:
+        index = get_profile_index()
+        traits = stored_trait_scores(scores.get("traits") or {})
+        index.add(assessment_id, index.vector(traits, stored_facet_scores(scores.get("facets"))))
+    except Exception as e:
+        logger.warning(f"Profile vector index update failed for {assessment_id}: {e}")
@@ -8,8 +8,10 @@ from .explanations import generate_personality_explanation
 from .gemini_provider import GeminiProvider
 from .llm_client import LLMClient, create_llm_client
 from .provider_base import LLMProviderBase
-from .router import generate_explanation
-from .templates import SYSTEM_PROMPT, get_personality_explanation_prompt
+from .hedging import HedgePolicy
+from .provider_registry import ProviderRegistry, get_hedging_stats, get_provider_registry_stats, provider_registry
+from .router import agenerate_explanation, astream_explanation, generate_explanation
+from .templates import SYSTEM_PROMPT, get_personality_explanation_prompt, get_prompt_cache_stats
 
 __all__ = [
     # Legacy
@@ -17,10 +19,18 @@ __all__ = [
     'create_llm_client',
     'SYSTEM_PROMPT',
     'get_personality_explanation_prompt',
+    'get_prompt_cache_stats',
     # New provider-based
     'generate_personality_explanation',
     'generate_explanation',
+    'agenerate_explanation',
+    'astream_explanation',
     'GeminiProvider',
-    'LLMProviderBase'
+    'LLMProviderBase',
+    'ProviderRegistry',
+    'provider_registry',
+    'get_provider_registry_stats',
+    'HedgePolicy',
+    'get_hedging_stats'
 ]
 
@@ -3,11 +3,13 @@ LifeSync Personality Engine - Gemini Provider
 Production-ready with retry, backoff, and safe JSON handling
 """
 
+import asyncio
 import logging
 import time
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
-from ..utils.safe_json import safe_load_json
+from ..utils.safe_json import recover_json
+from .hedging import HedgePolicy
 from .provider_base import LLMProviderBase
 from .providers.provider_failure import ProviderFailure
 
@@ -25,7 +27,13 @@ class GeminiProvider(LLMProviderBase):
     MAX_RETRIES = 1
     BACKOFF_SCHEDULE = [0.5]  # seconds
     
-    def __init__(self, model_name: str = None, api_key: Optional[str] = None, alternate_models: Optional[List[str]] = None):
+    def __init__(
+        self,
+        model_name: str = None,
+        api_key: Optional[str] = None,
+        alternate_models: Optional[List[str]] = None,
+        hedge_policy: Optional[HedgePolicy] = None
+    ):
         """
         Initialize Gemini provider.
         
@@ -33,6 +41,8 @@ class GeminiProvider(LLMProviderBase):
             model_name: Primary Gemini model name (default: "gemini-2.0-flash")
             api_key: Gemini API key
             alternate_models: List of alternate models to try if primary fails
+            hedge_policy: If set, agenerate_content fires the first alternate in
+                parallel when the primary is slow (see _ahedged_generate)
         """
         if not api_key:
             raise ValueError("Gemini API key required")
@@ -51,8 +61,66 @@ class GeminiProvider(LLMProviderBase):
         self.alternate_models = alternate_models or self.ALTERNATE_MODELS
         
         super().__init__(model_name, api_key)
-        self.model = self.genai.GenerativeModel(model_name)
-        self.models_tried = []
+        # Model objects are built once and reused: each keeps its SDK client
+        # (and connection) after the first call
+        self._models = {
+            name: self.genai.GenerativeModel(name)
+            for name in [model_name] + list(self.alternate_models)
+        }
+        self.model = self._models[model_name]
+        self.hedge_policy = hedge_policy
+    
+    def _get_model(self, model_name: str):
+        model = self._models.get(model_name)
+        if model is None:
+            model = self._models.setdefault(model_name, self.genai.GenerativeModel(model_name))
+        return model
+    
+    @staticmethod
+    def _full_prompt(prompt: str, system_prompt: Optional[str]) -> str:
+        """Gemini takes a single prompt: system prompt first"""
+        if system_prompt:
+            return f"{system_prompt}\n\n{prompt}"
+        return prompt
+    
+    @staticmethod
+    def _clean_text(model_name: str, text: str) -> str:
+        """
+        Strip markdown code fences.
+        
+        The JSON itself is recovered and checked once, in _build_explanation.
+        """
+        text = text.strip()
+        
+        # Remove markdown code blocks
+        if text.startswith("```json"):
+            text = text[7:]
+        if text.startswith("```"):
+            text = text[3:]
+        if text.endswith("```"):
+            text = text[:-3]
+        
+        return text.strip()
+    
+    def _retry_wait(self, model_name: str, attempt: int, error: Exception) -> Optional[float]:
+        """Log a failed attempt and return the backoff before the next one (None = don't wait)"""
+        error_msg = str(error)
+        
+        # Log the error
+        logger.warning(f"Gemini {model_name} attempt {attempt + 1} failed: {error_msg[:200]}")
+        
+        # Check if it's a quota/rate limit error
+        if "429" in error_msg or "quota" in error_msg.lower() or "rate limit" in error_msg.lower():
+            # For rate limits, wait longer
+            wait_time = self.BACKOFF_SCHEDULE[attempt] * 2
+            logger.info(f"Rate limit detected, waiting {wait_time}s before retry")
+            return wait_time
+        # Regular backoff
+        if attempt < self.MAX_RETRIES - 1:
+            wait_time = self.BACKOFF_SCHEDULE[attempt]
+            logger.debug(f"Waiting {wait_time}s before retry")
+            return wait_time
+        return None
     
     def _try_model(self, model_name: str, prompt: str, system_prompt: Optional[str] = None, temperature: float = 0.7, **kwargs) -> str:
         """
@@ -71,13 +139,8 @@ class GeminiProvider(LLMProviderBase):
         Raises:
             ProviderFailure: If all retries fail
         """
-        # Create model instance
-        model = self.genai.GenerativeModel(model_name)
-        
-        # Combine prompts
-        full_prompt = prompt
-        if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
+        model = self._get_model(model_name)
+        full_prompt = self._full_prompt(prompt, system_prompt)
         
         last_error = None
         
@@ -93,52 +156,50 @@ class GeminiProvider(LLMProviderBase):
                         **kwargs
                     }
                 )
-                
-                # Extract and sanitize text
-                text = response.text.strip()
-                
-                # Remove markdown code blocks
-                if text.startswith("```json"):
-                    text = text[7:]
-                if text.startswith("```"):
-                    text = text[3:]
-                if text.endswith("```"):
-                    text = text[:-3]
-                
-                text = text.strip()
-                
-                # Use safe JSON loader to validate
-                parsed = safe_load_json(text)
-                if "error" in parsed:
-                    # JSON is malformed, but we got a response - log and continue
-                    logger.warning(f"Gemini {model_name} returned malformed JSON, but got response")
-                    # Still return the text, safe_load_json will have extracted what it could
-                
-                return text
+                return self._clean_text(model_name, response.text)
                 
             except Exception as e:
                 last_error = e
-                error_msg = str(e)
-                
-                # Log the error
-                logger.warning(f"Gemini {model_name} attempt {attempt + 1} failed: {error_msg[:200]}")
-                
-                # Check if it's a quota/rate limit error
-                if "429" in error_msg or "quota" in error_msg.lower() or "rate limit" in error_msg.lower():
-                    # For rate limits, wait longer
-                    wait_time = self.BACKOFF_SCHEDULE[attempt] * 2
-                    logger.info(f"Rate limit detected, waiting {wait_time}s before retry")
+                wait_time = self._retry_wait(model_name, attempt, e)
+                if wait_time is not None:
                     time.sleep(wait_time)
-                else:
-                    # Regular backoff
-                    if attempt < self.MAX_RETRIES - 1:
-                        wait_time = self.BACKOFF_SCHEDULE[attempt]
-                        logger.debug(f"Waiting {wait_time}s before retry")
-                        time.sleep(wait_time)
         
         # All retries failed
         raise ProviderFailure("Gemini", model_name, last_error, self.MAX_RETRIES)
     
+    async def _atry_model(self, model_name: str, prompt: str, system_prompt: Optional[str] = None, temperature: float = 0.7, **kwargs) -> str:
+        """
+        Async _try_model using the SDK's generate_content_async.
+        
+        Backoff uses asyncio.sleep, and cancellation (request timeout) is
+        never swallowed by the retry loop: CancelledError is not an Exception.
+        """
+        model = self._get_model(model_name)
+        full_prompt = self._full_prompt(prompt, system_prompt)
+        
+        last_error = None
+        
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                logger.debug(f"Gemini {model_name} async attempt {attempt + 1}/{self.MAX_RETRIES}")
+                
+                response = await model.generate_content_async(
+                    full_prompt,
+                    generation_config={
+                        "temperature": temperature,
+                        **kwargs
+                    }
+                )
+                return self._clean_text(model_name, response.text)
+                
+            except Exception as e:
+                last_error = e
+                wait_time = self._retry_wait(model_name, attempt, e)
+                if wait_time is not None:
+                    await asyncio.sleep(wait_time)
+        
+        raise ProviderFailure("Gemini", model_name, last_error, self.MAX_RETRIES)
+    
     def generate_content(
         self,
         prompt: str,
@@ -161,6 +222,8 @@ class GeminiProvider(LLMProviderBase):
             Generated text content (sanitized and trimmed)
         """
         models_to_try = [self.model_name] + self.alternate_models
+        # Local to the call: a registry-pooled provider is shared between requests
+        models_tried = []
         
         last_error = None
         
@@ -170,23 +233,209 @@ class GeminiProvider(LLMProviderBase):
                     logger.info(f"Trying alternate Gemini model: {model_name}")
                 
                 result = self._try_model(model_name, prompt, system_prompt, temperature, **kwargs)
-                self.models_tried.append(model_name)
+                models_tried.append(model_name)
                 return result
                 
             except ProviderFailure as e:
                 last_error = e
-                self.models_tried.append(model_name)
+                models_tried.append(model_name)
                 logger.warning(f"Gemini model {model_name} failed: {e}")
                 # Try next model
                 continue
         
         # All models failed
-        error_msg = f"All Gemini models failed. Tried: {', '.join(self.models_tried)}"
+        error_msg = f"All Gemini models failed. Tried: {', '.join(models_tried)}"
+        if last_error:
+            error_msg += f". Last error: {str(last_error)}"
+        
+        raise ProviderFailure("Gemini", "all models", last_error or Exception(error_msg), self.MAX_RETRIES)
+    
+    async def agenerate_content(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_retries: int = None,  # Ignored, we use our own retry logic
+        **kwargs
+    ) -> str:
+        """
+        Async generate_content: same model fallback order, non-blocking calls.
+        
+        With a hedge policy the alternate is started early instead of only
+        after the primary fails (see _ahedged_generate).
+        """
+        if self.hedge_policy is not None and self.alternate_models:
+            return await self._ahedged_generate(prompt, system_prompt, temperature, **kwargs)
+        
+        models_to_try = [self.model_name] + self.alternate_models
+        # Local to the call: a registry-pooled provider is shared between requests
+        models_tried = []
+        
+        last_error = None
+        
+        for model_name in models_to_try:
+            try:
+                if model_name != self.model_name:
+                    logger.info(f"Trying alternate Gemini model: {model_name}")
+                
+                result = await self._atry_model(model_name, prompt, system_prompt, temperature, **kwargs)
+                models_tried.append(model_name)
+                return result
+                
+            except ProviderFailure as e:
+                last_error = e
+                models_tried.append(model_name)
+                logger.warning(f"Gemini model {model_name} failed: {e}")
+                continue
+        
+        error_msg = f"All Gemini models failed. Tried: {', '.join(models_tried)}"
+        if last_error:
+            error_msg += f". Last error: {str(last_error)}"
+        
+        raise ProviderFailure("Gemini", "all models", last_error or Exception(error_msg), self.MAX_RETRIES)
+    
+    async def _ahedged_generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> str:
+        """
+        agenerate_content with hedging.
+        
+        The primary runs alone for hedge_policy.delay() seconds; if it hasn't
+        answered by then the first alternate starts alongside it. The first
+        answer holding a JSON object is returned and the other call is
+        cancelled. A failed call starts the next model right away, as in the
+        sequential path. If every answer lacks valid JSON the first one is
+        returned, so the caller reports the parse error as before.
+        """
+        policy = self.hedge_policy
+        queue = [self.model_name] + list(self.alternate_models)
+        # Local to the call: a registry-pooled provider is shared between requests
+        models_tried = []
+        
+        tasks = {}
+        
+        def launch():
+            model_name = queue.pop(0)
+            models_tried.append(model_name)
+            task = asyncio.ensure_future(self._atry_model(model_name, prompt, system_prompt, temperature, **kwargs))
+            tasks[task] = (model_name, time.monotonic())
+            return task
+        
+        primary = launch()
+        hedge_at = tasks[primary][1] + policy.delay()
+        pending = {primary}
+        hedged = False
+        unparsed = None
+        last_error = None
+        
+        try:
+            while pending:
+                timeout = None
+                if not hedged and queue and primary in pending:
+                    timeout = max(hedge_at - time.monotonic(), 0)
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                
+                if not done:
+                    hedged = True
+                    logger.info(f"Gemini {self.model_name} slower than {timeout:.2f}s, hedging with {queue[0]}")
+                    pending.add(launch())
+                    continue
+                
+                for task in done:
+                    model_name, started = tasks[task]
+                    try:
+                        text = task.result()
+                    except ProviderFailure as e:
+                        last_error = e
+                        logger.warning(f"Gemini model {model_name} failed: {e}")
+                        continue
+                    if task is primary:
+                        policy.record_latency(time.monotonic() - started)
+                    try:
+                        recover_json(text)
+                    except ValueError:
+                        logger.warning(f"Gemini model {model_name} returned no valid JSON")
+                        unparsed = unparsed or (model_name, text)
+                        continue
+                    policy.record_call(model_name, hedged, cancelled=len(pending))
+                    return text
+                
+                if not pending and queue:
+                    pending.add(launch())
+        finally:
+            # A primary that lost to the hedge still says its latency is at least this long
+            if hedged and primary in pending:
+                policy.record_latency(time.monotonic() - tasks[primary][1], censored=True)
+            for task in pending:
+                task.cancel()
+        
+        if unparsed is not None:
+            policy.record_call(unparsed[0], hedged)
+            return unparsed[1]
+        
+        policy.record_call(None, hedged)
+        error_msg = f"All Gemini models failed. Tried: {', '.join(models_tried)}"
         if last_error:
             error_msg += f". Last error: {str(last_error)}"
         
         raise ProviderFailure("Gemini", "all models", last_error or Exception(error_msg), self.MAX_RETRIES)
     
+    async def astream_content(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream text chunks as Gemini generates them (SDK stream=True).
+        
+        Alternate models are tried only while nothing has been streamed; once
+        a chunk has been yielded a failure is raised, since the caller has
+        already used part of the answer. Each model gets one attempt.
+        """
+        full_prompt = self._full_prompt(prompt, system_prompt)
+        # Local to the call: a registry-pooled provider is shared between requests
+        models_tried = []
+        
+        last_error = None
+        
+        for model_name in [self.model_name] + self.alternate_models:
+            streamed = False
+            try:
+                if model_name != self.model_name:
+                    logger.info(f"Trying alternate Gemini model: {model_name}")
+                
+                response = await self._get_model(model_name).generate_content_async(
+                    full_prompt,
+                    generation_config={
+                        "temperature": temperature,
+                        **kwargs
+                    },
+                    stream=True
+                )
+                async for chunk in response:
+                    text = chunk.text
+                    if text:
+                        streamed = True
+                        yield text
+                models_tried.append(model_name)
+                return
+                
+            except Exception as e:
+                models_tried.append(model_name)
+                if streamed:
+                    raise ProviderFailure("Gemini", model_name, e, 0)
+                last_error = e
+                logger.warning(f"Gemini model {model_name} stream failed: {str(e)[:200]}")
+        
+        error_msg = f"All Gemini models failed. Tried: {', '.join(models_tried)}"
+        raise ProviderFailure("Gemini", "all models", last_error or Exception(error_msg), 1)
+    
     def generate_explanation(
         self,
         traits: dict,
@@ -202,11 +451,8 @@ class GeminiProvider(LLMProviderBase):
         
         Overrides base method for Gemini-specific handling.
         """
-        from .templates import SYSTEM_PROMPT, get_personality_explanation_prompt
-        
-        system_prompt = system_prompt or SYSTEM_PROMPT
-        user_prompt = get_personality_explanation_prompt(
-            traits, facets, confidence, dominant, tone_profile=tone_profile, persona=persona
+        system_prompt, user_prompt = self._explanation_prompts(
+            traits, facets, confidence, dominant, system_prompt, tone_profile, persona
         )
         
         start_time = time.time()
@@ -218,87 +464,66 @@ class GeminiProvider(LLMProviderBase):
                 temperature=0.7
             )
             
-            generation_time_ms = int((time.time() - start_time) * 1000)
-            
-            # Use safe JSON parser from base class
-            from .provider_base import safe_json_parse
-            try:
-                parsed_response = safe_json_parse(content)
-            except ValueError as e:
-                logger.error(f"Failed to parse Gemini JSON: {e}")
-                # Return a structured response even if JSON is broken
-                return {
-                    "summary": "Unable to parse LLM response. Please try again.",
-                    "strengths": [],
-                    "challenges": [],
-                    "steps": [],
-                    "confidence_note": "Response parsing failed.",
-                    "model_name": self.model_name,
-                    "tokens_used": None,
-                    "generation_time_ms": generation_time_ms,
-                    "error": str(e),
-                    "raw_response": content[:500]
-                }
-            
-            # New persona-based format
-            persona_title = parsed_response.get("persona_title", "")
-            vibe_summary = parsed_response.get("vibe_summary", "")
-            strengths = parsed_response.get("strengths", [])
-            growth_edges = parsed_response.get("growth_edges", [])
-            how_you_show_up = parsed_response.get("how_you_show_up", "")
-            tagline = parsed_response.get("tagline", "")
-            
-            # Backward compatibility: handle old format if new format not present
-            if not persona_title and not vibe_summary:
-                summary = parsed_response.get("summary", "")
-                old_strengths = parsed_response.get("strengths", [])
-                old_challenges = parsed_response.get("challenges", [])
-                
-                if summary:
-                    vibe_summary = summary
-                if old_strengths:
-                    strengths = old_strengths
-                if old_challenges:
-                    growth_edges = old_challenges
-            
-            # Convert to steps format for backward compatibility
-            steps = []
-            if strengths:
-                steps.extend([f"Strength: {s}" for s in strengths])
-            if growth_edges:
-                steps.extend([f"Growth Edge: {g}" for g in growth_edges])
+            return self._build_explanation(
+                content, start_time, system_prompt, traits, facets, confidence, dominant
+            )
             
-            # Build summary from new format for backward compatibility
-            summary = vibe_summary or ""
-            if how_you_show_up:
-                summary += f"\n\n{how_you_show_up}"
+        except ProviderFailure as e:
+            raise e
+        except Exception as e:
+            raise ProviderFailure("Gemini", self.model_name, e, 0)
+    
+    async def agenerate_explanation(
+        self,
+        traits: dict,
+        facets: dict,
+        confidence: dict,
+        dominant: dict,
+        system_prompt: Optional[str] = None,
+        tone_profile: Optional[dict] = None,
+        persona: Optional[dict] = None
+    ) -> dict:
+        """Async generate_explanation with the same error handling"""
+        system_prompt, user_prompt = self._explanation_prompts(
+            traits, facets, confidence, dominant, system_prompt, tone_profile, persona
+        )
+        
+        start_time = time.time()
+        
+        try:
+            content = await self.agenerate_content(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                temperature=0.7
+            )
             
-            return {
-                # New persona format
-                "persona_title": persona_title,
-                "vibe_summary": vibe_summary,
-                "strengths": strengths,
-                "growth_edges": growth_edges,
-                "how_you_show_up": how_you_show_up,
-                "tagline": tagline,
-                # Backward compatibility fields
-                "summary": summary,
-                "challenges": growth_edges,
-                "steps": steps,
-                "confidence_note": "",
-                "model_name": self.model_name,
-                "tokens_used": None,  # Gemini doesn't provide token count in same way
-                "generation_time_ms": generation_time_ms,
-                "system_prompt": system_prompt,
-                "user_payload": {
-                    "traits": traits,
-                    "facets": facets,
-                    "confidence": confidence,
-                    "dominant": dominant
-                }
-            }
+            return self._build_explanation(
+                content, start_time, system_prompt, traits, facets, confidence, dominant
+            )
             
         except ProviderFailure as e:
             raise e
         except Exception as e:
             raise ProviderFailure("Gemini", self.model_name, e, 0)
+    
+    def _build_explanation(self, content, start_time, system_prompt, traits, facets, confidence, dominant, fields=None) -> dict:
+        """Base parsing, but a structured error dict (not an exception) when the JSON is unusable"""
+        try:
+            return super()._build_explanation(
+                content, start_time, system_prompt, traits, facets, confidence, dominant, fields=fields
+            )
+        except ValueError as e:
+            logger.error(f"Failed to parse Gemini JSON: {e}")
+            # Return a structured response even if JSON is broken
+            return {
+                "summary": "Unable to parse LLM response. Please try again.",
+                "strengths": [],
+                "challenges": [],
+                "steps": [],
+                "confidence_note": "Response parsing failed.",
+                "model_name": self.model_name,
+                "tokens_used": None,
+                "generation_time_ms": int((time.time() - start_time) * 1000),
+                "error": str(e),
+                "raw_response": content[:500]
+            }
@@ -0,0 +1,112 @@
+"""
+LifeSync Personality Engine - Hedged LLM Requests
+Latency-based hedging policy for a primary model and its alternates
+
+Tail latency with sequential fallback is the sum of the attempts. With a
+hedge policy the provider fires the alternate model in parallel once the
+primary has taken longer than a percentile of its recent latencies, keeps
+the first valid answer and cancels the other call. The percentile bounds
+the extra load: at p95, about 5% of calls are hedged.
+
+A primary cancelled because the alternate won is kept as a censored sample
+(its latency is only known to exceed the time it ran). Dropping those would
+lose the right tail, pull the percentile down and hedge more than intended.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Tuple
+
+from ..config.constants import (
+    HEDGE_CENSORED_BACKOFF,
+    HEDGE_DEFAULT_DELAY,
+    HEDGE_LATENCY_WINDOW,
+    HEDGE_MIN_DELAY,
+    HEDGE_MIN_SAMPLES,
+)
+
+
+class HedgePolicy:
+    """
+    When to hedge, and how often it happened.
+
+    Args:
+        percentile: Percentile (0-100] of recent primary latencies to wait before hedging
+        window: Primary latencies kept
+        min_samples: Latencies needed before the percentile is used
+        default_delay: Seconds to wait while fewer than min_samples are known
+        min_delay: Lower bound on the delay (seconds)
+        censored_backoff: Multiplier on a censored latency when the percentile falls on one
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        window: int = HEDGE_LATENCY_WINDOW,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        default_delay: float = HEDGE_DEFAULT_DELAY,
+        min_delay: float = HEDGE_MIN_DELAY,
+        censored_backoff: float = HEDGE_CENSORED_BACKOFF,
+    ):
+        if not 0 < percentile <= 100:
+            raise ValueError(f"Hedge percentile must be in (0, 100], got {percentile}")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.censored_backoff = censored_backoff
+        self._lock = threading.Lock()
+        # (seconds, censored)
+        self._latencies: Deque[Tuple[float, bool]] = deque(maxlen=window)
+        self._calls = 0
+        self._hedged = 0
+        self._cancelled = 0
+        self._failed = 0
+        self._wins: Dict[str, int] = {}
+
+    def delay(self) -> float:
+        """Seconds to wait for the primary before firing the alternate"""
+        with self._lock:
+            # Censored samples rank above every completed one: they outlasted a hedge delay
+            latencies = sorted(self._latencies, key=lambda sample: (sample[1], sample[0]))
+        if len(latencies) < self.min_samples:
+            return self.default_delay
+        rank = max(math.ceil(self.percentile / 100 * len(latencies)) - 1, 0)
+        seconds, censored = latencies[rank]
+        # The percentile lies somewhere beyond a censored sample: back off past it
+        if censored:
+            seconds *= self.censored_backoff
+        return max(seconds, self.min_delay)
+
+    def record_latency(self, seconds: float, censored: bool = False):
+        """A primary call's latency; censored = cancelled after this long, the real latency is longer"""
+        with self._lock:
+            self._latencies.append((seconds, censored))
+
+    def record_call(self, winner: str = None, hedged: bool = False, cancelled: int = 0):
+        """One call's outcome: the model whose answer was used (None = all failed)"""
+        with self._lock:
+            self._calls += 1
+            self._hedged += hedged
+            self._cancelled += cancelled
+            if winner is None:
+                self._failed += 1
+            else:
+                self._wins[winner] = self._wins.get(winner, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        delay = self.delay()
+        with self._lock:
+            return {
+                "percentile": self.percentile,
+                "delay_ms": round(delay * 1000, 1),
+                "samples": len(self._latencies),
+                "censored": sum(censored for _, censored in self._latencies),
+                "calls": self._calls,
+                "hedged": self._hedged,
+                "hedge_rate": round(self._hedged / self._calls, 4) if self._calls else 0.0,
+                "wins": dict(self._wins),
+                "cancelled": self._cancelled,
+                "failed": self._failed,
+            }
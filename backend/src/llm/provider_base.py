@@ -3,17 +3,41 @@ LifeSync Personality Engine - LLM Provider Base Class
 Abstract base class for LLM providers
 """
 
+import asyncio
 import json
-import re
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from ..utils.json_stream import JsonFieldStream
+from ..utils.safe_json import recover_json
+
+# Streamed explanation events: ("field", (name, value)) as each top-level
+# field of the model's JSON completes, then ("explanation", full dict)
+ExplanationEvent = Tuple[str, Any]
+
+
+# Top-level fields of an explanation response (new persona format and the old one)
+EXPLANATION_SCHEMA = {
+    "persona_title": str,
+    "vibe_summary": str,
+    "strengths": list,
+    "growth_edges": list,
+    "how_you_show_up": str,
+    "tagline": str,
+    "summary": str,
+    "challenges": list,
+}
 
 
 def safe_json_parse(content: str) -> Dict[str, Any]:
     """
     Safely parse JSON from LLM response, extracting JSON from text if needed.
     
+    Single pass over the text (see recover_json): markdown fences and extra
+    text are skipped, trailing commas and truncation repaired, and fields
+    that don't match EXPLANATION_SCHEMA's types dropped.
+    
     Args:
         content: Raw content from LLM (may contain extra text before/after JSON)
     
@@ -23,63 +47,7 @@ def safe_json_parse(content: str) -> Dict[str, Any]:
     Raises:
         ValueError: If no valid JSON can be found
     """
-    # Try direct JSON parse first
-    try:
-        return json.loads(content)
-    except json.JSONDecodeError:
-        pass
-    
-    # Try to extract JSON from text using regex
-    # Look for JSON object pattern: { ... }
-    json_pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-    matches = re.findall(json_pattern, content, re.DOTALL)
-    
-    for match in matches:
-        try:
-            parsed = json.loads(match)
-            # Validate it has the expected structure (new or old format)
-            if isinstance(parsed, dict) and (
-                "persona_title" in parsed or 
-                "vibe_summary" in parsed or 
-                "summary" in parsed or 
-                "strengths" in parsed or 
-                "challenges" in parsed or
-                "growth_edges" in parsed
-            ):
-                return parsed
-        except json.JSONDecodeError:
-            continue
-    
-    # Try to find JSON array pattern if object not found
-    array_pattern = r'\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]'
-    matches = re.findall(array_pattern, content, re.DOTALL)
-    
-    for match in matches:
-        try:
-            parsed = json.loads(match)
-            if isinstance(parsed, (dict, list)):
-                return parsed if isinstance(parsed, dict) else {"data": parsed}
-        except json.JSONDecodeError:
-            continue
-    
-    # Last resort: try to extract anything that looks like JSON
-    # Remove common markdown code blocks
-    content_clean = re.sub(r'```json\s*', '', content)
-    content_clean = re.sub(r'```\s*', '', content_clean)
-    content_clean = content_clean.strip()
-    
-    # Try to find the first { and last }
-    first_brace = content_clean.find('{')
-    last_brace = content_clean.rfind('}')
-    
-    if first_brace != -1 and last_brace != -1 and last_brace > first_brace:
-        json_str = content_clean[first_brace:last_brace + 1]
-        try:
-            return json.loads(json_str)
-        except json.JSONDecodeError:
-            pass
-    
-    raise ValueError(f"Could not extract valid JSON from LLM response: {content[:200]}")
+    return recover_json(content, EXPLANATION_SCHEMA)
 
 
 class LLMProviderBase(ABC):
@@ -139,11 +107,8 @@ class LLMProviderBase(ABC):
         Returns:
             Dictionary with explanation data
         """
-        from .templates import SYSTEM_PROMPT, get_personality_explanation_prompt
-        
-        system_prompt = system_prompt or SYSTEM_PROMPT
-        user_prompt = get_personality_explanation_prompt(
-            traits, facets, confidence, dominant, tone_profile=tone_profile, persona=persona
+        system_prompt, user_prompt = self._explanation_prompts(
+            traits, facets, confidence, dominant, system_prompt, tone_profile, persona
         )
         
         start_time = time.time()
@@ -155,73 +120,205 @@ class LLMProviderBase(ABC):
                 system_prompt=system_prompt
             )
             
-            generation_time_ms = int((time.time() - start_time) * 1000)
-            
-            # Parse JSON response - extract JSON from text if needed
-            parsed_response = safe_json_parse(content)
-            
-            # New persona-based format
-            persona_title = parsed_response.get("persona_title", "")
-            vibe_summary = parsed_response.get("vibe_summary", "")
-            strengths = parsed_response.get("strengths", [])
-            growth_edges = parsed_response.get("growth_edges", [])
-            how_you_show_up = parsed_response.get("how_you_show_up", "")
-            tagline = parsed_response.get("tagline", "")
-            
-            # Backward compatibility: handle old format if new format not present
-            if not persona_title and not vibe_summary:
-                # Old format: {summary, strengths, challenges}
-                summary = parsed_response.get("summary", "")
-                old_strengths = parsed_response.get("strengths", [])
-                old_challenges = parsed_response.get("challenges", [])
-                
-                # Convert old format to new format
-                if summary:
-                    vibe_summary = summary
-                if old_strengths:
-                    strengths = old_strengths
-                if old_challenges:
-                    growth_edges = old_challenges
-            
-            # Convert to steps format for backward compatibility
-            steps = []
-            if strengths:
-                steps.extend([f"Strength: {s}" for s in strengths])
-            if growth_edges:
-                steps.extend([f"Growth Edge: {g}" for g in growth_edges])
+            return self._build_explanation(
+                content, start_time, system_prompt, traits, facets, confidence, dominant
+            )
             
-            # Build summary from new format for backward compatibility
-            summary = vibe_summary or ""
-            if how_you_show_up:
-                summary += f"\n\n{how_you_show_up}"
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse LLM JSON response: {e}")
+        except Exception as e:
+            raise RuntimeError(f"LLM API call failed: {e}")
+    
+    async def agenerate_content(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
+        """
+        Async variant of generate_content.
+        
+        Providers with a native async SDK should override this; the default
+        runs the blocking call in a worker thread so the event loop stays free
+        (the thread itself cannot be interrupted on cancellation).
+        """
+        return await asyncio.to_thread(self.generate_content, prompt, system_prompt, **kwargs)
+    
+    async def agenerate_explanation(
+        self,
+        traits: Dict[str, float],
+        facets: Dict[str, float],
+        confidence: Dict[str, Any],
+        dominant: Dict[str, str],
+        system_prompt: Optional[str] = None,
+        tone_profile: Optional[Dict[str, Any]] = None,
+        persona: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of generate_explanation.
+        
+        Cancelling the awaiting task (e.g. on request timeout) cancels the
+        in-flight agenerate_content call.
+        """
+        system_prompt, user_prompt = self._explanation_prompts(
+            traits, facets, confidence, dominant, system_prompt, tone_profile, persona
+        )
+        
+        start_time = time.time()
+        
+        try:
+            content = await self.agenerate_content(
+                prompt=user_prompt,
+                system_prompt=system_prompt
+            )
             
-            return {
-                # New persona format
-                "persona_title": persona_title,
-                "vibe_summary": vibe_summary,
-                "strengths": strengths,
-                "growth_edges": growth_edges,
-                "how_you_show_up": how_you_show_up,
-                "tagline": tagline,
-                # Backward compatibility fields
-                "summary": summary,
-                "challenges": growth_edges,  # Map growth_edges to challenges for old code
-                "steps": steps,
-                "confidence_note": "",
-                "model_name": self.model_name,
-                "tokens_used": None,  # Provider-specific
-                "generation_time_ms": generation_time_ms,
-                "system_prompt": system_prompt,
-                "user_payload": {
-                    "traits": traits,
-                    "facets": facets,
-                    "confidence": confidence,
-                    "dominant": dominant
-                }
-            }
+            return self._build_explanation(
+                content, start_time, system_prompt, traits, facets, confidence, dominant
+            )
             
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to parse LLM JSON response: {e}")
         except Exception as e:
             raise RuntimeError(f"LLM API call failed: {e}")
-
+    
+    async def astream_content(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream generated text in chunks.
+        
+        Providers with a streaming API should override this; the default
+        yields the whole agenerate_content result as a single chunk.
+        """
+        yield await self.agenerate_content(prompt, system_prompt, **kwargs)
+    
+    async def astream_explanation(
+        self,
+        traits: Dict[str, float],
+        facets: Dict[str, float],
+        confidence: Dict[str, Any],
+        dominant: Dict[str, str],
+        system_prompt: Optional[str] = None,
+        tone_profile: Optional[Dict[str, Any]] = None,
+        persona: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[ExplanationEvent]:
+        """
+        Streaming generate_explanation.
+        
+        Yields ("field", (name, value)) for each top-level field of the
+        model's JSON as soon as it is complete, then ("explanation", dict)
+        built from the full text exactly as agenerate_explanation would.
+        """
+        system_prompt, user_prompt = self._explanation_prompts(
+            traits, facets, confidence, dominant, system_prompt, tone_profile, persona
+        )
+        
+        start_time = time.time()
+        fields = JsonFieldStream()
+        chunks = []
+        
+        async for chunk in self.astream_content(prompt=user_prompt, system_prompt=system_prompt):
+            chunks.append(chunk)
+            for field in fields.feed(chunk):
+                yield "field", field
+        
+        yield "explanation", self._build_explanation(
+            "".join(chunks), start_time, system_prompt, traits, facets, confidence, dominant, fields=fields
+        )
+    
+    @staticmethod
+    def _explanation_prompts(
+        traits: Dict[str, float],
+        facets: Dict[str, float],
+        confidence: Dict[str, Any],
+        dominant: Dict[str, str],
+        system_prompt: Optional[str],
+        tone_profile: Optional[Dict[str, Any]],
+        persona: Optional[Dict[str, Any]]
+    ) -> Tuple[str, str]:
+        """(system prompt, user prompt) for an explanation request"""
+        from .templates import SYSTEM_PROMPT, get_personality_explanation_prompt
+        
+        system_prompt = system_prompt or SYSTEM_PROMPT
+        user_prompt = get_personality_explanation_prompt(
+            traits, facets, confidence, dominant, tone_profile=tone_profile, persona=persona
+        )
+        return system_prompt, user_prompt
+    
+    def _build_explanation(
+        self,
+        content: str,
+        start_time: float,
+        system_prompt: str,
+        traits: Dict[str, float],
+        facets: Dict[str, float],
+        confidence: Dict[str, Any],
+        dominant: Dict[str, str],
+        fields: Optional[JsonFieldStream] = None
+    ) -> Dict[str, Any]:
+        """
+        Parse raw model output into the explanation dict.
+        
+        fields: the stream that already scanned content while it was
+        streamed; its object is used instead of parsing content again.
+        """
+        generation_time_ms = int((time.time() - start_time) * 1000)
+        
+        # Parse JSON response - extract JSON from text if needed
+        if fields is not None and fields.started:
+            parsed_response = fields.close(EXPLANATION_SCHEMA)
+        else:
+            parsed_response = safe_json_parse(content)
+        
+        # New persona-based format
+        persona_title = parsed_response.get("persona_title", "")
+        vibe_summary = parsed_response.get("vibe_summary", "")
+        strengths = parsed_response.get("strengths", [])
+        growth_edges = parsed_response.get("growth_edges", [])
+        how_you_show_up = parsed_response.get("how_you_show_up", "")
+        tagline = parsed_response.get("tagline", "")
+        
+        # Backward compatibility: handle old format if new format not present
+        if not persona_title and not vibe_summary:
+            # Old format: {summary, strengths, challenges}
+            summary = parsed_response.get("summary", "")
+            old_strengths = parsed_response.get("strengths", [])
+            old_challenges = parsed_response.get("challenges", [])
+            
+            # Convert old format to new format
+            if summary:
+                vibe_summary = summary
+            if old_strengths:
+                strengths = old_strengths
+            if old_challenges:
+                growth_edges = old_challenges
+        
+        # Convert to steps format for backward compatibility
+        steps = []
+        if strengths:
+            steps.extend([f"Strength: {s}" for s in strengths])
+        if growth_edges:
+            steps.extend([f"Growth Edge: {g}" for g in growth_edges])
+        
+        # Build summary from new format for backward compatibility
+        summary = vibe_summary or ""
+        if how_you_show_up:
+            summary += f"\n\n{how_you_show_up}"
+        
+        return {
+            # New persona format
+            "persona_title": persona_title,
+            "vibe_summary": vibe_summary,
+            "strengths": strengths,
+            "growth_edges": growth_edges,
+            "how_you_show_up": how_you_show_up,
+            "tagline": tagline,
+            # Backward compatibility fields
+            "summary": summary,
+            "challenges": growth_edges,  # Map growth_edges to challenges for old code
+            "steps": steps,
+            "confidence_note": "",
+            "model_name": self.model_name,
+            "tokens_used": None,  # Provider-specific
+            "generation_time_ms": generation_time_ms,
+            "system_prompt": system_prompt,
+            "user_payload": {
+                "traits": traits,
+                "facets": facets,
+                "confidence": confidence,
+                "dominant": dominant
+            }
+        }
@@ -0,0 +1,124 @@
+"""
+LifeSync Personality Engine - LLM Provider Registry
+Long-lived provider instances shared across requests
+
+Building a GeminiProvider calls genai.configure(), which drops the SDK's
+cached clients, and builds GenerativeModel objects whose clients (and
+connections) are only created on their first call. Doing that per request
+puts client setup and a TLS handshake on every explanation. The registry
+keeps one configured provider per (provider, model, API key) and reuses it.
+
+Keys are read by the caller at request time: when a different key shows up
+(rotation), providers built for the old key are dropped and new ones are
+configured with it, without a restart. genai's configuration is process-wide,
+so only one Gemini key is live at a time.
+
+With GEMINI_HEDGING_ENABLED each pooled Gemini provider gets its own
+HedgePolicy, so the latency percentile is learned per primary model.
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from ..config.llm_provider import GEMINI_HEDGE_PERCENTILE, GEMINI_HEDGING_ENABLED, get_gemini_key
+from .gemini_provider import GeminiProvider
+from .hedging import HedgePolicy
+from .provider_base import LLMProviderBase
+
+logger = logging.getLogger(__name__)
+
+
+def _fingerprint(api_key: str) -> str:
+    """Registry key for an API key (raw keys are never stored or reported)"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+class ProviderRegistry:
+    """Pool of configured provider instances keyed by (provider, model, key fingerprint)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._instances: Dict[Tuple[str, str, str], LLMProviderBase] = {}
+        self._created = 0
+        self._reused = 0
+        self._rotations = 0
+
+    def gemini(self, model_name: Optional[str] = None, api_key: Optional[str] = None) -> GeminiProvider:
+        """
+        Shared GeminiProvider for model_name.
+
+        Args:
+            model_name: Primary model (default: GeminiProvider.DEFAULT_MODEL)
+            api_key: Key to use; read via get_gemini_key() when omitted
+
+        Raises:
+            ValueError: If no API key is available
+        """
+        api_key = api_key if api_key is not None else get_gemini_key()
+        if not api_key:
+            raise ValueError("Gemini API key required")
+        model_name = model_name or GeminiProvider.DEFAULT_MODEL
+        fingerprint = _fingerprint(api_key)
+        key = ("gemini", model_name, fingerprint)
+
+        instance = self._instances.get(key)
+        if instance is not None:
+            self._reused += 1
+            return instance
+
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is not None:
+                self._reused += 1
+                return instance
+
+            stale = [k for k in self._instances if k[0] == "gemini" and k[2] != fingerprint]
+            if stale:
+                # Rotated key: genai is configured globally, so every Gemini entry goes
+                for k in stale:
+                    del self._instances[k]
+                self._rotations += 1
+                logger.info(f"[LLM] Gemini API key rotated; dropped {len(stale)} pooled provider(s)")
+
+            hedge_policy = HedgePolicy(percentile=GEMINI_HEDGE_PERCENTILE) if GEMINI_HEDGING_ENABLED else None
+            instance = GeminiProvider(model_name=model_name, api_key=api_key, hedge_policy=hedge_policy)
+            self._instances[key] = instance
+            self._created += 1
+            return instance
+
+    def clear(self):
+        with self._lock:
+            self._instances.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._created + self._reused
+        return {
+            "providers": len(self._instances),
+            "created": self._created,
+            "reused": self._reused,
+            "rotations": self._rotations,
+            "reuse_rate": round(self._reused / lookups, 4) if lookups else 0.0,
+            "entries": [f"{provider}:{model}:{fingerprint}" for provider, model, fingerprint in self._instances],
+        }
+
+    def hedging_stats(self) -> Dict[str, Any]:
+        """Hedge rate and wins per pooled provider that hedges"""
+        return {
+            f"{provider}:{model}:{fingerprint}": instance.hedge_policy.stats()
+            for (provider, model, fingerprint), instance in list(self._instances.items())
+            if getattr(instance, "hedge_policy", None) is not None
+        }
+
+
+# Process-wide registry
+provider_registry = ProviderRegistry()
+
+
+def get_provider_registry_stats() -> Dict[str, Any]:
+    return provider_registry.stats()
+
+
+def get_hedging_stats() -> Dict[str, Any]:
+    return {"enabled": GEMINI_HEDGING_ENABLED, "providers": provider_registry.hedging_stats()}
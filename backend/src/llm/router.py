@@ -4,14 +4,15 @@ Production-ready router with automatic fallback between providers
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from ..config.llm_provider import get_gemini_key
 from .circuit_breaker import (
     CircuitBreaker,
     with_circuit_breaker,
 )
-from .gemini_provider import GeminiProvider
+from .provider_base import ExplanationEvent
+from .provider_registry import provider_registry
 
 logger = logging.getLogger(__name__)
 
@@ -44,17 +45,37 @@ async def generate_explanation_async(
     """
     Async wrapper for generation with circuit breaker.
     """
-    # Note: Since the underlying provider might be sync, we might need to run it in threadpool
-    # if we want true async non-blocking behavior.
-    # For now, we assume the provider call is what we are wrapping.
-    # However, existing generate_explanation is sync.
-    # The circuit breaker decorator expects an async function.
-
-    # We will call the sync function directly here
-    return _generate_explanation_impl(
+    return await _agenerate_explanation_impl(
         traits, facets, confidence, dominant, provider, system_prompt, tone_profile, persona
     )
 
+def _missing_key_explanation() -> Dict[str, Any]:
+    error_msg = "Gemini API key not configured. Please set GEMINI_API_KEY."
+    logger.error(error_msg)
+    return {
+        "error": error_msg,
+        "summary": "AI generation is unavailable because the API key is missing.",
+        "steps": [],
+        "confidence_note": ""
+    }
+
+def _failed_explanation(e: Exception) -> Dict[str, Any]:
+    """Record a failed call on the circuit and build the error response"""
+    gemini_circuit.record_failure()
+    error_msg = f"Gemini generation failed: {str(e)}"
+    logger.error(error_msg)
+
+    # If circuit just opened, return fallback
+    if gemini_circuit.state.name == "OPEN":
+         return get_fallback_explanation()
+
+    return {
+        "error": error_msg,
+        "summary": "Unable to generate explanation due to an AI service error.",
+        "steps": [],
+        "confidence_note": "Please check your internet connection or try again later."
+    }
+
 def _generate_explanation_impl(
     traits, facets, confidence, dominant, provider, system_prompt, tone_profile, persona
 ) -> Dict[str, Any]:
@@ -62,18 +83,11 @@ def _generate_explanation_impl(
     gemini_key = get_gemini_key()
     
     if not gemini_key or gemini_key.startswith("YOUR"):
-        error_msg = "Gemini API key not configured. Please set GEMINI_API_KEY."
-        logger.error(error_msg)
-        return {
-            "error": error_msg,
-            "summary": "AI generation is unavailable because the API key is missing.",
-            "steps": [],
-            "confidence_note": ""
-        }
+        return _missing_key_explanation()
     
     try:
         logger.info("[LLM] Using Gemini (gemini-2.0-flash)")
-        provider_instance = GeminiProvider(model_name="gemini-2.0-flash", api_key=gemini_key)
+        provider_instance = provider_registry.gemini("gemini-2.0-flash", gemini_key)
         
         result = provider_instance.generate_explanation(
             traits=traits,
@@ -91,6 +105,28 @@ def _generate_explanation_impl(
         # Re-raise exception so circuit breaker can track it
         raise e
 
+async def _agenerate_explanation_impl(
+    traits, facets, confidence, dominant, provider, system_prompt, tone_profile, persona
+) -> Dict[str, Any]:
+    """Async generation: the SDK call is awaited, so cancelling the caller cancels it."""
+    gemini_key = get_gemini_key()
+    
+    if not gemini_key or gemini_key.startswith("YOUR"):
+        return _missing_key_explanation()
+    
+    logger.info("[LLM] Using Gemini (gemini-2.0-flash, async)")
+    provider_instance = provider_registry.gemini("gemini-2.0-flash", gemini_key)
+    
+    return await provider_instance.agenerate_explanation(
+        traits=traits,
+        facets=facets,
+        confidence=confidence,
+        dominant=dominant,
+        system_prompt=system_prompt,
+        tone_profile=tone_profile,
+        persona=persona
+    )
+
 def generate_explanation(
     traits: Dict[str, float],
     facets: Dict[str, float],
@@ -134,20 +170,85 @@ def generate_explanation(
         return result
 
     except Exception as e:
-        gemini_circuit.record_failure()
-        error_msg = f"Gemini generation failed: {str(e)}"
-        logger.error(error_msg)
-
-        # If circuit just opened, return fallback
-        if gemini_circuit.state.name == "OPEN":
-             return get_fallback_explanation()
-
-        return {
-            "error": error_msg,
-            "summary": "Unable to generate explanation due to an AI service error.",
-            "steps": [],
-            "confidence_note": "Please check your internet connection or try again later."
-        }
+        return _failed_explanation(e)
+
+async def agenerate_explanation(
+    traits: Dict[str, float],
+    facets: Dict[str, float],
+    confidence: Dict[str, Any],
+    dominant: Dict[str, str],
+    provider: Optional[str] = None,
+    system_prompt: Optional[str] = None,
+    tone_profile: Optional[Dict[str, Any]] = None,
+    persona: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Async generate_explanation: same circuit handling and error dicts.
+
+    Nothing blocks the event loop, and a cancelled caller (request timeout)
+    cancels the in-flight Gemini call. Cancellation is not counted as a
+    provider failure.
+    """
+    if not gemini_circuit.allow_request():
+         logger.warning("Gemini circuit is OPEN (fast fail)")
+         return get_fallback_explanation()
+
+    try:
+        result = await _agenerate_explanation_impl(
+            traits, facets, confidence, dominant, provider, system_prompt, tone_profile, persona
+        )
+        gemini_circuit.record_success()
+        return result
+
+    except Exception as e:
+        return _failed_explanation(e)
+
+async def astream_explanation(
+    traits: Dict[str, float],
+    facets: Dict[str, float],
+    confidence: Dict[str, Any],
+    dominant: Dict[str, str],
+    provider: Optional[str] = None,
+    system_prompt: Optional[str] = None,
+    tone_profile: Optional[Dict[str, Any]] = None,
+    persona: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[ExplanationEvent]:
+    """
+    Streaming agenerate_explanation.
+    
+    Yields ("field", (name, value)) events as Gemini streams the JSON, then
+    one ("explanation", dict). Circuit handling matches agenerate_explanation:
+    an open circuit, missing key or provider failure ends the stream with the
+    fallback/error dict as the explanation.
+    """
+    if not gemini_circuit.allow_request():
+         logger.warning("Gemini circuit is OPEN (fast fail)")
+         yield "explanation", get_fallback_explanation()
+         return
+
+    gemini_key = get_gemini_key()
+    if not gemini_key or gemini_key.startswith("YOUR"):
+        yield "explanation", _missing_key_explanation()
+        return
+
+    try:
+        logger.info("[LLM] Using Gemini (gemini-2.0-flash, streaming)")
+        provider_instance = provider_registry.gemini("gemini-2.0-flash", gemini_key)
+        
+        async for event in provider_instance.astream_explanation(
+            traits=traits,
+            facets=facets,
+            confidence=confidence,
+            dominant=dominant,
+            system_prompt=system_prompt,
+            tone_profile=tone_profile,
+            persona=persona
+        ):
+            yield event
+        gemini_circuit.record_success()
+
+    except Exception as e:
+        yield "explanation", _failed_explanation(e)
 
 # Keep the old implementation structure for reference but use the new logic
 def _unused_generate_explanation_legacy_signature(
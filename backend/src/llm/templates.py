@@ -1,7 +1,22 @@
 """
 LifeSync Personality Engine - LLM Prompt Templates
+
+The user prompt is assembled from compiled fragments: the persona block and
+the persona-specific instructions are rendered once per persona and the tone
+block once per tone profile. Only the score lines are rendered per request;
+whole prompts are not cached, since the rendered scores almost never repeat.
+The output is byte-for-byte what the original concatenation produced.
 """
 
+import heapq
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from src.config.constants import PROMPT_FRAGMENT_CACHE_SIZE
+
+# Bump whenever prompt wording changes: cached explanations are keyed on it
+PROMPT_TEMPLATE_VERSION = "1"
+
 SYSTEM_PROMPT = """You are generating a personality profile for a self-development app called LifeSync.
 
 Do NOT use academic psychology jargon. Avoid technical MBTI terminology unless necessary.
@@ -63,131 +78,80 @@ def _convert_traits_to_codes(traits: dict) -> dict:
     return {mapping.get(k, k): v for k, v in traits.items() if k in mapping}
 
 
-def get_personality_explanation_prompt(
-    traits: dict, 
-    facets: dict, 
-    confidence: dict, 
-    dominant: dict,
-    tone_profile: dict = None,
-    persona: dict = None
-) -> str:
-    """
-    Generate a user prompt for personality explanation with tone guidance.
-    
-    Args:
-        traits: OCEAN trait scores (0-1 scale)
-        facets: Facet scores (0-1 scale)
-        confidence: Confidence scores for traits and facets
-        dominant: Dominant profile (MBTI proxy, neuroticism level, personality code)
-        tone_profile: Optional tone profile from tone generator
-        persona: Optional persona object from persona registry
-    
-    Returns:
-        Formatted prompt string with tone guidance
-    """
-    # Build tone text block if tone profile is provided
-    tone_text = ""
-    if tone_profile:
-        style_list = tone_profile.get("style", [])
-        strengths_list = tone_profile.get("strengths", [])
-        cautions_list = tone_profile.get("cautions", [])
-        
-        tone_text = "Use the following communication tone:\n"
-        if style_list:
-            tone_text += f"- {', '.join(style_list)}\n\n"
-        else:
-            tone_text += "- friendly, clear\n\n"
-        
-        if strengths_list:
-            tone_text += "Highlight strengths:\n"
-            tone_text += f"- {', '.join(strengths_list)}\n\n"
-        
-        if cautions_list:
-            tone_text += "Be mindful of sensitivities:\n"
-            tone_text += f"- {', '.join(cautions_list)}\n\n"
-    
-    # Build trait scores text
-    trait_scores_text = "\n".join([
-        f"- {trait}: {traits.get(trait, 0.5):.2f} (confidence: {confidence.get('traits', {}).get(trait, 0):.2f})"
-        for trait in ["Openness", "Conscientiousness", "Extraversion", "Agreeableness", "Neuroticism"]
-    ])
-    
-    # Build facet scores text (top 5)
-    facet_scores_text = ""
-    if facets:
-        top_facets = sorted(
-            [(k, v) for k, v in facets.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
-        if top_facets:
-            facet_scores_text = "\n".join([
-                f"- {facet_name}: {score:.2f}"
-                for facet_name, score in top_facets
-            ])
-    
-    # Determine Persona details
-    if persona:
-        persona_title = persona.get("title", "Unknown Persona")
-        persona_tagline = persona.get("tagline", "")
-        persona_desc = persona.get("description", "")
-        llm_template_instruction = persona.get("llm_template", "")
-    else:
-        # Fallback to MBTI mapping if no persona provided (legacy support)
-        mbti_type = dominant.get("mbti_proxy", "UNKNOWN")
-        persona_mapping = {
-            "INFJ": "The Insightful Guide",
-            "INFP": "The Imaginative Healer",
-            "INTJ": "The Strategic Visionary",
-            "INTP": "The Curious Architect",
-            "ENFJ": "The Visionary Mentor",
-            "ENFP": "The Creative Catalyst",
-            "ENTJ": "The Commanding Architect",
-            "ENTP": "The Trailblazing Inventor",
-            "ISFJ": "The Quiet Guardian",
-            "ISFP": "The Gentle Creator",
-            "ISTJ": "The Grounded Strategist",
-            "ISTP": "The Analytical Explorer",
-            "ESFJ": "The Warm Connector",
-            "ESFP": "The Radiant Performer",
-            "ESTJ": "The Organized Leader",
-            "ESTP": "The Energetic Improviser"
-        }
-        persona_title = persona_mapping.get(mbti_type, f"The {mbti_type}")
-        persona_tagline = ""
-        persona_desc = ""
-        llm_template_instruction = ""
-    
-    # Build the complete prompt
-    prompt = """You are generating a personality profile for LifeSync, a self-development app.
+TRAIT_NAMES = ["Openness", "Conscientiousness", "Extraversion", "Agreeableness", "Neuroticism"]
+
+# Fallback titles by MBTI proxy when no persona is given (legacy support)
+MBTI_PERSONA_TITLES = {
+    "INFJ": "The Insightful Guide",
+    "INFP": "The Imaginative Healer",
+    "INTJ": "The Strategic Visionary",
+    "INTP": "The Curious Architect",
+    "ENFJ": "The Visionary Mentor",
+    "ENFP": "The Creative Catalyst",
+    "ENTJ": "The Commanding Architect",
+    "ENTP": "The Trailblazing Inventor",
+    "ISFJ": "The Quiet Guardian",
+    "ISFP": "The Gentle Creator",
+    "ISTJ": "The Grounded Strategist",
+    "ISTP": "The Analytical Explorer",
+    "ESFJ": "The Warm Connector",
+    "ESFP": "The Radiant Performer",
+    "ESTJ": "The Organized Leader",
+    "ESTP": "The Energetic Improviser"
+}
+
+_PROMPT_HEAD = """You are generating a personality profile for LifeSync, a self-development app.
 
 Your goal: Make the user FEEL understood. Keep it short, warm, and emotionally resonant.
 
 """
+
+# (persona_title, tagline, description, llm_template) / (style, strengths, cautions)
+PersonaKey = Tuple[str, str, str, str]
+ToneKey = Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]
+
+
+@lru_cache(maxsize=PROMPT_FRAGMENT_CACHE_SIZE)
+def _compile_tone(tone_key: ToneKey) -> str:
+    """Tone guidance block (empty key = no tone profile)"""
+    if not tone_key:
+        return ""
+    style_list, strengths_list, cautions_list = tone_key
     
-    if tone_text:
-        prompt += tone_text
+    tone_text = "Use the following communication tone:\n"
+    if style_list:
+        tone_text += f"- {', '.join(style_list)}\n\n"
+    else:
+        tone_text += "- friendly, clear\n\n"
     
-    prompt += f"""Persona title: {persona_title}
-"""
-    if persona_tagline:
-        prompt += f"Tagline: {persona_tagline}\n"
-    if persona_desc:
-        prompt += f"Description: {persona_desc}\n"
+    if strengths_list:
+        tone_text += "Highlight strengths:\n"
+        tone_text += f"- {', '.join(strengths_list)}\n\n"
+    
+    if cautions_list:
+        tone_text += "Be mindful of sensitivities:\n"
+        tone_text += f"- {', '.join(cautions_list)}\n\n"
+    return tone_text
 
-    prompt += f"""
-Trait scores:
-{trait_scores_text}
 
-"""
+@lru_cache(maxsize=PROMPT_FRAGMENT_CACHE_SIZE)
+def _compile_persona(persona_key: PersonaKey) -> Tuple[str, str]:
+    """
+    Static persona fragments around the score lines.
     
-    if facet_scores_text:
-        prompt += f"""Top facet scores:
-{facet_scores_text}
+    Returns:
+        (persona block before the trait scores, everything after the facet scores)
+    """
+    persona_title, persona_tagline, persona_desc, llm_template_instruction = persona_key
 
+    head = f"""Persona title: {persona_title}
 """
-    
-    prompt += f"""You are generating a personality profile for a self-development app called LifeSync.
+    if persona_tagline:
+        head += f"Tagline: {persona_tagline}\n"
+    if persona_desc:
+        head += f"Description: {persona_desc}\n"
+
+    tail = f"""You are generating a personality profile for a self-development app called LifeSync.
 
 Do NOT use academic psychology jargon. Avoid technical MBTI terminology unless necessary.
 
@@ -207,12 +171,12 @@ You are given:
 """
 
     if llm_template_instruction:
-        prompt += f"""Specific Instruction for this Persona:
+        tail += f"""Specific Instruction for this Persona:
 {llm_template_instruction}
 
 """
 
-    prompt += f"""Format your final output EXACTLY like this:
+    tail += f"""Format your final output EXACTLY like this:
 
 1. **Persona Title** (big + bold)
    Use: "{persona_title}"
@@ -248,6 +212,93 @@ Return ONLY valid JSON (no extra text before or after):
   "how_you_show_up": "3-4 short sentences describing real-world behavior. Make it relatable and specific.",
   "tagline": "A short, memorable phrase that captures their essence"
 }}"""
+    return head, tail
+
+
+def _assemble_prompt(persona_key: PersonaKey, tone_key: ToneKey, trait_scores_text: str, facet_scores_text: str) -> str:
+    persona_head, persona_tail = _compile_persona(persona_key)
+
+    prompt = _PROMPT_HEAD + _compile_tone(tone_key) + persona_head
+    prompt += f"""
+Trait scores:
+{trait_scores_text}
+
+"""
+    if facet_scores_text:
+        prompt += f"""Top facet scores:
+{facet_scores_text}
+
+"""
+    return prompt + persona_tail
+
+
+def _persona_key(persona: Optional[dict], dominant: dict) -> PersonaKey:
+    if persona:
+        return (
+            persona.get("title", "Unknown Persona"),
+            persona.get("tagline", ""),
+            persona.get("description", ""),
+            persona.get("llm_template", ""),
+        )
+    mbti_type = dominant.get("mbti_proxy", "UNKNOWN")
+    return (MBTI_PERSONA_TITLES.get(mbti_type, f"The {mbti_type}"), "", "", "")
+
+
+def _tone_key(tone_profile: Optional[dict]) -> ToneKey:
+    if not tone_profile:
+        return ()
+    return (
+        tuple(tone_profile.get("style") or ()),
+        tuple(tone_profile.get("strengths") or ()),
+        tuple(tone_profile.get("cautions") or ()),
+    )
+
+
+def get_personality_explanation_prompt(
+    traits: dict, 
+    facets: dict, 
+    confidence: dict, 
+    dominant: dict,
+    tone_profile: dict = None,
+    persona: dict = None
+) -> str:
+    """
+    Generate a user prompt for personality explanation with tone guidance.
+    
+    Args:
+        traits: OCEAN trait scores (0-1 scale)
+        facets: Facet scores (0-1 scale)
+        confidence: Confidence scores for traits and facets
+        dominant: Dominant profile (MBTI proxy, neuroticism level, personality code)
+        tone_profile: Optional tone profile from tone generator
+        persona: Optional persona object from persona registry
     
-    return prompt
+    Returns:
+        Formatted prompt string with tone guidance
+    """
+    # Score lines are rendered per request; everything else comes from compiled fragments
+    trait_confidence = confidence.get('traits', {})
+    trait_scores_text = "\n".join([
+        f"- {trait}: {traits.get(trait, 0.5):.2f} (confidence: {trait_confidence.get(trait, 0):.2f})"
+        for trait in TRAIT_NAMES
+    ])
+    
+    # Top 5 facets (nlargest is documented as sorted(..., reverse=True)[:n])
+    facet_scores_text = ""
+    if facets:
+        top_facets = heapq.nlargest(5, facets.items(), key=lambda x: x[1])
+        facet_scores_text = "\n".join([
+            f"- {facet_name}: {score:.2f}"
+            for facet_name, score in top_facets
+        ])
+    
+    return _assemble_prompt(_persona_key(persona, dominant), _tone_key(tone_profile), trait_scores_text, facet_scores_text)
+
 
+def get_prompt_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counts of the compiled prompt caches"""
+    stats = {}
+    for name, cached in (("personas", _compile_persona), ("tones", _compile_tone)):
+        info = cached.cache_info()
+        stats[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
+    return stats
@@ -1,4 +1,6 @@
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
 
 PERSONAS = [
   # 1
@@ -527,52 +529,127 @@ def distance_from_range_center(val: float, range_tuple: Tuple[float, float]) ->
     center = (range_tuple[0] + range_tuple[1]) / 2
     return abs(val - center)
 
-def map_profile_to_persona(profile: Dict[str, float]) -> Dict[str, Any]:
+# Ranges compiled once at import: (personas, traits) bounds in TRAITS order
+TRAITS = ["openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism"]
+
+_RANGE_LO = np.array([[p["ranges"][t][0] for t in TRAITS] for p in PERSONAS], dtype=np.float64)
+_RANGE_HI = np.array([[p["ranges"][t][1] for t in TRAITS] for p in PERSONAS], dtype=np.float64)
+_RANGE_CENTER = (_RANGE_LO + _RANGE_HI) / 2
+
+# Profiles scored per block in map_profiles_to_personas (bounds the (block, personas, traits) temporaries)
+_BATCH_BLOCK = 4096
+
+def _score_matrix(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Maps an OCEAN profile to a persona.
-    profile: Dict with keys 'openness', 'conscientiousness', 'extraversion', 'agreeableness', 'neuroticism'
-             Values should be 0-100.
+    Hits and proximity of every persona for each profile row (0-100, TRAITS order).
+
+    Same arithmetic as the per-trait loop: a trait inside the range adds one
+    hit and its distance from the range center; outside, it adds the
+    distance to the range if within 10 points, otherwise a flat 30.
     """
-    scored = []
-    traits = ["openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism"]
-    
-    for p in PERSONAS:
-        hits = 0
-        proximity = 0
-        
-        for t in traits:
-            val = profile.get(t, 0)
-            r = p["ranges"][t]
-            if in_range(val, (r[0], r[1])):
-                hits += 1
-                proximity += distance_from_range_center(val, (r[0], r[1]))
-            else:
-                min_val, max_val = r
-                delta = max(min_val - val, val - max_val, 0)
-                if delta <= 10:
-                    proximity += delta
-                else:
-                    proximity += 30
-        
-        scored.append({
-            "persona": p,
-            "hits": hits,
-            "proximity": proximity
-        })
-    
-    # Sort by hits (descending) then proximity (ascending)
-    scored.sort(key=lambda x: (-x["hits"], x["proximity"]))
-    
-    top = scored[0]
-    
-    # Calculate confidence
-    base_confidence = top["hits"] / 5
-    proximity_boost = max(0, 1 - (top["proximity"] / (5 * 50)))
+    v = values[:, None, :]
+    inside = (_RANGE_LO <= v) & (v <= _RANGE_HI)
+    delta = np.maximum(np.maximum(_RANGE_LO - v, v - _RANGE_HI), 0)
+    terms = np.where(inside, np.abs(v - _RANGE_CENTER), np.where(delta <= 10, delta, 30))
+    hits = inside.sum(axis=2)
+    # Accumulate trait by trait so float sums match the original loop bit for bit
+    proximity = terms[:, :, 0].copy()
+    for t in range(1, len(TRAITS)):
+        proximity += terms[:, :, t]
+    return hits, proximity
+
+def _best_personas(hits: np.ndarray, proximity: np.ndarray) -> np.ndarray:
+    """Index of the top persona per row: most hits, then least proximity, then PERSONAS order"""
+    most_hits = hits == hits.max(axis=1, keepdims=True)
+    return np.argmin(np.where(most_hits, proximity, np.inf), axis=1)
+
+def _persona_result(index: int, hits: int, proximity: float) -> Dict[str, Any]:
+    base_confidence = hits / 5
+    proximity_boost = max(0, 1 - (proximity / (5 * 50)))
     confidence = min(1, base_confidence * 0.75 + proximity_boost * 0.25)
-    
+
     return {
-        "persona": top["persona"],
+        "persona": PERSONAS[index],
         "confidence": round(confidence * 100),
-        "hits": top["hits"],
-        "proximity": round(top["proximity"])
+        "hits": hits,
+        "proximity": round(proximity)
     }
+
+def map_profile_to_persona(profile: Dict[str, float]) -> Dict[str, Any]:
+    """
+    Maps an OCEAN profile to a persona.
+    profile: Dict with keys 'openness', 'conscientiousness', 'extraversion', 'agreeableness', 'neuroticism'
+             Values should be 0-100.
+    """
+    values = np.array([[profile.get(t, 0) for t in TRAITS]], dtype=np.float64)
+    hits, proximity = _score_matrix(values)
+    best = int(_best_personas(hits, proximity)[0])
+    return _persona_result(best, int(hits[0, best]), float(proximity[0, best]))
+
+def map_profiles_to_personas(matrix: Any) -> List[Dict[str, Any]]:
+    """
+    Maps many OCEAN profiles at once.
+    matrix: (n, 5) array-like of 0-100 scores in TRAITS order.
+    Returns one map_profile_to_persona() result per row.
+    """
+    values = np.asarray(matrix, dtype=np.float64).reshape(-1, len(TRAITS))
+    results = []
+    for start in range(0, len(values), _BATCH_BLOCK):
+        hits, proximity = _score_matrix(values[start:start + _BATCH_BLOCK])
+        best = _best_personas(hits, proximity)
+        rows = np.arange(len(best))
+        results.extend(
+            _persona_result(int(i), int(h), float(p))
+            for i, h, p in zip(best, hits[rows, best], proximity[rows, best])
+        )
+    return results
+
+class PersonaGrid:
+    """
+    Optional O(1) persona lookup over a quantized 0-100 grid.
+
+    Every grid point (step apart on each trait) is mapped once with
+    map_profiles_to_personas(); lookup() snaps a profile to the nearest grid
+    point. Results are identical to map_profile_to_persona() on grid points
+    only: other profiles get the answer for their grid point, which can
+    differ near range boundaries. A 1-point step would need 101^5 entries,
+    so the grid is an approximation for coarse steps (10 -> 11^5 entries, ~1 MB).
+    """
+
+    def __init__(self, step: int = 10):
+        if step <= 0 or 100 % step:
+            raise ValueError("step must be a positive divisor of 100")
+        self.step = step
+        self.points = 100 // step + 1
+        axis = np.arange(self.points, dtype=np.float64) * step
+        grid = np.stack(np.meshgrid(*[axis] * len(TRAITS), indexing="ij"), axis=-1).reshape(-1, len(TRAITS))
+
+        self.persona_idx = np.empty(len(grid), dtype=np.int16)
+        self.confidence = np.empty(len(grid), dtype=np.int16)
+        self.hits = np.empty(len(grid), dtype=np.int8)
+        self.proximity = np.empty(len(grid), dtype=np.int16)
+        for start in range(0, len(grid), _BATCH_BLOCK):
+            hits, proximity = _score_matrix(grid[start:start + _BATCH_BLOCK])
+            best = _best_personas(hits, proximity)
+            rows = np.arange(len(best))
+            best_hits, best_proximity = hits[rows, best], proximity[rows, best]
+            block = slice(start, start + len(best))
+            self.persona_idx[block] = best
+            self.hits[block] = best_hits
+            self.proximity[block] = np.round(best_proximity)
+            self.confidence[block] = [
+                _persona_result(0, int(h), float(p))["confidence"] for h, p in zip(best_hits, best_proximity)
+            ]
+        self._strides = [self.points ** (len(TRAITS) - 1 - t) for t in range(len(TRAITS))]
+
+    def lookup(self, profile: Dict[str, float]) -> Dict[str, Any]:
+        """map_profile_to_persona() result for the profile's nearest grid point"""
+        cell = 0
+        for t, stride in zip(TRAITS, self._strides):
+            cell += min(max(round(profile.get(t, 0) / self.step), 0), self.points - 1) * stride
+        return {
+            "persona": PERSONAS[self.persona_idx[cell]],
+            "confidence": int(self.confidence[cell]),
+            "hits": int(self.hits[cell]),
+            "proximity": int(self.proximity[cell])
+        }
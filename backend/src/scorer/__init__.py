@@ -2,11 +2,24 @@
 LifeSync Personality Scorer Module
 """
 
+from .adaptive import AdaptiveQuiz
 from .create_scorer_wrapper import (
+    get_balanced_question_ids,
+    get_percentiles,
     get_question_metadata,
+    get_registry,
+    get_scorer,
+    score_and_validate,
     score_answers,
+    score_many,
+    score_packed,
+    start_adaptive_quiz,
+    start_session,
     validate_responses,
 )
+from .packed_answers import PackedAnswersError, pack_answers, pack_answers_base64
+from .registry import ScoringRegistry, UnknownScoringVersionError
+from .scoring_session import ScoringSession
 
-__all__ = ['score_answers', 'get_question_metadata', 'validate_responses']
+__all__ = ['score_answers', 'score_many', 'score_packed', 'pack_answers', 'pack_answers_base64', 'PackedAnswersError', 'score_and_validate', 'start_session', 'ScoringSession', 'start_adaptive_quiz', 'AdaptiveQuiz', 'get_balanced_question_ids', 'get_question_metadata', 'get_percentiles', 'validate_responses', 'get_registry', 'get_scorer', 'ScoringRegistry', 'UnknownScoringVersionError']
 
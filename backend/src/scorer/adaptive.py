@@ -0,0 +1,240 @@
+"""
+LifeSync Personality Scorer - Adaptive Question Selection
+Computerized adaptive testing (CAT): ask the most informative question next, stop once every trait is precise
+"""
+
+import weakref
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.config.constants import CAT_CONFIDENCE_THRESHOLD, CAT_MAX_QUESTIONS
+
+from .compiled_bank import CompiledQuestionBank
+from .personality_scorer import PersonalityScorer
+from .score_result import ScoreResult
+from .scoring_session import ScoringSession
+
+# Pseudo-observations of prior variance mixed into each trait's variance
+# estimate, so a few identical answers don't look perfectly precise
+PRIOR_STRENGTH = 2.0
+
+
+class ItemTables:
+    """
+    Per-trait candidate items precomputed from a compiled question bank.
+
+    Shared by every quiz over the same bank (see for_bank()).
+    """
+
+    _cache: 'weakref.WeakKeyDictionary[CompiledQuestionBank, ItemTables]' = weakref.WeakKeyDictionary()
+
+    def __init__(self, compiled: CompiledQuestionBank):
+        self.compiled = compiled
+        self.n_traits = len(compiled.trait_codes)
+        self.n_facets = len(compiled.facet_codes)
+        # Question rows per trait column, in bank order
+        self.trait_items: List[np.ndarray] = [
+            np.flatnonzero(compiled.trait_idx == t) for t in range(self.n_traits)
+        ]
+
+        # Variance of a uniformly random answer on the 0-1 scale (the prior)
+        levels = compiled.scale_max - compiled.scale_min + 1
+        self.prior_var = (levels * levels - 1) / 12.0 / (levels - 1) ** 2
+
+    @classmethod
+    def for_bank(cls, compiled: CompiledQuestionBank) -> 'ItemTables':
+        tables = cls._cache.get(compiled)
+        if tables is None:
+            tables = cls._cache[compiled] = cls(compiled)
+        return tables
+
+    def pick(self, trait: int, asked: np.ndarray, facet_counts: np.ndarray) -> Optional[int]:
+        """
+        Most informative unasked item of a trait, or None if none are left.
+
+        Heavier items reduce the trait's standard error most; ties go to the
+        least-covered facet, then bank order.
+        """
+        items = self.trait_items[trait]
+        items = items[~asked[items]]
+        if not len(items):
+            return None
+        order = np.lexsort((items, facet_counts[self.compiled.facet_idx[items]], -self.compiled.weights[items]))
+        return int(items[order[0]])
+
+
+class AdaptiveQuiz:
+    """
+    Adaptive quiz on top of a ScoringSession.
+
+    Each trait's estimate is a weighted mean of scaled answers; its standard
+    error comes from the observed answer variance (shrunk towards the prior
+    of a random answer) over the effective number of answers. Trait
+    confidence is 1 - SE / prior SD, i.e. how much of the initial
+    uncertainty has been removed (0.0 until the trait has
+    MIN_QUESTIONS_PER_TRAIT answers, as in score()).
+
+    next_question() targets the least-confident trait and returns its most
+    informative unasked item; it returns None once every trait reaches the
+    confidence threshold, the trait pools run out or max_questions is hit.
+
+    Example:
+        >>> quiz = AdaptiveQuiz(scorer)
+        >>> while (q_id := quiz.next_question()) is not None:
+        ...     quiz.answer(q_id, ask_user(q_id))
+        >>> quiz.result()['ocean']
+    """
+
+    def __init__(
+        self,
+        scorer: PersonalityScorer,
+        responses: Optional[Dict[str, int]] = None,
+        confidence_threshold: float = CAT_CONFIDENCE_THRESHOLD,
+        max_questions: int = CAT_MAX_QUESTIONS,
+    ):
+        """
+        Args:
+            scorer: Loaded PersonalityScorer (shared, never modified)
+            responses: Answers given so far (e.g. replayed from a stateless client)
+            confidence_threshold: Per-trait confidence (0-1) at which the quiz stops
+            max_questions: Hard cap on questions asked
+
+        Raises:
+            ValueError: If a replayed answer is invalid (see ScoringSession.add())
+        """
+        self.scorer = scorer
+        self.session = ScoringSession(scorer)
+        self.tables = ItemTables.for_bank(scorer.compiled)
+        self.confidence_threshold = confidence_threshold
+        self.max_questions = max_questions
+
+        n_traits = self.tables.n_traits
+        self._weight = np.zeros(n_traits)
+        self._weighted_sum = np.zeros(n_traits)
+        self._weighted_sq_sum = np.zeros(n_traits)
+        self._weight_sq = np.zeros(n_traits)
+        self._facet_counts = np.zeros(self.tables.n_facets, dtype=np.int64)
+        self._asked = np.zeros(len(scorer.compiled.ids), dtype=bool)
+
+        for q_id, value in (responses or {}).items():
+            self.answer(q_id, value)
+
+    def answer(self, q_id: str, value: int):
+        """
+        Record an answer (any question, not only the suggested one).
+
+        Raises:
+            ValueError: If the question is unknown, already answered or off-scale
+        """
+        self.session.add(q_id, value)
+        compiled = self.scorer.compiled
+        i = compiled.index[q_id]
+        t = compiled.trait_idx[i]
+        w = compiled.weights[i]
+        x = (value - compiled.scale_min) / (compiled.scale_max - compiled.scale_min)
+        if compiled.reverse[i]:
+            x = 1.0 - x
+
+        self._weight[t] += w
+        self._weighted_sum[t] += w * x
+        self._weighted_sq_sum[t] += w * x * x
+        self._weight_sq[t] += w * w
+        self._facet_counts[compiled.facet_idx[i]] += 1
+        self._asked[i] = True
+
+    def __len__(self) -> int:
+        return len(self.session)
+
+    def _standard_errors(self) -> np.ndarray:
+        """Standard error of each trait estimate (prior SD for untouched traits)"""
+        prior_var = self.tables.prior_var
+        weight = self._weight
+        answered = weight > 0
+        safe_weight = np.where(answered, weight, 1.0)
+
+        n_eff = np.where(answered, weight * weight / np.where(answered, self._weight_sq, 1.0), 0.0)
+        ss = np.maximum(self._weighted_sq_sum - self._weighted_sum ** 2 / safe_weight, 0.0) * n_eff / safe_weight
+        variance = (PRIOR_STRENGTH * prior_var + ss) / (PRIOR_STRENGTH + np.maximum(n_eff - 1.0, 0.0))
+        return np.where(answered, np.sqrt(variance / np.maximum(n_eff, 1.0)), np.sqrt(prior_var))
+
+    def _confidence(self) -> np.ndarray:
+        confidence = np.clip(1.0 - self._standard_errors() / np.sqrt(self.tables.prior_var), 0.0, 1.0)
+        return np.where(self._weight >= self.scorer.MIN_QUESTIONS_PER_TRAIT, confidence, 0.0)
+
+    def trait_confidence(self) -> Dict[str, float]:
+        """Precision-based confidence per trait code (0-1)"""
+        confidence = self._confidence()
+        codes = self.scorer.compiled.trait_codes
+        return {codes[t]: round(float(confidence[t]), 3) for t in range(self.tables.n_traits)}
+
+    def standard_errors(self) -> Dict[str, float]:
+        """Standard error of each trait estimate on the 0-1 scale"""
+        errors = self._standard_errors()
+        codes = self.scorer.compiled.trait_codes
+        return {codes[t]: round(float(errors[t]), 4) for t in range(self.tables.n_traits)}
+
+    def _open_traits(self) -> List[int]:
+        """Traits below the threshold that still have unasked items"""
+        confidence = self._confidence()
+        asked = self._asked
+        return [
+            t for t in range(self.tables.n_traits)
+            if confidence[t] < self.confidence_threshold and not asked[self.tables.trait_items[t]].all()
+        ]
+
+    def is_complete(self) -> bool:
+        return len(self.session) >= self.max_questions or not self._open_traits()
+
+    def next_question(self) -> Optional[str]:
+        """Id of the next question to ask, or None when the quiz is complete"""
+        if len(self.session) >= self.max_questions:
+            return None
+        open_traits = self._open_traits()
+        if not open_traits:
+            return None
+
+        # Least-confident trait; ties go to the one with the least answered weight, then trait order
+        confidence = self._confidence()
+        trait = min(open_traits, key=lambda t: (confidence[t], self._weight[t], t))
+        item = self.tables.pick(trait, self._asked, self._facet_counts)
+        return self.scorer.compiled.ids[item]
+
+    def progress(self) -> Dict[str, Any]:
+        """Partial scores plus the adaptive stopping state"""
+        return {
+            **self.session.snapshot(),
+            'precision': self.trait_confidence(),
+            'is_complete': self.is_complete(),
+        }
+
+    def result(self) -> ScoreResult:
+        """Full score() result for the answers given"""
+        return self.session.result()
+
+
+def balanced_question_ids(scorer: PersonalityScorer, limit: int) -> List[str]:
+    """
+    Fixed, trait- and facet-balanced question order for non-adaptive clients.
+
+    What the adaptive selector asks before it has seen any answers: traits
+    take turns, each trait cycles through its facets, heavier items first.
+    """
+    tables = ItemTables.for_bank(scorer.compiled)
+    asked = np.zeros(len(scorer.compiled.ids), dtype=bool)
+    facet_counts = np.zeros(tables.n_facets, dtype=np.int64)
+    trait_weight = np.zeros(tables.n_traits)
+
+    ids = []
+    while len(ids) < limit:
+        open_traits = [t for t in range(tables.n_traits) if not asked[tables.trait_items[t]].all()]
+        if not open_traits:
+            break
+        trait = min(open_traits, key=lambda t: (trait_weight[t], t))
+        item = tables.pick(trait, asked, facet_counts)
+        asked[item] = True
+        facet_counts[scorer.compiled.facet_idx[item]] += 1
+        trait_weight[trait] += scorer.compiled.weights[item]
+        ids.append(scorer.compiled.ids[item])
+    return ids
+
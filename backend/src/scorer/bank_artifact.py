@@ -0,0 +1,277 @@
+"""
+LifeSync Personality Scorer - Question Bank Artifact
+Compiles the JSON question bank into a versioned binary file that workers memory-map read-only
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from src.config.constants import SCORING_VERSION
+
+# File layout (little-endian):
+#   header   magic, format version, payload SHA-256, scoring version, section sizes
+#   payload  weights f8[n] | max trait weights f8[T] | max facet weights f8[F]
+#            | trait idx u1[n] | facet idx u1[n] | reverse u1[n] | pad to 4
+#            | string offsets u4[2n + 1] | string bytes (ids, then texts) | metadata JSON
+ARTIFACT_MAGIC = b"LSQB"
+ARTIFACT_FORMAT_VERSION = 1
+ARTIFACT_SUFFIX = ".lsqb"
+
+_HEADER = struct.Struct("<4sI32s16sIIIIII")
+
+
+class ArtifactError(ValueError):
+    """Raised when an artifact is missing, corrupt, stale or built for another scoring version"""
+    pass
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """SHA-256 of a file's raw bytes (used to detect artifacts built from an older bank)"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _pad(buf: bytearray, alignment: int):
+    buf.extend(b"\0" * (-len(buf) % alignment))
+
+
+def build_artifact(source_path: Union[str, Path], output_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Compile a question bank JSON file into a binary artifact.
+
+    Max weights are taken from a PersonalityScorer loaded from the same JSON,
+    so the stored floats are exactly the ones the JSON path computes.
+
+    Args:
+        source_path: Question bank JSON (e.g. lifesync_180_questions.json)
+        output_path: Where to write the artifact
+
+    Returns:
+        Summary dict (questions, bytes, payload_sha256, scoring_version)
+    """
+    from .personality_scorer import PersonalityScorer
+
+    with open(source_path, 'r') as f:
+        data = json.load(f)
+    scorer = PersonalityScorer(str(source_path))
+    compiled = scorer.compiled
+
+    if len(compiled.trait_codes) > 255 or len(compiled.facet_codes) > 255:
+        raise ArtifactError("Too many trait/facet codes for a u1 index")
+
+    questions = list(scorer.questions.values())
+    n = len(questions)
+
+    payload = bytearray()
+    payload += compiled.weights.astype('<f8').tobytes()
+    payload += np.array(
+        [scorer.max_weights['traits'].get(c, 0.0) for c in compiled.trait_codes], dtype='<f8'
+    ).tobytes()
+    payload += np.array(
+        [scorer.max_weights['facets'].get(c, 0.0) for c in compiled.facet_codes], dtype='<f8'
+    ).tobytes()
+    payload += compiled.trait_idx.astype(np.uint8).tobytes()
+    payload += compiled.facet_idx.astype(np.uint8).tobytes()
+    payload += compiled.reverse.astype(np.uint8).tobytes()
+    _pad(payload, 4)
+
+    encoded = [q['id'].encode('utf-8') for q in questions] + [q.get('text', '').encode('utf-8') for q in questions]
+    offsets = np.zeros(len(encoded) + 1, dtype='<u4')
+    offsets[1:] = np.cumsum([len(b) for b in encoded])
+    strings = b"".join(encoded)
+    payload += offsets.tobytes()
+    payload += strings
+
+    meta = json.dumps({
+        'bank_version': data.get('version'),
+        'name': data.get('name'),
+        'description': data.get('description'),
+        'traits': scorer.traits,
+        'facets': scorer.facets,
+        'scale': scorer.scale,
+        'trait_codes': compiled.trait_codes,
+        'facet_codes': compiled.facet_codes,
+        'source_sha256': file_sha256(source_path),
+    }, separators=(',', ':')).encode('utf-8')
+    payload += meta
+
+    digest = hashlib.sha256(payload).digest()
+    header = _HEADER.pack(
+        ARTIFACT_MAGIC,
+        ARTIFACT_FORMAT_VERSION,
+        digest,
+        SCORING_VERSION.encode('ascii'),
+        n,
+        len(compiled.trait_codes),
+        len(compiled.facet_codes),
+        len(strings),
+        len(meta),
+        0,
+    )
+
+    output_path = Path(output_path)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(payload)
+    tmp_path.replace(output_path)
+
+    return {
+        'questions': n,
+        'bytes': len(header) + len(payload),
+        'payload_sha256': digest.hex(),
+        'scoring_version': SCORING_VERSION,
+    }
+
+
+class QuestionBankArtifact:
+    """
+    Read-only view over a memory-mapped question bank artifact.
+
+    Numeric sections are NumPy views straight into the mapping, so every
+    process that loads the same file shares one copy through the page cache.
+    """
+
+    def __init__(self, path: Union[str, Path], expected_source_sha256: Optional[str] = None):
+        """
+        Map and verify an artifact.
+
+        Args:
+            path: Artifact file path
+            expected_source_sha256: Optional SHA-256 of the source JSON; a
+                                    mismatch means the artifact is stale
+
+        Raises:
+            ArtifactError: If the file is missing, corrupt, stale or was built
+                           for a different SCORING_VERSION
+        """
+        self.path = Path(path)
+        try:
+            with open(self.path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise ArtifactError(f"Cannot map question bank artifact {self.path}: {e}")
+
+        if len(self._mmap) < _HEADER.size:
+            raise ArtifactError(f"Question bank artifact {self.path} is truncated")
+
+        (magic, format_version, digest, scoring_version, n, n_traits, n_facets,
+         strings_len, meta_len, _reserved) = _HEADER.unpack_from(self._mmap, 0)
+
+        if magic != ARTIFACT_MAGIC:
+            raise ArtifactError(f"{self.path} is not a question bank artifact")
+        if format_version != ARTIFACT_FORMAT_VERSION:
+            raise ArtifactError(f"Unsupported artifact format version {format_version}")
+
+        self.scoring_version = scoring_version.rstrip(b"\0").decode('ascii')
+        if self.scoring_version != SCORING_VERSION:
+            raise ArtifactError(
+                f"Artifact built for scoring version {self.scoring_version}, expected {SCORING_VERSION}"
+            )
+
+        buf = memoryview(self._mmap)
+        if hashlib.sha256(buf[_HEADER.size:]).digest() != digest:
+            raise ArtifactError(f"Question bank artifact {self.path} failed integrity check")
+        self.payload_sha256 = digest.hex()
+
+        offset = _HEADER.size
+        self.weights = np.frombuffer(buf, dtype='<f8', count=n, offset=offset)
+        offset += 8 * n
+        self.max_trait_weights = np.frombuffer(buf, dtype='<f8', count=n_traits, offset=offset)
+        offset += 8 * n_traits
+        self.max_facet_weights = np.frombuffer(buf, dtype='<f8', count=n_facets, offset=offset)
+        offset += 8 * n_facets
+        self.trait_idx = np.frombuffer(buf, dtype=np.uint8, count=n, offset=offset)
+        offset += n
+        self.facet_idx = np.frombuffer(buf, dtype=np.uint8, count=n, offset=offset)
+        offset += n
+        self.reverse = np.frombuffer(buf, dtype=np.uint8, count=n, offset=offset)
+        offset += n
+        offset += -offset % 4
+        self._string_offsets = np.frombuffer(buf, dtype='<u4', count=2 * n + 1, offset=offset)
+        offset += 4 * (2 * n + 1)
+        self._strings_start = offset
+        offset += strings_len
+
+        self.meta: Dict[str, Any] = json.loads(bytes(buf[offset:offset + meta_len]).decode('utf-8'))
+        if expected_source_sha256 and self.meta.get('source_sha256') != expected_source_sha256:
+            raise ArtifactError(f"Question bank artifact {self.path} is stale (source JSON changed)")
+
+        self.n_questions = n
+        strings = self._decode_strings(strings_len)
+        self.ids: List[str] = strings[:n]
+        self._texts: List[str] = strings[n:]
+
+    def _decode_strings(self, strings_len: int) -> List[str]:
+        """Decode the whole string table with one copy out of the mapping"""
+        blob = self._mmap[self._strings_start:self._strings_start + strings_len]
+        bounds = self._string_offsets.tolist()
+        return [blob[start:end].decode('utf-8') for start, end in zip(bounds, bounds[1:])]
+
+    def text(self, i: int) -> str:
+        """Question text for the question at bank index i"""
+        return self._texts[i]
+
+    @property
+    def trait_codes(self) -> List[str]:
+        return self.meta['trait_codes']
+
+    @property
+    def facet_codes(self) -> List[str]:
+        return self.meta['facet_codes']
+
+    def max_weights(self) -> Dict[str, Dict[str, float]]:
+        """Max weights in the same shape as PersonalityScorer._compute_max_weights()"""
+        has_trait = np.bincount(self.trait_idx, minlength=len(self.trait_codes)) > 0
+        has_facet = np.bincount(self.facet_idx, minlength=len(self.facet_codes)) > 0
+        return {
+            'traits': {c: w for c, w, present in zip(self.trait_codes, self.max_trait_weights.tolist(), has_trait) if present},
+            'facets': {c: w for c, w, present in zip(self.facet_codes, self.max_facet_weights.tolist(), has_facet) if present},
+        }
+
+    def questions(self) -> List[Dict[str, Any]]:
+        """Question dicts in bank order (same keys as the JSON bank)"""
+        trait_codes = self.trait_codes
+        facet_codes = self.facet_codes
+        return [
+            {
+                'id': q_id,
+                'text': text,
+                'trait': trait_codes[t],
+                'facet': facet_codes[f],
+                'reverse': bool(r),
+                'weight': w,
+            }
+            for q_id, text, t, f, r, w in zip(
+                self.ids,
+                self._texts,
+                self.trait_idx.tolist(),
+                self.facet_idx.tolist(),
+                self.reverse.tolist(),
+                self.weights.tolist(),
+            )
+        ]
+
+
+def default_artifact_path(source_path: Union[str, Path]) -> Path:
+    """Artifact path that sits next to a question bank JSON file"""
+    return Path(source_path).with_suffix(ARTIFACT_SUFFIX)
+
+
+def load_artifact(path: Union[str, Path], source_path: Optional[Union[str, Path]] = None) -> QuestionBankArtifact:
+    """
+    Load an artifact, verifying it against its source JSON when available.
+
+    Raises:
+        ArtifactError: If the artifact cannot be used
+    """
+    expected = None
+    if source_path is not None and Path(source_path).exists():
+        expected = file_sha256(source_path)
+    return QuestionBankArtifact(path, expected_source_sha256=expected)
@@ -0,0 +1,168 @@
+"""
+LifeSync Personality Scorer - Canonical Hashing
+Fast canonical JSON encoders for the parity telemetry hashes
+
+Both encoders produce exactly the bytes of
+``json.dumps(data, sort_keys=True, separators=(',', ':'))`` (what
+PersonalityScorer.compute_hash hashed before), without the generic JSON walk:
+
+* Input hashes: response dicts are flat {question_id: int}. The question
+  ids and scale values are known up front, so CanonicalHasher precomputes
+  every '"Q001":4' fragment and encoding is a key sort plus one join.
+* Output hashes: the payload always has the same seven keys, so it is
+  rendered from a fixed template.
+
+Anything outside those shapes (non-identifier keys, non-numeric values)
+falls back to json.dumps, so the hash never changes meaning.
+
+The TypeScript engine mirrors these encoders in
+packages/personality-engine/scoring/canonicalHash.ts; both are checked
+against the shared golden vectors in
+packages/personality-engine/test/fixtures/canonical_hash_vectors.json.
+"""
+
+import hashlib
+import json
+import math
+import re
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from .packed_answers import PackedAnswers
+
+# Keys that json.dumps writes verbatim (no escaping needed)
+_PLAIN_KEY = re.compile(r'[A-Za-z0-9_\-]+\Z')
+
+# Sorted keys of the output payload: A, C, E, N, O, mbti, version
+_OUTPUT_TEMPLATE = '{"A":%s,"C":%s,"E":%s,"N":%s,"O":%s,"mbti":%s,"version":%s}'
+
+_float_repr = float.__repr__
+
+
+def _generic(data: Any) -> str:
+    return json.dumps(data, sort_keys=True, separators=(',', ':'))
+
+
+def canonical_responses_json(responses: Dict[str, Any]) -> str:
+    """
+    Canonical JSON for a {question_id: value} response dict.
+
+    Byte-identical to json.dumps(responses, sort_keys=True, separators=(',', ':')).
+    """
+    parts = []
+    append = parts.append
+    for key in sorted(responses):
+        value = responses[key]
+        value_type = type(value)
+        if value_type is int:
+            encoded = int.__repr__(value)
+        elif value_type is float and math.isfinite(value):
+            encoded = _float_repr(value)
+        else:
+            return _generic(responses)
+        if type(key) is not str or not _PLAIN_KEY.match(key):
+            return _generic(responses)
+        append('"%s":%s' % (key, encoded))
+    return '{' + ','.join(parts) + '}'
+
+
+def _encode_score(value: Any) -> Optional[str]:
+    if type(value) is float and math.isfinite(value):
+        return _float_repr(value)
+    if type(value) is int:
+        return int.__repr__(value)
+    return None
+
+
+def _encode_label(value: Any) -> Optional[str]:
+    if value is None:
+        return 'null'
+    if type(value) is str and _PLAIN_KEY.match(value):
+        return '"%s"' % value
+    return None
+
+
+def canonical_output_json(ocean: Dict[str, float], mbti: Optional[str], version: str) -> str:
+    """
+    Canonical JSON for the output hash payload {**ocean, 'mbti': ..., 'version': ...}.
+
+    Byte-identical to json.dumps of that dict with sort_keys=True and compact separators.
+    """
+    if len(ocean) == 5:
+        encoded = [_encode_score(ocean.get(code)) for code in ('A', 'C', 'E', 'N', 'O')]
+        encoded.append(_encode_label(mbti))
+        encoded.append(_encode_label(version))
+        if None not in encoded:
+            return _OUTPUT_TEMPLATE % tuple(encoded)
+    return _generic({**ocean, 'mbti': mbti, 'version': version})
+
+
+class CanonicalHasher:
+    """
+    Parity hasher specialised for one question bank.
+
+    Holds a precomputed '"<id>":<value>' fragment for every question id and
+    on-scale integer answer. Responses that use anything else (unknown ids,
+    off-scale or non-int values) go through canonical_responses_json(), so
+    the bytes hashed are always the same as json.dumps would produce.
+    """
+
+    def __init__(self, question_ids: Iterable[str], scale_min: int = 1, scale_max: int = 5):
+        values = range(int(scale_min), int(scale_max) + 1)
+        self._ids: List[str] = list(question_ids)
+        self._fragments: Dict[str, Dict[int, str]] = {
+            q_id: {v: '"%s":%d' % (q_id, v) for v in values}
+            for q_id in self._ids
+            if _PLAIN_KEY.match(q_id)
+        }
+
+        # Packed answer vectors are in bank order; this visits them in sorted-key order
+        self._sorted_positions = np.array(
+            sorted(range(len(self._ids)), key=self._ids.__getitem__), dtype=np.intp
+        )
+        self._fragment_rows = [self._fragments.get(q_id) for q_id in self._ids]
+
+    def responses_json(self, responses: Dict[str, Any]) -> str:
+        """Canonical JSON for a response dict (see canonical_responses_json)"""
+        # bool is an int subclass but encodes as true/false, so require exact int
+        if set(map(type, responses.values())) <= {int}:
+            fragments = self._fragments
+            try:
+                return '{' + ','.join([fragments[k][responses[k]] for k in sorted(responses)]) + '}'
+            except (KeyError, TypeError):
+                pass
+        return canonical_responses_json(responses)
+
+    def packed_json(self, packed: PackedAnswers) -> str:
+        """Canonical JSON for a packed answer vector (same bytes as for its dict form)"""
+        positions = self._sorted_positions
+        answered = positions[packed.values[positions] > 0]
+        rows = self._fragment_rows
+        try:
+            return '{' + ','.join([
+                rows[i][v] for i, v in zip(answered.tolist(), packed.values[answered].tolist())
+            ]) + '}'
+        except (KeyError, TypeError):
+            return canonical_responses_json(packed.to_dict(self._ids))
+
+    def hash_responses(self, responses: Union[Dict[str, Any], PackedAnswers]) -> str:
+        """Parity input hash of a response dict or packed answer vector"""
+        if isinstance(responses, PackedAnswers):
+            return sha256_hex(self.packed_json(responses))
+        return sha256_hex(self.responses_json(responses))
+
+
+def sha256_hex(text: str) -> str:
+    """SHA-256 hex digest of a canonical JSON string"""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def hash_responses(responses: Dict[str, Any]) -> str:
+    """Parity input hash of a response dict"""
+    return sha256_hex(canonical_responses_json(responses))
+
+
+def hash_output(ocean: Dict[str, float], mbti: Optional[str], version: str) -> str:
+    """Parity output hash of rounded OCEAN scores, MBTI proxy and scoring version"""
+    return sha256_hex(canonical_output_json(ocean, mbti, version))
@@ -0,0 +1,227 @@
+"""
+LifeSync Personality Scorer - Compiled Question Bank
+Dense NumPy index tables built once from the question bank for vectorized scoring
+"""
+
+from itertools import chain, repeat
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+# Canonical trait order used by every scoring output
+TRAIT_ORDER = ['O', 'C', 'E', 'A', 'N']
+
+
+def _response_values(q_idx: np.ndarray, values: Callable[[], Iterable[Any]]) -> np.ndarray:
+    """
+    Response values as floats, aligned with q_idx.
+
+    If a value isn't a number, only the values of known questions are
+    converted: like the dict-based path, an unknown id is skipped whatever
+    its value (NaN never passes valid_mask).
+    """
+    try:
+        return np.fromiter(values(), dtype=np.float64, count=len(q_idx))
+    except (TypeError, ValueError):
+        return np.fromiter(
+            (value if i >= 0 else np.nan for i, value in zip(q_idx.tolist(), values())),
+            dtype=np.float64, count=len(q_idx)
+        )
+
+
+class CompiledQuestionBank:
+    """
+    Question bank compiled into dense arrays.
+
+    Every question gets a row index; per-question trait/facet membership,
+    weight and reverse flag are stored as parallel arrays so a response set
+    can be scored with a handful of array operations instead of per-question
+    dict lookups.
+
+    Trait columns follow TRAIT_ORDER and facet columns follow the order of the
+    bank's ``facets`` mapping. Codes referenced by questions but missing from
+    those lists are appended after them so accumulation never drops data.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        trait_codes: List[str],
+        facet_codes: List[str],
+        trait_idx: np.ndarray,
+        facet_idx: np.ndarray,
+        weights: np.ndarray,
+        reverse: np.ndarray,
+        scale: Dict
+    ):
+        """
+        Wrap prebuilt index arrays (e.g. views into a memory-mapped artifact).
+
+        Use from_questions() to compile parsed question bank JSON.
+
+        Args:
+            ids: Question ids in bank order
+            trait_codes: Trait code per trait column
+            facet_codes: Facet code per facet column
+            trait_idx: Trait column per question
+            facet_idx: Facet column per question
+            weights: Weight per question (float64)
+            reverse: Reverse-scoring flag per question
+            scale: Response scale ({'min': 1, 'max': 5, ...})
+        """
+        self.ids = ids
+        self.index: Dict[str, int] = {q_id: i for i, q_id in enumerate(ids)}
+        self.trait_codes = trait_codes
+        self.facet_codes = facet_codes
+
+        self.trait_idx = trait_idx
+        self.facet_idx = facet_idx
+        self.weights = weights
+        self.reverse = reverse.astype(bool, copy=False)
+
+        self.scale_min = scale['min']
+        self.scale_max = scale['max']
+
+        # Shared with callers, never written after construction
+        for arr in (self.trait_idx, self.facet_idx, self.weights, self.reverse):
+            arr.flags.writeable = False
+
+    @classmethod
+    def from_questions(
+        cls,
+        questions: List[Dict],
+        facets: Dict[str, str],
+        scale: Dict
+    ) -> 'CompiledQuestionBank':
+        """
+        Build index tables from parsed question bank data.
+
+        Args:
+            questions: Question dicts in bank order (id, trait, facet, weight, reverse)
+            facets: Facet code -> display name mapping from the bank
+            scale: Response scale ({'min': 1, 'max': 5, ...})
+        """
+        trait_codes: List[str] = list(TRAIT_ORDER)
+        facet_codes: List[str] = list(facets.keys())
+        for q in questions:
+            if q['trait'] not in trait_codes:
+                trait_codes.append(q['trait'])
+            if q['facet'] not in facet_codes:
+                facet_codes.append(q['facet'])
+
+        trait_pos = {code: i for i, code in enumerate(trait_codes)}
+        facet_pos = {code: i for i, code in enumerate(facet_codes)}
+
+        return cls(
+            ids=[q['id'] for q in questions],
+            trait_codes=trait_codes,
+            facet_codes=facet_codes,
+            trait_idx=np.array([trait_pos[q['trait']] for q in questions], dtype=np.intp),
+            facet_idx=np.array([facet_pos[q['facet']] for q in questions], dtype=np.intp),
+            weights=np.array([q['weight'] for q in questions], dtype=np.float64),
+            reverse=np.array([bool(q['reverse']) for q in questions], dtype=bool),
+            scale=scale,
+        )
+
+    @property
+    def n_questions(self) -> int:
+        return len(self.ids)
+
+    def lookup(self, responses: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert a response dict into (question index, value) arrays.
+
+        Unknown question ids map to -1. Order follows the dict's iteration
+        order, which keeps accumulation order identical to the dict-based path.
+        """
+        n = len(responses)
+        q_idx = np.fromiter(map(self.index.get, responses, repeat(-1)), dtype=np.intp, count=n)
+        return q_idx, _response_values(q_idx, responses.values)
+
+    def valid_mask(self, q_idx: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Mask of responses that reference a known question and are inside the scale"""
+        return (q_idx >= 0) & (values >= self.scale_min) & (values <= self.scale_max)
+
+    def accumulate_arrays(
+        self,
+        q_idx: np.ndarray,
+        values: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Accumulate weighted sums for already-validated (index, value) arrays.
+
+        np.bincount adds weights sequentially in input order, so the float
+        results match the dict-based accumulation bit for bit.
+
+        Returns:
+            (trait_sums, trait_weights, facet_sums, facet_weights) aligned with
+            trait_codes / facet_codes
+        """
+        scaled = (values - self.scale_min) / (self.scale_max - self.scale_min)
+        scaled = np.where(self.reverse[q_idx], 1.0 - scaled, scaled)
+
+        weights = self.weights[q_idx]
+        weighted = scaled * weights
+        trait_idx = self.trait_idx[q_idx]
+        facet_idx = self.facet_idx[q_idx]
+
+        n_traits = len(self.trait_codes)
+        n_facets = len(self.facet_codes)
+        return (
+            np.bincount(trait_idx, weights=weighted, minlength=n_traits),
+            np.bincount(trait_idx, weights=weights, minlength=n_traits),
+            np.bincount(facet_idx, weights=weighted, minlength=n_facets),
+            np.bincount(facet_idx, weights=weights, minlength=n_facets),
+        )
+
+    def accumulate(self, responses: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Accumulate weighted trait/facet sums for a response dict (invalid entries skipped)"""
+        q_idx, values = self.lookup(responses)
+        mask = self.valid_mask(q_idx, values)
+        return self.accumulate_arrays(q_idx[mask], values[mask])
+
+    def accumulate_many(
+        self,
+        responses_list: List[Dict[str, int]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Accumulate a whole batch of response dicts in one pass.
+
+        All responses are flattened into a single (row, question, value) stream
+        and binned into row-major (n_rows, n_codes) matrices. Each bin still
+        receives its values in that respondent's dict order, so every row is
+        identical to accumulate() on the same dict.
+
+        Returns:
+            (trait_sums, trait_weights, facet_sums, facet_weights) as 2-D arrays
+            with one row per response dict
+        """
+        n_rows = len(responses_list)
+        lengths = [len(r) for r in responses_list]
+        total = sum(lengths)
+
+        q_idx = np.fromiter(
+            map(self.index.get, chain.from_iterable(responses_list), repeat(-1)),
+            dtype=np.intp, count=total
+        )
+        values = _response_values(q_idx, lambda: chain.from_iterable(r.values() for r in responses_list))
+        rows = np.repeat(np.arange(n_rows, dtype=np.intp), lengths)
+
+        mask = self.valid_mask(q_idx, values)
+        q_idx, values, rows = q_idx[mask], values[mask], rows[mask]
+
+        scaled = (values - self.scale_min) / (self.scale_max - self.scale_min)
+        scaled = np.where(self.reverse[q_idx], 1.0 - scaled, scaled)
+        weights = self.weights[q_idx]
+        weighted = scaled * weights
+
+        n_traits = len(self.trait_codes)
+        n_facets = len(self.facet_codes)
+        trait_bins = rows * n_traits + self.trait_idx[q_idx]
+        facet_bins = rows * n_facets + self.facet_idx[q_idx]
+        return (
+            np.bincount(trait_bins, weights=weighted, minlength=n_rows * n_traits).reshape(n_rows, n_traits),
+            np.bincount(trait_bins, weights=weights, minlength=n_rows * n_traits).reshape(n_rows, n_traits),
+            np.bincount(facet_bins, weights=weighted, minlength=n_rows * n_facets).reshape(n_rows, n_facets),
+            np.bincount(facet_bins, weights=weights, minlength=n_rows * n_facets).reshape(n_rows, n_facets),
+        )
@@ -3,38 +3,129 @@ LifeSync Personality Scorer Wrapper
 Provides a simple interface to score personality assessments
 """
 
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from src.config.constants import (
+    BATCH_SCORING_CHUNK_SIZE,
+    BATCH_SCORING_POOL_THRESHOLD,
+    CAT_CONFIDENCE_THRESHOLD,
+    CAT_MAX_QUESTIONS,
+    NORMS_MIN_POPULATION,
+    SCORING_MEMO_SIZE,
+    SCORING_VERSION,
+    SCORING_VERSIONS,
+)
+
+from .adaptive import AdaptiveQuiz, balanced_question_ids
+from .bank_artifact import ArtifactError, default_artifact_path
+from .norms import NormsError, NormTables
 from .personality_scorer import PersonalityScorer
+from .registry import ScoringRegistry, UnknownScoringVersionError
+from .score_result import ScoreResult
+from .scoring_session import ScoringSession
+
+logger = logging.getLogger(__name__)
 
 # Get the path to the question bank
-_QUESTIONS_PATH = Path(__file__).parent.parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+_QUESTION_BANK_DIR = Path(__file__).parent.parent.parent / "data" / "question_bank"
+_QUESTIONS_PATH = _QUESTION_BANK_DIR / "lifesync_180_questions.json"
+
+# Precompiled artifact built by scripts/build_question_artifact.py (optional)
+_ARTIFACT_PATH = default_artifact_path(_QUESTIONS_PATH)
+
+# Population norms built by scripts/build_norms.py (optional)
+_NORMS_PATH = Path(__file__).parent.parent.parent / "data" / "norms" / "lifesync_norms.npz"
 
 # Global scorer instance (lazy-loaded)
 _scorer_instance = None
 
+# Scorers for other scoring versions (lazy-created)
+_registry: Optional[ScoringRegistry] = None
+
+# Process pool for large batches (lazy-created, one per process)
+_scoring_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_registry() -> ScoringRegistry:
+    """Get or create the scoring version registry (versions from SCORING_VERSIONS)"""
+    global _registry
+    if _registry is None:
+        registry = ScoringRegistry(SCORING_VERSION, memo_size=SCORING_MEMO_SIZE)
+        for version, bank_file in SCORING_VERSIONS.items():
+            registry.register(version, _QUESTION_BANK_DIR / bank_file)
+        _registry = registry
+    return _registry
+
+
+def _load_default_scorer() -> PersonalityScorer:
+    """Load the current-version scorer, preferring the precompiled artifact"""
+    if _ARTIFACT_PATH.exists():
+        try:
+            return PersonalityScorer.from_artifact(
+                str(_ARTIFACT_PATH), str(_QUESTIONS_PATH), memo_size=SCORING_MEMO_SIZE
+            )
+        except ArtifactError as e:
+            logger.warning(f"Ignoring question bank artifact, falling back to JSON: {e}")
+    if not _QUESTIONS_PATH.exists():
+        raise FileNotFoundError(
+            f"Question bank not found at {_QUESTIONS_PATH}. "
+            "Please ensure lifesync_180_questions.json exists in data/question_bank/"
+        )
+    return PersonalityScorer(str(_QUESTIONS_PATH), memo_size=SCORING_MEMO_SIZE)
+
+
+def _attach_norms(scorer: PersonalityScorer):
+    """Attach the population norms artifact if present and built for this scoring version"""
+    if not _NORMS_PATH.exists():
+        return
+    try:
+        norms = NormTables.load(_NORMS_PATH)
+    except NormsError as e:
+        logger.warning(f"Ignoring norms artifact: {e}")
+        return
+    if norms.scoring_version != scorer.scoring_version:
+        logger.warning(
+            f"Ignoring norms artifact built for scoring version {norms.scoring_version} "
+            f"(scorer is {scorer.scoring_version})"
+        )
+        return
+    scorer.set_norms(norms)
 
-def _get_scorer() -> PersonalityScorer:
-    """Get or create the scorer instance"""
+
+def get_scorer(scoring_version: Optional[str] = None) -> PersonalityScorer:
+    """
+    Get or create the scorer instance
+    
+    Args:
+        scoring_version: Optional scoring version (default: SCORING_VERSION)
+    
+    Raises:
+        UnknownScoringVersionError: If the version is not registered
+    """
     global _scorer_instance
     if _scorer_instance is None:
-        if not _QUESTIONS_PATH.exists():
-            raise FileNotFoundError(
-                f"Question bank not found at {_QUESTIONS_PATH}. "
-                "Please ensure lifesync_180_questions.json exists in data/question_bank/"
-            )
-        _scorer_instance = PersonalityScorer(str(_QUESTIONS_PATH))
-    return _scorer_instance
+        _scorer_instance = _load_default_scorer()
+        _attach_norms(_scorer_instance)
+        # Other versions of the same bank share its compiled tables
+        get_registry().add(_scorer_instance)
+    if scoring_version is None or scoring_version == _scorer_instance.scoring_version:
+        return _scorer_instance
+    return get_registry().get(scoring_version)
 
 
-def score_answers(answers: Dict[str, int]) -> Dict[str, Any]:
+def score_answers(answers: Dict[str, int], scoring_version: Optional[str] = None) -> Dict[str, Any]:
     """
     Score personality assessment answers and return traits, facets, confidence, and dominant profile.
     
     Args:
         answers: Dictionary mapping question_id to response value (1-5)
                 Example: {"Q001": 4, "Q014": 2, "Q025": 5, ...}
+        scoring_version: Optional scoring version (default: SCORING_VERSION)
     
     Returns:
         Dictionary containing:
@@ -52,10 +143,152 @@ def score_answers(answers: Dict[str, int]) -> Dict[str, Any]:
         >>> print(result['traits']['Openness'])
         0.72
     """
-    scorer = _get_scorer()
-    result = scorer.score(answers)
+    scorer = get_scorer(scoring_version)
+    return _format_result(scorer.score(answers))
+
+
+def score_packed(
+    answers: Union[str, bytes],
+    bank_version: Optional[str] = None,
+    scoring_version: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Score a packed answer vector (one nibble per question, 0 = unanswered).
+    
+    Args:
+        answers: Packed bytes, or the same bytes as base64 text
+        bank_version: Question bank version the vector was packed against
+        scoring_version: Optional scoring version (default: SCORING_VERSION)
+    
+    Returns:
+        Dictionary in the same format as score_answers()
+    
+    Raises:
+        PackedAnswersError: If the payload is malformed, off-scale or for another bank version
+        UnknownScoringVersionError: If the scoring version is not registered
+    """
+    scorer = get_scorer(scoring_version)
+    return _format_result(scorer.score_packed(scorer.decode_packed(answers, bank_version)))
+
+
+def score_many(
+    answers_list: List[Dict[str, int]],
+    max_workers: Optional[int] = None,
+    scoring_version: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Score many personality assessments in one call.
+    
+    Small batches are scored in-process with a single vectorized pass.
+    Batches of BATCH_SCORING_POOL_THRESHOLD or more are split into chunks
+    and fanned out to a process pool.
+    
+    Args:
+        answers_list: List of answer dictionaries (question_id -> value 1-5)
+        max_workers: Optional process pool size (defaults to CPU count)
+        scoring_version: Optional scoring version (default: SCORING_VERSION)
+    
+    Returns:
+        List of results in the same format as score_answers(), in input order
+    
+    Raises:
+        UnknownScoringVersionError: If the scoring version is not registered
+    """
+    if len(answers_list) < BATCH_SCORING_POOL_THRESHOLD:
+        return _score_chunk(answers_list, scoring_version)
+    
+    # Resolve here so an unknown version fails before any work is fanned out
+    get_scorer(scoring_version)
+    
+    chunks = [
+        answers_list[i:i + BATCH_SCORING_CHUNK_SIZE]
+        for i in range(0, len(answers_list), BATCH_SCORING_CHUNK_SIZE)
+    ]
+    results: List[Dict[str, Any]] = []
+    for chunk_results in _get_pool(max_workers).map(partial(_score_chunk, scoring_version=scoring_version), chunks):
+        results.extend(chunk_results)
+    return results
+
+
+def start_session(
+    answers: Optional[Dict[str, int]] = None,
+    scoring_version: Optional[str] = None,
+) -> ScoringSession:
+    """
+    Start an incremental scoring session on the shared scorer.
+    
+    Args:
+        answers: Optional answers to seed the session with
+        scoring_version: Optional scoring version (default: SCORING_VERSION)
+    
+    Returns:
+        ScoringSession; call snapshot() for live progress and result() at the end
+    
+    Raises:
+        ValueError: If a seeded answer is invalid
+        UnknownScoringVersionError: If the scoring version is not registered
+    """
+    return ScoringSession(get_scorer(scoring_version), answers)
+
+
+def start_adaptive_quiz(
+    answers: Optional[Dict[str, int]] = None,
+    confidence_threshold: Optional[float] = None,
+    max_questions: Optional[int] = None,
+) -> AdaptiveQuiz:
+    """
+    Start (or replay) an adaptive quiz on the shared scorer.
+    
+    Args:
+        answers: Answers given so far
+        confidence_threshold: Per-trait stopping confidence (default: CAT_CONFIDENCE_THRESHOLD)
+        max_questions: Question cap (default: CAT_MAX_QUESTIONS)
     
-    # Format the response to match expected structure
+    Returns:
+        AdaptiveQuiz; call next_question() until it returns None
+    
+    Raises:
+        ValueError: If a replayed answer is invalid
+    """
+    return AdaptiveQuiz(
+        get_scorer(),
+        answers,
+        confidence_threshold=confidence_threshold or CAT_CONFIDENCE_THRESHOLD,
+        max_questions=max_questions or CAT_MAX_QUESTIONS,
+    )
+
+
+def get_balanced_question_ids(limit: int) -> List[str]:
+    """Trait- and facet-balanced fixed question order of the given length"""
+    return balanced_question_ids(get_scorer(), limit)
+
+
+def _score_chunk(answers_list: List[Dict[str, int]], scoring_version: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Score a chunk of answer sets in the current process (also the pool task)"""
+    scorer = get_scorer(scoring_version)
+    return [_format_result(result) for result in scorer.score_many(answers_list)]
+
+
+def _get_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Get or create the batch scoring process pool"""
+    global _scoring_pool
+    if _scoring_pool is None:
+        _scoring_pool = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count())
+    return _scoring_pool
+
+
+def shutdown_scoring_pool():
+    """Shut down the batch scoring process pool if it was started"""
+    global _scoring_pool
+    if _scoring_pool is not None:
+        _scoring_pool.shutdown(wait=True)
+        _scoring_pool = None
+
+
+def _format_result(result: ScoreResult) -> Dict[str, Any]:
+    """Format a raw scorer result into the score_answers() structure"""
+    # Plain copies of just the fields we need (memoized results are shared and frozen)
+    result = result.to_dict(_FORMAT_FIELDS)
     return {
         "traits": result["traits"],
         "facets": result["facets"],
@@ -74,6 +307,26 @@ def score_answers(answers: Dict[str, int]) -> Dict[str, Any]:
     }
 
 
+_FORMAT_FIELDS = (
+    "traits", "facets", "trait_confidence", "facet_confidence", "mbti_proxy",
+    "neuroticism_level", "personality_code", "top_facets", "coverage", "responses_count",
+)
+
+
+def get_memo_stats() -> Optional[Dict[str, Any]]:
+    """Scoring memo counters, or None if the scorer has not been loaded yet"""
+    if _scorer_instance is None:
+        return None
+    return _scorer_instance.memo_stats()
+
+
+def get_registry_stats() -> Optional[Dict[str, Any]]:
+    """Scoring version registry stats, or None if no scorer has been loaded yet"""
+    if _registry is None:
+        return None
+    return _registry.stats()
+
+
 def validate_responses(answers: Dict[str, int]) -> Dict[str, Any]:
     """
     Validate that responses cover all traits evenly.
@@ -92,10 +345,51 @@ def validate_responses(answers: Dict[str, int]) -> Dict[str, Any]:
             'missing_traits': List[str]  # Traits with no questions
         }
     """
-    scorer = _get_scorer()
+    scorer = get_scorer()
     return scorer.validate_responses(answers)
 
 
+def score_and_validate(
+    answers: Dict[str, int],
+    scoring_version: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Score answers and validate trait coverage in a single pass.
+    
+    Args:
+        answers: Dictionary mapping question_id to response value (1-5)
+        scoring_version: Optional scoring version (default: SCORING_VERSION)
+    
+    Returns:
+        Tuple of (score_answers() result, validate_responses() report)
+    """
+    scorer = get_scorer(scoring_version)
+    result, validation = scorer.score_and_validate(answers)
+    return _format_result(result), validation
+
+
+def get_percentiles(
+    traits: Dict[str, Optional[float]],
+    facets: Optional[Dict[str, Optional[float]]] = None,
+    scoring_version: Optional[str] = None,
+) -> Optional[Dict[str, Dict[str, Optional[float]]]]:
+    """
+    Population percentiles for stored long-name trait/facet scores (0-1).
+    
+    Uses the precomputed norm tables only; the population is never queried.
+    
+    Returns:
+        {"traits": {...}, "facets": {...}}, or None when no norms exist for the version
+    """
+    try:
+        norms = get_scorer(scoring_version).norms
+    except UnknownScoringVersionError:
+        return None
+    if norms is None:
+        return None
+    return norms.percentiles(traits, facets, NORMS_MIN_POPULATION)
+
+
 def get_question_metadata() -> Dict[str, Any]:
     """
     Get metadata about the question bank (traits, facets, scale info).
@@ -103,7 +397,7 @@ def get_question_metadata() -> Dict[str, Any]:
     Returns:
         Dictionary with question bank metadata
     """
-    scorer = _get_scorer()
+    scorer = get_scorer()
     return {
         "traits": scorer.traits,
         "facets": scorer.facets,
@@ -0,0 +1,263 @@
+"""
+LifeSync Personality Scorer - Population Norms
+Percentile tables for traits and facets, built from stored assessments
+
+Each dimension (trait or facet) is a sorted array of distinct score values
+with their counts. Scores are stored at 3 decimals, so a dimension never
+holds more than ~1000 entries whatever the population size, and a lookup is
+one np.searchsorted (O(log n)). Tables are persisted as a small .npz
+artifact and refreshed incrementally by merging new observations in.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .score_result import TRAIT_NAMES
+
+NORMS_FORMAT_VERSION = 1
+
+# Stored scores are rounded to 3 decimals; observations are quantized to match
+_DECIMALS = 3
+
+# Observations buffered per dimension before they are merged into the counts
+_FLUSH_SIZE = 10000
+
+GROUPS = ("traits", "facets")
+
+
+class NormsError(ValueError):
+    """Raised when a norms artifact is missing, corrupt or for another format version"""
+    pass
+
+
+class NormTable:
+    """Distinct sorted values and their counts for one dimension"""
+
+    __slots__ = ('values', 'counts', '_below', 'total')
+
+    def __init__(self, values: np.ndarray, counts: np.ndarray):
+        self.values = values
+        self.counts = counts
+        # Observations strictly below values[i]
+        cumulative = np.cumsum(counts)
+        self._below = cumulative - counts
+        self.total = int(cumulative[-1]) if len(cumulative) else 0
+
+    @classmethod
+    def empty(cls) -> 'NormTable':
+        return cls(np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64))
+
+    def merged(self, observations: np.ndarray) -> 'NormTable':
+        """New table with observations (already quantized) added"""
+        if not len(observations):
+            return self
+        values, inverse = np.unique(np.concatenate([self.values, observations]), return_inverse=True)
+        weights = np.concatenate([self.counts, np.ones(len(observations), dtype=np.int64)])
+        return NormTable(values, np.bincount(inverse, weights=weights).astype(np.int64))
+
+    def percentile(self, value: float) -> float:
+        """Mid-rank percentile (0-100): share below plus half the share equal to value"""
+        value = float(np.round(value, _DECIMALS))
+        i = int(np.searchsorted(self.values, value))
+        below = int(self._below[i]) if i < len(self.values) else self.total
+        equal = int(self.counts[i]) if i < len(self.values) and self.values[i] == value else 0
+        return round(100.0 * (below + equal / 2) / self.total, 1)
+
+
+class NormTables:
+    """
+    Percentile tables for every trait and facet.
+
+    Dimensions are keyed by group ("traits" or "facets") and the long names
+    used in score results (e.g. "Openness", "Fantasy").
+    """
+
+    def __init__(self, tables: Dict[str, Dict[str, NormTable]], meta: Optional[Dict[str, Any]] = None):
+        self.tables = tables
+        self.meta = meta or {}
+
+    @property
+    def population(self) -> int:
+        return self.meta.get("population", 0)
+
+    @property
+    def scoring_version(self) -> Optional[str]:
+        return self.meta.get("scoring_version")
+
+    def percentile(self, group: str, name: str, value: Optional[float], min_population: int = 1) -> Optional[float]:
+        """Percentile of value, or None without a score or enough observations"""
+        table = self.tables.get(group, {}).get(name)
+        if value is None or table is None or table.total < max(min_population, 1):
+            return None
+        return table.percentile(value)
+
+    def percentiles(
+        self,
+        traits: Dict[str, Optional[float]],
+        facets: Optional[Dict[str, Optional[float]]] = None,
+        min_population: int = 1,
+    ) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Percentiles for long-name trait and facet score dicts.
+
+        Returns:
+            {"traits": {name: pct}, "facets": {name: pct}} (None where unavailable)
+        """
+        return {
+            "traits": {name: self.percentile("traits", name, v, min_population) for name, v in traits.items()},
+            "facets": {name: self.percentile("facets", name, v, min_population) for name, v in (facets or {}).items()},
+        }
+
+    def save(self, path: Union[str, Path]):
+        """Write the tables as a .npz artifact (written to a temp file, then renamed)"""
+        path = Path(path)
+        dimensions = [[group, name] for group in GROUPS for name in self.tables.get(group, {})]
+        arrays = {}
+        for i, (group, name) in enumerate(dimensions):
+            table = self.tables[group][name]
+            arrays[f"values_{i}"] = table.values
+            arrays[f"counts_{i}"] = table.counts
+        meta = {**self.meta, "format_version": NORMS_FORMAT_VERSION, "dimensions": dimensions}
+        arrays["meta"] = np.frombuffer(json.dumps(meta).encode('utf-8'), dtype=np.uint8)
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'NormTables':
+        """
+        Load a .npz norms artifact.
+
+        Raises:
+            NormsError: If the file is missing, unreadable or another format version
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(data["meta"].tobytes().decode('utf-8'))
+                if meta.get("format_version") != NORMS_FORMAT_VERSION:
+                    raise NormsError(f"Norms artifact {path} has format {meta.get('format_version')}")
+                tables: Dict[str, Dict[str, NormTable]] = {group: {} for group in GROUPS}
+                for i, (group, name) in enumerate(meta.pop("dimensions")):
+                    tables.setdefault(group, {})[name] = NormTable(data[f"values_{i}"], data[f"counts_{i}"])
+        except NormsError:
+            raise
+        except (OSError, KeyError, ValueError) as e:
+            raise NormsError(f"Cannot load norms artifact {path}: {e}")
+        meta.pop("format_version", None)
+        return cls(tables, meta)
+
+
+class NormsBuilder:
+    """
+    Accumulates stored scores into NormTables.
+
+    Start from an existing NormTables to refresh incrementally: only the new
+    assessments need to be added. Observations are buffered per dimension
+    and merged every _FLUSH_SIZE values, so memory does not grow with the
+    population.
+    """
+
+    def __init__(self, base: Optional[NormTables] = None):
+        self.tables: Dict[str, Dict[str, NormTable]] = {
+            group: dict((base.tables.get(group) or {}) if base else {}) for group in GROUPS
+        }
+        self.population = base.population if base else 0
+        self._pending: Dict[Tuple[str, str], List[float]] = {}
+
+    def add(self, traits: Dict[str, Optional[float]], facets: Optional[Dict[str, Optional[float]]] = None):
+        """Add one assessment's long-name trait and facet scores (0-1; None is skipped)"""
+        self.population += 1
+        for group, scores in (("traits", traits), ("facets", facets or {})):
+            for name, value in scores.items():
+                if value is None:
+                    continue
+                pending = self._pending.setdefault((group, name), [])
+                pending.append(value)
+                if len(pending) >= _FLUSH_SIZE:
+                    self._flush(group, name)
+
+    def _flush(self, group: str, name: str):
+        observations = np.round(np.asarray(self._pending.pop((group, name)), dtype=np.float64), _DECIMALS)
+        table = self.tables[group].get(name) or NormTable.empty()
+        self.tables[group][name] = table.merged(observations)
+
+    def build(self, **meta: Any) -> NormTables:
+        """Merge anything still buffered and return the tables (meta is stored with them)"""
+        for group, name in list(self._pending):
+            self._flush(group, name)
+        return NormTables(
+            {group: dict(tables) for group, tables in self.tables.items()},
+            {**meta, "population": self.population, "built_at": time.time()},
+        )
+
+
+def stored_trait_scores(trait_scores: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """
+    Long-name 0-1 trait scores from a stored trait_scores column.
+
+    Rows hold either long names on a 0-1 scale ({"Openness": 0.8}) or short
+    codes on a 0-100 scale ({"O": 80.0}).
+    """
+    traits = {}
+    for code, name in TRAIT_NAMES.items():
+        value = trait_scores.get(code)
+        if value is not None:
+            traits[name] = float(value) / 100.0 if value > 1.0 else float(value)
+        else:
+            value = trait_scores.get(name)
+            traits[name] = float(value) if value is not None else None
+    return traits
+
+
+def stored_facet_scores(facet_scores: Any, facet_names: Optional[Dict[str, str]] = None) -> Dict[str, Optional[float]]:
+    """
+    Long-name 0-1 facet scores from a stored facet_scores column.
+
+    Like trait_scores, rows hold either long names on a 0-1 scale
+    ({"Fantasy": 0.8}) or facet codes on a 0-100 scale ({"O1": 80.0}, written
+    by the score-assessment edge function).
+
+    Args:
+        facet_scores: The stored column (anything but a dict gives {})
+        facet_names: Facet code -> long name (default: the question bank's)
+    """
+    if not isinstance(facet_scores, dict):
+        return {}
+    if facet_names is None:
+        facet_names = _bank_facet_names()
+    facets: Dict[str, Optional[float]] = {}
+    for key, value in facet_scores.items():
+        name = facet_names.get(key, key)
+        if value is None:
+            facets.setdefault(name, None)
+            continue
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            continue
+        facets[name] = value / 100.0 if value > 1.0 else value
+    return facets
+
+
+def _bank_facet_names() -> Dict[str, str]:
+    # Imported lazily: the scorer wrapper imports this module
+    from .create_scorer_wrapper import get_scorer
+    return get_scorer().facets
+
+
+def iter_stored_scores(rows: Iterable[Dict[str, Any]]) -> Iterable[Tuple[Dict[str, Optional[float]], Dict[str, Optional[float]]]]:
+    """(traits, facets) pairs from stored assessment rows, skipping rows without scores"""
+    facet_names = None
+    for row in rows:
+        trait_scores = row.get("trait_scores")
+        if not isinstance(trait_scores, dict) or not trait_scores:
+            continue
+        if facet_names is None:
+            facet_names = _bank_facet_names()
+        yield stored_trait_scores(trait_scores), stored_facet_scores(row.get("facet_scores"), facet_names)
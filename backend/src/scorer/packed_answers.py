@@ -0,0 +1,106 @@
+"""
+LifeSync Personality Scorer - Packed Answer Vectors
+Compact wire format for a full response set: one 4-bit value per question
+
+Layout: questions in bank order, two per byte, the even-indexed question in
+the high nibble. 0 means unanswered, 1-15 is the response value (only the
+bank's scale is accepted). The full 180-question quiz packs into 90 bytes
+(120 base64 characters) instead of ~1.6KB of JSON.
+"""
+
+import base64
+import binascii
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class PackedAnswersError(ValueError):
+    """Raised when a packed answer vector is malformed or targets another bank"""
+    pass
+
+
+class PackedAnswers:
+    """
+    Decoded packed answer vector.
+
+    Holds one uint8 per bank question (0 = unanswered). Scorers consume the
+    arrays directly; to_dict() is only needed for callers that want the
+    classic {question_id: value} form.
+    """
+
+    __slots__ = ('bank_version', 'values', 'answered')
+
+    def __init__(self, bank_version: Optional[str], values: np.ndarray):
+        self.bank_version = bank_version
+        self.values = values
+        self.answered = np.flatnonzero(values)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, n_questions: int, bank_version: Optional[str] = None) -> 'PackedAnswers':
+        """
+        Unpack nibbles for a bank with n_questions questions.
+
+        Raises:
+            PackedAnswersError: If the byte length does not match the bank
+        """
+        expected = (n_questions + 1) // 2
+        if len(data) != expected:
+            raise PackedAnswersError(
+                f"Packed answers must be {expected} bytes for {n_questions} questions, got {len(data)}"
+            )
+        packed = np.frombuffer(data, dtype=np.uint8)
+        values = np.empty(2 * expected, dtype=np.uint8)
+        values[0::2] = packed >> 4
+        values[1::2] = packed & 0x0F
+        if n_questions % 2 and values[-1]:
+            raise PackedAnswersError("Padding nibble must be 0")
+        return cls(bank_version, values[:n_questions])
+
+    @classmethod
+    def from_base64(cls, text: str, n_questions: int, bank_version: Optional[str] = None) -> 'PackedAnswers':
+        """
+        Decode a base64 (standard or URL-safe) packed vector.
+
+        Raises:
+            PackedAnswersError: If the text is not valid base64 or has the wrong length
+        """
+        try:
+            data = base64.b64decode(text.replace('-', '+').replace('_', '/'), validate=True)
+        except (binascii.Error, ValueError) as e:
+            raise PackedAnswersError(f"Packed answers are not valid base64: {e}")
+        return cls.from_bytes(data, n_questions, bank_version)
+
+    def __len__(self) -> int:
+        return len(self.answered)
+
+    def to_dict(self, question_ids: List[str]) -> Dict[str, int]:
+        """Answered questions as {question_id: value} in bank order"""
+        return {question_ids[i]: v for i, v in zip(self.answered.tolist(), self.values[self.answered].tolist())}
+
+
+def pack_answers(answers: Dict[str, int], question_ids: List[str]) -> bytes:
+    """
+    Pack an answer dict into the nibble wire format.
+
+    Args:
+        answers: {question_id: value}; values must be 1-15
+        question_ids: Bank question ids in bank order
+
+    Raises:
+        PackedAnswersError: If an id is unknown or a value does not fit a nibble
+    """
+    index = {q_id: i for i, q_id in enumerate(question_ids)}
+    values = np.zeros(len(question_ids) + len(question_ids) % 2, dtype=np.uint8)
+    for q_id, value in answers.items():
+        if q_id not in index:
+            raise PackedAnswersError(f"Unknown question id: {q_id}")
+        if type(value) is not int or not 1 <= value <= 15:
+            raise PackedAnswersError(f"Response value for {q_id} must be an integer between 1 and 15")
+        values[index[q_id]] = value
+    return ((values[0::2] << 4) | values[1::2]).astype(np.uint8).tobytes()
+
+
+def pack_answers_base64(answers: Dict[str, int], question_ids: List[str]) -> str:
+    """pack_answers() encoded as standard base64 text"""
+    return base64.b64encode(pack_answers(answers, question_ids)).decode('ascii')
@@ -3,20 +3,38 @@ LifeSync Personality Scoring Engine
 Handles 180-question OCEAN assessment with 30 facets
 """
 
+import copy
 import hashlib
 import json
+import threading
 from collections import defaultdict
-from typing import Dict, List, Optional, Tuple
+from itertools import compress
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from cachetools import LRUCache
 
 from src.config.constants import SCORING_VERSION
 
+from .bank_artifact import load_artifact
+from .canonical_hash import CanonicalHasher
+from .compiled_bank import TRAIT_ORDER, CompiledQuestionBank
+from .norms import NormTables
+from .packed_answers import PackedAnswers, PackedAnswersError
+from .score_result import ScoreResult
+
 
 class PersonalityScorer:
     """Score personality responses and return OCEAN traits + facets"""
     
     @staticmethod
     def compute_hash(data: Dict) -> str:
-        """Generating deterministic hash for parity telemetry"""
+        """
+        Generating deterministic hash for parity telemetry
+        
+        Generic reference encoding; score() uses the byte-identical fast
+        encoders in canonical_hash.
+        """
         # Sort keys and remove separators to match JS JSON.stringify() behavior
         msg = json.dumps(data, sort_keys=True, separators=(',', ':'))
         return hashlib.sha256(msg.encode()).hexdigest()
@@ -24,18 +42,155 @@ class PersonalityScorer:
     # Minimum questions per trait to generate a valid score
     MIN_QUESTIONS_PER_TRAIT = 3
     
-    def __init__(self, questions_path: str):
-        """Load question bank from JSON file"""
-        with open(questions_path, 'r') as f:
-            data = json.load(f)
+    def __init__(
+        self,
+        questions_path: str,
+        compiled: bool = True,
+        memo_size: int = 0,
+        scoring_version: Optional[str] = None
+    ):
+        """
+        Load question bank from JSON file
+
+        Args:
+            questions_path: Path to the question bank JSON
+            compiled: Score with the vectorized NumPy tables (default). Set to
+                      False to use the reference dict-based accumulation.
+            memo_size: Size of the score() result memo (0 disables it)
+            scoring_version: Version stamped on results (default: SCORING_VERSION)
+        """
+        self._scoring_version = scoring_version
+        with open(questions_path, 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw)
+        
+        # Identifies the bank contents (same value as an artifact's source_sha256)
+        self.bank_fingerprint = hashlib.sha256(raw).hexdigest()
         
         self.questions = {q['id']: q for q in data['questions']}
         self.facets = data['facets']
         self.traits = data['traits']
         self.scale = data['scale']
+        self.bank_version = data.get('version')
         
         # Compute max weights per trait/facet for confidence scoring
         self.max_weights = self._compute_max_weights()
+        
+        # Dense index tables for vectorized scoring (built once at load time)
+        self.compiled = CompiledQuestionBank.from_questions(list(self.questions.values()), self.facets, self.scale) if compiled else None
+        self.hasher = CanonicalHasher(self.questions, self.scale['min'], self.scale['max'])
+        self.artifact = None
+        self.norms = None
+        self.enable_memo(memo_size)
+    
+    @classmethod
+    def from_artifact(
+        cls,
+        artifact_path: str,
+        source_path: Optional[str] = None,
+        memo_size: int = 0
+    ) -> 'PersonalityScorer':
+        """
+        Load a scorer from a precompiled question bank artifact.
+        
+        Skips JSON parsing and max-weight computation; the compiled tables are
+        read-only views into the memory-mapped file.
+        
+        Args:
+            artifact_path: Path to the .lsqb artifact
+            source_path: Optional source JSON used to detect a stale artifact
+            memo_size: Size of the score() result memo (0 disables it)
+        
+        Raises:
+            ArtifactError: If the artifact is corrupt, stale or built for
+                           another SCORING_VERSION
+        """
+        artifact = load_artifact(artifact_path, source_path)
+        
+        scorer = cls.__new__(cls)
+        scorer._scoring_version = None
+        scorer.questions = {q['id']: q for q in artifact.questions()}
+        scorer.facets = artifact.meta['facets']
+        scorer.traits = artifact.meta['traits']
+        scorer.scale = artifact.meta['scale']
+        scorer.bank_version = artifact.meta['bank_version']
+        scorer.max_weights = artifact.max_weights()
+        scorer.compiled = CompiledQuestionBank(
+            ids=artifact.ids,
+            trait_codes=artifact.trait_codes,
+            facet_codes=artifact.facet_codes,
+            trait_idx=artifact.trait_idx,
+            facet_idx=artifact.facet_idx,
+            weights=artifact.weights,
+            reverse=artifact.reverse,
+            scale=scorer.scale,
+        )
+        scorer.hasher = CanonicalHasher(artifact.ids, scorer.scale['min'], scorer.scale['max'])
+        scorer.bank_fingerprint = artifact.meta['source_sha256']
+        scorer.artifact = artifact
+        scorer.norms = None
+        scorer.enable_memo(memo_size)
+        return scorer
+    
+    @property
+    def scoring_version(self) -> str:
+        """Scoring version stamped on results and used in memo keys"""
+        return self._scoring_version or SCORING_VERSION
+    
+    def for_version(self, scoring_version: str, memo_size: int = 0) -> 'PersonalityScorer':
+        """
+        Scorer for another scoring version over the same question bank.
+        
+        The clone shares this scorer's question dicts, compiled tables,
+        hasher and artifact mapping (all read-only); only the version label
+        and the memo are its own. Norms built for another version are dropped.
+        """
+        scorer = copy.copy(self)
+        scorer._scoring_version = scoring_version
+        if scorer.norms is not None and scorer.norms.scoring_version != scoring_version:
+            scorer.norms = None
+        scorer.enable_memo(memo_size)
+        return scorer
+    
+    def set_norms(self, norms: Optional[NormTables]):
+        """
+        Attach population norms used for result percentiles (None detaches).
+        
+        Memoized results carry percentiles from the old tables, so the memo
+        is cleared.
+        """
+        self.norms = norms
+        self.clear_memo()
+    
+    def enable_memo(self, maxsize: int):
+        """
+        Enable (maxsize > 0) or disable the score() result memo.
+        
+        Repeated response sets (retakes, straight-liners, test traffic) are
+        served from a bounded LRU keyed by the canonical input hash, the
+        scoring version and the question bank fingerprint. Memoized results are
+        frozen, so every caller shares one immutable ScoreResult.
+        """
+        self._memo = LRUCache(maxsize=maxsize) if maxsize > 0 else None
+        self._memo_lock = threading.Lock()
+        self.memo_hits = 0
+        self.memo_misses = 0
+    
+    def memo_stats(self) -> Dict:
+        """Memo size and hit/miss counters (same shape as db cache stats)"""
+        return {
+            "enabled": self._memo is not None,
+            "size": len(self._memo) if self._memo is not None else 0,
+            "maxsize": self._memo.maxsize if self._memo is not None else 0,
+            "hits": self.memo_hits,
+            "misses": self.memo_misses
+        }
+    
+    def clear_memo(self):
+        """Drop all memoized results (counters are kept)"""
+        if self._memo is not None:
+            with self._memo_lock:
+                self._memo.clear()
     
     def _compute_max_weights(self) -> Dict:
         """Calculate maximum possible weight per trait and facet"""
@@ -62,18 +217,19 @@ class PersonalityScorer:
         
         return scaled
     
-    def score(self, responses: Dict[str, int]) -> Dict:
+    def _accumulate(self, responses: Dict[str, int]) -> Tuple[Dict[str, float], ...]:
         """
-        Score personality from user responses
+        Accumulate weighted sums per trait and facet.
         
-        Args:
-            responses: Dict mapping question_id to response value (1-5)
-            Example: {"Q001": 4, "Q007": 2, "Q013": 5, ...}
+        Uses the compiled NumPy tables when available, otherwise the reference
+        dict-based loop. Both produce identical floats (same summation order).
         
         Returns:
-            Dict with traits, facets, confidence, and derived profiles
+            (trait_sums, trait_weights, facet_sums, facet_weights) keyed by code
         """
-        # Accumulate weighted scores
+        if self.compiled is not None:
+            return self._sums_by_code(*self.compiled.accumulate(responses))
+        
         trait_sums = defaultdict(float)
         trait_weights = defaultdict(float)
         facet_sums = defaultdict(float)
@@ -102,13 +258,236 @@ class PersonalityScorer:
             facet_sums[q['facet']] += scaled * weight
             facet_weights[q['facet']] += weight
         
+        return trait_sums, trait_weights, facet_sums, facet_weights
+    
+    def _sums_by_code(
+        self,
+        trait_sums: np.ndarray,
+        trait_weights: np.ndarray,
+        facet_sums: np.ndarray,
+        facet_weights: np.ndarray
+    ) -> Tuple[Dict[str, float], ...]:
+        """Key compiled accumulator arrays by trait/facet code"""
+        trait_codes = self.compiled.trait_codes
+        facet_codes = self.compiled.facet_codes
+        return (
+            dict(zip(trait_codes, trait_sums.tolist())),
+            dict(zip(trait_codes, trait_weights.tolist())),
+            dict(zip(facet_codes, facet_sums.tolist())),
+            dict(zip(facet_codes, facet_weights.tolist())),
+        )
+    
+    def score(self, responses: Dict[str, int]) -> ScoreResult:
+        """
+        Score personality from user responses
+        
+        Args:
+            responses: Dict mapping question_id to response value (1-5)
+            Example: {"Q001": 4, "Q007": 2, "Q013": 5, ...}
+        
+        Returns:
+            ScoreResult (read-only mapping) with traits, facets, confidence, and
+            derived profiles; call to_dict() for a plain dict
+        """
+        return self._score_with(responses, self._accumulate)
+    
+    def score_packed(self, packed: PackedAnswers) -> ScoreResult:
+        """
+        Score a packed answer vector without building a response dict.
+        
+        Questions are accumulated in bank order, so the result equals score()
+        on the same answers given in bank order (the parity input hash is
+        identical for any order).
+        
+        Args:
+            packed: Decoded vector (see decode_packed())
+        
+        Raises:
+            PackedAnswersError: If the vector targets another bank version or
+                                holds values outside the response scale
+        """
+        if packed.bank_version is not None and packed.bank_version != self.bank_version:
+            raise PackedAnswersError(
+                f"Packed answers are for question bank {packed.bank_version}, expected {self.bank_version}"
+            )
+        if len(packed.values) != len(self.questions):
+            raise PackedAnswersError(
+                f"Packed answers hold {len(packed.values)} questions, expected {len(self.questions)}"
+            )
+        answered_values = packed.values[packed.answered]
+        if answered_values.size and (
+            answered_values.min() < self.scale['min'] or answered_values.max() > self.scale['max']
+        ):
+            raise PackedAnswersError(
+                f"Packed response values must be between {self.scale['min']} and {self.scale['max']}"
+            )
+        return self._score_with(packed, self._accumulate_packed)
+    
+    def decode_packed(self, data: Union[bytes, str], bank_version: Optional[str] = None) -> PackedAnswers:
+        """
+        Decode packed answers (raw bytes or base64 text) for this bank.
+        
+        Raises:
+            PackedAnswersError: If the payload is malformed
+        """
+        if isinstance(data, str):
+            return PackedAnswers.from_base64(data, len(self.questions), bank_version)
+        return PackedAnswers.from_bytes(data, len(self.questions), bank_version)
+    
+    def _accumulate_packed(self, packed: PackedAnswers) -> Tuple[Dict[str, float], ...]:
+        """Accumulate sums straight from a packed vector's index/value arrays"""
+        if self.compiled is None:
+            return self._accumulate(packed.to_dict(list(self.questions)))
+        values = packed.values[packed.answered].astype(np.float64)
+        return self._sums_by_code(*self.compiled.accumulate_arrays(packed.answered, values))
+    
+    def _score_with(
+        self,
+        responses: Union[Dict[str, int], PackedAnswers],
+        accumulate: Callable
+    ) -> ScoreResult:
+        """Build a result with the given accumulator, going through the memo when enabled"""
+        if self._memo is None:
+            return self._build_result(responses, *accumulate(responses))
+        
+        input_hash = self.hasher.hash_responses(responses)
+        key = (self.scoring_version, self.bank_fingerprint, input_hash)
+        with self._memo_lock:
+            result = self._memo.get(key)
+            if result is not None:
+                self.memo_hits += 1
+                return result
+            self.memo_misses += 1
+        
+        result = self._build_result(responses, *accumulate(responses), input_hash=input_hash).freeze()
+        with self._memo_lock:
+            self._memo[key] = result
+        return result
+    
+    def score_many(self, responses_list: List[Dict[str, int]]) -> List[ScoreResult]:
+        """
+        Score a batch of response sets in one pass.
+        
+        With compiled tables the whole batch is accumulated with a single set
+        of array operations; each result is identical to calling score() on
+        the same responses.
+        
+        Args:
+            responses_list: List of response dicts (question_id -> value)
+        
+        Returns:
+            List of score result dicts, in input order
+        """
+        if self.compiled is None or not responses_list:
+            return [self.score(responses) for responses in responses_list]
+        
+        trait_sums, trait_weights, facet_sums, facet_weights = self.compiled.accumulate_many(responses_list)
+        trait_codes = self.compiled.trait_codes
+        facet_codes = self.compiled.facet_codes
+        
+        return [
+            self._build_result(
+                responses,
+                dict(zip(trait_codes, t_sums)),
+                dict(zip(trait_codes, t_weights)),
+                dict(zip(facet_codes, f_sums)),
+                dict(zip(facet_codes, f_weights)),
+            )
+            for responses, t_sums, t_weights, f_sums, f_weights in zip(
+                responses_list,
+                trait_sums.tolist(),
+                trait_weights.tolist(),
+                facet_sums.tolist(),
+                facet_weights.tolist(),
+            )
+        ]
+    
+    def score_and_validate(self, responses: Dict[str, int]) -> Tuple[ScoreResult, Dict]:
+        """
+        Score responses and build the validation report in one traversal.
+        
+        Equivalent to (score(responses), validate_responses(responses)) but
+        looks up and range-checks each response only once and reuses the
+        per-trait counts for both outputs.
+        
+        Args:
+            responses: Dict mapping question_id to response value (1-5)
+        
+        Returns:
+            Tuple of (score result, validation report)
+        """
+        if self.compiled is None:
+            return self._score_and_validate_reference(responses)
+        
+        compiled = self.compiled
+        q_idx, values = compiled.lookup(responses)
+        mask = compiled.valid_mask(q_idx, values)
+        
+        if mask.all():
+            invalid_question_ids = []
+        else:
+            invalid_question_ids = list(compress(responses, (~mask).tolist()))
+            q_idx, values = q_idx[mask], values[mask]
+        
+        sums = self._sums_by_code(*compiled.accumulate_arrays(q_idx, values))
+        
+        # Per-trait answer counts, keyed in order of first appearance like the dict loop
+        trait_idx = compiled.trait_idx[q_idx]
+        counts = np.bincount(trait_idx, minlength=len(compiled.trait_codes))
+        seen, first = np.unique(trait_idx, return_index=True)
+        trait_coverage = {
+            compiled.trait_codes[i]: int(counts[i])
+            for i in seen[np.argsort(first, kind='stable')].tolist()
+        }
+        
+        result = self._build_result(responses, *sums)
+        validation = self._build_validation(responses, trait_coverage, invalid_question_ids)
+        return result, validation
+    
+    def _score_and_validate_reference(self, responses: Dict[str, int]) -> Tuple[ScoreResult, Dict]:
+        """Dict-based fused score + validation (used when compiled tables are disabled)"""
+        trait_sums = defaultdict(float)
+        trait_weights = defaultdict(float)
+        facet_sums = defaultdict(float)
+        facet_weights = defaultdict(float)
+        trait_coverage = defaultdict(int)
+        invalid_question_ids = []
+        
+        for q_id, response in responses.items():
+            q = self.questions.get(q_id)
+            if q is None or not (self.scale['min'] <= response <= self.scale['max']):
+                invalid_question_ids.append(q_id)
+                continue
+            
+            scaled = self._scale_response(response, q['reverse'])
+            weight = q['weight']
+            
+            trait_sums[q['trait']] += scaled * weight
+            trait_weights[q['trait']] += weight
+            facet_sums[q['facet']] += scaled * weight
+            facet_weights[q['facet']] += weight
+            trait_coverage[q['trait']] += 1
+        
+        result = self._build_result(responses, trait_sums, trait_weights, facet_sums, facet_weights)
+        validation = self._build_validation(responses, trait_coverage, invalid_question_ids)
+        return result, validation
+    
+    def _build_result(
+        self,
+        responses: Dict[str, int],
+        trait_sums: Dict[str, float],
+        trait_weights: Dict[str, float],
+        facet_sums: Dict[str, float],
+        facet_weights: Dict[str, float],
+        input_hash: Optional[str] = None
+    ) -> ScoreResult:
+        """Build the score result from accumulated per-trait/per-facet sums"""
         # Compute trait scores - return None if insufficient data (Solution D)
         trait_scores = {}
         trait_confidence = {}
         traits_with_data = []
         
-        for trait_code in ['O', 'C', 'E', 'A', 'N']:
-            print(f"DEBUG: Trait {trait_code} - Sum: {trait_sums[trait_code]}, Weight: {trait_weights[trait_code]}")
+        for trait_code in TRAIT_ORDER:
             question_count = trait_weights.get(trait_code, 0)
             
             if question_count >= self.MIN_QUESTIONS_PER_TRAIT:
@@ -121,20 +500,6 @@ class PersonalityScorer:
                 trait_scores[trait_code] = None
                 trait_confidence[trait_code] = 0.0
         
-        # Compute facet scores - also return None if no data (Solution D)
-        facet_scores = {}
-        facet_confidence = {}
-        
-        for facet_code in self.facets.keys():
-            question_count = facet_weights.get(facet_code, 0)
-            
-            if question_count > 0:
-                facet_scores[facet_code] = facet_sums[facet_code] / facet_weights[facet_code]
-                facet_confidence[facet_code] = facet_weights[facet_code] / self.max_weights['facets'][facet_code]
-            else:
-                facet_scores[facet_code] = None
-                facet_confidence[facet_code] = 0.0
-        
         # Generate MBTI only if ALL traits have sufficient data (Solution D)
         mbti_code = None
         n_level = None
@@ -149,80 +514,20 @@ class PersonalityScorer:
                 n_level = self._neuroticism_level(trait_scores['N'])
                 personality_code = f"{mbti_code}-{n_level[0]}"  # e.g., "INFP-B"
         
-        # Get top facets (only from facets with data)
-        valid_facets = {k: v for k, v in facet_scores.items() if v is not None}
-        top_facets = self._get_top_facets(valid_facets, n=5) if valid_facets else []
-        
-        # Build result with proper null handling
-        # 🟢 Canonical Contract Alignment
-        ocean_scores = {
-            'O': round(trait_scores['O'], 3) if trait_scores['O'] is not None else 0.0,
-            'C': round(trait_scores['C'], 3) if trait_scores['C'] is not None else 0.0,
-            'E': round(trait_scores['E'], 3) if trait_scores['E'] is not None else 0.0,
-            'A': round(trait_scores['A'], 3) if trait_scores['A'] is not None else 0.0,
-            'N': round(trait_scores['N'], 3) if trait_scores['N'] is not None else 0.0
-        }
-
-        # Calculate input/output hashes for parity telemetry
-        input_hash = self.compute_hash(responses)
-        output_data = {
-            **ocean_scores,
-            'mbti': mbti_code,
-            'version': SCORING_VERSION
-        }
-        output_hash = self.compute_hash(output_data)
-
-        # Calculate global confidence (Average of non-zero trait confidences)
-        conf_values = [v for v in trait_confidence.values() if v > 0]
-        global_confidence = round(sum(conf_values) / len(conf_values), 2) if conf_values else 0.0
-
-        # Persona ID (Derive from MBTI or fallback)
-        persona_id = mbti_code.lower() if mbti_code and mbti_code != "UNKN" else "unknown"
-
-        result = {
-            # Canonical Contract Fields
-            'ocean': ocean_scores,
-            'persona_id': persona_id,
-            'mbti_proxy': mbti_code,
-            'confidence': global_confidence,
-            'metadata': {
-                'quiz_type': 'full180' if len(responses) >= 60 else 'quick', # Simple heuristic for now
-                'engine_version': '2.0.0',
-                'scoring_version': SCORING_VERSION,
-                'timestamp': 0, # Will be filled by API route
-                'input_hash': input_hash,
-                'output_hash': output_hash,
-                'execution_path': 'python'
-            },
-            
-            # Legacy/Detailed Fields (still useful for internal logic or detailed views)
-            'traits': {
-                'Openness': round(trait_scores['O'], 3) if trait_scores['O'] is not None else None,
-                'Conscientiousness': round(trait_scores['C'], 3) if trait_scores['C'] is not None else None,
-                'Extraversion': round(trait_scores['E'], 3) if trait_scores['E'] is not None else None,
-                'Agreeableness': round(trait_scores['A'], 3) if trait_scores['A'] is not None else None,
-                'Neuroticism': round(trait_scores['N'], 3) if trait_scores['N'] is not None else None
-            },
-            'trait_confidence': {
-                'Openness': round(trait_confidence['O'], 3),
-                'Conscientiousness': round(trait_confidence['C'], 3),
-                'Extraversion': round(trait_confidence['E'], 3),
-                'Agreeableness': round(trait_confidence['A'], 3),
-                'Neuroticism': round(trait_confidence['N'], 3)
-            },
-            'facets': {self.facets[k]: (round(v, 3) if v is not None else None) for k, v in facet_scores.items()},
-            'facet_confidence': {self.facets[k]: round(v, 3) for k, v in facet_confidence.items()},
-            # 'mbti_proxy': mbti_code, # Already defined above
-            'neuroticism_level': n_level,
-            'personality_code': personality_code,
-            'top_facets': top_facets,
-            'responses_count': len(responses),
-            'coverage': round(len(responses) / len(self.questions) * 100, 1),
-            'has_complete_profile': len(traits_with_data) == 5,
-            'traits_with_data': traits_with_data
-        }
-        
-        return result
+        # Facet dicts, legacy long-name views, top facets and hashes are built lazily
+        return ScoreResult(
+            self,
+            responses,
+            trait_scores,
+            trait_confidence,
+            facet_sums,
+            facet_weights,
+            mbti_code,
+            n_level,
+            personality_code,
+            traits_with_data,
+            input_hash,
+        )
     
     def _generate_mbti_proxy(self, trait_scores: Dict[str, Optional[float]], trait_confidence: Dict[str, float] = None) -> str:
         """
@@ -354,8 +659,6 @@ class PersonalityScorer:
                 'missing_traits': List[str]  # Traits with no questions
             }
         """
-        MIN_QUESTIONS_PER_TRAIT = 3  # Minimum questions needed per trait
-        
         # Count questions per trait
         trait_coverage = defaultdict(int)
         invalid_question_ids = []
@@ -375,6 +678,18 @@ class PersonalityScorer:
             q = self.questions[q_id]
             trait_coverage[q['trait']] += 1
         
+        return self._build_validation(responses, trait_coverage, invalid_question_ids)
+    
+    def _build_validation(
+        self,
+        responses: Dict[str, int],
+        trait_coverage: Dict[str, int],
+        invalid_question_ids: List[str]
+    ) -> Dict:
+        """Build the validation report from per-trait counts and rejected ids"""
+        MIN_QUESTIONS_PER_TRAIT = 3  # Minimum questions needed per trait
+        trait_coverage = defaultdict(int, trait_coverage)
+        
         # Check for missing traits
         all_traits = ['O', 'C', 'E', 'A', 'N']
         missing_traits = [t for t in all_traits if trait_coverage[t] < MIN_QUESTIONS_PER_TRAIT]
@@ -0,0 +1,124 @@
+"""
+LifeSync Personality Scorer - Scoring Registry
+Keeps scorers for several scoring versions and question banks loaded side by side
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .bank_artifact import file_sha256
+from .personality_scorer import PersonalityScorer
+
+logger = logging.getLogger(__name__)
+
+
+class UnknownScoringVersionError(ValueError):
+    """Raised when a scoring version is not registered"""
+    pass
+
+
+class ScoringRegistry:
+    """
+    Registry of PersonalityScorer instances keyed by scoring version.
+
+    Versions are registered with the question bank they score against and
+    loaded on first use, then kept for the life of the process. Versions
+    whose banks have identical contents (same SHA-256) share one set of
+    question dicts and compiled tables; only the version label and memo are
+    per-version.
+    """
+
+    def __init__(self, default_version: str, memo_size: int = 0):
+        """
+        Args:
+            default_version: Version served when none is requested
+            memo_size: score() memo size for scorers the registry loads
+        """
+        self.default_version = default_version
+        self.memo_size = memo_size
+        self._bank_paths: Dict[str, Path] = {}
+        self._scorers: Dict[str, PersonalityScorer] = {}
+        # One loaded scorer per bank fingerprint; other versions derive from it
+        self._banks: Dict[str, PersonalityScorer] = {}
+        self._lock = threading.Lock()
+
+    def register(self, scoring_version: str, questions_path: Union[str, Path]):
+        """Register a version and its question bank (loaded lazily by get())"""
+        with self._lock:
+            self._bank_paths[scoring_version] = Path(questions_path)
+            self._scorers.pop(scoring_version, None)
+
+    def add(self, scorer: PersonalityScorer):
+        """
+        Add an already loaded scorer under its own scoring version.
+
+        Its tables become shareable with other versions of the same bank.
+        """
+        with self._lock:
+            self._scorers[scorer.scoring_version] = scorer
+            self._banks.setdefault(scorer.bank_fingerprint, scorer)
+
+    def versions(self) -> List[str]:
+        """Registered scoring versions (loaded or not)"""
+        return sorted(set(self._bank_paths) | set(self._scorers))
+
+    def is_loaded(self, scoring_version: str) -> bool:
+        return scoring_version in self._scorers
+
+    def get(self, scoring_version: Optional[str] = None) -> PersonalityScorer:
+        """
+        Scorer for a scoring version (default_version when None).
+
+        Raises:
+            UnknownScoringVersionError: If the version is not registered
+        """
+        version = scoring_version or self.default_version
+        scorer = self._scorers.get(version)
+        if scorer is not None:
+            return scorer
+
+        with self._lock:
+            scorer = self._scorers.get(version)
+            if scorer is not None:
+                return scorer
+
+            path = self._bank_paths.get(version)
+            if path is None:
+                raise UnknownScoringVersionError(
+                    f"Unknown scoring version '{version}'. Available: {', '.join(self.versions()) or 'none'}"
+                )
+
+            fingerprint = file_sha256(path)
+            base = self._banks.get(fingerprint)
+            if base is not None:
+                scorer = base.for_version(version, memo_size=self.memo_size)
+                logger.info(f"Scoring version {version} shares tables with {base.scoring_version}")
+            else:
+                scorer = PersonalityScorer(str(path), memo_size=self.memo_size, scoring_version=version)
+                self._banks[fingerprint] = scorer
+                logger.info(f"Loaded scoring version {version} from {path}")
+
+            self._scorers[version] = scorer
+            return scorer
+
+    def for_assessment(self, assessment: Dict[str, Any]) -> PersonalityScorer:
+        """
+        Scorer matching a stored assessment's scoring version.
+
+        Reads the scoring_version column, then metadata.scoring_version, and
+        falls back to the default version for rows that predate versioning.
+        """
+        version = assessment.get("scoring_version") or (assessment.get("metadata") or {}).get("scoring_version")
+        return self.get(version)
+
+    def stats(self) -> Dict[str, Any]:
+        """Loaded versions, shared banks and per-version memo counters"""
+        return {
+            "default_version": self.default_version,
+            "registered": self.versions(),
+            "loaded": sorted(self._scorers),
+            "banks_loaded": len(self._banks),
+            "memo": {version: scorer.memo_stats() for version, scorer in self._scorers.items()},
+        }
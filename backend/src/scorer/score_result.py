@@ -0,0 +1,272 @@
+"""
+LifeSync Personality Scorer - Score Result
+Compact, lazily materialized result returned by PersonalityScorer.score()
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+from src.config.constants import NORMS_MIN_POPULATION
+
+from .canonical_hash import hash_output
+from .compiled_bank import TRAIT_ORDER
+
+if TYPE_CHECKING:
+    from .personality_scorer import PersonalityScorer
+
+# Long trait names used by the legacy views
+TRAIT_NAMES = {
+    'O': 'Openness',
+    'C': 'Conscientiousness',
+    'E': 'Extraversion',
+    'A': 'Agreeableness',
+    'N': 'Neuroticism',
+}
+
+# Contract key order (matches the dict score() used to build eagerly)
+RESULT_KEYS = (
+    'ocean',
+    'persona_id',
+    'mbti_proxy',
+    'confidence',
+    'metadata',
+    'traits',
+    'trait_confidence',
+    'facets',
+    'facet_confidence',
+    'neuroticism_level',
+    'personality_code',
+    'top_facets',
+    'responses_count',
+    'coverage',
+    'has_complete_profile',
+    'traits_with_data',
+    'percentiles',
+)
+
+_EAGER_KEYS = frozenset((
+    'ocean', 'persona_id', 'mbti_proxy', 'confidence', 'neuroticism_level',
+    'personality_code', 'responses_count', 'coverage', 'has_complete_profile',
+    'traits_with_data',
+))
+
+
+class ScoreResult(Mapping):
+    """
+    Read-only score result.
+
+    The fields most callers need (``ocean``, ``mbti_proxy``, ``confidence``,
+    ``persona_id``...) are computed up front. Legacy long-name views, the
+    facet dicts, top facets and the parity hashes are only built on first
+    access and then cached.
+
+    Behaves like the dict score() used to return: item access, iteration in
+    contract key order, ``==`` against dicts, and to_dict() for
+    serialization. The responses dict is kept by reference for the input
+    hash, so callers must not mutate it afterwards.
+
+    freeze() makes a result safe to share (e.g. from the scoring memo):
+    every field is materialized and nested dicts/lists become read-only
+    mapping proxies/tuples. to_dict() always returns fresh plain containers.
+    """
+
+    __slots__ = (
+        '_scorer', '_responses', '_trait_scores', '_trait_confidence',
+        '_facet_sums', '_facet_weights', '_facet_scores', '_lazy', '_input_hash', '_frozen',
+        'ocean', 'persona_id', 'mbti_proxy', 'confidence', 'neuroticism_level',
+        'personality_code', 'responses_count', 'coverage',
+        'has_complete_profile', 'traits_with_data',
+    )
+
+    def __init__(
+        self,
+        scorer: 'PersonalityScorer',
+        responses: Dict[str, int],
+        trait_scores: Dict[str, Optional[float]],
+        trait_confidence: Dict[str, float],
+        facet_sums: Dict[str, float],
+        facet_weights: Dict[str, float],
+        mbti_code: Optional[str],
+        n_level: Optional[str],
+        personality_code: Optional[str],
+        traits_with_data: List[str],
+        input_hash: Optional[str] = None,
+    ):
+        self._scorer = scorer
+        self._responses = responses
+        self._trait_scores = trait_scores
+        self._trait_confidence = trait_confidence
+        self._facet_sums = facet_sums
+        self._facet_weights = facet_weights
+        self._facet_scores = None
+        self._lazy: Dict[str, Any] = {}
+        self._input_hash = input_hash
+        self._frozen = False
+
+        self.ocean = {
+            code: round(trait_scores[code], 3) if trait_scores[code] is not None else 0.0
+            for code in TRAIT_ORDER
+        }
+
+        # Global confidence (average of non-zero trait confidences)
+        conf_values = [v for v in trait_confidence.values() if v > 0]
+        self.confidence = round(sum(conf_values) / len(conf_values), 2) if conf_values else 0.0
+
+        self.mbti_proxy = mbti_code
+        self.persona_id = mbti_code.lower() if mbti_code and mbti_code != "UNKN" else "unknown"
+        self.neuroticism_level = n_level
+        self.personality_code = personality_code
+        self.responses_count = len(responses)
+        self.coverage = round(len(responses) / len(scorer.questions) * 100, 1)
+        self.has_complete_profile = len(traits_with_data) == 5
+        self.traits_with_data = traits_with_data
+
+    # Mapping protocol
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _EAGER_KEYS:
+            return getattr(self, key)
+        value = self._lazy.get(key)
+        if value is None:
+            builder = _LAZY_BUILDERS.get(key)
+            if builder is None:
+                raise KeyError(key)
+            value = self._lazy[key] = builder(self)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(RESULT_KEYS)
+
+    def __len__(self) -> int:
+        return len(RESULT_KEYS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _EAGER_KEYS or key in _LAZY_BUILDERS
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ScoreResult):
+            other = other.to_dict()
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return self.to_dict() == dict(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ScoreResult(mbti_proxy={self.mbti_proxy!r}, ocean={self.ocean!r}, confidence={self.confidence!r})"
+
+    def __reduce__(self):
+        # Pickle (e.g. across a process pool) as the plain contract dict
+        return (dict, (self.to_dict(),))
+
+    def to_dict(self, keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Materialize fields into a plain dict (current API contract).
+
+        Args:
+            keys: Optional subset of fields (default: all, in contract order)
+        """
+        if not self._frozen:
+            return {key: self[key] for key in (keys or RESULT_KEYS)}
+        return {key: _thaw(self[key]) for key in (keys or RESULT_KEYS)}
+
+    def freeze(self) -> 'ScoreResult':
+        """Materialize every field and make nested values read-only (returns self)"""
+        if not self._frozen:
+            for key in _LAZY_BUILDERS:
+                self[key]
+            self.ocean = _freeze(self.ocean)
+            self.traits_with_data = _freeze(self.traits_with_data)
+            self._lazy = {key: _freeze(value) for key, value in self._lazy.items()}
+            self._frozen = True
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    # Lazy views
+
+    def _facets_by_code(self) -> Dict[str, Optional[float]]:
+        """Unrounded facet scores keyed by code (None when a facet has no data)"""
+        if self._facet_scores is None:
+            facet_sums, facet_weights = self._facet_sums, self._facet_weights
+            self._facet_scores = {
+                code: (facet_sums[code] / facet_weights[code] if facet_weights.get(code, 0) > 0 else None)
+                for code in self._scorer.facets
+            }
+        return self._facet_scores
+
+    def _metadata(self) -> Dict[str, Any]:
+        hasher = self._scorer.hasher
+        scoring_version = self._scorer.scoring_version
+        return {
+            'quiz_type': 'full180' if self.responses_count >= 60 else 'quick', # Simple heuristic for now
+            'engine_version': '2.0.0',
+            'scoring_version': scoring_version,
+            'timestamp': 0, # Will be filled by API route
+            'input_hash': self._input_hash or hasher.hash_responses(self._responses),
+            'output_hash': hash_output(self.ocean, self.mbti_proxy, scoring_version),
+            'execution_path': 'python'
+        }
+
+    def _traits(self) -> Dict[str, Optional[float]]:
+        return {
+            TRAIT_NAMES[code]: round(self._trait_scores[code], 3) if self._trait_scores[code] is not None else None
+            for code in TRAIT_ORDER
+        }
+
+    def _trait_confidence_view(self) -> Dict[str, float]:
+        return {TRAIT_NAMES[code]: round(self._trait_confidence[code], 3) for code in TRAIT_ORDER}
+
+    def _facets(self) -> Dict[str, Optional[float]]:
+        names = self._scorer.facets
+        return {names[k]: (round(v, 3) if v is not None else None) for k, v in self._facets_by_code().items()}
+
+    def _facet_confidence(self) -> Dict[str, float]:
+        names = self._scorer.facets
+        max_weights = self._scorer.max_weights['facets']
+        facet_weights = self._facet_weights
+        return {
+            names[code]: (round(facet_weights[code] / max_weights[code], 3) if facet_weights.get(code, 0) > 0 else 0.0)
+            for code in names
+        }
+
+    def _top_facets(self) -> List:
+        valid_facets = {k: v for k, v in self._facets_by_code().items() if v is not None}
+        return self._scorer._get_top_facets(valid_facets, n=5) if valid_facets else []
+
+    def _percentiles(self) -> Optional[Dict[str, Dict[str, Optional[float]]]]:
+        norms = self._scorer.norms
+        if norms is None:
+            return None
+        return norms.percentiles(self['traits'], self['facets'], NORMS_MIN_POPULATION)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        # top_facets entries are (name, score) tuples in the contract
+        return [v if isinstance(v, tuple) else _thaw(v) for v in value]
+    return value
+
+
+_LAZY_BUILDERS = {
+    'metadata': ScoreResult._metadata,
+    'traits': ScoreResult._traits,
+    'trait_confidence': ScoreResult._trait_confidence_view,
+    'facets': ScoreResult._facets,
+    'facet_confidence': ScoreResult._facet_confidence,
+    'top_facets': ScoreResult._top_facets,
+    'percentiles': ScoreResult._percentiles,
+}
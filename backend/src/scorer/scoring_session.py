@@ -0,0 +1,210 @@
+"""
+LifeSync Personality Scorer - Incremental Scoring Session
+Keeps running trait/facet sums so a quiz can be scored one answer at a time
+"""
+
+from typing import Any, Dict, Optional
+
+from .compiled_bank import TRAIT_ORDER
+from .personality_scorer import PersonalityScorer
+from .score_result import ScoreResult
+
+
+class ScoringSession:
+    """
+    Incremental scoring on top of a PersonalityScorer.
+
+    add(), change() and retract() update running per-trait and per-facet sums
+    in O(1), so snapshot() can report partial trait scores, confidence and the
+    MBTI proxy after every answer without re-scoring the whole response set.
+
+    Running sums are updated by adding and subtracting contributions, so they
+    can drift from score() in the last float bits after many changes. Use
+    result() for the final, canonical score: it runs the full scorer over the
+    current answers.
+
+    Example:
+        >>> session = ScoringSession(scorer)
+        >>> session.add("Q001", 4)
+        >>> session.change("Q001", 5)
+        >>> session.snapshot()['responses_count']
+        1
+    """
+
+    def __init__(self, scorer: PersonalityScorer, responses: Optional[Dict[str, int]] = None):
+        """
+        Start a session.
+
+        Args:
+            scorer: Loaded PersonalityScorer (shared, never modified)
+            responses: Optional answers to seed the session with
+
+        Raises:
+            ValueError: If a seeded answer is invalid (see add())
+        """
+        self.scorer = scorer
+        self.responses: Dict[str, int] = {}
+
+        self._trait_sums: Dict[str, float] = {}
+        self._trait_weights: Dict[str, float] = {}
+        self._trait_counts: Dict[str, int] = {}
+        self._facet_sums: Dict[str, float] = {}
+        self._facet_weights: Dict[str, float] = {}
+        self._facet_counts: Dict[str, int] = {}
+
+        for q_id, value in (responses or {}).items():
+            self.add(q_id, value)
+
+    def _question(self, q_id: str, value: int) -> Dict[str, Any]:
+        """Look up a question and check the value is on the scale"""
+        q = self.scorer.questions.get(q_id)
+        if q is None:
+            raise ValueError(f"Unknown question id: {q_id}")
+        scale = self.scorer.scale
+        if not (scale['min'] <= value <= scale['max']):
+            raise ValueError(
+                f"Response for {q_id} must be between {scale['min']} and {scale['max']}, got {value}"
+            )
+        return q
+
+    def _apply(self, q: Dict[str, Any], value: int, sign: int):
+        """Add (sign=1) or remove (sign=-1) one answer's contribution"""
+        weight = q['weight']
+        weighted = self.scorer._scale_response(value, q['reverse']) * weight
+        trait, facet = q['trait'], q['facet']
+
+        self._trait_counts[trait] = self._trait_counts.get(trait, 0) + sign
+        self._facet_counts[facet] = self._facet_counts.get(facet, 0) + sign
+
+        if self._trait_counts[trait]:
+            self._trait_sums[trait] = self._trait_sums.get(trait, 0.0) + sign * weighted
+            self._trait_weights[trait] = self._trait_weights.get(trait, 0.0) + sign * weight
+        else:
+            # Reset exactly so add/retract round trips leave no float residue
+            self._trait_sums[trait] = 0.0
+            self._trait_weights[trait] = 0.0
+
+        if self._facet_counts[facet]:
+            self._facet_sums[facet] = self._facet_sums.get(facet, 0.0) + sign * weighted
+            self._facet_weights[facet] = self._facet_weights.get(facet, 0.0) + sign * weight
+        else:
+            self._facet_sums[facet] = 0.0
+            self._facet_weights[facet] = 0.0
+
+    def add(self, q_id: str, value: int):
+        """
+        Record a new answer.
+
+        Raises:
+            ValueError: If the question is unknown, already answered (use
+                        change()) or the value is outside the response scale
+        """
+        if q_id in self.responses:
+            raise ValueError(f"Question {q_id} already answered, use change()")
+        q = self._question(q_id, value)
+        self._apply(q, value, 1)
+        self.responses[q_id] = value
+
+    def change(self, q_id: str, value: int):
+        """
+        Replace an existing answer (keeps its position in answer order).
+
+        Raises:
+            ValueError: If the question has not been answered or the new value
+                        is outside the response scale
+        """
+        if q_id not in self.responses:
+            raise ValueError(f"Question {q_id} has not been answered, use add()")
+        q = self._question(q_id, value)
+        self._apply(q, self.responses[q_id], -1)
+        self._apply(q, value, 1)
+        self.responses[q_id] = value
+
+    def retract(self, q_id: str):
+        """
+        Remove an answer.
+
+        Raises:
+            ValueError: If the question has not been answered
+        """
+        if q_id not in self.responses:
+            raise ValueError(f"Question {q_id} has not been answered")
+        value = self.responses.pop(q_id)
+        self._apply(self.scorer.questions[q_id], value, -1)
+
+    def set(self, q_id: str, value: int):
+        """Add or change an answer"""
+        if q_id in self.responses:
+            self.change(q_id, value)
+        else:
+            self.add(q_id, value)
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def __contains__(self, q_id: str) -> bool:
+        return q_id in self.responses
+
+    def trait_scores(self) -> Dict[str, Optional[float]]:
+        """Unrounded trait scores; None until a trait has enough answers"""
+        min_weight = self.scorer.MIN_QUESTIONS_PER_TRAIT
+        return {
+            code: (self._trait_sums[code] / self._trait_weights[code]
+                   if self._trait_weights.get(code, 0) >= min_weight else None)
+            for code in TRAIT_ORDER
+        }
+
+    def trait_confidence(self) -> Dict[str, float]:
+        """Unrounded trait confidence (0.0 until a trait has enough answers)"""
+        min_weight = self.scorer.MIN_QUESTIONS_PER_TRAIT
+        max_weights = self.scorer.max_weights['traits']
+        return {
+            code: (self._trait_weights[code] / max_weights[code]
+                   if self._trait_weights.get(code, 0) >= min_weight else 0.0)
+            for code in TRAIT_ORDER
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Cheap partial view of the current scores.
+
+        Uses the same thresholds and rounding as score(): traits need
+        MIN_QUESTIONS_PER_TRAIT weight before they get a score, and the MBTI
+        proxy is only produced once all five traits have data.
+
+        Returns:
+            Dict with traits, trait_confidence, confidence, mbti_proxy,
+            traits_with_data, responses_count and coverage
+        """
+        trait_scores = self.trait_scores()
+        trait_confidence = self.trait_confidence()
+        traits_with_data = [code for code in TRAIT_ORDER if trait_scores[code] is not None]
+
+        mbti_code = None
+        if len(traits_with_data) == len(TRAIT_ORDER):
+            mbti_code = self.scorer._generate_mbti_proxy(trait_scores, trait_confidence)
+
+        conf_values = [v for v in trait_confidence.values() if v > 0]
+
+        return {
+            'traits': {code: (round(v, 3) if v is not None else None) for code, v in trait_scores.items()},
+            'trait_confidence': {code: round(v, 3) for code, v in trait_confidence.items()},
+            'confidence': round(sum(conf_values) / len(conf_values), 2) if conf_values else 0.0,
+            'mbti_proxy': mbti_code,
+            'traits_with_data': traits_with_data,
+            'has_complete_profile': mbti_code is not None,
+            'responses_count': len(self.responses),
+            'coverage': round(len(self.responses) / len(self.scorer.questions) * 100, 1),
+        }
+
+    def facet_snapshot(self) -> Dict[str, Optional[float]]:
+        """Partial facet scores keyed by facet name (None until answered)"""
+        return {
+            name: (round(self._facet_sums[code] / self._facet_weights[code], 3)
+                   if self._facet_counts.get(code, 0) else None)
+            for code, name in self.scorer.facets.items()
+        }
+
+    def result(self) -> ScoreResult:
+        """Full score() result for the current answers"""
+        return self.scorer.score(dict(self.responses))
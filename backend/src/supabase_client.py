@@ -10,7 +10,7 @@ Improvements in this version:
 
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from supabase import Client, create_client
@@ -38,6 +38,7 @@ from .db.cache import (
     invalidate_history_cache,
 )
 from .db.timeout import TimeoutContext
+from .db.vector_index import index_saved_scores
 from .db.cache import cached, assessment_cache, history_cache, invalidate_assessment_cache, invalidate_history_cache
 
 logger = logging.getLogger(__name__)
@@ -167,42 +168,7 @@ class SupabaseClient:
         Returns:
             Updated assessment record
         """
-        traits = scores.get("traits", {})
-        facets = scores.get("facets", {})
-        dominant = scores.get("dominant", {})
-        
-        # Prepare data matching the schema
-        # We assume columns exist or we pack into metadata if possible. 
-        # Ideally, schema has: confidence, persona_id, engine_version, etc.
-        # If not, we leverage the JSONB columns to store this extra context until migration.
-        
-        # Extract metadata
-        meta = scores.get("metadata", {})
-        
-        update_data = {
-            "raw_scores": raw_responses,  # Store original responses as JSONB
-            "trait_scores": traits,  # Store trait scores as JSONB
-            "facet_scores": facets,  # Store facet scores as JSONB
-            "mbti_code": scores.get("mbti_proxy") or dominant.get("mbti_proxy", ""),
-            
-            # Canonical Fields Persistence
-            "persona_id": scores.get("persona_id"),
-            "confidence": scores.get("confidence"),
-            "scoring_version": meta.get("scoring_version", "v1"),
-            
-            # Metadata Persistence (Pack into a JSONB column if distinct columns missing)
-            "metadata": {
-                "engine_version": meta.get("engine_version"),
-                "scoring_version": meta.get("scoring_version"),
-                "timestamp": meta.get("timestamp"),
-                "quiz_type": meta.get("quiz_type"),
-                "platform": meta.get("platform"),
-                "is_fallback": meta.get("is_fallback", False),
-                "input_hash": meta.get("input_hash"),
-                "output_hash": meta.get("output_hash"),
-                "execution_path": meta.get("execution_path")
-            }
-        }
+        update_data = build_score_update(scores, raw_responses)
         
         client = self.service_client or self.client
 
@@ -217,8 +183,81 @@ class SupabaseClient:
         
         # Invalidate cache on update
         invalidate_assessment_cache(assessment_id)
+        index_saved_scores(assessment_id, scores)
         
         return result.data[0] if result.data else {}
+    
+    @with_db_retry(max_attempts=3)
+    def save_scores_batch(self, items: List[Tuple[str, Dict[str, Any], Dict[str, int]]]) -> int:
+        """
+        Save scores for many assessments in one round trip.
+        
+        Each item is (assessment_id, scores, raw_responses) as passed to
+        save_scores(). Rows are written by the apply_score_updates()
+        function (infra/supabase/migrations/apply_score_updates.sql) as a
+        single UPDATE ... FROM jsonb_to_recordset statement.
+        
+        Returns:
+            Number of rows updated
+        """
+        if not items:
+            return 0
+        
+        rows = [
+            {"id": assessment_id, **build_score_update(scores, raw_responses)}
+            for assessment_id, scores, raw_responses in items
+        ]
+        client = self.service_client or self.client
+
+        with TimeoutContext(config.DATABASE_QUERY_TIMEOUT):
+            result = client.rpc("apply_score_updates", {"updates": rows}).execute()
+
+        for assessment_id, scores, _ in items:
+            invalidate_assessment_cache(assessment_id)
+            index_saved_scores(assessment_id, scores)
+        
+        return result.data if isinstance(result.data, int) else len(rows)
+    
+    @with_db_retry(max_attempts=3)
+    def get_assessments_after(
+        self,
+        after_id: Optional[str],
+        limit: int,
+        columns: str = "id,raw_scores,trait_scores,facet_scores,mbti_code,persona_id,confidence,scoring_version,metadata",
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        scoring_version: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Page through scored assessments in id order (keyset pagination).
+        
+        Args:
+            after_id: Last id of the previous page (None for the first page)
+            limit: Page size
+            columns: Columns to select (must include id)
+            created_after: Only rows created strictly after this timestamp
+            created_before: Only rows created at or before this timestamp
+            scoring_version: Only rows scored with this version
+        
+        Returns:
+            Up to limit rows (only rows that have raw_scores)
+        """
+        client = self.service_client or self.client
+
+        query = client.table("personality_assessments").select(columns).not_.is_("raw_scores", "null")
+        if after_id is not None:
+            query = query.gt("id", after_id)
+        if created_after is not None:
+            query = query.gt("created_at", created_after)
+        if created_before is not None:
+            query = query.lte("created_at", created_before)
+        if scoring_version is not None:
+            query = query.eq("scoring_version", scoring_version)
+
+        with TimeoutContext(config.DATABASE_QUERY_TIMEOUT):
+            result = query.order("id").limit(limit).execute()
+
+        return result.data or []
 
     @with_db_retry(max_attempts=3)
     def save_telemetry(
@@ -654,6 +693,52 @@ class SupabaseClient:
 
 
 
+def build_score_update(scores: Dict[str, Any], raw_responses: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Build the personality_assessments column values for a scored assessment.
+
+    Shared by save_scores(), save_scores_batch() and the re-score job so every
+    write persists exactly the same fields.
+    """
+    traits = scores.get("traits", {})
+    facets = scores.get("facets", {})
+    dominant = scores.get("dominant", {})
+    
+    # Prepare data matching the schema
+    # We assume columns exist or we pack into metadata if possible. 
+    # Ideally, schema has: confidence, persona_id, engine_version, etc.
+    # If not, we leverage the JSONB columns to store this extra context until migration.
+    
+    # Extract metadata
+    meta = scores.get("metadata", {})
+    
+    update_data = {
+        "raw_scores": raw_responses,  # Store original responses as JSONB
+        "trait_scores": traits,  # Store trait scores as JSONB
+        "facet_scores": facets,  # Store facet scores as JSONB
+        "mbti_code": scores.get("mbti_proxy") or dominant.get("mbti_proxy", ""),
+        
+        # Canonical Fields Persistence
+        "persona_id": scores.get("persona_id"),
+        "confidence": scores.get("confidence"),
+        "scoring_version": meta.get("scoring_version", "v1"),
+        
+        # Metadata Persistence (Pack into a JSONB column if distinct columns missing)
+        "metadata": {
+            "engine_version": meta.get("engine_version"),
+            "scoring_version": meta.get("scoring_version"),
+            "timestamp": meta.get("timestamp"),
+            "quiz_type": meta.get("quiz_type"),
+            "platform": meta.get("platform"),
+            "is_fallback": meta.get("is_fallback", False),
+            "input_hash": meta.get("input_hash"),
+            "output_hash": meta.get("output_hash"),
+            "execution_path": meta.get("execution_path")
+        }
+    }
+    return update_data
+
+
 def create_supabase_client(
     url: Optional[str] = None,
     key: Optional[str] = None,
@@ -3,7 +3,7 @@ LifeSync Personality Engine - Utilities
 """
 
 from .metrics import Timer, log_api_request, log_llm_metrics, log_scoring_metrics
-from .safe_json import extract_json, repair_json, safe_load_json
+from .safe_json import extract_json, recover_json, repair_json, safe_load_json
 from .validators import (
     sanitize_answers,
     validate_answers,
@@ -14,6 +14,7 @@ from .validators import (
 
 __all__ = [
     'extract_json',
+    'recover_json',
     'repair_json',
     'safe_load_json',
     'validate_quiz_type',
@@ -0,0 +1,229 @@
+"""
+LifeSync Personality Engine - Background Job Queue
+
+Slow work (LLM explanation generation) is accepted by the API as a job and
+run by a bounded pool of asyncio workers, so request latency no longer
+depends on the provider and bursts wait in the queue instead of timing out.
+
+Jobs are recorded in a JobStore before they are queued: queued jobs are
+resumed on the next start, and status can be read by any worker. Each job
+kind has a handler and a concurrency key (e.g. the LLM provider); at most
+provider_concurrency jobs with the same key run at once. While a handler
+runs, the job's record is touched every heartbeat_interval seconds so a
+restarting worker doesn't resume a job that is still running elsewhere.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..config.constants import (
+    JOB_HEARTBEAT_INTERVAL,
+    JOB_PROVIDER_CONCURRENCY,
+    JOB_QUEUE_MAX_PENDING,
+    JOB_QUEUE_WORKERS,
+)
+from ..db.job_store import JobStore
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class QueueFullError(Exception):
+    """Raised by submit() when max_pending jobs are already waiting"""
+    pass
+
+
+class JobError(Exception):
+    """Raised by handlers; the message is reported to clients as the job error"""
+    pass
+
+
+class JobQueue:
+    """
+    Bounded async worker pool over a persistent JobStore (one event loop).
+
+    Args:
+        name: Label for logs and stats
+        workers: Number of worker tasks
+        max_pending: Jobs waiting in memory before submit() is refused
+        provider_concurrency: Jobs sharing a concurrency key that may run at once
+        heartbeat_interval: Seconds between updates of a running job's record
+    """
+
+    def __init__(
+        self,
+        name: str,
+        workers: int = JOB_QUEUE_WORKERS,
+        max_pending: int = JOB_QUEUE_MAX_PENDING,
+        provider_concurrency: int = JOB_PROVIDER_CONCURRENCY,
+        heartbeat_interval: float = JOB_HEARTBEAT_INTERVAL,
+    ):
+        self.name = name
+        self.workers = workers
+        self.max_pending = max_pending
+        self.provider_concurrency = provider_concurrency
+        self.heartbeat_interval = heartbeat_interval
+        self.store: Optional[JobStore] = None
+        self._handlers: Dict[str, JobHandler] = {}
+        self._key_funcs: Dict[str, Callable[[Dict[str, Any]], str]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+        self._events: Dict[str, asyncio.Event] = {}
+        self._running = 0
+        self._submitted = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._rejected = 0
+        self._recovered = 0
+
+    def register(
+        self,
+        kind: str,
+        handler: JobHandler,
+        concurrency_key: Optional[Callable[[Dict[str, Any]], str]] = None,
+    ):
+        """Handle jobs of this kind; concurrency_key(payload) names the limit they share"""
+        self._handlers[kind] = handler
+        self._key_funcs[kind] = concurrency_key or (lambda payload: "default")
+
+    @property
+    def started(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self, store: JobStore):
+        """Start the workers and resume the jobs left queued in store"""
+        if self.started:
+            return
+        self.store = store
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+
+        for job in store.recover():
+            if job["kind"] not in self._handlers:
+                continue
+            if self._queue.full():
+                # Left queued in the store for the next start
+                logger.warning(f"[{self.name}] Queue full while resuming jobs; {job['id']} deferred")
+                break
+            self._queue.put_nowait(job)
+            self._recovered += 1
+        logger.info(f"[{self.name}] Started {self.workers} workers ({self._recovered} jobs resumed)")
+
+    async def stop(self):
+        """Cancel the workers; running jobs go back to queued for the next start"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        # Bound to the stopped loop
+        self._limits.clear()
+        self._events.clear()
+        logger.info(f"[{self.name}] Stopped")
+
+    def submit(self, kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record and queue a job.
+
+        Raises:
+            QueueFullError: max_pending jobs are already waiting
+            RuntimeError: The queue is not started or kind has no handler
+        """
+        if not self.started:
+            raise RuntimeError(f"Job queue {self.name} is not running")
+        if kind not in self._handlers:
+            raise RuntimeError(f"No handler registered for job kind {kind}")
+        if self._queue.full():
+            self._rejected += 1
+            raise QueueFullError(f"{self._queue.qsize()} jobs already pending")
+
+        job = self.store.create(kind, payload)
+        self._queue.put_nowait(job)
+        self._submitted += 1
+        return job
+
+    async def wait(self, job_id: str, timeout: float):
+        """Return when this worker changes the job's status, or after timeout"""
+        event = self._events.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            if self._events.get(job_id) is event:
+                del self._events[job_id]
+
+    def _notify(self, job_id: str):
+        event = self._events.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    def _limit(self, key: str) -> asyncio.Semaphore:
+        limit = self._limits.get(key)
+        if limit is None:
+            limit = self._limits[key] = asyncio.Semaphore(self.provider_concurrency)
+        return limit
+
+    async def _heartbeat(self, job_id: str):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                self.store.touch(job_id)
+            except Exception as e:
+                logger.warning(f"[{self.name}] Heartbeat for job {job_id} failed: {e}")
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Dict[str, Any]):
+        job_id, kind, payload = job["id"], job["kind"], job["payload"]
+        async with self._limit(self._key_funcs[kind](payload)):
+            if not self.store.claim(job_id):
+                # Finished or claimed by another worker process
+                return
+            self._running += 1
+            self._notify(job_id)
+            heartbeat = asyncio.ensure_future(self._heartbeat(job_id))
+            try:
+                result = await self._handlers[kind](payload)
+            except asyncio.CancelledError:
+                self.store.requeue(job_id)
+                raise
+            except JobError as e:
+                self.store.fail(job_id, str(e))
+                self._failed += 1
+            except Exception as e:
+                logger.error(f"[{self.name}] Job {job_id} ({kind}) failed: {e}", exc_info=True)
+                self.store.fail(job_id, f"Job failed: {e}")
+                self._failed += 1
+            else:
+                self.store.complete(job_id, result)
+                self._succeeded += 1
+            finally:
+                heartbeat.cancel()
+                self._running -= 1
+            self._notify(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "started": self.started,
+            "workers": self.workers,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "max_pending": self.max_pending,
+            "running": self._running,
+            "submitted": self._submitted,
+            "succeeded": self._succeeded,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "resumed": self._recovered,
+        }
+
+
+# Process-wide queue; handlers are registered by the routes that submit jobs
+job_queue = JobQueue("jobs")
@@ -0,0 +1,226 @@
+"""
+LifeSync Personality Engine - Incremental JSON Field Parser
+Single-pass, string-aware scanner for the JSON object in LLM output
+
+The scanner skips text before the first '{' (prose, markdown fences), emits
+the top-level fields of the object as soon as each one is complete (for
+streaming) and builds a repaired copy of the object as it goes: trailing
+commas are dropped, mismatched closers are replaced with the expected one,
+and a truncated object can be closed at the end. Each character is looked
+at once; runs without structural characters are copied in bulk.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Characters that change the scanner state outside strings; everything between them is copied in bulk
+_STRUCTURAL = re.compile(r'[{}\[\]",\\]')
+# A string body up to (not including) its closing quote
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class JsonFieldStream:
+    """
+    Incremental parser for a JSON object arriving in chunks (LLM streaming).
+
+    feed() returns the (key, value) pairs of the top-level fields completed
+    by the chunk; close() returns the whole object, repaired. Text after the
+    object's closing '}' is ignored. A field that isn't valid JSON is not
+    emitted, but close() still tries the whole object.
+    """
+
+    def __init__(self):
+        self._started = False
+        self._done = False
+        # Closers for the open containers, innermost last
+        self._stack: List[str] = []
+        self._in_string = False
+        # A backslash ended the previous chunk: the next character is escaped
+        self._escape = False
+        # A comma outside strings not yet written: dropped if a closer follows
+        self._comma = False
+        # Repaired object text
+        self._parts: List[str] = []
+        # Index in _parts where the current top-level field starts
+        self._field_start = 0
+        # (len(_parts), stack) after the last complete element, for truncation
+        self._safe: Tuple[int, List[str]] = (0, [])
+
+    @property
+    def started(self) -> bool:
+        """True once the object's opening brace has been seen"""
+        return self._started
+
+    @property
+    def done(self) -> bool:
+        """True once the object's closing brace has been seen"""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        fields: List[Tuple[str, Any]] = []
+        if chunk:
+            self.scan(chunk, 0, fields)
+        return fields
+
+    def scan(self, text: str, pos: int = 0, fields: Optional[List[Tuple[str, Any]]] = None) -> Optional[int]:
+        """
+        Consume text[pos:]; completed top-level fields are appended to fields.
+
+        Returns:
+            Index just past the object's closing brace, or None if the object
+            is not finished within text
+        """
+        if self._done:
+            return None
+        if not self._started:
+            pos = text.find("{", pos)
+            if pos == -1:
+                return None
+            self._started = True
+            self._stack.append("}")
+            self._parts.append("{")
+            self._field_start = 1
+            self._safe = (1, ["}"])
+            pos += 1
+
+        start = i = pos
+        if self._escape:
+            self._escape = False
+            i += 1
+
+        n = len(text)
+        while i < n:
+            if self._in_string:
+                # The rest of the string body in one match: stops at the closing
+                # quote, or at a backslash that ends the text
+                j = _STRING_BODY.match(text, i).end()
+                if j >= n:
+                    break
+                if text[j] == "\\":
+                    self._escape = True
+                    break
+                self._in_string = False
+                i = j + 1
+                continue
+
+            match = _STRUCTURAL.search(text, i)
+            if match is None:
+                break
+            j = match.start()
+            ch = text[j]
+            # Literals and whitespace since the previous token (with any string it closed)
+            self._write(text[start:j])
+            start = i = j + 1
+
+            if ch == ",":
+                if len(self._stack) == 1:
+                    self._emit(fields)
+                self._safe = (len(self._parts), list(self._stack))
+                self._comma = True
+            elif ch in "}]":
+                # A pending comma here is a trailing comma: drop it
+                self._comma = False
+                closer = self._stack.pop()
+                self._parts.append(closer)
+                if not self._stack:
+                    self._emit(fields, closing=True)
+                    self._done = True
+                    return j + 1
+            else:
+                # '"', '{', '[' (or a stray backslash, left for the parser to reject)
+                self._flush_comma()
+                self._parts.append(ch)
+                if ch == '"':
+                    self._in_string = True
+                elif ch in _CLOSERS:
+                    self._stack.append(_CLOSERS[ch])
+                    self._safe = (len(self._parts), list(self._stack))
+
+        self._write(text[start:])
+        return None
+
+    def close(self, schema: Optional[Dict[str, type]] = None) -> Dict[str, Any]:
+        """
+        The scanned object, repaired and checked against schema.
+
+        A truncated object is closed as it stands (ending any open string);
+        if that isn't valid JSON it is cut back to its last complete element.
+
+        Args:
+            schema: Expected top-level fields -> type. The object must have at
+                least one of them; fields of the wrong type are dropped.
+
+        Raises:
+            ValueError: No object was found, it can't be repaired or it
+                matches none of the schema's fields
+        """
+        if not self._started:
+            raise ValueError("No JSON object found")
+
+        text = "".join(self._parts)
+        candidates = [text]
+        if not self._done:
+            tail = '"' if self._in_string and not self._escape else ""
+            safe_len, safe_stack = self._safe
+            candidates = [
+                text + tail + "".join(reversed(self._stack)),
+                "".join(self._parts[:safe_len]) + "".join(reversed(safe_stack)),
+            ]
+
+        error = None
+        for candidate in candidates:
+            try:
+                parsed = json.loads(candidate, strict=False)
+            except ValueError as e:
+                error = e
+                continue
+            return conform(parsed, schema)
+        raise ValueError(f"Invalid JSON object: {error}")
+
+    def _write(self, text: str):
+        if text:
+            if self._comma and not text.isspace():
+                self._flush_comma()
+            self._parts.append(text)
+
+    def _flush_comma(self):
+        if self._comma:
+            self._parts.append(",")
+            self._comma = False
+
+    def _emit(self, fields: Optional[List[Tuple[str, Any]]], closing: bool = False):
+        if fields is None:
+            return
+        end = len(self._parts) - 1 if closing else len(self._parts)
+        text = "".join(self._parts[self._field_start:end]).strip()
+        self._field_start = len(self._parts)
+        if text.startswith(","):
+            text = text[1:]
+        if not text:
+            return
+        try:
+            fields.extend(json.loads("{" + text + "}", strict=False).items())
+        except ValueError:
+            pass
+
+
+def conform(parsed: Any, schema: Optional[Dict[str, type]]) -> Dict[str, Any]:
+    """
+    Check a parsed object against schema (field -> type).
+
+    Raises:
+        ValueError: Not an object, or none of the schema's fields present
+    """
+    if not isinstance(parsed, dict):
+        raise ValueError(f"Expected a JSON object, got {type(parsed).__name__}")
+    if schema is None:
+        return parsed
+    if not any(key in parsed for key in schema):
+        raise ValueError(f"JSON object has none of the expected fields: {', '.join(schema)}")
+    return {
+        key: value for key, value in parsed.items()
+        if key not in schema or isinstance(value, schema[key])
+    }
@@ -7,47 +7,96 @@ import json
 import re
 from typing import Any, Dict, Optional
 
+from .json_stream import JsonFieldStream, conform
+
+_decoder = json.JSONDecoder(strict=False)
+# Where an object can start: '{' then a key, the closing brace or the end of the text
+_OBJECT_START = re.compile(r'\{\s*(?:["}]|$)')
+
+
+def recover_json(text: str, schema: Optional[Dict[str, type]] = None) -> Dict[str, Any]:
+    """
+    Recover the JSON object from LLM output in one linear pass.
+    
+    Skips markdown fences and prose before the object, repairs trailing
+    commas, mismatched closers and truncation, and checks the result against
+    schema (see JsonFieldStream.close). Each candidate object is first
+    decoded as-is by the C parser; only if that fails is it rescanned with
+    repairs. If a candidate can't be repaired or doesn't match the schema,
+    scanning resumes after it.
+    
+    Args:
+        text: Raw model output
+        schema: Optional expected top-level fields -> type
+    
+    Returns:
+        Parsed dictionary
+    
+    Raises:
+        ValueError: If no usable JSON object is found
+    """
+    error: Optional[ValueError] = None
+    pos = 0
+    while text and pos < len(text):
+        match = _OBJECT_START.search(text, pos)
+        if match is None:
+            break
+        pos = match.start()
+        # Well-formed objects: no repair needed
+        try:
+            parsed, end = _decoder.raw_decode(text, pos)
+        except ValueError:
+            pass
+        else:
+            try:
+                return conform(parsed, schema)
+            except ValueError as e:
+                error = error or e
+            pos = end
+            continue
+        
+        stream = JsonFieldStream()
+        end = stream.scan(text, pos)
+        if not stream.started:
+            break
+        try:
+            return stream.close(schema)
+        except ValueError as e:
+            error = error or e
+        if end is None:
+            break
+        pos = end
+    
+    raise ValueError(f"Could not extract valid JSON from LLM response: {error or 'no JSON object'}: {(text or '')[:200]}")
+
 
 def extract_json(text: str) -> Optional[str]:
     """
     Extract JSON substring from text that may contain extra content.
     
+    Braces inside strings are ignored when matching the closing brace.
+    
     Args:
         text: Text that may contain JSON
     
     Returns:
-        JSON substring or None if no JSON found
+        JSON substring or None if no complete JSON object found
     """
     if not text:
         return None
     
-    # Try to find JSON object boundaries
     start_idx = text.find("{")
     if start_idx == -1:
         return None
     
-    # Find matching closing brace
-    brace_count = 0
-    end_idx = start_idx
-    
-    for i in range(start_idx, len(text)):
-        if text[i] == '{':
-            brace_count += 1
-        elif text[i] == '}':
-            brace_count -= 1
-            if brace_count == 0:
-                end_idx = i + 1
-                break
-    
-    if brace_count == 0:
-        return text[start_idx:end_idx]
-    
-    return None
+    end_idx = JsonFieldStream().scan(text, start_idx)
+    return text[start_idx:end_idx] if end_idx is not None else None
 
 
 def repair_json(text: str) -> str:
     """
-    Repair common JSON issues:
+    Repair common JSON issues with regexes (recover_json repairs trailing
+    commas and truncation without touching string contents):
     - Trailing commas
     - Missing quotes around keys
     - Unescaped quotes in strings
@@ -80,12 +129,8 @@ def safe_load_json(text: str) -> Dict[str, Any]:
     """
     Safely load JSON from text that may be malformed.
     
-    Strategy:
-    1. Try direct json.loads
-    2. Try extract_json then json.loads
-    3. Try repair_json then json.loads
-    4. Try extract + repair + json.loads
-    5. Return error dict if all fail
+    Uses recover_json (fence/prose stripping, trailing comma and truncation
+    repair in a single pass).
     
     Args:
         text: Text that should contain JSON
@@ -96,38 +141,12 @@ def safe_load_json(text: str) -> Dict[str, Any]:
     if not text:
         return {"error": "Empty text", "raw": text}
     
-    # Strategy 1: Direct parse
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
-    
-    # Strategy 2: Extract JSON substring
-    extracted = extract_json(text)
-    if extracted:
-        try:
-            return json.loads(extracted)
-        except json.JSONDecodeError:
-            pass
-    
-    # Strategy 3: Repair then parse
     try:
-        repaired = repair_json(text)
-        return json.loads(repaired)
-    except (json.JSONDecodeError, Exception):
+        return recover_json(text)
+    except ValueError:
         pass
     
-    # Strategy 4: Extract + Repair
-    if extracted:
-        try:
-            repaired = repair_json(extracted)
-            return json.loads(repaired)
-        except (json.JSONDecodeError, Exception):
-            pass
-    
-    # Strategy 5: Return error dict
     return {
         "error": "Failed to parse JSON after all repair attempts",
         "raw": text[:500] if len(text) > 500 else text
     }
-
@@ -0,0 +1,219 @@
+"""
+LifeSync Personality Engine - Single-Flight Request Coalescing
+
+Concurrent calls with the same key share one execution: the first caller
+starts it, later callers await the same task and get the same result (or
+exception). The work runs in its own task so one caller timing out doesn't
+cancel it for the others; it is cancelled only when every caller has gone.
+
+With a FileFlightStore the coalescing also spans the API workers on a host:
+the executing worker holds an flock on a per-key lock file and publishes the
+result to a JSON file that other workers pick up for a short TTL instead of
+running the work again. flock is released by the OS if a worker dies.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from ..config.constants import SINGLE_FLIGHT_POLL_INTERVAL, SINGLE_FLIGHT_RESULT_TTL
+
+# Optional: POSIX file locks for cross-worker coalescing
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class FileFlightStore:
+    """
+    Lock and result files shared by the workers on a host.
+
+    Args:
+        directory: Directory for <key hash>.lock / <key hash>.json files
+        result_ttl: Seconds a published result is served to other callers
+        poll_interval: Seconds between lock attempts while another worker runs
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        result_ttl: float = SINGLE_FLIGHT_RESULT_TTL,
+        poll_interval: float = SINGLE_FLIGHT_POLL_INTERVAL,
+    ):
+        if not FCNTL_AVAILABLE:
+            raise RuntimeError("Cross-worker single-flight requires fcntl (POSIX)")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.directory / (hashlib.sha256(key.encode("utf-8")).hexdigest()[:32] + suffix)
+
+    def try_lock(self, key: str) -> Optional[int]:
+        """Non-blocking exclusive lock; returns the fd, or None if another worker holds it"""
+        path = self._path(key, ".lock")
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        # The previous holder unlinks the file before unlocking: make sure we
+        # locked the file that is still at the path
+        try:
+            current = os.stat(path)
+        except FileNotFoundError:
+            current = None
+        if current is None or current.st_ino != os.fstat(fd).st_ino:
+            os.close(fd)
+            return None
+        return fd
+
+    def unlock(self, key: str, fd: int):
+        try:
+            os.unlink(self._path(key, ".lock"))
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+
+    def result(self, key: str) -> Optional[Any]:
+        """Result published within the TTL, or None"""
+        path = self._path(key, ".json")
+        try:
+            if time.time() - path.stat().st_mtime > self.result_ttl:
+                return None
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def publish(self, key: str, result: Any):
+        path = self._path(key, ".json")
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(result))
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Single-flight result not published: {e}")
+        self._prune()
+
+    def _prune(self):
+        """Drop expired result files"""
+        cutoff = time.time() - self.result_ttl
+        for path in self.directory.glob("*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+
+class _Flight:
+    __slots__ = ("task", "waiters", "abandoned")
+
+    def __init__(self, task: "asyncio.Task"):
+        self.task = task
+        self.waiters = 0
+        self.abandoned = False
+
+
+class SingleFlight:
+    """
+    Per-key coalescing of concurrent async calls (one event loop).
+
+    Args:
+        name: Label for logs and stats
+        store: Optional FileFlightStore to coalesce across workers as well
+    """
+
+    def __init__(self, name: str, store: Optional[FileFlightStore] = None):
+        self.name = name
+        self.store = store
+        self._flights: Dict[str, _Flight] = {}
+        self._executions = 0
+        self._coalesced = 0
+        self._remote = 0
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Result of fn(), shared with every concurrent caller using the same key"""
+        flight = self._flights.get(key)
+        if flight is None or flight.abandoned:
+            flight = _Flight(asyncio.ensure_future(self._execute(key, fn)))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self._coalesced += 1
+            logger.info(f"[{self.name}] Joining in-flight call for {key}")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done():
+                flight.waiters -= 1
+                if flight.waiters == 0:
+                    # Nobody is left to use the result
+                    flight.abandoned = True
+                    flight.task.cancel()
+            raise
+
+    def _forget(self, key: str, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    async def _execute(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        if self.store is None:
+            self._executions += 1
+            return await fn()
+
+        while True:
+            result = self.store.result(key)
+            if result is not None:
+                self._remote += 1
+                return result
+            fd = self.store.try_lock(key)
+            if fd is not None:
+                break
+            await asyncio.sleep(self.store.poll_interval)
+
+        try:
+            # Published while we waited for the lock
+            result = self.store.result(key)
+            if result is not None:
+                self._remote += 1
+                return result
+            self._executions += 1
+            result = await fn()
+            self.store.publish(key, result)
+            return result
+        finally:
+            self.store.unlock(key, fd)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._flights),
+            "executions": self._executions,
+            "coalesced": self._coalesced,
+            "shared_across_workers": self._remote,
+            "cross_worker": self.store is not None,
+        }
+
+
+def create_flight_store(directory: Optional[str]) -> Optional[FileFlightStore]:
+    """FileFlightStore for directory, or None (per-process only) when unset or unavailable"""
+    if not directory:
+        return None
+    try:
+        return FileFlightStore(directory)
+    except (RuntimeError, OSError) as e:
+        logger.warning(f"Cross-worker single-flight disabled: {e}")
+        return None
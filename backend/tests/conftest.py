@@ -0,0 +1,40 @@
+"""
+LifeSync Personality Engine - Shared Test Fixtures
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.config import Config
+from src.db import explanation_cache, job_store, vector_index
+
+
+@pytest.fixture(autouse=True)
+def isolated_explanation_cache(monkeypatch):
+    """A private in-memory explanation cache per test: mocked LLM output must never reach the shared file"""
+    cache = explanation_cache.ExplanationCache(":memory:")
+    monkeypatch.setattr(explanation_cache, "_cache", cache)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_job_store(monkeypatch):
+    """A private in-memory job store per test: queued test jobs must never be resumed by a real app start"""
+    store = job_store.JobStore(":memory:")
+    monkeypatch.setattr(job_store, "_store", store)
+    yield store
+    store.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_profile_index(monkeypatch, tmp_path):
+    """A fresh process-wide vector index per test, snapshotted under tmp_path: test vectors must never reach the real snapshot"""
+    monkeypatch.setattr(Config, "VECTOR_INDEX_PATH", str(tmp_path / "index" / "profile_vectors.npz"))
+    monkeypatch.setattr(vector_index, "_index", None)
+    monkeypatch.setattr(vector_index, "_saved_version", 0)
@@ -0,0 +1,127 @@
+"""
+LifeSync Personality Scorer - Adaptive Quiz Tests
+Tests the CAT question selector, its stopping rule and POST /v1/questions/next
+
+Run with: pytest tests/test_adaptive_quiz.py -v
+"""
+
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.server import app
+from src.scorer.adaptive import AdaptiveQuiz, ItemTables, balanced_question_ids
+from src.scorer.personality_scorer import PersonalityScorer
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+client = TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    return PersonalityScorer(str(QUESTIONS_PATH))
+
+
+def _run(quiz, answer_for):
+    while (q_id := quiz.next_question()) is not None:
+        quiz.answer(q_id, answer_for(q_id))
+    return quiz
+
+
+class TestAdaptiveQuiz:
+    """Selection and stopping"""
+
+    def test_consistent_respondent_stops_early(self, scorer):
+        quiz = _run(AdaptiveQuiz(scorer), lambda q_id: 2 if scorer.questions[q_id]['reverse'] else 4)
+        assert 15 <= len(quiz) < 60
+        assert quiz.is_complete()
+        assert min(quiz.trait_confidence().values()) >= quiz.confidence_threshold
+        # Every trait got at least MIN_QUESTIONS_PER_TRAIT answers
+        traits = Counter(scorer.questions[q_id]['trait'] for q_id in quiz.session.responses)
+        assert min(traits.values()) >= scorer.MIN_QUESTIONS_PER_TRAIT
+        assert quiz.result()['has_complete_profile']
+
+    def test_noisy_respondent_needs_more_questions(self, scorer):
+        consistent = _run(AdaptiveQuiz(scorer), lambda q_id: 3)
+        rng = random.Random(5)
+        noisy = _run(AdaptiveQuiz(scorer), lambda q_id: rng.randint(1, 5))
+        assert len(noisy) > len(consistent)
+
+    def test_max_questions_cap(self, scorer):
+        rng = random.Random(6)
+        quiz = _run(AdaptiveQuiz(scorer, max_questions=12), lambda q_id: rng.randint(1, 5))
+        assert len(quiz) == 12
+
+    def test_targets_least_confident_trait(self, scorer):
+        quiz = AdaptiveQuiz(scorer)
+        for trait in 'OCEA':
+            for q_id in [q for q, info in scorer.questions.items() if info['trait'] == trait][:10]:
+                quiz.answer(q_id, 3)
+        assert scorer.questions[quiz.next_question()]['trait'] == 'N'
+
+    def test_replay_matches_incremental(self, scorer):
+        quiz = _run(AdaptiveQuiz(scorer, max_questions=20), lambda q_id: 4)
+        replayed = AdaptiveQuiz(scorer, dict(quiz.session.responses), max_questions=25)
+        assert replayed.trait_confidence() == quiz.trait_confidence()
+        assert replayed.next_question() not in quiz.session.responses
+
+    def test_invalid_answer(self, scorer):
+        with pytest.raises(ValueError):
+            AdaptiveQuiz(scorer, {'Q999': 3})
+
+    def test_item_tables_shared(self, scorer):
+        assert ItemTables.for_bank(scorer.compiled) is AdaptiveQuiz(scorer).tables
+
+
+class TestBalancedOrder:
+    """Fixed order used for /v1/questions?limit=N (N != 30)"""
+
+    def test_traits_take_turns(self, scorer):
+        ids = balanced_question_ids(scorer, 10)
+        traits = Counter(scorer.questions[q_id]['trait'] for q_id in ids)
+        assert set(traits.values()) == {2}
+        facets = [scorer.questions[q_id]['facet'] for q_id in ids]
+        assert len(set(facets)) == 10
+
+    def test_full_length(self, scorer):
+        assert sorted(balanced_question_ids(scorer, 500)) == sorted(scorer.questions)
+
+    def test_questions_endpoint_limit(self, scorer):
+        data = client.get("/v1/questions?limit=15").json()
+        assert data["count"] == 15
+        assert set(Counter(q["trait"] for q in data["questions"]).values()) == {3}
+
+
+class TestNextQuestionEndpoint:
+    """POST /v1/questions/next"""
+
+    def test_first_question(self):
+        response = client.post("/v1/questions/next", json={})
+        assert response.status_code == 200
+        data = response.json()
+        assert not data["done"]
+        assert data["question"]["id"]
+        assert data["answered"] == 0
+
+    def test_stateless_loop(self, scorer):
+        answers = {}
+        for _ in range(200):
+            data = client.post("/v1/questions/next", json={"answers": answers}).json()
+            if data["done"]:
+                break
+            q = data["question"]
+            answers[q["id"]] = 2 if q["reverse"] else 4
+        assert data["done"] and data["question"] is None
+        assert data["answered"] == len(answers) < len(scorer.questions)
+
+    def test_unknown_question(self):
+        response = client.post("/v1/questions/next", json={"answers": {"Q999": 3}})
+        assert response.status_code == 422
@@ -0,0 +1,135 @@
+"""
+LifeSync Personality Engine - Async LLM Path Tests
+Tests the async Gemini provider, async router and cancellation on timeout
+
+Run with: pytest tests/test_async_llm.py -v
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.llm import router
+from src.llm.circuit_breaker import CircuitState
+from src.llm.gemini_provider import GeminiProvider
+from src.llm.providers.provider_failure import ProviderFailure
+
+RESPONSE = {"persona_title": "The Architect", "vibe_summary": "Calm", "strengths": ["Focus"], "growth_edges": ["Rest"]}
+
+
+class FakeModel:
+    """Stands in for genai.GenerativeModel: scripted async outcomes per call"""
+
+    def __init__(self, name, outcomes, calls):
+        self.name = name
+        self._outcomes = outcomes
+        self._calls = calls
+
+    def generate_content(self, *args, **kwargs):
+        raise AssertionError("sync SDK call on the async path")
+
+    async def generate_content_async(self, prompt, generation_config=None):
+        self._calls.append(self.name)
+        outcome = self._outcomes[self.name].pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, float):
+            await asyncio.sleep(outcome)
+            outcome = RESPONSE
+        return SimpleNamespace(text=f"```json\n{json.dumps(outcome)}\n```")
+
+
+def _provider(outcomes):
+    calls = []
+    with patch("google.generativeai.GenerativeModel", lambda name: FakeModel(name, outcomes, calls)):
+        provider = GeminiProvider(api_key="test-key")
+    return provider, calls
+
+
+class TestAsyncGeminiProvider:
+    """agenerate_content / agenerate_explanation"""
+
+    def test_explanation(self):
+        provider, calls = _provider({"gemini-2.0-flash": [RESPONSE]})
+        result = asyncio.run(provider.agenerate_explanation({}, {}, {}, {"mbti_proxy": "INTJ"}))
+        assert result["persona_title"] == "The Architect"
+        assert result["steps"] == ["Strength: Focus", "Growth Edge: Rest"]
+        assert calls == ["gemini-2.0-flash"]
+
+    def test_falls_back_to_alternate_model(self):
+        provider, calls = _provider({"gemini-2.0-flash": [RuntimeError("boom")], "gemini-2.0-flash-exp": [RESPONSE]})
+        text = asyncio.run(provider.agenerate_content("prompt"))
+        assert json.loads(text) == RESPONSE
+        assert calls == ["gemini-2.0-flash", "gemini-2.0-flash-exp"]
+
+    def test_rate_limit_backoff_uses_asyncio_sleep(self):
+        provider, _ = _provider({"gemini-2.0-flash": [RuntimeError("429 quota")], "gemini-2.0-flash-exp": [RESPONSE]})
+        with patch("src.llm.gemini_provider.asyncio.sleep", new_callable=AsyncMock) as sleep, \
+                patch("src.llm.gemini_provider.time.sleep") as blocking_sleep:
+            asyncio.run(provider.agenerate_content("prompt"))
+        sleep.assert_awaited_once_with(GeminiProvider.BACKOFF_SCHEDULE[0] * 2)
+        blocking_sleep.assert_not_called()
+
+    def test_all_models_fail(self):
+        provider, _ = _provider({"gemini-2.0-flash": [RuntimeError("a")], "gemini-2.0-flash-exp": [RuntimeError("b")]})
+        with pytest.raises(ProviderFailure):
+            asyncio.run(provider.agenerate_explanation({}, {}, {}, {}))
+
+    def test_cancelled_on_timeout(self):
+        provider, calls = _provider({"gemini-2.0-flash": [5.0], "gemini-2.0-flash-exp": [RESPONSE]})
+
+        async def run():
+            await asyncio.wait_for(provider.agenerate_content("prompt"), timeout=0.05)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(run())
+        # Cancellation is not retried on the alternate model
+        assert calls == ["gemini-2.0-flash"]
+
+
+@pytest.fixture
+def closed_circuit():
+    router.gemini_circuit.state = CircuitState.CLOSED
+    router.gemini_circuit.failure_count = 0
+    yield router.gemini_circuit
+    router.gemini_circuit.state = CircuitState.CLOSED
+    router.gemini_circuit.failure_count = 0
+
+
+class TestAsyncRouter:
+    """router.agenerate_explanation"""
+
+    def test_success(self, closed_circuit):
+        with patch("src.llm.router._agenerate_explanation_impl", new_callable=AsyncMock) as impl:
+            impl.return_value = {"summary": "ok"}
+            assert asyncio.run(router.agenerate_explanation({}, {}, {}, {})) == {"summary": "ok"}
+
+    def test_failures_open_circuit(self, closed_circuit):
+        with patch("src.llm.router._agenerate_explanation_impl", new_callable=AsyncMock) as impl:
+            impl.side_effect = RuntimeError("down")
+            for _ in range(closed_circuit.failure_threshold):
+                result = asyncio.run(router.agenerate_explanation({}, {}, {}, {}))
+            assert closed_circuit.state == CircuitState.OPEN
+            assert result == router.get_fallback_explanation()
+            asyncio.run(router.agenerate_explanation({}, {}, {}, {}))
+            assert impl.await_count == closed_circuit.failure_threshold
+
+    def test_cancellation_is_not_a_failure(self, closed_circuit):
+        async def slow(*args):
+            await asyncio.sleep(5)
+
+        async def run():
+            await asyncio.wait_for(router.agenerate_explanation({}, {}, {}, {}), timeout=0.05)
+
+        with patch("src.llm.router._agenerate_explanation_impl", side_effect=slow):
+            with pytest.raises(asyncio.TimeoutError):
+                asyncio.run(run())
+        assert closed_circuit.failure_count == 0
@@ -0,0 +1,117 @@
+"""
+LifeSync Personality Scorer - Question Bank Artifact Tests
+Tests building, loading and validating the memory-mapped question bank artifact
+
+Run with: pytest tests/test_bank_artifact.py -v
+"""
+
+import random
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scorer import create_scorer_wrapper
+from src.scorer.bank_artifact import ArtifactError, build_artifact, load_artifact
+from src.scorer.personality_scorer import PersonalityScorer
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+
+@pytest.fixture
+def bank(tmp_path):
+    """Copy of the production bank plus an artifact built from it"""
+    source = tmp_path / "bank.json"
+    shutil.copy(QUESTIONS_PATH, source)
+    artifact = tmp_path / "bank.lsqb"
+    build_artifact(source, artifact)
+    return source, artifact
+
+
+class TestArtifactRoundTrip:
+    """An artifact-backed scorer must be indistinguishable from the JSON one"""
+
+    def test_questions_and_max_weights_match_json(self, bank):
+        source, artifact = bank
+        from_json = PersonalityScorer(str(source))
+        from_artifact = PersonalityScorer.from_artifact(str(artifact), str(source))
+
+        assert from_artifact.questions == from_json.questions
+        assert list(from_artifact.questions) == list(from_json.questions)
+        assert from_artifact.max_weights == from_json.max_weights
+        assert from_artifact.traits == from_json.traits
+        assert from_artifact.facets == from_json.facets
+        assert from_artifact.scale == from_json.scale
+
+    def test_scores_match_json(self, bank):
+        source, artifact = bank
+        from_json = PersonalityScorer(str(source))
+        from_artifact = PersonalityScorer.from_artifact(str(artifact))
+
+        rng = random.Random(5)
+        ids = list(from_json.questions)
+        for _ in range(50):
+            picked = rng.sample(ids, rng.randint(0, len(ids)))
+            responses = {q_id: rng.randint(1, 5) for q_id in picked}
+            assert from_artifact.score(responses) == from_json.score(responses)
+
+    def test_tables_are_read_only(self, bank):
+        _, artifact = bank
+        scorer = PersonalityScorer.from_artifact(str(artifact))
+        with pytest.raises(ValueError):
+            scorer.compiled.weights[0] = 2.0
+
+
+class TestArtifactValidation:
+    """Unusable artifacts raise ArtifactError"""
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(ArtifactError):
+            load_artifact(tmp_path / "missing.lsqb")
+
+    def test_corrupt_payload(self, bank):
+        _, artifact = bank
+        data = bytearray(artifact.read_bytes())
+        data[-1] ^= 0xFF
+        artifact.write_bytes(bytes(data))
+        with pytest.raises(ArtifactError, match="integrity"):
+            load_artifact(artifact)
+
+    def test_bad_magic(self, bank):
+        _, artifact = bank
+        data = bytearray(artifact.read_bytes())
+        data[:4] = b"JUNK"
+        artifact.write_bytes(bytes(data))
+        with pytest.raises(ArtifactError):
+            load_artifact(artifact)
+
+    def test_stale_source(self, bank):
+        source, artifact = bank
+        source.write_text(source.read_text() + "\n")
+        with pytest.raises(ArtifactError, match="stale"):
+            load_artifact(artifact, source)
+
+    def test_other_scoring_version(self, bank, monkeypatch):
+        from src.scorer import bank_artifact
+        _, artifact = bank
+        monkeypatch.setattr(bank_artifact, "SCORING_VERSION", "v999")
+        with pytest.raises(ArtifactError, match="scoring version"):
+            load_artifact(artifact)
+
+
+class TestWrapperFallback:
+    """The scoring wrapper falls back to JSON when the artifact is unusable"""
+
+    def test_falls_back_to_json(self, tmp_path, monkeypatch):
+        broken = tmp_path / "broken.lsqb"
+        broken.write_bytes(b"not an artifact")
+        monkeypatch.setattr(create_scorer_wrapper, "_ARTIFACT_PATH", broken)
+        monkeypatch.setattr(create_scorer_wrapper, "_scorer_instance", None)
+
+        scorer = create_scorer_wrapper.get_scorer()
+        assert scorer.artifact is None
+        assert len(scorer.questions) == 180
@@ -0,0 +1,94 @@
+"""
+LifeSync Personality Scorer - Batch Scoring Tests
+Tests score_many() and POST /v1/assessments/score:batch
+
+Run with: pytest tests/test_batch_scoring.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.server import app
+from src.config.constants import BATCH_SCORING_MAX_ITEMS
+from src.scorer import create_scorer_wrapper, score_answers, score_many
+from src.scorer.personality_scorer import PersonalityScorer
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+client = TestClient(app)
+
+
+def _random_answers(rng, ids):
+    picked = rng.sample(ids, rng.randint(1, len(ids)))
+    return {q_id: rng.randint(1, 5) for q_id in picked}
+
+
+@pytest.fixture
+def answer_sets():
+    scorer = PersonalityScorer(str(QUESTIONS_PATH))
+    rng = random.Random(11)
+    ids = list(scorer.questions)
+    return [_random_answers(rng, ids) for _ in range(40)]
+
+
+class TestScoreMany:
+    """score_many() must match per-item scoring"""
+
+    def test_scorer_score_many_matches_score(self, answer_sets):
+        scorer = PersonalityScorer(str(QUESTIONS_PATH))
+        batch = scorer.score_many(answer_sets + [{}, {'Q999': 3}])
+        singles = [scorer.score(a) for a in answer_sets + [{}, {'Q999': 3}]]
+        assert batch == singles
+
+    def test_wrapper_score_many_matches_score_answers(self, answer_sets):
+        assert score_many(answer_sets) == [score_answers(a) for a in answer_sets]
+
+    def test_empty_batch(self):
+        assert score_many([]) == []
+
+    def test_large_batch_uses_process_pool(self, answer_sets, monkeypatch):
+        monkeypatch.setattr(create_scorer_wrapper, "BATCH_SCORING_POOL_THRESHOLD", 10)
+        monkeypatch.setattr(create_scorer_wrapper, "BATCH_SCORING_CHUNK_SIZE", 7)
+        try:
+            results = score_many(answer_sets, max_workers=2)
+            assert create_scorer_wrapper._scoring_pool is not None
+        finally:
+            create_scorer_wrapper.shutdown_scoring_pool()
+
+        assert results == [score_answers(a) for a in answer_sets]
+
+
+class TestBatchEndpoint:
+    """POST /v1/assessments/score:batch"""
+
+    def test_batch_endpoint_scores_in_order(self, answer_sets):
+        response = client.post("/v1/assessments/score:batch", json={"responses": answer_sets[:5]})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 5
+        assert data["scoring_version"]
+        for item, answers in zip(data["results"], answer_sets[:5]):
+            assert item["responses_count"] == len(answers)
+            assert item["traits"] == score_answers(answers)["traits"]
+
+    def test_batch_endpoint_rejects_invalid_item(self, answer_sets):
+        body = {"responses": [answer_sets[0], {"not-a-question": 3}]}
+        response = client.post("/v1/assessments/score:batch", json=body)
+        assert response.status_code == 422
+        assert "responses[1]" in response.json()["detail"]
+
+    def test_batch_endpoint_enforces_max_items(self):
+        body = {"responses": [{"Q001": 3}] * (BATCH_SCORING_MAX_ITEMS + 1)}
+        response = client.post("/v1/assessments/score:batch", json=body)
+        assert response.status_code == 422
+
+    def test_batch_endpoint_rejects_empty(self):
+        response = client.post("/v1/assessments/score:batch", json={"responses": []})
+        assert response.status_code == 422
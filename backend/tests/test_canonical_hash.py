@@ -0,0 +1,98 @@
+"""
+LifeSync Personality Scorer - Canonical Hash Tests
+Tests that the fast parity hash encoders are byte-identical to json.dumps
+
+Run with: pytest tests/test_canonical_hash.py -v
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.constants import SCORING_VERSION
+from src.scorer.canonical_hash import (
+    CanonicalHasher,
+    canonical_output_json,
+    canonical_responses_json,
+    hash_output,
+)
+from src.scorer.personality_scorer import PersonalityScorer
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+# Shared with the TypeScript engine (packages/personality-engine)
+VECTORS_PATH = (
+    Path(__file__).parent.parent.parent
+    / "packages" / "personality-engine" / "test" / "fixtures" / "canonical_hash_vectors.json"
+)
+
+
+def _reference(data):
+    return json.dumps(data, sort_keys=True, separators=(',', ':'))
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    return PersonalityScorer(str(QUESTIONS_PATH))
+
+
+@pytest.fixture(scope="module")
+def vectors():
+    if not VECTORS_PATH.exists():
+        pytest.skip("Golden vectors not available (packages/ not present)")
+    return json.loads(VECTORS_PATH.read_text())
+
+
+class TestGoldenVectors:
+    """Cross-language golden vectors"""
+
+    def test_response_vectors(self, scorer, vectors):
+        for vector in vectors['responses']:
+            assert canonical_responses_json(vector['input']) == vector['canonical'], vector['name']
+            assert scorer.hasher.responses_json(vector['input']) == vector['canonical'], vector['name']
+            assert scorer.hasher.hash_responses(vector['input']) == vector['sha256'], vector['name']
+
+    def test_output_vectors(self, vectors):
+        for vector in vectors['outputs']:
+            canonical = canonical_output_json(vector['ocean'], vector['mbti'], vector['version'])
+            assert canonical == vector['canonical'], vector['name']
+            assert hash_output(vector['ocean'], vector['mbti'], vector['version']) == vector['sha256']
+
+
+class TestCanonicalEncoders:
+    """Fast encoders must match json.dumps on every input, falling back when needed"""
+
+    def test_random_responses(self, scorer):
+        rng = random.Random(51)
+        ids = list(scorer.questions) + ['Q999', 'x']
+        for _ in range(300):
+            picked = rng.sample(ids, rng.randint(0, len(ids)))
+            responses = {q_id: rng.choice([1, 2, 3, 4, 5, 0, 6, 2.5, 3.0, True]) for q_id in picked}
+            assert scorer.hasher.responses_json(responses) == _reference(responses)
+
+    def test_fallback_shapes(self, scorer):
+        for responses in ({1: 3, 2: 4}, {'Q001': None}, {'Q001': 'x'}, {'é': 1}, {'Q001': float('nan')}):
+            assert scorer.hasher.responses_json(responses) == _reference(responses)
+
+    def test_hasher_without_bank(self):
+        hasher = CanonicalHasher([])
+        assert hasher.responses_json({'Q002': 1, 'Q001': 5}) == _reference({'Q002': 1, 'Q001': 5})
+
+    def test_output_fallback(self):
+        odd = {'O': 0.5, 'C': 1, 'E': 0.25, 'A': 0.0, 'X': 0.1}
+        payload = {**odd, 'mbti': 'INFP', 'version': SCORING_VERSION}
+        assert canonical_output_json(odd, 'INFP', SCORING_VERSION) == _reference(payload)
+
+    def test_score_metadata_matches_compute_hash(self, scorer):
+        rng = random.Random(52)
+        responses = {q_id: rng.randint(1, 5) for q_id in scorer.questions}
+        result = scorer.score(responses)
+        output_data = {**result['ocean'], 'mbti': result['mbti_proxy'], 'version': SCORING_VERSION}
+        assert result['metadata']['input_hash'] == PersonalityScorer.compute_hash(responses)
+        assert result['metadata']['output_hash'] == PersonalityScorer.compute_hash(output_data)
@@ -0,0 +1,98 @@
+"""
+LifeSync Personality Scorer - Compiled Scoring Tests
+Tests that the vectorized NumPy scoring path matches the dict-based path bit for bit.
+
+Run with: pytest tests/test_compiled_scoring.py -v
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scorer.personality_scorer import PersonalityScorer
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+
+@pytest.fixture
+def scorers():
+    """Compiled and reference scorers over the production question bank"""
+    return PersonalityScorer(str(QUESTIONS_PATH)), PersonalityScorer(str(QUESTIONS_PATH), compiled=False)
+
+
+@pytest.fixture
+def weighted_bank(tmp_path):
+    """Question bank with uneven weights so float summation order actually matters"""
+    with open(QUESTIONS_PATH, 'r') as f:
+        data = json.load(f)
+    rng = random.Random(7)
+    for q in data['questions']:
+        q['weight'] = rng.choice([0.3, 0.7, 1.0, 1.1, 1.7])
+    path = tmp_path / "weighted_bank.json"
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+class TestCompiledScoring:
+    """Compiled tables must reproduce the reference scorer exactly"""
+
+    def test_compiled_tables_built_at_load(self, scorers):
+        compiled, reference = scorers
+        assert compiled.compiled is not None
+        assert compiled.compiled.n_questions == len(compiled.questions)
+        assert compiled.compiled.trait_codes[:5] == ['O', 'C', 'E', 'A', 'N']
+        assert reference.compiled is None
+
+    def test_full_quiz_matches_reference(self, scorers):
+        compiled, reference = scorers
+        rng = random.Random(1)
+        responses = {q_id: rng.randint(1, 5) for q_id in compiled.questions}
+        assert compiled.score(responses) == reference.score(responses)
+
+    def test_random_subsets_match_reference(self, scorers):
+        """Partial quizzes, unknown ids and out-of-range values are handled identically"""
+        compiled, reference = scorers
+        rng = random.Random(2)
+        ids = list(compiled.questions) + ['Q999', 'q001', 'bogus']
+        for _ in range(200):
+            picked = rng.sample(ids, rng.randint(0, len(ids)))
+            responses = {q_id: rng.choice([0, 1, 2, 3, 4, 5, 6, 2.5]) for q_id in picked}
+            assert compiled.score(responses) == reference.score(responses)
+
+    def test_non_numeric_values_on_unknown_ids_are_skipped(self, scorers):
+        compiled, reference = scorers
+        responses = {q_id: 4 for q_id in list(compiled.questions)[:30]}
+        responses.update({"bogus": "n/a", "Q999": None})
+        expected = reference.score(responses)
+        assert compiled.score(responses) == expected
+        assert compiled.score_many([responses, {"bogus": "n/a"}])[0] == expected
+        report = compiled.score_and_validate(responses)[1]
+        assert report == reference.score_and_validate(responses)[1]
+
+    def test_uneven_weights_match_bit_for_bit(self, weighted_bank):
+        compiled = PersonalityScorer(weighted_bank)
+        reference = PersonalityScorer(weighted_bank, compiled=False)
+        rng = random.Random(3)
+        ids = list(compiled.questions)
+        for _ in range(100):
+            picked = rng.sample(ids, rng.randint(1, len(ids)))
+            rng.shuffle(picked)
+            responses = {q_id: rng.randint(1, 5) for q_id in picked}
+
+            sums = compiled._accumulate(responses)
+            expected = reference._accumulate(responses)
+            for got, want in zip(sums, expected):
+                for code, value in want.items():
+                    assert got[code] == value
+
+            assert compiled.score(responses) == reference.score(responses)
+
+    def test_empty_responses(self, scorers):
+        compiled, reference = scorers
+        assert compiled.score({}) == reference.score({})
@@ -0,0 +1,176 @@
+"""
+LifeSync Personality Engine - Explanation Cache Tests
+Tests the SQLite explanation cache, profile signatures and cache use in generate_explanation
+
+Run with: pytest tests/test_explanation_cache.py -v
+"""
+
+import sys
+import time
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ai.explanation_generator import explanation_signature
+from src.api.config import Config
+from src.api.dependencies import get_supabase_client
+from src.api.routes.assessments import llm_circuit_breaker
+from src.api.server import app, limiter
+from src.db import explanation_cache
+from src.db.explanation_cache import ExplanationCache
+from src.db.quota import quota_tracker
+from src.llm.circuit_breaker import CircuitState
+
+TRAITS = {"Openness": 0.72, "Conscientiousness": 0.41, "Extraversion": 0.55, "Agreeableness": 0.8, "Neuroticism": 0.3}
+FACETS = {"Fantasy": 0.8, "Ideas": 0.71, "Order": 0.3, "Warmth": 0.66, "Trust": 0.5, "Anxiety": 0.2}
+EXPLANATION = {"persona_title": "The Architect", "vibe_summary": "Cool and calculated", "strengths": ["Planning"]}
+
+
+class TestExplanationCache:
+    """TTL, LRU and persistence"""
+
+    def test_hit_and_miss(self):
+        cache = ExplanationCache(":memory:")
+        assert cache.get("k") is None
+        cache.put("k", EXPLANATION)
+        assert cache.get("k") == EXPLANATION
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["size"], stats["hit_rate"]) == (1, 1, 1, 0.5)
+
+    def test_ttl_expiry(self, monkeypatch):
+        cache = ExplanationCache(":memory:", ttl=60)
+        cache.put("k", EXPLANATION)
+        now = time.time()
+        monkeypatch.setattr(explanation_cache.time, "time", lambda: now + 61)
+        assert cache.get("k") is None
+        assert cache.stats()["expired"] == 1 and len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = ExplanationCache(":memory:", max_entries=2)
+        cache.put("a", {"n": 1})
+        time.sleep(0.01)
+        cache.put("b", {"n": 2})
+        time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.put("c", {"n": 3})
+        assert cache.get("b") is None
+        assert cache.get("a") == {"n": 1} and cache.get("c") == {"n": 3}
+        assert cache.stats()["evictions"] == 1
+
+    def test_survives_restart(self, tmp_path):
+        path = tmp_path / "explanations.sqlite3"
+        first = ExplanationCache(path)
+        first.put("k", EXPLANATION)
+        first.close()
+        assert ExplanationCache(path).get("k") == EXPLANATION
+
+    def test_errors_are_misses(self):
+        cache = ExplanationCache(":memory:")
+        cache.put("bad", {"value": object()})
+        assert cache.get("bad") is None
+        cache.close()
+        assert cache.get("k") is None
+        assert cache.stats()["errors"] == 2
+
+    def test_default_path_is_outside_the_source_tree(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(explanation_cache, "_cache", None)
+        monkeypatch.setattr(explanation_cache.config, "EXPLANATION_CACHE_PATH", "")
+        monkeypatch.setattr(Config, "DATA_DIR", "")
+        monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path))
+        cache = explanation_cache.get_explanation_cache()
+        try:
+            assert Path(cache.path) == tmp_path / "lifesync" / "cache" / "explanations.sqlite3"
+        finally:
+            cache.close()
+
+
+class TestExplanationSignature:
+    """Quantized profile signature"""
+
+    def test_nearby_profiles_share_a_signature(self):
+        nudged = {name: v + 0.004 for name, v in TRAITS.items()}
+        assert explanation_signature(nudged, FACETS, {}) == explanation_signature(TRAITS, FACETS, {})
+
+    def test_signature_inputs(self):
+        base = explanation_signature(TRAITS, FACETS, {})
+        assert explanation_signature({**TRAITS, "Openness": 0.2}, FACETS, {}) != base
+        assert explanation_signature(TRAITS, {**FACETS, "Anxiety": 0.95}, {}) != base
+        assert explanation_signature(TRAITS, FACETS, {}, provider="openai") != base
+        assert explanation_signature(TRAITS, FACETS, {}, system_prompt="Be brief.") != base
+        # Facets outside the top five don't reach the prompt
+        assert explanation_signature(TRAITS, {**FACETS, "Anxiety": 0.1}, {}) == base
+
+    def test_prompt_version_prefix(self, monkeypatch):
+        from src.ai import explanation_generator
+        monkeypatch.setattr(explanation_generator, "PROMPT_TEMPLATE_VERSION", "99")
+        assert explanation_signature(TRAITS, FACETS, {}).startswith("v99:")
+
+
+@pytest.fixture
+def route_cache(monkeypatch):
+    """Private in-memory cache, fresh rate limits/quota and a closed circuit"""
+    cache = ExplanationCache(":memory:")
+    monkeypatch.setattr(explanation_cache, "_cache", cache)
+    if hasattr(limiter, "_limiter") and hasattr(limiter._limiter, "storage"):
+        limiter._limiter.storage.reset()
+    quota_tracker.reset_user_quota("testclient")
+    yield cache
+    quota_tracker.reset_user_quota("testclient")
+    llm_circuit_breaker.state = CircuitState.CLOSED
+
+
+class TestExplanationRouteCache:
+    """POST /v1/assessments/{id}/generate_explanation"""
+
+    def _post(self, db):
+        app.dependency_overrides[get_supabase_client] = lambda: db
+        try:
+            return TestClient(app).post(f"/v1/assessments/{uuid.uuid4()}/generate_explanation")
+        finally:
+            app.dependency_overrides.pop(get_supabase_client, None)
+
+    def _db(self):
+        db = MagicMock()
+        db.get_assessment_full.return_value = {
+            "trait_scores": {"O": 72.0, "C": 41.0, "E": 55.0, "A": 80.0, "N": 30.0},
+            "facet_scores": FACETS,
+            "confidence": 0.9,
+            "mbti_code": "ENFJ",
+        }
+        return db
+
+    @patch("src.api.routes.assessments.agenerate_explanation_with_tone")
+    def test_shared_profile_skips_llm(self, mock_generate, route_cache):
+        mock_generate.return_value = dict(EXPLANATION)
+        first = self._post(self._db())
+        assert first.status_code == 200 and "cached" not in first.json()
+
+        db = self._db()
+        second = self._post(db)
+        assert second.status_code == 200
+        assert second.json() == {**EXPLANATION, "cached": True}
+        assert mock_generate.call_count == 1
+        db.save_explanation.assert_called_once()
+        assert route_cache.stats()["hits"] == 1
+
+    @patch("src.api.routes.assessments.agenerate_explanation_with_tone")
+    def test_fallbacks_not_cached(self, mock_generate, route_cache):
+        mock_generate.return_value = {**EXPLANATION, "is_fallback": True}
+        assert self._post(self._db()).status_code == 200
+        assert len(route_cache) == 0
+
+    @patch("src.api.routes.assessments.agenerate_explanation_with_tone")
+    def test_served_while_circuit_open(self, mock_generate, route_cache):
+        mock_generate.return_value = dict(EXPLANATION)
+        self._post(self._db())
+        llm_circuit_breaker.state = CircuitState.OPEN
+        llm_circuit_breaker.last_failure_time = time.time()
+        response = self._post(self._db())
+        assert response.status_code == 200 and response.json()["cached"] is True
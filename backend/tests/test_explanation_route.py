@@ -22,7 +22,7 @@ class TestExplanationRoute(unittest.TestCase):
         self.assessment_id = "test-assessment-id"
         
     @patch("src.api.routes.assessments.create_supabase_client")
-    @patch("src.api.routes.assessments.generate_explanation_with_tone")
+    @patch("src.api.routes.assessments.agenerate_explanation_with_tone")
     def test_generate_explanation_success(self, mock_generate, mock_create_db):
         # 1. Mock DB
         mock_db = MagicMock()
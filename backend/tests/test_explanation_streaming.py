@@ -0,0 +1,237 @@
+"""
+LifeSync Personality Engine - Streaming Explanation Tests
+Tests incremental field parsing, Gemini streaming and the SSE explanation route
+
+Run with: pytest tests/test_explanation_streaming.py -v
+"""
+
+import asyncio
+import json
+import sys
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.dependencies import get_supabase_client
+from src.api.routes.assessments import llm_circuit_breaker
+from src.api.server import app, limiter
+from src.db import explanation_cache
+from src.db.quota import quota_tracker
+from src.llm.circuit_breaker import CircuitState
+from src.llm.gemini_provider import GeminiProvider
+from src.llm.providers.provider_failure import ProviderFailure
+from src.utils.json_stream import JsonFieldStream
+
+RESPONSE = {
+    "persona_title": "The Architect",
+    "vibe_summary": "Calm, \"precise\" and {curious}",
+    "strengths": ["Focus", "Planning"],
+    "growth_edges": ["Rest"],
+    "how_you_show_up": "Quietly\\nsteady",
+    "tagline": "Plans first",
+}
+TEXT = "```json\n" + json.dumps(RESPONSE, indent=2) + "\n```"
+
+
+def collect(chunks):
+    stream = JsonFieldStream()
+    fields = []
+    for chunk in chunks:
+        fields.extend(stream.feed(chunk))
+    return stream, fields
+
+
+class TestJsonFieldStream:
+    """Top-level fields as soon as they complete"""
+
+    def test_whole_text(self):
+        stream, fields = collect([TEXT])
+        assert fields == list(RESPONSE.items()) and stream.done
+
+    def test_any_chunking_gives_the_same_fields(self):
+        for size in (1, 2, 3, 7, 16):
+            chunks = [TEXT[i:i + size] for i in range(0, len(TEXT), size)]
+            assert collect(chunks)[1] == list(RESPONSE.items()), size
+
+    def test_fields_are_emitted_before_the_object_ends(self):
+        stream = JsonFieldStream()
+        assert stream.feed('{"persona_title": "The Arch') == []
+        assert stream.feed('itect", "strengths": ["A",') == [("persona_title", "The Architect")]
+        assert stream.feed(' "B"]}') == [("strengths", ["A", "B"])]
+
+    def test_malformed_field_is_skipped(self):
+        assert collect(['{"a": nope, "b": 1}'])[1] == [("b", 1)]
+
+
+class FakeStreamingModel:
+    """Stands in for genai.GenerativeModel: scripted streamed chunks per call"""
+
+    def __init__(self, name, outcomes, calls):
+        self.name = name
+        self._outcomes = outcomes
+        self._calls = calls
+
+    async def generate_content_async(self, prompt, generation_config=None, stream=False):
+        assert stream
+        self._calls.append(self.name)
+        outcome = self._outcomes[self.name].pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+
+        async def chunks():
+            for part in outcome:
+                await asyncio.sleep(0)
+                if isinstance(part, Exception):
+                    raise part
+                yield SimpleNamespace(text=part)
+
+        return chunks()
+
+
+def _provider(outcomes):
+    calls = []
+    with patch("google.generativeai.GenerativeModel", lambda name: FakeStreamingModel(name, outcomes, calls)):
+        provider = GeminiProvider(api_key="test-key")
+    return provider, calls
+
+
+async def _events(provider):
+    return [event async for event in provider.astream_explanation({}, {}, {}, {"mbti_proxy": "INTJ"})]
+
+
+class TestGeminiStreaming:
+    """astream_content / astream_explanation"""
+
+    def test_fields_then_explanation(self):
+        provider, calls = _provider({"gemini-2.0-flash": [[TEXT[:40], TEXT[40:90], TEXT[90:]]]})
+        events = asyncio.run(_events(provider))
+        assert [kind for kind, _ in events] == ["field"] * len(RESPONSE) + ["explanation"]
+        assert events[0] == ("field", ("persona_title", "The Architect"))
+        assert events[-1][1]["steps"] == ["Strength: Focus", "Strength: Planning", "Growth Edge: Rest"]
+        assert calls == ["gemini-2.0-flash"]
+
+    def test_alternate_model_before_first_chunk(self):
+        provider, calls = _provider({
+            "gemini-2.0-flash": [RuntimeError("boom")],
+            "gemini-2.0-flash-exp": [[TEXT]],
+        })
+        events = asyncio.run(_events(provider))
+        assert events[-1][1]["persona_title"] == "The Architect"
+        assert calls == ["gemini-2.0-flash", "gemini-2.0-flash-exp"]
+
+    def test_failure_after_first_chunk_is_raised(self):
+        provider, calls = _provider({"gemini-2.0-flash": [[TEXT[:60], RuntimeError("reset")]]})
+        with pytest.raises(ProviderFailure):
+            asyncio.run(_events(provider))
+        assert calls == ["gemini-2.0-flash"]
+
+
+@pytest.fixture
+def stream_route(monkeypatch):
+    """Private explanation cache, fresh limits/quota, a closed circuit and a mocked DB"""
+    monkeypatch.setattr(explanation_cache, "_cache", explanation_cache.ExplanationCache(":memory:"))
+    if hasattr(limiter, "_limiter") and hasattr(limiter._limiter, "storage"):
+        limiter._limiter.storage.reset()
+    for user in ("testclient", "127.0.0.1"):
+        quota_tracker.reset_user_quota(user)
+    db = MagicMock()
+    db.get_assessment_full.return_value = {
+        "trait_scores": {"O": 72.0, "C": 41.0, "E": 55.0, "A": 80.0, "N": 30.0},
+        "facet_scores": {},
+        "confidence": 0.9,
+        "mbti_code": "ENFJ",
+    }
+    app.dependency_overrides[get_supabase_client] = lambda: db
+    yield db
+    app.dependency_overrides.pop(get_supabase_client, None)
+    for user in ("testclient", "127.0.0.1"):
+        quota_tracker.reset_user_quota(user)
+    llm_circuit_breaker.state = CircuitState.CLOSED
+
+
+def parse_sse(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestStreamingRoute:
+    """POST /v1/assessments/{id}/generate_explanation:stream"""
+
+    @patch("src.api.routes.assessments.astream_explanation_with_tone")
+    def test_streams_fields_and_saves(self, mock_stream, stream_route):
+        async def fake_stream(**kwargs):
+            for item in RESPONSE.items():
+                yield "field", item
+            yield "explanation", dict(RESPONSE, model_name="gemini-2.0-flash")
+
+        mock_stream.side_effect = fake_stream
+        client = TestClient(app)
+        url = f"/v1/assessments/{uuid.uuid4()}/generate_explanation:stream"
+
+        response = client.post(url)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse(response.text)
+        assert [e for e, _ in events] == ["field"] * len(RESPONSE) + ["done"]
+        assert events[0][1] == {"field": "persona_title", "value": "The Architect"}
+        stream_route.save_explanation.assert_called_once()
+        assert stream_route.save_explanation.call_args[0][1]["tagline"] == "Plans first"
+
+        # Same profile again: replayed from the explanation cache without the LLM
+        cached = parse_sse(client.post(url).text)
+        assert mock_stream.call_count == 1
+        assert [e for e, _ in cached] == ["field"] * len(RESPONSE) + ["done"]
+        assert cached[-1][1]["cached"] is True
+
+    @patch("src.api.routes.assessments.astream_explanation_with_tone")
+    def test_duplicate_streams_share_generation(self, mock_stream, stream_route):
+        async def slow_stream(**kwargs):
+            for item in RESPONSE.items():
+                await asyncio.sleep(0.01)
+                yield "field", item
+            yield "explanation", dict(RESPONSE)
+
+        mock_stream.side_effect = slow_stream
+        url = f"/v1/assessments/{uuid.uuid4()}/generate_explanation:stream"
+
+        async def post_twice():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+                return await asyncio.gather(client.post(url), client.post(url))
+
+        responses = asyncio.run(post_twice())
+        assert mock_stream.call_count == 1
+        stream_route.save_explanation.assert_called_once()
+        for response in responses:
+            events = parse_sse(response.text)
+            assert [e for e, _ in events] == ["field"] * len(RESPONSE) + ["done"]
+            assert dict(data.values() for e, data in events[:-1]) == RESPONSE
+
+    @patch("src.api.routes.assessments.astream_explanation_with_tone")
+    def test_stream_error_event(self, mock_stream, stream_route):
+        async def broken_stream(**kwargs):
+            yield "field", ("persona_title", "The Architect")
+            raise RuntimeError("boom")
+
+        mock_stream.side_effect = broken_stream
+        response = TestClient(app).post(f"/v1/assessments/{uuid.uuid4()}/generate_explanation:stream")
+        events = parse_sse(response.text)
+        assert [e for e, _ in events] == ["field", "error"]
+        stream_route.save_explanation.assert_not_called()
+
+    def test_open_circuit_without_cache(self, stream_route):
+        llm_circuit_breaker.state = CircuitState.OPEN
+        llm_circuit_breaker.last_failure_time = float("inf")
+        response = TestClient(app).post(f"/v1/assessments/{uuid.uuid4()}/generate_explanation:stream")
+        assert response.status_code == 503
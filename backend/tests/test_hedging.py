@@ -0,0 +1,209 @@
+"""
+LifeSync Personality Engine - Hedged Request Tests
+Tests the hedge policy and hedged Gemini calls across primary and alternate models
+
+Run with: pytest tests/test_hedging.py -v
+"""
+
+import asyncio
+import importlib
+import json
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.llm.gemini_provider import GeminiProvider
+from src.llm.hedging import HedgePolicy
+from src.llm.providers.provider_failure import ProviderFailure
+
+# The module (src.llm re-exports the registry instance under the same name)
+registry_module = importlib.import_module("src.llm.provider_registry")
+
+RESPONSE = {"persona_title": "The Architect", "vibe_summary": "Calm", "strengths": ["Focus"], "growth_edges": ["Rest"]}
+
+PRIMARY, ALTERNATE = "gemini-2.0-flash", "gemini-2.0-flash-exp"
+
+
+class FakeModel:
+    """Stands in for genai.GenerativeModel: per call, (delay, outcome) with outcome a dict, text or exception"""
+
+    def __init__(self, name, outcomes, calls, cancelled):
+        self.name = name
+        self._outcomes = outcomes
+        self._calls = calls
+        self._cancelled = cancelled
+
+    async def generate_content_async(self, prompt, generation_config=None):
+        self._calls.append(self.name)
+        delay, outcome = self._outcomes[self.name].pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self._cancelled.append(self.name)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        text = outcome if isinstance(outcome, str) else json.dumps(dict(outcome, model=self.name))
+        return SimpleNamespace(text=text)
+
+
+def _provider(outcomes, policy):
+    calls, cancelled = [], []
+    with patch("google.generativeai.GenerativeModel", lambda name: FakeModel(name, outcomes, calls, cancelled)):
+        provider = GeminiProvider(api_key="test-key", hedge_policy=policy)
+    return provider, calls, cancelled
+
+
+def _generate(provider):
+    return json.loads(asyncio.run(provider.agenerate_content("prompt")))
+
+
+class TestHedgePolicy:
+    """Delay from recent primary latencies"""
+
+    def test_default_delay_until_enough_samples(self):
+        policy = HedgePolicy(percentile=90, min_samples=5, default_delay=3.0, min_delay=0.0)
+        for latency in (0.1, 0.2, 0.3, 0.4):
+            policy.record_latency(latency)
+        assert policy.delay() == 3.0
+        policy.record_latency(0.5)
+        assert policy.delay() == 0.5
+
+    def test_percentile_of_window(self):
+        policy = HedgePolicy(percentile=50, window=10, min_samples=1, min_delay=0.0)
+        for latency in range(1, 21):
+            policy.record_latency(float(latency))
+        # Only the last 10 (11..20) are kept
+        assert policy.delay() == 15.0
+
+    def test_min_delay_and_validation(self):
+        policy = HedgePolicy(min_samples=1, min_delay=0.25)
+        policy.record_latency(0.01)
+        assert policy.delay() == 0.25
+        with pytest.raises(ValueError):
+            HedgePolicy(percentile=0)
+
+    def test_censored_sample_at_percentile_backs_off(self):
+        policy = HedgePolicy(percentile=90, min_samples=1, min_delay=0.0, censored_backoff=2.0)
+        for latency in range(1, 10):
+            policy.record_latency(float(latency))
+        policy.record_latency(0.5, censored=True)
+        # Outlasted a hedge, so it ranks above the completed calls even though 0.5 is the smallest
+        assert policy.delay() == 9.0
+        policy.record_latency(0.5, censored=True)
+        assert policy.delay() == 1.0
+        assert policy.stats()["censored"] == 2
+
+    @pytest.mark.parametrize("alternate_latency", [0.01, 0.1, 1.0])
+    def test_hedge_rate_stays_near_target_with_a_slow_primary(self, alternate_latency):
+        """Replays the provider's race: a hedged primary either wins or is cancelled (censored)"""
+        rng = random.Random(7)
+        policy = HedgePolicy(percentile=95, window=200, min_samples=20, default_delay=1.0, min_delay=0.0)
+        for _ in range(4000):
+            latency = rng.lognormvariate(0.0, 1.0)
+            delay = policy.delay()
+            if latency <= delay:
+                policy.record_latency(latency)
+                policy.record_call(PRIMARY)
+            elif latency <= delay + alternate_latency:
+                policy.record_latency(latency)
+                policy.record_call(PRIMARY, hedged=True, cancelled=1)
+            else:
+                policy.record_latency(delay + alternate_latency, censored=True)
+                policy.record_call(ALTERNATE, hedged=True, cancelled=1)
+        assert 0.03 <= policy.stats()["hedge_rate"] <= 0.07
+
+
+class TestHedgedGeneration:
+    """GeminiProvider.agenerate_content with a hedge policy"""
+
+    def test_fast_primary_is_not_hedged(self):
+        policy = HedgePolicy(default_delay=0.2)
+        provider, calls, _ = _provider({PRIMARY: [(0.0, RESPONSE)]}, policy)
+        assert _generate(provider)["model"] == PRIMARY
+        assert calls == [PRIMARY]
+        stats = policy.stats()
+        assert stats["hedged"] == 0 and stats["wins"] == {PRIMARY: 1} and stats["samples"] == 1
+
+    def test_slow_primary_is_hedged_and_cancelled(self):
+        policy = HedgePolicy(default_delay=0.05)
+        provider, calls, cancelled = _provider({PRIMARY: [(5.0, RESPONSE)], ALTERNATE: [(0.0, RESPONSE)]}, policy)
+        assert _generate(provider)["model"] == ALTERNATE
+        assert calls == [PRIMARY, ALTERNATE]
+        assert cancelled == [PRIMARY]
+        stats = policy.stats()
+        assert stats["hedged"] == 1 and stats["hedge_rate"] == 1.0
+        assert stats["wins"] == {ALTERNATE: 1} and stats["cancelled"] == 1
+        # The lost primary call is a censored sample: it ran at least until the hedge delay
+        assert stats["samples"] == 1 and stats["censored"] == 1
+
+    def test_primary_can_still_win_after_hedging(self):
+        policy = HedgePolicy(default_delay=0.02)
+        provider, _, cancelled = _provider({PRIMARY: [(0.05, RESPONSE)], ALTERNATE: [(5.0, RESPONSE)]}, policy)
+        assert _generate(provider)["model"] == PRIMARY
+        assert cancelled == [ALTERNATE]
+        assert policy.stats()["wins"] == {PRIMARY: 1}
+
+    def test_failed_primary_starts_alternate_without_hedging(self):
+        policy = HedgePolicy(default_delay=5.0)
+        provider, calls, _ = _provider({PRIMARY: [(0.0, RuntimeError("boom"))], ALTERNATE: [(0.0, RESPONSE)]}, policy)
+        assert _generate(provider)["model"] == ALTERNATE
+        assert calls == [PRIMARY, ALTERNATE]
+        assert policy.stats()["hedged"] == 0
+
+    def test_invalid_json_waits_for_the_other_model(self):
+        policy = HedgePolicy(default_delay=0.02)
+        provider, _, _ = _provider({PRIMARY: [(0.05, "Sorry, I can't help")], ALTERNATE: [(0.1, RESPONSE)]}, policy)
+        assert _generate(provider)["model"] == ALTERNATE
+
+    def test_no_valid_json_returns_first_answer(self):
+        policy = HedgePolicy(default_delay=5.0)
+        provider, _, _ = _provider({PRIMARY: [(0.0, "not json")], ALTERNATE: [(0.0, "nope")]}, policy)
+        assert asyncio.run(provider.agenerate_content("prompt")) == "not json"
+
+    def test_all_models_fail(self):
+        policy = HedgePolicy(default_delay=0.01)
+        provider, _, _ = _provider({PRIMARY: [(0.02, RuntimeError("a"))], ALTERNATE: [(0.0, RuntimeError("b"))]}, policy)
+        with pytest.raises(ProviderFailure):
+            asyncio.run(provider.agenerate_content("prompt"))
+        assert policy.stats()["failed"] == 1
+
+    def test_timeout_cancels_both_calls(self):
+        policy = HedgePolicy(default_delay=0.01)
+        provider, _, cancelled = _provider({PRIMARY: [(5.0, RESPONSE)], ALTERNATE: [(5.0, RESPONSE)]}, policy)
+
+        async def run():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(provider.agenerate_content("prompt"), timeout=0.1)
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+        assert sorted(cancelled) == [PRIMARY, ALTERNATE]
+
+
+class TestRegistryHedging:
+    """Pooled providers get a policy when GEMINI_HEDGING_ENABLED"""
+
+    def test_enabled(self, monkeypatch):
+        monkeypatch.setattr(registry_module, "GEMINI_HEDGING_ENABLED", True)
+        monkeypatch.setattr(registry_module, "GEMINI_HEDGE_PERCENTILE", 90.0)
+        registry = registry_module.ProviderRegistry()
+        with patch("google.generativeai.GenerativeModel", lambda name: SimpleNamespace(name=name)):
+            provider = registry.gemini(api_key="test-key")
+        assert provider.hedge_policy.percentile == 90.0
+        [stats] = registry.hedging_stats().values()
+        assert stats["calls"] == 0 and stats["hedge_rate"] == 0.0
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(registry_module, "GEMINI_HEDGING_ENABLED", False)
+        registry = registry_module.ProviderRegistry()
+        with patch("google.generativeai.GenerativeModel", lambda name: SimpleNamespace(name=name)):
+            assert registry.gemini(api_key="test-key").hedge_policy is None
+        assert registry.hedging_stats() == {}
@@ -0,0 +1,337 @@
+"""
+LifeSync Personality Engine - Background Job Tests
+Tests the SQLite job store, the async job queue and the explanation job routes
+
+Run with: pytest tests/test_job_queue.py -v
+"""
+
+import asyncio
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.config import Config
+from src.api.dependencies import get_supabase_client
+from src.api.routes.assessments import llm_circuit_breaker
+from src.api.server import app, limiter
+from src.db import explanation_cache, job_store
+from src.db.job_store import JobStore
+from src.db.quota import quota_tracker
+from src.llm.circuit_breaker import CircuitState
+from src.utils.job_queue import JobError, JobQueue, QueueFullError, job_queue
+
+EXPLANATION = {"persona_title": "The Architect", "vibe_summary": "Cool and calculated", "strengths": ["Planning"]}
+ASSESSMENT = {
+    "trait_scores": {"O": 72.0, "C": 41.0, "E": 55.0, "A": 80.0, "N": 30.0},
+    "facet_scores": {},
+    "confidence": 0.9,
+    "mbti_code": "ENFJ",
+}
+
+
+async def until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        await asyncio.sleep(0.005)
+
+
+class TestJobStore:
+    """Lifecycle, claiming and recovery"""
+
+    def test_lifecycle(self):
+        store = JobStore(":memory:")
+        job = store.create("explanation", {"assessment_id": "a"})
+        assert store.get(job["id"])["status"] == "queued"
+        assert store.claim(job["id"])
+        assert not store.claim(job["id"])
+        store.complete(job["id"], EXPLANATION)
+        stored = store.get(job["id"])
+        assert (stored["status"], stored["result"], stored["attempts"]) == ("succeeded", EXPLANATION, 1)
+        assert store.get("missing") is None
+
+    def test_recover_requeues_stale_and_prunes_finished(self):
+        store = JobStore(":memory:", retention=0, stale_after=0)
+        queued = store.create("explanation", {})
+        stale = store.create("explanation", {})
+        done = store.create("explanation", {})
+        store.claim(stale["id"])
+        store.claim(done["id"])
+        store.fail(done["id"], "boom")
+        time.sleep(0.01)
+        assert [job["id"] for job in store.recover()] == [queued["id"], stale["id"]]
+        assert store.get(done["id"]) is None
+
+    def test_touched_running_job_is_not_stale(self):
+        store = JobStore(":memory:", stale_after=0.05)
+        job = store.create("explanation", {})
+        store.claim(job["id"])
+        time.sleep(0.06)
+        assert store.touch(job["id"])
+        assert store.recover() == []
+        assert store.get(job["id"])["status"] == "running"
+        time.sleep(0.06)
+        assert [j["id"] for j in store.recover()] == [job["id"]]
+        # Only running jobs are touched
+        assert not store.touch(job["id"])
+
+    def test_finished_jobs_pruned_while_running(self):
+        store = JobStore(":memory:", retention=0, prune_interval=0.05)
+        done = store.create("explanation", {})
+        store.claim(done["id"])
+        store.complete(done["id"], EXPLANATION)
+        # Within the prune interval of the create above
+        store.create("explanation", {})
+        assert store.get(done["id"]) is not None
+        time.sleep(0.06)
+        store.create("explanation", {})
+        assert store.get(done["id"]) is None
+        assert store.counts() == {"queued": 2}
+
+    def test_survives_restart(self, tmp_path):
+        path = tmp_path / "jobs.sqlite3"
+        first = JobStore(path)
+        job = first.create("explanation", {"assessment_id": "a"})
+        first.close()
+        assert [j["id"] for j in JobStore(path).recover()] == [job["id"]]
+
+    def test_default_path_is_outside_the_source_tree(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(job_store, "_store", None)
+        monkeypatch.setattr(job_store.config, "JOB_STORE_PATH", "")
+        monkeypatch.setattr(Config, "DATA_DIR", str(tmp_path))
+        store = job_store.get_job_store()
+        try:
+            assert Path(store.path) == tmp_path / "jobs" / "jobs.sqlite3"
+        finally:
+            store.close()
+
+
+class TestJobQueue:
+    """Workers, limits and restarts"""
+
+    def test_runs_jobs(self):
+        async def run():
+            queue, store = JobQueue("test", workers=2), JobStore(":memory:")
+
+            async def handler(payload):
+                return {"echo": payload["n"]}
+
+            async def failing(payload):
+                raise JobError("no such assessment")
+
+            queue.register("echo", handler)
+            queue.register("fail", failing)
+            await queue.start(store)
+            ok, bad = queue.submit("echo", {"n": 1}), queue.submit("fail", {})
+            await until(lambda: store.get(bad["id"])["status"] == "failed" and store.get(ok["id"])["status"] == "succeeded")
+            await queue.stop()
+            return queue, store.get(ok["id"]), store.get(bad["id"])
+
+        queue, ok, bad = asyncio.run(run())
+        assert ok["result"] == {"echo": 1}
+        assert bad["error"] == "no such assessment"
+        assert (queue.stats()["succeeded"], queue.stats()["failed"]) == (1, 1)
+
+    def test_provider_concurrency_limit(self):
+        async def run():
+            queue, store = JobQueue("test", workers=6, provider_concurrency=2), JobStore(":memory:")
+            running, peak, gate = {"a": 0, "b": 0}, {"a": 0, "b": 0}, asyncio.Event()
+
+            async def handler(payload):
+                provider = payload["provider"]
+                running[provider] += 1
+                peak[provider] = max(peak[provider], running[provider])
+                await gate.wait()
+                running[provider] -= 1
+
+            queue.register("llm", handler, concurrency_key=lambda payload: payload["provider"])
+            await queue.start(store)
+            jobs = [queue.submit("llm", {"provider": p}) for p in "aaaab"]
+            await until(lambda: running == {"a": 2, "b": 1})
+            gate.set()
+            await until(lambda: all(store.get(j["id"])["status"] == "succeeded" for j in jobs))
+            await queue.stop()
+            return peak
+
+        assert asyncio.run(run()) == {"a": 2, "b": 1}
+
+    def test_full_queue_rejects(self):
+        async def run():
+            queue, gate = JobQueue("test", workers=1, max_pending=1), asyncio.Event()
+
+            async def handler(payload):
+                await gate.wait()
+
+            queue.register("slow", handler)
+            await queue.start(JobStore(":memory:"))
+            queue.submit("slow", {})
+            await asyncio.sleep(0.01)
+            queue.submit("slow", {})
+            with pytest.raises(QueueFullError):
+                queue.submit("slow", {})
+            gate.set()
+            await queue.stop()
+            return queue.stats()["rejected"]
+
+        assert asyncio.run(run()) == 1
+
+    def test_running_job_heartbeat(self):
+        async def run():
+            queue, store = JobQueue("test", workers=1, heartbeat_interval=0.01), JobStore(":memory:")
+            gate = asyncio.Event()
+
+            async def handler(payload):
+                await gate.wait()
+
+            queue.register("slow", handler)
+            await queue.start(store)
+            job = queue.submit("slow", {})
+            await until(lambda: store.get(job["id"])["status"] == "running")
+            claimed_at = store.get(job["id"])["updated_at"]
+            await until(lambda: store.get(job["id"])["updated_at"] > claimed_at)
+            gate.set()
+            await until(lambda: store.get(job["id"])["status"] == "succeeded")
+            await queue.stop()
+
+        asyncio.run(run())
+
+    def test_unstarted_queue_refuses_jobs(self):
+        queue = JobQueue("test")
+        queue.register("echo", MagicMock())
+        with pytest.raises(RuntimeError):
+            queue.submit("echo", {})
+
+    def test_jobs_resume_after_restart(self, tmp_path):
+        path = tmp_path / "jobs.sqlite3"
+
+        async def run():
+            calls = []
+
+            async def handler(payload):
+                calls.append(payload["n"])
+                if len(calls) == 1:
+                    await asyncio.Event().wait()
+                return payload["n"]
+
+            first = JobQueue("first", workers=1)
+            first.register("echo", handler)
+            await first.start(JobStore(path))
+            interrupted, waiting = first.submit("echo", {"n": 1}), first.submit("echo", {"n": 2})
+            await until(lambda: calls == [1])
+            await first.stop()
+
+            store = JobStore(path)
+            assert store.get(interrupted["id"])["status"] == "queued"
+            second = JobQueue("second", workers=1)
+            second.register("echo", handler)
+            await second.start(store)
+            await until(lambda: store.get(interrupted["id"])["status"] == "succeeded"
+                        and store.get(waiting["id"])["status"] == "succeeded")
+            await second.stop()
+            return second, calls
+
+        second, calls = asyncio.run(run())
+        assert sorted(calls) == [1, 1, 2]
+        assert second.stats()["resumed"] == 2
+
+
+@pytest.fixture
+def job_route(monkeypatch):
+    """Private job store, no shared explanation cache, fresh limits/quota"""
+    monkeypatch.setattr(job_store, "_store", JobStore(":memory:"))
+    monkeypatch.setattr(explanation_cache, "_cache", explanation_cache.ExplanationCache(":memory:"))
+    if hasattr(limiter, "_limiter") and hasattr(limiter._limiter, "storage"):
+        limiter._limiter.storage.reset()
+    quota_tracker.reset_user_quota("127.0.0.1")
+    db = MagicMock()
+    db.get_assessment.return_value = ASSESSMENT
+    db.get_assessment_full.return_value = ASSESSMENT
+    app.dependency_overrides[get_supabase_client] = lambda: db
+    with patch("src.api.routes.assessments.get_supabase_client", lambda: db):
+        yield db
+    app.dependency_overrides.pop(get_supabase_client, None)
+    quota_tracker.reset_user_quota("127.0.0.1")
+    llm_circuit_breaker.state = CircuitState.CLOSED
+
+
+def call_with_queue(requests):
+    """Run requests(client) against the app with the shared job queue started"""
+    async def run():
+        await job_queue.start(job_store.get_job_store())
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+                return await requests(client)
+        finally:
+            await job_queue.stop()
+
+    return asyncio.run(run())
+
+
+class TestExplanationJobRoutes:
+    """POST .../generate_explanation:async, GET /v1/jobs/{id} and its event stream"""
+
+    @patch("src.api.routes.assessments.agenerate_explanation_with_tone")
+    def test_enqueue_and_poll(self, mock_generate, job_route):
+        mock_generate.return_value = dict(EXPLANATION)
+
+        async def requests(client):
+            accepted = await client.post(f"/v1/assessments/{uuid.uuid4()}/generate_explanation:async")
+            job_id = accepted.json()["job_id"]
+            for _ in range(200):
+                status = await client.get(f"/v1/jobs/{job_id}")
+                if status.json()["status"] == "succeeded":
+                    break
+                await asyncio.sleep(0.01)
+            return accepted, status
+
+        accepted, status = call_with_queue(requests)
+        assert accepted.status_code == 202
+        assert accepted.headers["location"] == f"/v1/jobs/{accepted.json()['job_id']}"
+        assert accepted.json()["status"] == "queued"
+        assert status.json()["result"]["persona_title"] == "The Architect"
+        job_route.save_explanation.assert_called_once()
+
+    @patch("src.api.routes.assessments.agenerate_explanation_with_tone")
+    def test_event_stream(self, mock_generate, job_route):
+        async def slow_generate(**kwargs):
+            await asyncio.sleep(0.05)
+            return dict(EXPLANATION)
+
+        mock_generate.side_effect = slow_generate
+
+        async def requests(client):
+            accepted = await client.post(f"/v1/assessments/{uuid.uuid4()}/generate_explanation:async")
+            return await client.get(accepted.json()["events_url"])
+
+        response = call_with_queue(requests)
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [block for block in response.text.split("\n\n") if block.startswith("event:")]
+        statuses = [block.split("\n")[0].split(": ")[1] for block in events]
+        assert statuses[-1] == "succeeded" and set(statuses) <= {"queued", "running", "succeeded"}
+        final = json.loads(events[-1].split("data: ", 1)[1])
+        assert final["result"]["persona_title"] == "The Architect"
+
+    def test_missing_assessment_is_not_queued(self, job_route):
+        job_route.get_assessment.return_value = None
+
+        async def requests(client):
+            return await client.post(f"/v1/assessments/{uuid.uuid4()}/generate_explanation:async")
+
+        assert call_with_queue(requests).status_code == 404
+        assert job_store.get_job_store().counts() == {}
+
+    def test_unknown_job(self, job_route):
+        async def requests(client):
+            return await client.get(f"/v1/jobs/{uuid.uuid4()}"), await client.get("/v1/jobs/not-a-uuid/events")
+
+        assert [r.status_code for r in call_with_queue(requests)] == [404, 404]
@@ -0,0 +1,176 @@
+"""
+LifeSync Personality Scorer - Population Norms Tests
+Tests percentile tables, the .npz artifact and percentiles on score results
+
+Run with: pytest tests/test_norms.py -v
+"""
+
+import random
+import sys
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.dependencies import get_supabase_client
+from src.api.server import app
+from src.config.constants import SCORING_VERSION
+from src.scorer import create_scorer_wrapper
+from src.scorer.norms import NormsBuilder, NormsError, NormTable, NormTables, iter_stored_scores, stored_facet_scores, stored_trait_scores
+from src.scorer.personality_scorer import PersonalityScorer
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+client = TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def population():
+    """Stored-looking (traits, facets) pairs from 300 random full assessments"""
+    scorer = PersonalityScorer(str(QUESTIONS_PATH))
+    rng = random.Random(101)
+    pairs = []
+    for _ in range(300):
+        result = scorer.score({q_id: rng.randint(1, 5) for q_id in scorer.questions})
+        pairs.append((result['traits'], result['facets']))
+    return pairs
+
+
+@pytest.fixture(scope="module")
+def norms(population):
+    builder = NormsBuilder()
+    for traits, facets in population:
+        builder.add(traits, facets)
+    return builder.build(scoring_version=SCORING_VERSION, watermark="2026-01-01T00:00:00+00:00")
+
+
+def _reference_percentile(values, value):
+    values = np.round(np.asarray(values), 3)
+    return round(100.0 * ((values < value).sum() + (values == value).sum() / 2) / len(values), 1)
+
+
+class TestNormTables:
+    """Percentile lookups against a brute-force reference"""
+
+    def test_matches_brute_force(self, norms, population):
+        openness = [traits['Openness'] for traits, _ in population]
+        fantasy = [facets['Fantasy'] for _, facets in population]
+        for value in (0.0, 0.25, openness[0], openness[7], 0.5, 0.731, 1.0):
+            assert norms.percentile("traits", "Openness", value) == _reference_percentile(openness, round(value, 3))
+        assert norms.percentile("facets", "Fantasy", fantasy[3]) == _reference_percentile(fantasy, fantasy[3])
+
+    def test_compact(self, norms):
+        table = norms.tables["traits"]["Openness"]
+        assert table.total == norms.population == 300
+        assert len(table.values) <= 1001
+        assert np.all(np.diff(table.values) > 0)
+
+    def test_missing_and_small_populations(self, norms):
+        assert norms.percentile("traits", "Openness", None) is None
+        assert norms.percentile("traits", "Bogus", 0.5) is None
+        assert norms.percentile("traits", "Openness", 0.5, min_population=1000) is None
+
+    def test_incremental_refresh_matches_full_build(self, norms, population):
+        first = NormsBuilder()
+        for traits, facets in population[:120]:
+            first.add(traits, facets)
+        refreshed = NormsBuilder(first.build())
+        for traits, facets in population[120:]:
+            refreshed.add(traits, facets)
+        refreshed = refreshed.build()
+        assert refreshed.population == norms.population
+        for group, tables in norms.tables.items():
+            for name, table in tables.items():
+                np.testing.assert_array_equal(refreshed.tables[group][name].values, table.values)
+                np.testing.assert_array_equal(refreshed.tables[group][name].counts, table.counts)
+
+    def test_artifact_round_trip(self, norms, tmp_path):
+        path = tmp_path / "norms.npz"
+        norms.save(path)
+        loaded = NormTables.load(path)
+        assert loaded.population == 300
+        assert loaded.scoring_version == SCORING_VERSION
+        assert loaded.meta["watermark"] == norms.meta["watermark"]
+        assert loaded.percentiles({"Openness": 0.5}) == norms.percentiles({"Openness": 0.5})
+        with pytest.raises(NormsError):
+            NormTables.load(tmp_path / "missing.npz")
+
+    def test_stored_trait_formats(self):
+        assert stored_trait_scores({"O": 80.0, "Conscientiousness": 0.4})["Openness"] == 0.8
+        assert stored_trait_scores({"O": 80.0, "Conscientiousness": 0.4})["Conscientiousness"] == 0.4
+        assert stored_trait_scores({})["Neuroticism"] is None
+        rows = [{"trait_scores": None}, {"trait_scores": {"Openness": 0.5}, "facet_scores": None}]
+        assert list(iter_stored_scores(rows)) == [(stored_trait_scores({"Openness": 0.5}), {})]
+
+    def test_stored_facet_formats(self):
+        # score-assessment edge function rows: short trait and facet codes on a 0-100 scale
+        row = {"trait_scores": {"O": 80.0}, "facet_scores": {"O1": 75.0, "N6": 20.0, "C2": None}}
+        [(traits, facets)] = iter_stored_scores([row])
+        assert traits["Openness"] == 0.8
+        assert facets == {"Fantasy": 0.75, "Vulnerability": 0.2, "Order": None}
+        assert stored_facet_scores({"Fantasy": 0.5, "Ideas": "n/a"}) == {"Fantasy": 0.5}
+        assert stored_facet_scores(None) == {}
+
+    def test_empty_table(self):
+        assert NormTable.empty().total == 0
+
+
+class TestScoreResultPercentiles:
+    """score() results carry percentiles once norms are attached"""
+
+    def test_none_without_norms(self):
+        scorer = PersonalityScorer(str(QUESTIONS_PATH))
+        assert scorer.score({'Q001': 3})['percentiles'] is None
+
+    def test_attached_norms(self, norms, population):
+        scorer = PersonalityScorer(str(QUESTIONS_PATH), memo_size=4)
+        answers = {f"Q{i:03d}": 4 for i in range(1, 181)}
+        before = scorer.score(answers)
+        scorer.set_norms(norms)
+        result = scorer.score(answers)
+        assert result is not before
+        percentiles = result['percentiles']
+        assert percentiles['traits']['Openness'] == norms.percentile("traits", "Openness", result['traits']['Openness'])
+        assert set(percentiles['facets']) == set(result['facets'])
+        assert result.to_dict()['percentiles'] == percentiles
+
+    def test_other_version_drops_norms(self, norms):
+        scorer = PersonalityScorer(str(QUESTIONS_PATH))
+        scorer.set_norms(norms)
+        assert scorer.for_version("v0").norms is None
+
+
+class TestAssessmentPercentiles:
+    """GET /v1/assessments/{id} adds percentiles from the norm tables"""
+
+    def test_get_assessment(self, norms, monkeypatch):
+        scorer = create_scorer_wrapper.get_scorer()
+        monkeypatch.setattr(scorer, "norms", norms)
+
+        assessment_id = str(uuid.uuid4())
+        db = MagicMock()
+        db.get_assessment.return_value = {
+            "id": assessment_id,
+            "trait_scores": {"O": 55.0, "C": 40.0, "E": 61.0, "A": 70.0, "N": 35.0},
+            # Long names (legacy rows) and edge-function facet codes on a 0-100 scale
+            "facet_scores": {"Fantasy": 0.5, "O2": 60.0},
+            "mbti_code": "ENFJ",
+            "scoring_version": SCORING_VERSION,
+        }
+        app.dependency_overrides[get_supabase_client] = lambda: db
+        try:
+            response = client.get(f"/v1/assessments/{assessment_id}")
+        finally:
+            app.dependency_overrides.pop(get_supabase_client, None)
+
+        assert response.status_code == 200
+        percentiles = response.json()["percentiles"]
+        assert percentiles["traits"]["Openness"] == norms.percentile("traits", "Openness", 0.55)
+        assert percentiles["facets"]["Fantasy"] == norms.percentile("facets", "Fantasy", 0.5)
+        assert percentiles["facets"]["Aesthetics"] == norms.percentile("facets", "Aesthetics", 0.6)
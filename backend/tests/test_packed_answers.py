@@ -0,0 +1,144 @@
+"""
+LifeSync Personality Scorer - Packed Answer Tests
+Tests the nibble-packed answer wire format and POST /v1/assessments/score:packed
+
+Run with: pytest tests/test_packed_answers.py -v
+"""
+
+import base64
+import random
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.routes import assessments
+from src.api.server import app
+from src.scorer import score_answers
+from src.scorer.packed_answers import PackedAnswers, PackedAnswersError, pack_answers, pack_answers_base64
+from src.scorer.personality_scorer import PersonalityScorer
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+client = TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    return PersonalityScorer(str(QUESTIONS_PATH))
+
+
+@pytest.fixture
+def answers(scorer):
+    rng = random.Random(71)
+    return {q_id: rng.randint(1, 5) for q_id in rng.sample(list(scorer.questions), 120)}
+
+
+def _in_bank_order(scorer, answers):
+    return {q_id: answers[q_id] for q_id in scorer.questions if q_id in answers}
+
+
+class TestPackedFormat:
+    """Packing round trips and error handling"""
+
+    def test_full_quiz_is_90_bytes(self, scorer):
+        ids = list(scorer.questions)
+        packed = pack_answers({q_id: 5 for q_id in ids}, ids)
+        assert len(packed) == 90
+        assert len(pack_answers_base64({q_id: 5 for q_id in ids}, ids)) == 120
+
+    def test_round_trip(self, scorer, answers):
+        ids = list(scorer.questions)
+        decoded = PackedAnswers.from_bytes(pack_answers(answers, ids), len(ids))
+        assert decoded.to_dict(ids) == _in_bank_order(scorer, answers)
+        assert len(decoded) == len(answers)
+
+    def test_odd_question_count(self):
+        ids = ['Q001', 'Q002', 'Q003']
+        packed = pack_answers({'Q003': 4}, ids)
+        assert packed == bytes([0x00, 0x40])
+        assert PackedAnswers.from_bytes(packed, 3).to_dict(ids) == {'Q003': 4}
+        with pytest.raises(PackedAnswersError):
+            PackedAnswers.from_bytes(bytes([0x00, 0x41]), 3)
+
+    def test_malformed_payloads(self, scorer):
+        with pytest.raises(PackedAnswersError):
+            scorer.decode_packed(b"\x00" * 10)
+        with pytest.raises(PackedAnswersError):
+            scorer.decode_packed("not base64!!")
+        with pytest.raises(PackedAnswersError):
+            pack_answers({'Q999': 3}, list(scorer.questions))
+        with pytest.raises(PackedAnswersError):
+            pack_answers({'Q001': 16}, list(scorer.questions))
+
+
+class TestScorePacked:
+    """score_packed() must match score() on the same answers"""
+
+    def test_matches_dict_scoring(self, scorer):
+        ids = list(scorer.questions)
+        rng = random.Random(72)
+        for _ in range(100):
+            answers = {q_id: rng.randint(1, 5) for q_id in rng.sample(ids, rng.randint(0, len(ids)))}
+            result = scorer.score_packed(scorer.decode_packed(pack_answers_base64(answers, ids)))
+            assert result == scorer.score(_in_bank_order(scorer, answers))
+            assert result['metadata']['input_hash'] == scorer.score(answers)['metadata']['input_hash']
+
+    def test_off_scale_values_rejected(self, scorer):
+        ids = list(scorer.questions)
+        with pytest.raises(PackedAnswersError, match="between"):
+            scorer.score_packed(scorer.decode_packed(pack_answers({'Q001': 9}, ids)))
+
+    def test_bank_version_mismatch_rejected(self, scorer, answers):
+        packed = scorer.decode_packed(pack_answers(answers, list(scorer.questions)), bank_version="0.0.1")
+        with pytest.raises(PackedAnswersError, match="question bank"):
+            scorer.score_packed(packed)
+
+
+class TestPackedEndpoint:
+    """POST /v1/assessments/score:packed"""
+
+    def test_json_base64_body(self, scorer, answers):
+        body = {"bank_version": scorer.bank_version, "answers": pack_answers_base64(answers, list(scorer.questions))}
+        response = client.post("/v1/assessments/score:packed", json=body)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["bank_version"] == scorer.bank_version
+        assert data["responses_count"] == len(answers)
+        assert data["traits"] == score_answers(_in_bank_order(scorer, answers))["traits"]
+
+    def test_url_safe_base64(self, scorer, answers):
+        raw = pack_answers(answers, list(scorer.questions))
+        body = {"bank_version": scorer.bank_version, "answers": base64.urlsafe_b64encode(raw).decode()}
+        assert client.post("/v1/assessments/score:packed", json=body).status_code == 200
+
+    def test_wrong_bank_version(self, scorer, answers):
+        body = {"bank_version": "0.0.1", "answers": pack_answers_base64(answers, list(scorer.questions))}
+        response = client.post("/v1/assessments/score:packed", json=body)
+        assert response.status_code == 422
+
+    def test_invalid_bodies(self):
+        assert client.post("/v1/assessments/score:packed", content=b"{nope",
+                           headers={"content-type": "application/json"}).status_code == 400
+        assert client.post("/v1/assessments/score:packed", json={"answers": "AAAA"}).status_code == 422
+
+    def test_msgpack_without_library(self, monkeypatch):
+        monkeypatch.setattr(assessments, "MSGPACK_AVAILABLE", False)
+        response = client.post("/v1/assessments/score:packed", content=b"\x80",
+                               headers={"content-type": "application/msgpack"})
+        assert response.status_code == 415
+
+    def test_msgpack_body(self, scorer, answers):
+        msgpack = pytest.importorskip("msgpack")
+        body = msgpack.packb({
+            "bank_version": scorer.bank_version,
+            "answers": pack_answers(answers, list(scorer.questions)),
+        })
+        response = client.post("/v1/assessments/score:packed", content=body,
+                               headers={"content-type": "application/msgpack"})
+        assert response.status_code == 200
+        assert response.json()["responses_count"] == len(answers)
@@ -0,0 +1,122 @@
+"""
+LifeSync Personality Scorer - Persona Mapping Tests
+Tests the compiled persona ranges against the per-persona loop they replace
+
+Run with: pytest tests/test_persona_mapping.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.personas.persona_registry import (
+    PERSONAS,
+    TRAITS,
+    PersonaGrid,
+    distance_from_range_center,
+    in_range,
+    map_profile_to_persona,
+    map_profiles_to_personas,
+)
+
+
+def _reference_mapping(profile):
+    """The original linear scan + sort"""
+    scored = []
+    for p in PERSONAS:
+        hits = 0
+        proximity = 0
+        for t in TRAITS:
+            val = profile.get(t, 0)
+            r = p["ranges"][t]
+            if in_range(val, (r[0], r[1])):
+                hits += 1
+                proximity += distance_from_range_center(val, (r[0], r[1]))
+            else:
+                delta = max(r[0] - val, val - r[1], 0)
+                proximity += delta if delta <= 10 else 30
+        scored.append({"persona": p, "hits": hits, "proximity": proximity})
+    scored.sort(key=lambda x: (-x["hits"], x["proximity"]))
+
+    top = scored[0]
+    base_confidence = top["hits"] / 5
+    proximity_boost = max(0, 1 - (top["proximity"] / (5 * 50)))
+    confidence = min(1, base_confidence * 0.75 + proximity_boost * 0.25)
+    return {
+        "persona": top["persona"],
+        "confidence": round(confidence * 100),
+        "hits": top["hits"],
+        "proximity": round(top["proximity"])
+    }
+
+
+def _profiles(n, seed):
+    rng = random.Random(seed)
+    profiles = []
+    for i in range(n):
+        if i % 3 == 0:
+            profiles.append({t: rng.randint(0, 100) for t in TRAITS})
+        elif i % 3 == 1:
+            profiles.append({t: rng.random() * 100 for t in TRAITS})
+        else:
+            # 0-1 scores scaled as in explanation_generator
+            profiles.append({t: round(rng.random(), 3) * 100 for t in TRAITS})
+    return profiles
+
+
+class TestCompiledMapping:
+    """Identical persona, confidence, hits and proximity"""
+
+    def test_single_profiles_match_reference(self):
+        for profile in _profiles(3000, 151) + [{}, {t: 50 for t in TRAITS}]:
+            assert map_profile_to_persona(profile) == _reference_mapping(profile)
+
+    def test_range_boundaries(self):
+        # Values on range edges and 10 points outside them exercise every branch
+        edges = sorted({v for p in PERSONAS for r in p["ranges"].values() for e in r for v in (e - 10, e, e + 10)})
+        rng = random.Random(152)
+        for _ in range(2000):
+            profile = {t: rng.choice(edges) for t in TRAITS}
+            assert map_profile_to_persona(profile) == _reference_mapping(profile)
+
+    def test_result_types(self):
+        result = map_profile_to_persona({t: 42.5 for t in TRAITS})
+        assert result["persona"] in PERSONAS
+        assert all(type(result[key]) is int for key in ("confidence", "hits", "proximity"))
+
+    def test_batch_matches_single(self):
+        profiles = _profiles(500, 153)
+        matrix = [[p[t] for t in TRAITS] for p in profiles]
+        assert map_profiles_to_personas(matrix) == [map_profile_to_persona(p) for p in profiles]
+
+    def test_batch_empty(self):
+        assert map_profiles_to_personas([]) == []
+
+
+@pytest.fixture(scope="module")
+def grid():
+    return PersonaGrid(step=20)
+
+
+class TestPersonaGrid:
+    """Quantized lookup table"""
+
+    def test_exact_on_grid_points(self, grid):
+        rng = random.Random(154)
+        for _ in range(500):
+            profile = {t: rng.randrange(0, 101, 20) for t in TRAITS}
+            assert grid.lookup(profile) == map_profile_to_persona(profile)
+
+    def test_snaps_to_nearest_point(self, grid):
+        profile = {t: 38.0 for t in TRAITS}
+        assert grid.lookup(profile) == map_profile_to_persona({t: 40 for t in TRAITS})
+        assert grid.lookup({t: 130.0 for t in TRAITS}) == map_profile_to_persona({t: 100 for t in TRAITS})
+
+    def test_invalid_step(self):
+        with pytest.raises(ValueError):
+            PersonaGrid(step=7)
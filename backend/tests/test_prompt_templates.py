@@ -0,0 +1,100 @@
+"""
+LifeSync Personality Engine - Prompt Template Tests
+Tests compiled prompt fragments and the assembled-prompt cache
+
+Run with: pytest tests/test_prompt_templates.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ai.tone_generator import generate_tone
+from src.llm.templates import TRAIT_NAMES, get_personality_explanation_prompt, get_prompt_cache_stats
+from src.personas.persona_registry import PERSONAS
+
+TRAITS = {"Openness": 0.72, "Conscientiousness": 0.655, "Extraversion": 0.41, "Agreeableness": 0.7, "Neuroticism": 0.3}
+CONFIDENCE = {"traits": {"Openness": 0.9, "Neuroticism": 0.5}}
+FACETS = {"Fantasy": 0.61, "Ideas": 0.9, "Order": 0.61, "Warmth": 0.2, "Trust": 0.75, "Feelings": 0.61, "Values": 0.1}
+
+
+def _prompt(**overrides):
+    kwargs = dict(traits=TRAITS, facets=FACETS, confidence=CONFIDENCE, dominant={"mbti_proxy": "INTJ"})
+    kwargs.update(overrides)
+    return get_personality_explanation_prompt(**kwargs)
+
+
+class TestPromptLayout:
+    """Fragments assemble into the documented layout"""
+
+    def test_score_blocks(self):
+        prompt = _prompt()
+        assert (
+            "\nTrait scores:\n"
+            "- Openness: 0.72 (confidence: 0.90)\n"
+            "- Conscientiousness: 0.66 (confidence: 0.00)\n"
+            "- Extraversion: 0.41 (confidence: 0.00)\n"
+            "- Agreeableness: 0.70 (confidence: 0.00)\n"
+            "- Neuroticism: 0.30 (confidence: 0.50)\n\n"
+        ) in prompt
+        # Ties keep dict order, as with a stable descending sort
+        assert (
+            "Top facet scores:\n"
+            "- Ideas: 0.90\n- Trust: 0.75\n- Fantasy: 0.61\n- Order: 0.61\n- Feelings: 0.61\n\n"
+        ) in prompt
+
+    def test_missing_traits_default(self):
+        prompt = _prompt(traits={}, confidence={})
+        assert all(f"- {trait}: 0.50 (confidence: 0.00)" in prompt for trait in TRAIT_NAMES)
+
+    def test_no_facets(self):
+        assert "Top facet scores" not in _prompt(facets={})
+
+    def test_mbti_fallback_title(self):
+        assert 'Use: "The Strategic Visionary"' in _prompt()
+        assert "Persona title: The XXXX\n" in _prompt(dominant={"mbti_proxy": "XXXX"})
+
+    def test_persona_fragments(self):
+        persona = PERSONAS[0]
+        prompt = _prompt(persona=persona)
+        assert prompt.index(f"Persona title: {persona['title']}\nTagline: {persona['tagline']}\n") < prompt.index("Trait scores:")
+        assert f"Specific Instruction for this Persona:\n{persona['llm_template']}\n\n" in prompt
+        assert prompt.endswith('  "tagline": "A short, memorable phrase that captures their essence"\n}')
+
+    def test_tone_block(self):
+        tone = generate_tone({"O": 0.9, "C": 0.5, "E": 0.5, "A": 0.5, "N": 0.9})
+        prompt = _prompt(tone_profile=tone)
+        assert f"Use the following communication tone:\n- {', '.join(tone['style'])}\n\n" in prompt
+        assert "Be mindful of sensitivities:\n- may need reassurance" in prompt
+        assert "communication tone" not in _prompt(tone_profile={})
+        assert "- friendly, clear\n\n" in _prompt(tone_profile={"style": None, "strengths": ["kind"]})
+
+
+class TestPromptCache:
+    """Bounded fragment caches keyed by persona and tone; score lines rendered per request"""
+
+    def test_repeat_requests_hit(self):
+        tone = {"style": ["direct"], "strengths": [], "cautions": []}
+        first = _prompt(persona=PERSONAS[1], tone_profile=tone)
+        before = get_prompt_cache_stats()
+        assert _prompt(persona=PERSONAS[1], tone_profile=tone) == first
+        after = get_prompt_cache_stats()
+        assert after["personas"]["hits"] == before["personas"]["hits"] + 1
+        assert after["tones"]["hits"] == before["tones"]["hits"] + 1
+        assert "prompts" not in after
+
+    def test_score_lines_rendered_per_request(self):
+        base = _prompt(persona=PERSONAS[1])
+        changed = _prompt(persona=PERSONAS[1], traits={**TRAITS, "Openness": 0.2})
+        assert changed != base and "- Openness: 0.20" in changed
+        # Differences hidden by the 2-decimal rendering give the same prompt
+        assert _prompt(persona=PERSONAS[1], traits={**TRAITS, "Openness": 0.7201}) == base
+
+    def test_fragments_shared_across_prompts(self):
+        _prompt(persona=PERSONAS[2])
+        before = get_prompt_cache_stats()["personas"]
+        _prompt(persona=PERSONAS[2], traits={**TRAITS, "Neuroticism": 0.99})
+        after = get_prompt_cache_stats()["personas"]
+        assert after["hits"] == before["hits"] + 1 and after["misses"] == before["misses"]
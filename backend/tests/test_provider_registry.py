@@ -0,0 +1,87 @@
+"""
+LifeSync Personality Engine - Provider Registry Tests
+Tests pooled provider/model reuse and API key rotation
+
+Run with: pytest tests/test_provider_registry.py -v
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import llm_provider
+from src.llm.gemini_provider import GeminiProvider
+from src.llm.provider_registry import ProviderRegistry
+
+
+@pytest.fixture
+def genai():
+    """Counts SDK configure calls and model constructions"""
+    with patch("google.generativeai.configure") as configure, \
+            patch("google.generativeai.GenerativeModel", side_effect=lambda name: MagicMock(name=name)) as model:
+        yield SimpleNamespace(configure=configure, model=model)
+
+
+class TestProviderRegistry:
+    """One configured provider per (provider, model, key)"""
+
+    def test_reuses_instance(self, genai):
+        registry = ProviderRegistry()
+        first = registry.gemini("gemini-2.0-flash", "key-a")
+        assert registry.gemini("gemini-2.0-flash", "key-a") is first
+        assert genai.configure.call_count == 1
+        stats = registry.stats()
+        assert (stats["created"], stats["reused"], stats["providers"]) == (1, 1, 1)
+
+    def test_models_built_once(self, genai):
+        provider = ProviderRegistry().gemini("gemini-2.0-flash", "key-a")
+        models = genai.model.call_count
+        provider._get_model("gemini-2.0-flash").generate_content.return_value = SimpleNamespace(text='{"summary": "x"}')
+        for _ in range(3):
+            provider.generate_content("prompt")
+        assert genai.model.call_count == models == 1 + len(GeminiProvider.ALTERNATE_MODELS)
+
+    def test_key_rotation(self, genai):
+        registry = ProviderRegistry()
+        old = registry.gemini("gemini-2.0-flash", "key-a")
+        registry.gemini("gemini-2.0-flash-exp", "key-a")
+        new = registry.gemini("gemini-2.0-flash", "key-b")
+        assert new is not old and new.api_key == "key-b"
+        genai.configure.assert_called_with(api_key="key-b")
+        stats = registry.stats()
+        assert (stats["providers"], stats["rotations"]) == (1, 1)
+        assert not any("key-" in entry for entry in stats["entries"])
+
+    def test_reads_key_at_call_time(self, genai, monkeypatch):
+        registry = ProviderRegistry()
+        monkeypatch.setenv("GEMINI_API_KEY", "key-a")
+        assert registry.gemini().api_key == "key-a"
+        monkeypatch.setenv("GEMINI_API_KEY", "key-b")
+        assert registry.gemini().api_key == "key-b"
+
+    def test_missing_key(self, genai, monkeypatch):
+        monkeypatch.setattr(llm_provider, "GEMINI_API_KEY_FILE", "")
+        monkeypatch.setenv("GEMINI_API_KEY", "")
+        with pytest.raises(ValueError):
+            ProviderRegistry().gemini()
+
+
+class TestGeminiKey:
+    """get_gemini_key() is read per call"""
+
+    def test_key_file_wins(self, tmp_path, monkeypatch):
+        key_file = tmp_path / "gemini.key"
+        key_file.write_text("file-key\n")
+        monkeypatch.setattr(llm_provider, "GEMINI_API_KEY_FILE", str(key_file))
+        monkeypatch.setenv("GEMINI_API_KEY", "env-key")
+        assert llm_provider.get_gemini_key() == "file-key"
+        key_file.write_text("rotated-key")
+        assert llm_provider.get_gemini_key() == "rotated-key"
+        key_file.unlink()
+        assert llm_provider.get_gemini_key() == "env-key"
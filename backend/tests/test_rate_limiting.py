@@ -120,7 +120,7 @@ class TestResetPasswordRateLimit:
 class TestLLMGenerationRateLimit:
     """Test rate limiting on LLM generation endpoint - Issue #5."""
 
-    @patch('src.api.routes.assessments.generate_explanation_with_tone')
+    @patch('src.api.routes.assessments.agenerate_explanation_with_tone')
     def test_llm_generation_daily_limit(self, mock_generate, client):
         """Test that LLM generation enforces 10/day rate limit."""
         # Note: auth.py says 10/day and 2/hour. 
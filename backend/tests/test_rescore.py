@@ -0,0 +1,142 @@
+"""
+LifeSync Personality Scorer - Bulk Re-score Tests
+Tests the streaming re-score job over stored raw_scores
+
+Run with: pytest tests/test_rescore.py -v
+"""
+
+import io
+import json
+import random
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.constants import SCORING_VERSION
+from src.db.rescore import RescoreJob, rescore_page
+from src.supabase_client import SupabaseClient, build_score_update
+
+
+class FakeAssessmentTable:
+    """In-memory personality_assessments with the two calls RescoreJob uses"""
+
+    def __init__(self, rows):
+        self.rows = {row["id"]: row for row in rows}
+        self.pages = []
+        self.batches = []
+
+    def get_assessments_after(self, after_id, limit):
+        ids = sorted(i for i in self.rows if after_id is None or i > after_id)[:limit]
+        self.pages.append(len(ids))
+        return [dict(self.rows[i]) for i in ids]
+
+    def save_scores_batch(self, items):
+        self.batches.append(len(items))
+        for assessment_id, scores, raw_responses in items:
+            self.rows[assessment_id].update(build_score_update(scores, raw_responses))
+        return len(items)
+
+
+def _stored_row(i, rng):
+    raw = {f"Q{q:03d}": rng.randint(1, 5) for q in range(1, 181)}
+    return {"id": f"a{i:05d}", "raw_scores": raw, "scoring_version": "v0", "metadata": {"timestamp": 1700000000 + i}}
+
+
+@pytest.fixture
+def table():
+    rng = random.Random(91)
+    rows = [_stored_row(i, rng) for i in range(23)]
+    rows.append({"id": "a00023", "raw_scores": {"Q001": 9}, "scoring_version": "v0", "metadata": None})
+    return FakeAssessmentTable(rows)
+
+
+class TestRescorePage:
+    """rescore_page() diffs a fresh score against the stored columns"""
+
+    def test_unchanged_row_has_no_changes(self, table):
+        row = table.rows["a00000"]
+        first = rescore_page([row])[0]
+        row.update(build_score_update(first["scores"], first["raw_responses"]))
+        assert rescore_page([row]) == [{"id": "a00000", "changes": {}}]
+
+    def test_changes_and_metadata(self, table):
+        entry = rescore_page([table.rows["a00001"]])[0]
+        assert entry["changes"]["scoring_version"] == {"old": "v0", "new": SCORING_VERSION}
+        assert entry["scores"]["metadata"]["timestamp"] == 1700000001
+        assert entry["scores"]["metadata"]["scoring_version"] == SCORING_VERSION
+
+    def test_unscorable_row(self, table):
+        entry = rescore_page([table.rows["a00023"]])[0]
+        assert "error" in entry
+
+
+class TestRescoreJob:
+    """Keyset paging, batching, dry runs and checkpoints"""
+
+    def test_apply(self, table):
+        stats = RescoreJob(table, page_size=5, workers=0).run()
+        assert table.pages == [5, 5, 5, 5, 4]
+        assert table.batches == [5, 5, 5, 5, 3]
+        assert (stats.scanned, stats.changed, stats.written, stats.skipped) == (24, 23, 23, 1)
+        assert all(row["scoring_version"] == SCORING_VERSION for row in list(table.rows.values())[:23])
+        assert RescoreJob(table, page_size=5, workers=0).run().changed == 0
+
+    def test_dry_run_report(self, table):
+        report = io.StringIO()
+        stats = RescoreJob(table, page_size=10, workers=0, dry_run=True, report=report).run()
+        assert table.batches == []
+        lines = [json.loads(line) for line in report.getvalue().splitlines()]
+        assert len(lines) == stats.changed == 23
+        assert stats.field_changes["scoring_version"] == 23
+        assert lines[0]["changes"]["trait_scores"]["old"] is None
+
+    def test_checkpoint_resume(self, table, tmp_path):
+        checkpoint = tmp_path / "rescore.json"
+        calls = {"n": 0}
+        save = table.save_scores_batch
+
+        def failing_save(items):
+            calls["n"] += 1
+            if calls["n"] == 3:
+                raise ConnectionError("lost connection")
+            return save(items)
+
+        table.save_scores_batch = failing_save
+        with pytest.raises(ConnectionError):
+            RescoreJob(table, page_size=5, workers=0, checkpoint_path=checkpoint).run()
+        assert json.loads(checkpoint.read_text())["last_id"] == "a00009"
+
+        table.save_scores_batch = save
+        stats = RescoreJob(table, page_size=5, workers=0, checkpoint_path=checkpoint).run()
+        assert (stats.scanned, stats.written) == (24, 23)
+
+    def test_checkpoint_for_other_mode(self, table, tmp_path):
+        checkpoint = tmp_path / "rescore.json"
+        RescoreJob(table, page_size=50, workers=0, dry_run=True, checkpoint_path=checkpoint).run()
+        with pytest.raises(ValueError, match="Checkpoint"):
+            RescoreJob(table, page_size=50, workers=0, checkpoint_path=checkpoint).run()
+
+    def test_process_pool(self, table):
+        stats = RescoreJob(table, page_size=4, workers=2).run()
+        assert (stats.scanned, stats.written) == (24, 23)
+
+
+class TestSaveScoresBatch:
+    """save_scores_batch() writes the same columns as save_scores()"""
+
+    def test_single_rpc_with_save_scores_columns(self):
+        mock_client = MagicMock()
+        with patch("src.supabase_client.create_client", return_value=mock_client):
+            db = SupabaseClient(url="https://test.supabase.co", key="test")
+        scores = {"traits": {"Openness": 0.5}, "facets": {}, "mbti_proxy": "INTJ", "metadata": {"scoring_version": "v1"}}
+        db.save_scores_batch([("a1", scores, {"Q001": 3}), ("a2", scores, {"Q001": 4})])
+
+        name, params = mock_client.rpc.call_args[0]
+        assert name == "apply_score_updates"
+        assert params["updates"][1] == {"id": "a2", **build_score_update(scores, {"Q001": 4})}
+        assert db.save_scores_batch([]) == 0
@@ -0,0 +1,82 @@
+"""
+LifeSync Personality Scorer - Score Result Tests
+Tests the lazily materialized ScoreResult returned by score()
+
+Run with: pytest tests/test_score_result.py -v
+"""
+
+import json
+import pickle
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scorer.personality_scorer import PersonalityScorer
+from src.scorer.score_result import RESULT_KEYS, ScoreResult
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    return PersonalityScorer(str(QUESTIONS_PATH))
+
+
+@pytest.fixture
+def full_responses(scorer):
+    rng = random.Random(41)
+    return {q_id: rng.randint(1, 5) for q_id in scorer.questions}
+
+
+class TestScoreResult:
+    """ScoreResult must behave like the contract dict"""
+
+    def test_is_read_only_mapping(self, scorer, full_responses):
+        result = scorer.score(full_responses)
+        assert isinstance(result, ScoreResult)
+        assert list(result) == list(RESULT_KEYS)
+        assert len(result) == len(RESULT_KEYS)
+        assert 'facets' in result and 'bogus' not in result
+        with pytest.raises(KeyError):
+            result['bogus']
+        with pytest.raises(TypeError):
+            result['ocean'] = {}
+
+    def test_eager_fields_as_attributes(self, scorer, full_responses):
+        result = scorer.score(full_responses)
+        assert result.ocean == result['ocean']
+        assert result.mbti_proxy == result['mbti_proxy']
+        assert result.confidence == result['confidence']
+        assert result.persona_id == result.mbti_proxy.lower()
+
+    def test_lazy_views_are_cached(self, scorer, full_responses):
+        result = scorer.score(full_responses)
+        assert result['facets'] is result['facets']
+        assert result['metadata'] is result['metadata']
+
+    def test_to_dict_serializes_contract(self, scorer, full_responses):
+        result = scorer.score(full_responses)
+        data = result.to_dict()
+        assert type(data) is dict
+        assert list(data) == list(RESULT_KEYS)
+        assert json.loads(json.dumps(data)) == json.loads(json.dumps(dict(result)))
+        assert data == result
+
+    def test_facets_and_top_facets(self, scorer):
+        result = scorer.score({'Q001': 5, 'Q002': 1})
+        assert len(result['facets']) == len(scorer.facets)
+        answered = [v for v in result['facets'].values() if v is not None]
+        assert len(answered) == len(result['top_facets']) <= 2
+        assert result['traits']['Openness'] is None
+        assert result.ocean['O'] == 0.0
+
+    def test_pickles_as_plain_dict(self, scorer, full_responses):
+        result = scorer.score(full_responses)
+        restored = pickle.loads(pickle.dumps(result))
+        assert type(restored) is dict
+        assert restored == result
@@ -12,6 +12,7 @@ Run with: pytest tests/test_scorer_validation.py -v --log-cli-level=INFO
 """
 
 import pytest
+import random
 import sys
 import logging
 from pathlib import Path
@@ -174,6 +175,35 @@ class TestScorerValidation:
         logger.info("✅ Test passed: Empty responses correctly handled")
 
 
+
+class TestScoreAndValidate:
+    """score_and_validate() must equal score() + validate_responses()"""
+
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_matches_separate_calls(self, compiled):
+        questions_path = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+        scorer = PersonalityScorer(str(questions_path), compiled=compiled)
+
+        rng = random.Random(31)
+        ids = list(scorer.questions) + ['Q999', 'bogus']
+        for _ in range(150):
+            picked = rng.sample(ids, rng.randint(0, 60))
+            responses = {q_id: rng.choice([0, 1, 2, 3, 4, 5, 6]) for q_id in picked}
+
+            result, validation = scorer.score_and_validate(responses)
+            assert result == scorer.score(responses)
+            expected = scorer.validate_responses(responses)
+            assert validation == expected
+            assert list(validation['coverage']) == list(expected['coverage'])
+
+    def test_wrapper_returns_formatted_result(self):
+        from src.scorer import score_and_validate, score_answers, validate_responses
+        answers = {'Q001': 4, 'Q002': 2, 'Q999': 3}
+        result, validation = score_and_validate(answers)
+        assert result == score_answers(answers)
+        assert validation == validate_responses(answers)
+        assert not validation['is_valid']
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--log-cli-level=INFO"])
-
@@ -0,0 +1,98 @@
+"""
+LifeSync Personality Scorer - Result Memo Tests
+Tests the bounded LRU in front of PersonalityScorer.score()
+
+Run with: pytest tests/test_scoring_memo.py -v
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scorer import personality_scorer
+from src.scorer.personality_scorer import PersonalityScorer
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+
+@pytest.fixture
+def memo_scorer():
+    return PersonalityScorer(str(QUESTIONS_PATH), memo_size=4)
+
+
+@pytest.fixture
+def straight_liner():
+    return {f"Q{i:03d}": 3 for i in range(1, 181)}
+
+
+class TestScoringMemo:
+    """Repeated response sets are served from the memo"""
+
+    def test_disabled_by_default(self):
+        scorer = PersonalityScorer(str(QUESTIONS_PATH))
+        scorer.score({'Q001': 3})
+        assert scorer.memo_stats() == {"enabled": False, "size": 0, "maxsize": 0, "hits": 0, "misses": 0}
+
+    def test_repeat_returns_shared_result(self, memo_scorer, straight_liner):
+        first = memo_scorer.score(straight_liner)
+        # Same answers in a different order hash the same
+        second = memo_scorer.score(dict(reversed(list(straight_liner.items()))))
+        assert second is first
+        assert memo_scorer.memo_stats()["hits"] == 1
+        assert memo_scorer.memo_stats()["misses"] == 1
+
+    def test_memoized_result_matches_fresh_score(self, memo_scorer):
+        reference = PersonalityScorer(str(QUESTIONS_PATH))
+        rng = random.Random(61)
+        responses = {q_id: rng.randint(1, 5) for q_id in reference.questions}
+        memo_scorer.score(responses)
+        cached = memo_scorer.score(responses)
+        assert cached == reference.score(responses)
+        assert cached.to_dict() == reference.score(responses).to_dict()
+        assert json.dumps(cached.to_dict()) == json.dumps(reference.score(responses).to_dict())
+
+    def test_shared_result_is_immutable(self, memo_scorer, straight_liner):
+        result = memo_scorer.score(straight_liner)
+        assert result.frozen
+        with pytest.raises(TypeError):
+            result['ocean']['O'] = 1.0
+        with pytest.raises(TypeError):
+            result['facets']['Imagination'] = 1.0
+        with pytest.raises(AttributeError):
+            result['top_facets'].append(('x', 1.0))
+
+        plain = result.to_dict()
+        plain['ocean']['O'] = 1.0
+        assert result['ocean']['O'] != 1.0
+
+    def test_lru_is_bounded(self, memo_scorer):
+        for value in range(1, 6):
+            memo_scorer.score({'Q001': value, 'Q002': value})
+        assert memo_scorer.memo_stats()["size"] == 4
+        memo_scorer.score({'Q001': 1, 'Q002': 1})
+        assert memo_scorer.memo_stats()["hits"] == 0
+
+    def test_scoring_version_change_invalidates(self, memo_scorer, straight_liner, monkeypatch):
+        first = memo_scorer.score(straight_liner)
+        monkeypatch.setattr(personality_scorer, "SCORING_VERSION", "v-next")
+        assert memo_scorer.score(straight_liner) is not first
+        assert memo_scorer.memo_stats()["misses"] == 2
+
+    def test_bank_change_invalidates(self, memo_scorer, straight_liner, tmp_path):
+        data = json.loads(QUESTIONS_PATH.read_text())
+        data['questions'][0]['weight'] = 2.0
+        other_bank = tmp_path / "bank.json"
+        other_bank.write_text(json.dumps(data))
+        other = PersonalityScorer(str(other_bank), memo_size=4)
+        assert other.bank_fingerprint != memo_scorer.bank_fingerprint
+
+    def test_clear_memo(self, memo_scorer, straight_liner):
+        first = memo_scorer.score(straight_liner)
+        memo_scorer.clear_memo()
+        assert memo_scorer.score(straight_liner) is not first
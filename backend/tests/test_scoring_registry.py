@@ -0,0 +1,134 @@
+"""
+LifeSync Personality Scorer - Scoring Registry Tests
+Tests serving several scoring versions side by side from one process
+
+Run with: pytest tests/test_scoring_registry.py -v
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.server import app
+from src.config.constants import SCORING_VERSION
+from src.scorer import create_scorer_wrapper, score_answers
+from src.scorer.canonical_hash import hash_output
+from src.scorer.personality_scorer import PersonalityScorer
+from src.scorer.registry import ScoringRegistry, UnknownScoringVersionError
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def registry():
+    registry = ScoringRegistry("v1", memo_size=8)
+    registry.register("v1", QUESTIONS_PATH)
+    registry.register("v0", QUESTIONS_PATH)
+    return registry
+
+
+@pytest.fixture
+def answers():
+    rng = random.Random(81)
+    return {f"Q{i:03d}": rng.randint(1, 5) for i in range(1, 181)}
+
+
+@pytest.fixture
+def v0_registered(monkeypatch):
+    registry = ScoringRegistry(SCORING_VERSION)
+    registry.register("v0", QUESTIONS_PATH)
+    monkeypatch.setattr(create_scorer_wrapper, "_registry", registry)
+    monkeypatch.setattr(create_scorer_wrapper, "_scorer_instance", None)
+    return registry
+
+
+class TestScoringRegistry:
+    """Version lookup and table sharing"""
+
+    def test_same_bank_shares_tables(self, registry):
+        v1 = registry.get("v1")
+        v0 = registry.get("v0")
+        assert v0 is not v1
+        assert v0.compiled is v1.compiled
+        assert v0.questions is v1.questions
+        assert registry.stats()["banks_loaded"] == 1
+
+    def test_default_and_cached(self, registry):
+        assert registry.get() is registry.get("v1")
+        assert registry.get("v0") is registry.get("v0")
+
+    def test_version_stamped_on_results(self, registry, answers):
+        v1 = registry.get("v1").score(answers)
+        v0 = registry.get("v0").score(answers)
+        assert v0['ocean'] == v1['ocean']
+        assert v0['metadata']['scoring_version'] == "v0"
+        assert v1['metadata']['scoring_version'] == "v1"
+        assert v0['metadata']['input_hash'] == v1['metadata']['input_hash']
+        assert v0['metadata']['output_hash'] == hash_output(v0['ocean'], v0['mbti_proxy'], "v0")
+        assert v0['metadata']['output_hash'] != v1['metadata']['output_hash']
+
+    def test_memos_are_per_version(self, registry, answers):
+        registry.get("v1").score(answers)
+        registry.get("v0").score(answers)
+        memo = registry.stats()["memo"]
+        assert memo["v1"]["misses"] == 1
+        assert memo["v0"]["misses"] == 1
+
+    def test_different_bank_loads_separately(self, registry, tmp_path):
+        data = json.loads(QUESTIONS_PATH.read_text())
+        data['questions'][0]['weight'] = 2.0
+        other_bank = tmp_path / "bank.json"
+        other_bank.write_text(json.dumps(data))
+        registry.register("v2", other_bank)
+        assert registry.get("v2").compiled is not registry.get("v1").compiled
+        assert registry.stats()["banks_loaded"] == 2
+
+    def test_add_loaded_scorer(self, answers):
+        registry = ScoringRegistry("v1")
+        scorer = PersonalityScorer(str(QUESTIONS_PATH))
+        registry.add(scorer)
+        registry.register("v0", QUESTIONS_PATH)
+        assert registry.get("v1") is scorer
+        assert registry.get("v0").compiled is scorer.compiled
+
+    def test_unknown_version(self, registry):
+        with pytest.raises(UnknownScoringVersionError, match="v9"):
+            registry.get("v9")
+
+    def test_for_assessment(self, registry):
+        assert registry.for_assessment({"scoring_version": "v0"}).scoring_version == "v0"
+        assert registry.for_assessment({"metadata": {"scoring_version": "v0"}}).scoring_version == "v0"
+        assert registry.for_assessment({"metadata": None}).scoring_version == "v1"
+
+
+class TestVersionedScoring:
+    """score_answers() and the batch endpoint with an explicit version"""
+
+    def test_score_answers_default(self, answers):
+        assert score_answers(answers) == score_answers(answers, scoring_version=SCORING_VERSION)
+
+    def test_score_answers_unknown_version(self, answers):
+        with pytest.raises(UnknownScoringVersionError):
+            score_answers(answers, scoring_version="v9")
+
+    def test_older_version_shares_default_scorer_tables(self, v0_registered, answers):
+        assert score_answers(answers, scoring_version="v0") == score_answers(answers)
+        assert v0_registered.get("v0").compiled is create_scorer_wrapper.get_scorer().compiled
+
+    def test_batch_endpoint_version(self, v0_registered, answers):
+        response = client.post("/v1/assessments/score:batch", json={"responses": [answers], "scoring_version": "v0"})
+        assert response.status_code == 200
+        assert response.json()["scoring_version"] == "v0"
+
+    def test_batch_endpoint_unknown_version(self, answers):
+        response = client.post("/v1/assessments/score:batch", json={"responses": [answers], "scoring_version": "v9"})
+        assert response.status_code == 422
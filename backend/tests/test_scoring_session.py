@@ -0,0 +1,106 @@
+"""
+LifeSync Personality Scorer - Scoring Session Tests
+Tests incremental add/change/retract against full re-scoring
+
+Run with: pytest tests/test_scoring_session.py -v
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scorer import ScoringSession, start_session
+from src.scorer.compiled_bank import TRAIT_ORDER
+from src.scorer.personality_scorer import PersonalityScorer
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+TRAIT_NAMES = {
+    'O': 'Openness',
+    'C': 'Conscientiousness',
+    'E': 'Extraversion',
+    'A': 'Agreeableness',
+    'N': 'Neuroticism',
+}
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    return PersonalityScorer(str(QUESTIONS_PATH))
+
+
+def _assert_snapshot_matches(session, scorer):
+    snapshot = session.snapshot()
+    full = scorer.score(dict(session.responses))
+    for code in TRAIT_ORDER:
+        assert snapshot['traits'][code] == full['traits'][TRAIT_NAMES[code]]
+        assert snapshot['trait_confidence'][code] == full['trait_confidence'][TRAIT_NAMES[code]]
+    assert snapshot['mbti_proxy'] == full['mbti_proxy']
+    assert snapshot['confidence'] == full['confidence']
+    assert snapshot['traits_with_data'] == full['traits_with_data']
+    assert snapshot['responses_count'] == full['responses_count']
+    assert snapshot['coverage'] == full['coverage']
+    assert session.facet_snapshot() == full['facets']
+
+
+class TestScoringSession:
+    """Snapshots after every edit must agree with a full score()"""
+
+    def test_answer_by_answer(self, scorer):
+        session = ScoringSession(scorer)
+        rng = random.Random(21)
+        for q_id in scorer.questions:
+            session.add(q_id, rng.randint(1, 5))
+            _assert_snapshot_matches(session, scorer)
+        assert session.result() == scorer.score(dict(session.responses))
+
+    def test_random_add_change_retract(self, scorer):
+        session = ScoringSession(scorer)
+        rng = random.Random(22)
+        ids = list(scorer.questions)
+        for _ in range(600):
+            q_id = rng.choice(ids)
+            if q_id in session and rng.random() < 0.4:
+                session.retract(q_id)
+            else:
+                session.set(q_id, rng.randint(1, 5))
+            _assert_snapshot_matches(session, scorer)
+
+    def test_retract_everything_resets(self, scorer):
+        session = ScoringSession(scorer, {q_id: 4 for q_id in list(scorer.questions)[:40]})
+        for q_id in list(session.responses):
+            session.retract(q_id)
+        snapshot = session.snapshot()
+        assert len(session) == 0
+        assert all(v is None for v in snapshot['traits'].values())
+        assert snapshot['mbti_proxy'] is None
+        assert snapshot['confidence'] == 0.0
+
+    def test_change_keeps_answer_order(self, scorer):
+        session = ScoringSession(scorer, {'Q001': 1, 'Q002': 2})
+        session.change('Q001', 5)
+        assert list(session.responses) == ['Q001', 'Q002']
+
+    def test_invalid_edits_raise(self, scorer):
+        session = ScoringSession(scorer, {'Q001': 3})
+        with pytest.raises(ValueError):
+            session.add('Q999', 3)
+        with pytest.raises(ValueError):
+            session.add('Q002', 6)
+        with pytest.raises(ValueError):
+            session.add('Q001', 4)
+        with pytest.raises(ValueError):
+            session.change('Q002', 4)
+        with pytest.raises(ValueError):
+            session.retract('Q002')
+        assert session.responses == {'Q001': 3}
+
+    def test_start_session_uses_shared_scorer(self):
+        session = start_session({'Q001': 4})
+        assert len(session) == 1
+        assert session.snapshot()['responses_count'] == 1
@@ -0,0 +1,199 @@
+"""
+LifeSync Personality Engine - Single-Flight Tests
+Tests request coalescing per key, across workers and in generate_explanation
+
+Run with: pytest tests/test_single_flight.py -v
+"""
+
+import asyncio
+import sys
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.dependencies import get_supabase_client
+from src.api.routes.assessments import llm_circuit_breaker
+from src.api.server import app, limiter
+from src.db import explanation_cache
+from src.db.quota import quota_tracker
+from src.llm.circuit_breaker import CircuitState
+from src.utils.single_flight import FileFlightStore, SingleFlight
+
+EXPLANATION = {"persona_title": "The Architect", "vibe_summary": "Cool and calculated", "strengths": ["Planning"]}
+
+
+class Work:
+    """Async callable that counts executions and waits for release()"""
+
+    def __init__(self, result="done", error=None):
+        self.calls = 0
+        self.result = result
+        self.error = error
+        self.gate = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.gate.wait()
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class TestSingleFlight:
+    """Per-process coalescing"""
+
+    def test_concurrent_callers_share_one_call(self):
+        async def run():
+            flights, work = SingleFlight("test"), Work()
+            callers = [asyncio.ensure_future(flights.run("a", work)) for _ in range(5)]
+            other = asyncio.ensure_future(flights.run("b", work))
+            await asyncio.sleep(0)
+            work.gate.set()
+            results = await asyncio.gather(*callers, other)
+            return flights, work, results
+
+        flights, work, results = asyncio.run(run())
+        assert results == ["done"] * 6
+        assert work.calls == 2
+        assert flights.stats()["coalesced"] == 4 and flights.stats()["in_flight"] == 0
+
+    def test_errors_are_shared(self):
+        async def run():
+            flights, work = SingleFlight("test"), Work(error=ValueError("boom"))
+            callers = [asyncio.ensure_future(flights.run("a", work)) for _ in range(3)]
+            await asyncio.sleep(0)
+            work.gate.set()
+            return work, await asyncio.gather(*callers, return_exceptions=True)
+
+        work, results = asyncio.run(run())
+        assert work.calls == 1 and all(isinstance(r, ValueError) for r in results)
+
+    def test_later_calls_run_again(self):
+        async def run():
+            flights, work = SingleFlight("test"), Work()
+            work.gate.set()
+            await flights.run("a", work)
+            await flights.run("a", work)
+            return work
+
+        assert asyncio.run(run()).calls == 2
+
+    def test_one_cancelled_caller_keeps_the_call(self):
+        async def run():
+            flights, work = SingleFlight("test"), Work()
+            first = asyncio.ensure_future(flights.run("a", work))
+            second = asyncio.ensure_future(flights.run("a", work))
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.sleep(0)
+            work.gate.set()
+            return await second
+
+        assert asyncio.run(run()) == "done"
+
+    def test_all_callers_cancelled_cancels_the_call(self):
+        async def run():
+            flights, work = SingleFlight("test"), Work()
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(flights.run("a", work), timeout=0.01)
+            await asyncio.sleep(0)
+            assert flights.stats()["in_flight"] == 0
+            # A new caller starts a fresh call rather than joining the cancelled one
+            work.gate.set()
+            return await flights.run("a", work), work.calls
+
+        assert asyncio.run(run()) == ("done", 2)
+
+
+class TestFileFlightStore:
+    """Coalescing across workers (two SingleFlight instances sharing a directory)"""
+
+    def test_second_worker_gets_published_result(self, tmp_path):
+        async def run():
+            worker_a = SingleFlight("a", FileFlightStore(tmp_path, poll_interval=0.01))
+            worker_b = SingleFlight("b", FileFlightStore(tmp_path, poll_interval=0.01))
+            work = Work(result={"n": 1})
+            first = asyncio.ensure_future(worker_a.run("k", work))
+            await asyncio.sleep(0.02)
+            second = asyncio.ensure_future(worker_b.run("k", work))
+            await asyncio.sleep(0.05)
+            work.gate.set()
+            return work, worker_b, await asyncio.gather(first, second)
+
+        work, worker_b, results = asyncio.run(run())
+        assert results == [{"n": 1}, {"n": 1}]
+        assert work.calls == 1 and worker_b.stats()["shared_across_workers"] == 1
+        assert not list(tmp_path.glob("*.lock"))
+
+    def test_failed_work_is_not_published(self, tmp_path):
+        async def run():
+            store = FileFlightStore(tmp_path)
+            failing = Work(error=RuntimeError("down"))
+            failing.gate.set()
+            with pytest.raises(RuntimeError):
+                await SingleFlight("a", store).run("k", failing)
+            retry = Work(result={"n": 2})
+            retry.gate.set()
+            return await SingleFlight("b", store).run("k", retry)
+
+        assert asyncio.run(run()) == {"n": 2}
+
+    def test_result_ttl(self, tmp_path):
+        store = FileFlightStore(tmp_path, result_ttl=0)
+        store.publish("k", {"n": 1})
+        assert store.result("k") is None
+        assert store.result("missing") is None
+
+
+@pytest.fixture
+def fresh_route(monkeypatch):
+    """No shared explanation cache, fresh limits/quota and a closed circuit"""
+    monkeypatch.setattr(explanation_cache, "_cache", explanation_cache.ExplanationCache(":memory:"))
+    if hasattr(limiter, "_limiter") and hasattr(limiter._limiter, "storage"):
+        limiter._limiter.storage.reset()
+    quota_tracker.reset_user_quota("127.0.0.1")
+    yield
+    quota_tracker.reset_user_quota("127.0.0.1")
+    llm_circuit_breaker.state = CircuitState.CLOSED
+
+
+class TestExplanationRoute:
+    """Concurrent POST /v1/assessments/{id}/generate_explanation"""
+
+    @patch("src.api.routes.assessments.agenerate_explanation_with_tone")
+    def test_duplicate_requests_share_generation(self, mock_generate, fresh_route):
+        async def slow_generate(**kwargs):
+            await asyncio.sleep(0.05)
+            return dict(EXPLANATION)
+
+        mock_generate.side_effect = slow_generate
+        db = MagicMock()
+        db.get_assessment_full.return_value = {
+            "trait_scores": {"O": 72.0, "C": 41.0, "E": 55.0, "A": 80.0, "N": 30.0},
+            "facet_scores": {},
+            "confidence": 0.9,
+            "mbti_code": "ENFJ",
+        }
+        url = f"/v1/assessments/{uuid.uuid4()}/generate_explanation"
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+                return await asyncio.gather(client.post(url), client.post(url))
+
+        app.dependency_overrides[get_supabase_client] = lambda: db
+        try:
+            responses = asyncio.run(run())
+        finally:
+            app.dependency_overrides.pop(get_supabase_client, None)
+
+        assert [r.status_code for r in responses] == [200, 200]
+        assert responses[0].json() == responses[1].json()
+        assert mock_generate.call_count == 1
+        db.save_explanation.assert_called_once()
@@ -0,0 +1,66 @@
+"""
+LifeSync Personality Engine - Tone Generator Tests
+Tests the precomputed tone table and band-code signatures
+
+Run with: pytest tests/test_tone_generator.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ai.tone_generator import TONE_TABLE, generate_tone, generate_tone_safe, tone_band_code
+
+DEFAULT_TONE = {"style": ["friendly", "clear"], "strengths": [], "cautions": []}
+
+
+class TestBandCode:
+    """Profile signature"""
+
+    def test_bands(self):
+        traits = {"O": 0.72, "C": 0.65, "E": 0.34, "A": 0.35, "N": 0.66}
+        assert tone_band_code(traits) == "21012"
+
+    def test_thresholds_are_exclusive(self):
+        assert tone_band_code({t: 0.65 for t in "OCEAN"}) == "11111"
+        assert tone_band_code({t: 0.35 for t in "OCEAN"}) == "11111"
+
+    def test_missing_traits(self):
+        with pytest.raises(ValueError, match="C, N"):
+            tone_band_code({"O": 0.5, "E": 0.5, "A": 0.5})
+
+
+class TestToneTable:
+    """243 immutable profiles"""
+
+    def test_every_band_combination(self):
+        assert len(TONE_TABLE) == 243
+        assert all(tone["style"] for tone in TONE_TABLE.values())
+
+    def test_table_is_immutable(self):
+        with pytest.raises(TypeError):
+            TONE_TABLE["00000"]["style"] = ()
+        assert isinstance(TONE_TABLE["00000"]["style"], tuple)
+
+    def test_generate_tone(self):
+        tone = generate_tone({"O": 0.9, "C": 0.5, "E": 0.1, "A": 0.9, "N": 0.9})
+        assert tone["style"] == [
+            "creative", "metaphorical", "imaginative", "moderately organized",
+            "calm", "introspective", "soft-spoken", "warm", "gentle", "supportive",
+        ]
+        assert tone["cautions"] == ["may need reassurance", "emotionally sensitive", "may experience stress more intensely"]
+        assert tone["strengths"][-1] == "empathetic and considerate of others"
+
+    def test_results_are_copies(self):
+        traits = {t: 0.9 for t in "OCEAN"}
+        generate_tone(traits)["style"].append("mutated")
+        assert "mutated" not in generate_tone(traits)["style"]
+
+    def test_safe_defaults(self):
+        assert generate_tone_safe({}) == DEFAULT_TONE
+        assert generate_tone_safe({"O": None, "C": 1, "E": 1, "A": 1, "N": 1}) == DEFAULT_TONE
+        assert generate_tone_safe({t: 0.5 for t in "OCEAN"}) == generate_tone({t: 0.5 for t in "OCEAN"})
@@ -0,0 +1,256 @@
+"""
+LifeSync Personality Scorer - Profile Vector Index Tests
+Tests k-NN queries against brute force, incremental updates, snapshots and GET /v1/assessments/{id}/similar
+
+Run with: pytest tests/test_vector_index.py -v
+"""
+
+import asyncio
+import random
+import sys
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.config import Config
+from src.api.dependencies import get_supabase_client
+from src.api.server import app
+from src.db import vector_index
+from src.db.vector_index import ProfileVectorIndex, VectorIndexError, profile_dimensions, quantize
+from src.scorer.personality_scorer import PersonalityScorer
+
+QUESTIONS_PATH = Path(__file__).parent.parent / "data" / "question_bank" / "lifesync_180_questions.json"
+
+client = TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def profiles():
+    """(id, traits, facets) from 200 random full assessments"""
+    scorer = PersonalityScorer(str(QUESTIONS_PATH))
+    rng = random.Random(141)
+    rows = []
+    for i in range(200):
+        result = scorer.score({q_id: rng.randint(1, 5) for q_id in scorer.questions})
+        rows.append((f"p{i:03d}", result['traits'], result['facets']))
+    return rows
+
+
+@pytest.fixture
+def index(profiles):
+    index = ProfileVectorIndex(profile_dimensions(), capacity=16)
+    index.add_many([p[0] for p in profiles], [index.vector(p[1], p[2]) for p in profiles])
+    return index
+
+
+@pytest.fixture
+def process_index(index, monkeypatch):
+    """Use the populated index as the process-wide one"""
+    monkeypatch.setattr(vector_index, "_index", index)
+    return index
+
+
+def _brute_force(index, profiles, query_id, k, width):
+    levels = {p[0]: quantize(index.vector(p[1], p[2]))[:width].astype(np.int64) for p in profiles}
+    q = levels[query_id]
+    distances = sorted(
+        (round(float(np.sqrt(((v - q) ** 2).sum())) / 254, 4), other_id)
+        for other_id, v in levels.items() if other_id != query_id
+    )
+    return [d for d, _ in distances[:k]]
+
+
+class TestQueries:
+    """Exact neighbours"""
+
+    @pytest.mark.parametrize("space,width", [("full", None), ("traits", 5)])
+    def test_matches_brute_force(self, index, profiles, space, width):
+        for query_id, traits, facets in profiles[:20]:
+            neighbors = index.query(index.vector(traits, facets), k=7, space=space, exclude=query_id)
+            assert [d for _, d in neighbors] == _brute_force(index, profiles, query_id, 7, width or index.dim)
+            assert query_id not in [other_id for other_id, _ in neighbors]
+
+    def test_blocked_scan(self, index, profiles, monkeypatch):
+        expected = index.query(index.get_vector("p005"), k=10, exclude="p005")
+        monkeypatch.setattr(vector_index, "VECTOR_INDEX_BLOCK_ROWS", 16)
+        assert index.query(index.get_vector("p005"), k=10, exclude="p005") == expected
+
+    def test_self_is_nearest(self, index):
+        assert index.query(index.get_vector("p010"), k=1) == [("p010", 0.0)]
+
+    def test_k_larger_than_index(self, index):
+        assert len(index.query(index.get_vector("p000"), k=500, exclude="p000")) == len(index) - 1
+
+    def test_missing_scores_are_neutral(self, index):
+        vector = index.vector({"Openness": 0.9})
+        assert vector[0] == 0.9 and np.isnan(vector[1:]).all()
+        assert quantize(vector)[1] == 0
+
+    def test_bad_input(self, index):
+        with pytest.raises(VectorIndexError):
+            index.query(np.zeros(3))
+        with pytest.raises(VectorIndexError):
+            index.query(np.zeros(index.dim), space="facets")
+        with pytest.raises(VectorIndexError):
+            ProfileVectorIndex(["Fantasy", "Openness"])
+
+
+class TestUpdates:
+    """Incremental add / replace / remove"""
+
+    def test_replace(self, index, profiles):
+        size = len(index)
+        index.add("p001", index.get_vector("p002"))
+        assert len(index) == size
+        assert index.query(index.get_vector("p002"), k=2)[1][1] == 0.0
+
+    def test_remove_moves_last_row(self, index, profiles):
+        last_vector = index.get_vector("p199")
+        assert index.remove("p050")
+        assert not index.remove("p050")
+        assert "p050" not in index and len(index) == len(profiles) - 1
+        assert np.array_equal(index.get_vector("p199"), last_vector)
+        assert index.query(last_vector, k=1) == [("p199", 0.0)]
+
+    def test_save_scores_updates_process_index(self, process_index, profiles):
+        from src.supabase_client import SupabaseClient
+
+        mock_sb_client = MagicMock()
+        mock_sb_client.table.return_value.update.return_value.eq.return_value.execute.return_value.data = [{"id": "new"}]
+        with patch("src.supabase_client.create_client", return_value=mock_sb_client):
+            db = SupabaseClient(url="https://test.supabase.co", key="test")
+            _, traits, facets = profiles[3]
+            db.save_scores("new", {"traits": traits, "facets": facets}, {})
+
+        assert "new" in process_index
+        assert process_index.query(process_index.get_vector("p003"), k=2, exclude="p003")[0] == ("new", 0.0)
+
+
+class TestSnapshot:
+    """.npz round trip"""
+
+    def test_round_trip(self, index, tmp_path):
+        path = tmp_path / "profile_vectors.npz"
+        index.save(path)
+        loaded = ProfileVectorIndex.load(path)
+        assert len(loaded) == len(index)
+        for query_id in ("p000", "p123"):
+            vector = index.get_vector(query_id)
+            assert loaded.query(vector, k=5) == index.query(vector, k=5)
+
+    def test_loaded_index_accepts_updates(self, index, tmp_path):
+        path = tmp_path / "profile_vectors.npz"
+        index.save(path)
+        loaded = ProfileVectorIndex.load(path)
+        loaded.add("extra", index.get_vector("p000"))
+        assert len(loaded) == len(index) + 1
+
+    def test_unreadable_snapshot(self, tmp_path):
+        path = tmp_path / "broken.npz"
+        path.write_bytes(b"not a snapshot")
+        with pytest.raises(VectorIndexError):
+            ProfileVectorIndex.load(path)
+
+    def test_default_path_is_under_the_data_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(Config, "VECTOR_INDEX_PATH", "")
+        monkeypatch.setattr(Config, "DATA_DIR", str(tmp_path))
+        assert vector_index.snapshot_path() == tmp_path / "index" / "profile_vectors.npz"
+
+    def test_process_snapshot_only_when_changed(self, process_index, profiles):
+        path = vector_index.snapshot_profile_index()
+        assert path == vector_index.snapshot_path() and path.exists()
+        assert vector_index.snapshot_profile_index() is None
+        process_index.add("new", process_index.get_vector("p000"))
+        assert vector_index.snapshot_profile_index() == path
+
+        # The next process loads it
+        vector_index._index = None
+        assert len(vector_index.get_profile_index()) == len(profiles) + 1
+        assert vector_index.snapshot_profile_index() is None
+
+    def test_not_loaded_is_not_written(self):
+        assert vector_index.snapshot_profile_index() is None
+        assert not vector_index.snapshot_path().exists()
+
+    def test_written_at_shutdown(self, process_index):
+        with TestClient(app):
+            process_index.add("new", process_index.get_vector("p000"))
+        assert "new" in ProfileVectorIndex.load(vector_index.snapshot_path())
+
+    def test_written_periodically(self, process_index):
+        async def run():
+            task = asyncio.ensure_future(vector_index.snapshot_profile_index_periodically(interval=0.01))
+            await asyncio.sleep(0.1)
+            task.cancel()
+
+        asyncio.run(run())
+        assert len(ProfileVectorIndex.load(vector_index.snapshot_path())) == len(process_index)
+
+
+class TestSimilarEndpoint:
+    """GET /v1/assessments/{id}/similar"""
+
+    def _get(self, url, db=None):
+        app.dependency_overrides[get_supabase_client] = lambda: db or MagicMock()
+        try:
+            return client.get(url)
+        finally:
+            app.dependency_overrides.pop(get_supabase_client, None)
+
+    def test_indexed_assessment(self, process_index):
+        assessment_id = str(uuid.uuid4())
+        process_index.add(assessment_id, process_index.get_vector("p042"))
+
+        response = self._get(f"/v1/assessments/{assessment_id}/similar?k=3")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["space"] == "full" and data["index_size"] == len(process_index)
+        assert data["neighbors"][0] == {"assessment_id": "p042", "distance": 0.0, "similarity": 1.0}
+        assert len(data["neighbors"]) == 3
+
+    def test_falls_back_to_stored_scores(self, process_index, profiles):
+        assessment_id = str(uuid.uuid4())
+        _, traits, facets = profiles[7]
+        db = MagicMock()
+        db.get_assessment.return_value = {
+            "id": assessment_id,
+            "trait_scores": {"O": traits["Openness"] * 100, "C": traits["Conscientiousness"] * 100,
+                             "E": traits["Extraversion"] * 100, "A": traits["Agreeableness"] * 100,
+                             "N": traits["Neuroticism"] * 100},
+            "facet_scores": facets,
+        }
+        data = self._get(f"/v1/assessments/{assessment_id}/similar?space=traits&k=1", db).json()
+        assert data["neighbors"][0]["assessment_id"] == "p007"
+
+    def test_edge_function_row_in_full_space(self, process_index, profiles):
+        # score-assessment edge function rows: trait and facet codes on a 0-100 scale
+        assessment_id = str(uuid.uuid4())
+        _, traits, facets = profiles[11]
+        codes = {name: code for code, name in PersonalityScorer(str(QUESTIONS_PATH)).facets.items()}
+        db = MagicMock()
+        db.get_assessment.return_value = {
+            "id": assessment_id,
+            "trait_scores": {name[0]: value * 100 for name, value in traits.items()},
+            "facet_scores": {codes[name]: value * 100 for name, value in facets.items()},
+        }
+        data = self._get(f"/v1/assessments/{assessment_id}/similar?k=1", db).json()
+        assert data["neighbors"][0] == {"assessment_id": "p011", "distance": 0.0, "similarity": 1.0}
+
+    def test_not_found(self, process_index):
+        db = MagicMock()
+        db.get_assessment.return_value = None
+        response = self._get(f"/v1/assessments/{uuid.uuid4()}/similar", db)
+        assert response.status_code == 404
+
+    def test_invalid_params(self, process_index):
+        assessment_id = str(uuid.uuid4())
+        assert self._get(f"/v1/assessments/{assessment_id}/similar?space=mbti").status_code == 422
+        assert self._get(f"/v1/assessments/{assessment_id}/similar?k=0").status_code == 422
+        assert self._get("/v1/assessments/not-a-uuid/similar").status_code == 422
@@ -0,0 +1,82 @@
+/**
+ * Canonical JSON for parity telemetry hashes
+ * Byte-identical to the Python backend's
+ * json.dumps(data, sort_keys=True, separators=(',', ':'))
+ * for the two payloads it hashes (backend/src/scorer/canonical_hash.py).
+ *
+ * Hash the returned string with SHA-256 (hex) to get input_hash / output_hash.
+ * Checked against test/fixtures/canonical_hash_vectors.json.
+ */
+import type { OceanScores } from '../types';
+
+/**
+ * Python float repr: shortest round-trip digits, exponent form outside
+ * 1e-4 <= |x| < 1e16, and always a '.0' on integral values.
+ */
+export function pythonFloatRepr(value: number): string {
+    if (!Number.isFinite(value)) {
+        throw new Error(`Cannot encode non-finite number: ${value}`);
+    }
+    if (value === 0) {
+        return Object.is(value, -0) ? '-0.0' : '0.0';
+    }
+
+    const [mantissa, exp] = value.toExponential().split('e');
+    const exponent = parseInt(exp, 10);
+    const sign = mantissa.startsWith('-') ? '-' : '';
+    const digits = mantissa.replace('-', '').replace('.', '');
+
+    if (exponent < -4 || exponent >= 16) {
+        const fraction = digits.length > 1 ? `.${digits.slice(1)}` : '';
+        const expSign = exponent < 0 ? '-' : '+';
+        const expDigits = String(Math.abs(exponent)).padStart(2, '0');
+        return `${sign}${digits[0]}${fraction}e${expSign}${expDigits}`;
+    }
+
+    if (exponent < 0) {
+        return `${sign}0.${'0'.repeat(-exponent - 1)}${digits}`;
+    }
+    const intPart = digits.slice(0, exponent + 1).padEnd(exponent + 1, '0');
+    const fracPart = digits.slice(exponent + 1) || '0';
+    return `${sign}${intPart}.${fracPart}`;
+}
+
+/** Python json string encoding (ensure_ascii=True) */
+function encodeString(value: string): string {
+    return JSON.stringify(value).replace(
+        /[\u0080-\uffff]/g,
+        (ch) => `\\u${ch.charCodeAt(0).toString(16).padStart(4, '0')}`
+    );
+}
+
+/** Integral answers encode as Python ints, anything else as Python floats */
+function encodeAnswer(value: number): string {
+    return Number.isInteger(value) && Math.abs(value) < 1e16 ? String(value) : pythonFloatRepr(value);
+}
+
+/**
+ * Canonical JSON of an answer map (input hash payload).
+ * Keys are sorted by code unit, which matches Python for BMP keys such as question ids.
+ */
+export function canonicalResponsesJson(answers: Record<string, number>): string {
+    const parts = Object.keys(answers)
+        .sort()
+        .map((key) => `${encodeString(key)}:${encodeAnswer(answers[key])}`);
+    return `{${parts.join(',')}}`;
+}
+
+/**
+ * Canonical JSON of the output hash payload {...ocean, mbti, version}.
+ * OCEAN values are the rounded 0-1 scores and are always encoded as floats.
+ */
+export function canonicalOutputJson(
+    ocean: OceanScores,
+    mbti: string | null,
+    version: string
+): string {
+    const scores = (['A', 'C', 'E', 'N', 'O'] as const)
+        .map((code) => `"${code}":${pythonFloatRepr(ocean[code])}`)
+        .join(',');
+    const mbtiJson = mbti === null ? 'null' : encodeString(mbti);
+    return `{${scores},"mbti":${mbtiJson},"version":${encodeString(version)}}`;
+}
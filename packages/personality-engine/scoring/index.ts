@@ -5,3 +5,4 @@ export { computeProfile } from './computeProfile';
 export { applyReverseScoring } from './applyReverseScoring';
 export { aggregateTraits } from './aggregateTraits';
 export { normalizeScores, normalizeFacetScores } from './normalizeScores';
+export { canonicalResponsesJson, canonicalOutputJson, pythonFloatRepr } from './canonicalHash';
@@ -0,0 +1,36 @@
+import { describe, it, expect } from 'vitest';
+import { createHash } from 'crypto';
+import { canonicalResponsesJson, canonicalOutputJson, pythonFloatRepr } from '../scoring/canonicalHash';
+import vectors from './fixtures/canonical_hash_vectors.json';
+
+// Golden vectors are generated by backend/scripts/generate_canonical_hash_vectors.py
+const sha256 = (text: string) => createHash('sha256').update(text).digest('hex');
+
+describe('Canonical hash parity with the Python backend', () => {
+    for (const vector of vectors.responses) {
+        it(`input hash: ${vector.name}`, () => {
+            const canonical = canonicalResponsesJson(vector.input as Record<string, number>);
+            expect(canonical).toBe(vector.canonical);
+            expect(sha256(canonical)).toBe(vector.sha256);
+        });
+    }
+
+    for (const vector of vectors.outputs) {
+        it(`output hash: ${vector.name}`, () => {
+            const canonical = canonicalOutputJson(vector.ocean, vector.mbti, vector.version);
+            expect(canonical).toBe(vector.canonical);
+            expect(sha256(canonical)).toBe(vector.sha256);
+        });
+    }
+
+    it('formats floats like Python repr', () => {
+        expect(pythonFloatRepr(0)).toBe('0.0');
+        expect(pythonFloatRepr(1)).toBe('1.0');
+        expect(pythonFloatRepr(0.742)).toBe('0.742');
+        expect(pythonFloatRepr(0.0001)).toBe('0.0001');
+        expect(pythonFloatRepr(0.00001)).toBe('1e-05');
+        expect(pythonFloatRepr(1e16)).toBe('1e+16');
+        expect(pythonFloatRepr(123456.5)).toBe('123456.5');
+        expect(pythonFloatRepr(-2.5)).toBe('-2.5');
+    });
+});